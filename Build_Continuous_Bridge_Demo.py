@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import numpy as np
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
@@ -352,8 +351,7 @@ Sap.File.Save(ModelPath)
 Sap.Analyze.RunAnalysis()
 
 # Get Modal results
-PartiMassRatios = Sap.Results.Modal.ParticipatingMassRatios()
-periods = PartiMassRatios[4]
+modal = Sap.Results.Modal.Summary()
 # print Modal results(20 modes)
 
 # setup table
@@ -363,29 +361,19 @@ table.add_column("Period", justify="right", style="green")
 table.add_column("SumUx", justify="right", style="green")
 table.add_column("SumUy", justify="right", style="green")
 table.add_column("SumUz", justify="right", style="green")
-count = 0
-for i in range(PartiMassRatios[0]):
-    # add data to the table (only when any of mass ratio in Ux, Uy, Uz is greater than 0.01)
-    if any(np.array([PartiMassRatios[5][i],PartiMassRatios[6][i],PartiMassRatios[7][i]])>0.01):
-        table.add_row(
-            f"{i+1:02d}",
-            f"{PartiMassRatios[4][i]:.2f}",
-            f"{PartiMassRatios[8][i]:.2f}",
-            f"{PartiMassRatios[9][i]:.2f}",
-            f"{PartiMassRatios[10][i]:.2f}",
-        )
-        count+=1
-    if count >= 50:
-        break
-    
-# Rayleigh damping period 1: get the periods with mass ratio greater than 0.1
-period_x_1 = [periods[i] for i in range(len(periods)) if PartiMassRatios[5][i]>0.1][0]
-period_y_1 = [periods[i] for i in range(len(periods)) if PartiMassRatios[6][i]>0.1][0]
-period_z_1 = [periods[i] for i in range(len(periods)) if PartiMassRatios[7][i]>0.1][0]
-# Rayleigh damping period 2: get the periods with sum mass ratio greater than 0.9
-period_x_2 = [periods[i] for i in range(len(periods)) if PartiMassRatios[8][i]>0.9][0]
-period_y_2 = [periods[i] for i in range(len(periods)) if PartiMassRatios[9][i]>0.9][0]
-period_z_2 = [periods[i] for i in range(len(periods)) if PartiMassRatios[10][i]>0.9][0]
+# add data to the table (only when any of mass ratio in Ux, Uy, Uz is greater than 0.01)
+for i in modal.significant_modes(Threshold=0.01, Limit=50):
+    table.add_row(
+        f"{i+1:02d}",
+        f"{modal.Period[i]:.2f}",
+        *(f"{ratio:.2f}" for ratio in modal.SumMassRatio[i,:3]),
+    )
+
+# Rayleigh damping period 1: the period of the first mode with mass ratio greater than 0.1
+# Rayleigh damping period 2: the period of the first mode with sum mass ratio greater than 0.9
+period_x_1, period_x_2 = modal.control_periods("Ux")
+period_y_1, period_y_2 = modal.control_periods("Uy")
+period_z_1, period_z_2 = modal.control_periods("Uz")
 
 # print table
 console = Console()
@@ -484,18 +472,11 @@ table.add_column("支座反力(反应谱)", justify="right", style="yellow")
 table.add_column("支座位移(E2时程)", justify="right", style="green")
 table.add_column("支座反力(E2时程)", justify="right", style="yellow")
 if True:
-    Sap.Scripts.SelectCombo_Case("E2X")
-    # get Link deformation result by group name
-    Name,LinkAbsDeformationS,__,__ = Sap.Scripts.GetResults.LinkDeformation_by_Group("Bearing")
-    # get Link shearforce result by group name
-    Name,LinkAbsForceS,LinkMaxForceS,LinkMinForceS = Sap.Scripts.GetResults.LinkForce_by_Group("Bearing")
-    
-    Sap.Scripts.SelectCombo_Case("E2纵向+竖向")
-    
-    # get Link deformation result by group name
-    Name,LinkAbsDeformationTH,__,__ = Sap.Scripts.GetResults.LinkDeformation_by_Group("Bearing")
-    # get Link shearforce result by group name
-    Name,LinkAbsForceTH,LinkMaxForceTH,LinkMinForceTH = Sap.Scripts.GetResults.LinkForce_by_Group("Bearing")
+    # get Link deformation and shearforce of both cases by group name, [case,item,component]
+    __,Name,LinkAbsDeformation,__,__ = Sap.Scripts.GetResults.Cube_by_Group("Bearing",["E2X","E2纵向+竖向"],"LinkDeformation")
+    __,Name,LinkAbsForce,__,__ = Sap.Scripts.GetResults.Cube_by_Group("Bearing",["E2X","E2纵向+竖向"],"LinkForce")
+    LinkAbsDeformationS,LinkAbsDeformationTH = LinkAbsDeformation
+    LinkAbsForceS,LinkAbsForceTH = LinkAbsForce
     sorted_indices = sorted(range(len(Name)), key=lambda i: int(Name[i].split('_')[1][1:]))
     for i in sorted_indices:
         table.add_row(
@@ -517,18 +498,11 @@ table.add_column("支座反力(反应谱)", justify="right", style="yellow")
 table.add_column("支座位移(E2时程)", justify="right", style="green")
 table.add_column("支座反力(E2时程)", justify="right", style="yellow")
 if True:
-    Sap.Scripts.SelectCombo_Case("E2Y")
-    # get Link deformation result by group name
-    Name,LinkAbsDeformationS,__,__ = Sap.Scripts.GetResults.LinkDeformation_by_Group("Bearing")
-    # get Link shearforce result by group name
-    Name,LinkAbsForceS,LinkMaxForceS,LinkMinForceS = Sap.Scripts.GetResults.LinkForce_by_Group("Bearing")
-    
-    Sap.Scripts.SelectCombo_Case("E2横向+竖向")
-    
-    # get Link deformation result by group name
-    Name,LinkAbsDeformationTH,__,__ = Sap.Scripts.GetResults.LinkDeformation_by_Group("Bearing")
-    # get Link shearforce result by group name
-    Name,LinkAbsForceTH,LinkMaxForceTH,LinkMinForceTH = Sap.Scripts.GetResults.LinkForce_by_Group("Bearing")
+    # get Link deformation and shearforce of both cases by group name, [case,item,component]
+    __,Name,LinkAbsDeformation,__,__ = Sap.Scripts.GetResults.Cube_by_Group("Bearing",["E2Y","E2横向+竖向"],"LinkDeformation")
+    __,Name,LinkAbsForce,__,__ = Sap.Scripts.GetResults.Cube_by_Group("Bearing",["E2Y","E2横向+竖向"],"LinkForce")
+    LinkAbsDeformationS,LinkAbsDeformationTH = LinkAbsDeformation
+    LinkAbsForceS,LinkAbsForceTH = LinkAbsForce
     sorted_indices = sorted(range(len(Name)), key=lambda i: int(Name[i].split('_')[1][1:]))
     for i in sorted_indices:
         table.add_row(
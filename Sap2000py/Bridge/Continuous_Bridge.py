@@ -3,23 +3,28 @@ import weakref
 from dataclasses import dataclass, field
 from itertools import chain
 from pathlib import Path
-from typing import ClassVar, Dict, List, Literal, Union
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Literal, Optional, Union
 from abc import ABC, abstractmethod
 import copy
 
 import numpy as np
 from loguru import logger
-from sectionproperties.analysis import Section
-from sectionproperties.pre import Geometry
-from shapely import Polygon
 
 from Sap2000py import Saproject
+from Sap2000py.Saproject import ProjectBound
+from Sap2000py.SapModelCache import LINK_TYPES
+from Sap2000py.SapManifest import CHANGED, SAME
+
+if TYPE_CHECKING:
+    # only annotations, sectionproperties is imported where a section is meshed
+    from sectionproperties.analysis import Section
+    from sectionproperties.pre import Geometry
 
 
 class ShouldNotInstantiateError(Exception):
     pass
 
-class SapSection(ABC):
+class SapSection(ProjectBound, ABC):
     name: str
     material: str
     notes: str = "Creates by Sap2000py"
@@ -35,7 +40,9 @@ class SapSection(ABC):
 
     def ignore_mass_effect(self):
         # Set mass and weight modifiers to 0
-        ret = Saproject()._Model.PropFrame.SetModifiers(self.name,[1,1,1,1,1,1,0,0])
+        if self.build_step("SectionModifiers", self.name, [1,1,1,1,1,1,0,0]) == SAME:
+            return
+        ret = self.Sap._Model.PropFrame.SetModifiers(self.name,[1,1,1,1,1,1,0,0])
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"Mass effect ignored for Section <yellow>{self.name}</yellow>!")
         else:
@@ -55,8 +62,12 @@ class SapSection(ABC):
 
     @property
     def is_defined(self):
-        ret = Saproject()._Model.PropFrame.GetNameList()
-        return self.name in list(ret[1])
+        return self.Sap.ModelCache.has("PropFrame", self.name)
+
+    def define_if_needed(self):
+        # in an incremental build the manifest tells whether the section changed
+        if self.Sap.manifest is not None or not self.is_defined:
+            return self.define()
 
     @classmethod
     def rigid_link(cls, name: str = "rigid", stiffness: float = 1e10):
@@ -75,10 +86,11 @@ class Section_General(SapSection):
     I33:float
     I23:float
     J:float=1e10
-    geom:Geometry = None
-    sec: Section = None
+    geom:"Geometry" = None
+    sec: "Section" = None
     unit_of_sec:Literal['mm','cm','m'] = 'm'
     notes:str=""
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     @property
     def t3(self):
@@ -89,20 +101,22 @@ class Section_General(SapSection):
         return self.Width
 
     def define(self):
+        if self.build_step("Section", self.name, self) == SAME:
+            return 0
         if self.unit_of_sec == 'mm':
-            Saproject().setUnits("KN_mm_C")
+            self.Sap.setUnits("KN_mm_C")
         elif self.unit_of_sec == 'cm':
-            Saproject().setUnits("KN_cm_C")
+            self.Sap.setUnits("KN_cm_C")
         elif self.unit_of_sec == 'm':
-            Saproject().setUnits("KN_m_C")
-        ret = Saproject().Define.section.PropFrame_SetGeneral(self.name, self.material, self.t3, self.t2, self.Area, self.As2, self.As3, self.I22, self.I33, self.J, notes=self.notes)
+            self.Sap.setUnits("KN_m_C")
+        ret = self.Sap.Define.section.PropFrame_SetGeneral(self.name, self.material, self.t3, self.t2, self.Area, self.As2, self.As3, self.I22, self.I33, self.J, notes=self.notes)
         if ret == 0:
             logger.opt(colors=True).success(f"Section <yellow>{self.name}</yellow> added!")
-        Saproject().setUnits("KN_m_C")
+        self.Sap.setUnits("KN_m_C")
         return ret
     
     def get_section_prop_from_sap(self):
-        ret = Saproject().Define.section.PropFrame_GetSectProps(self.name)
+        ret = self.Sap.Define.section.PropFrame_GetSectProps(self.name)
         if ret[-1] == 0:
             self.Area = ret[0]
             self.As2 = ret[1]
@@ -138,9 +152,10 @@ class Section_General(SapSection):
 
     @classmethod
     def rigid_link(cls,name:str = "rigid",stiffness:float = 1e12):
-        frame_list = Saproject().Assign.FrameObj.Get.NameList()
-        if name not in frame_list[1]:
-            materials = Saproject().Define.material.Get.NameList()[1]
+        Sap = Saproject()
+        # an incremental build claims the rigid section every time, the manifest skips the repeats
+        if Sap.manifest is not None or not Sap.ModelCache.has("PropFrame", name):
+            materials = Sap.ModelCache.names("PropMaterial")
             # use the first material as the rigid link material
             rigid_section = cls(name = name, material = materials[0],Area=0.01,Depth=0.01,Width=0.01,As2=0,As3=0,I22=stiffness,I33=stiffness,I23=0,J=stiffness,geom=None,sec=None,unit_of_sec='m',notes="rigid link")
             rigid_section.define()
@@ -169,8 +184,11 @@ class Section_NonPrismatic(SapSection):
     name:str
     VaryingRules:list[Literal['Variable','Absolute'],float,str,str,Literal['Linear','Parabolic','Cubic'],Literal['Linear','Parabolic','Cubic']]
     notes:str=""
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def define(self):
+        if self.build_step("Section", self.name, self) == SAME:
+            return [0]
         NumberItems:int = len(self.VaryingRules)
         lengthTypeList:List = [segment[0] for segment in self.VaryingRules]
         lengthlist:List = [segment[1] for segment in self.VaryingRules]
@@ -178,7 +196,7 @@ class Section_NonPrismatic(SapSection):
         endSecList:List = [segment[3] for segment in self.VaryingRules]
         EI33Variation = [segment[4] for segment in self.VaryingRules]
         EI22Variation = [segment[5] for segment in self.VaryingRules]
-        ret = Saproject().Define.section.PropFrame_SetNonPrismatic(self.name, NumberItems, startSecList, endSecList, lengthlist, lengthTypeList, EI33Variation, EI22Variation)
+        ret = self.Sap.Define.section.PropFrame_SetNonPrismatic(self.name, NumberItems, startSecList, endSecList, lengthlist, lengthTypeList, EI33Variation, EI22Variation)
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"Section <yellow>{self.name}</yellow> added!")
         return ret
@@ -191,15 +209,18 @@ class Section_Rectangle(SapSection):
     depth:float
     unit_of_sec:Literal['mm','cm','m'] = 'm'
     notes:str=""
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def define(self):
+        if self.build_step("Section", self.name, self) == SAME:
+            return 0
         if self.unit_of_sec == 'mm':
-            Saproject().setUnits("KN_mm_C")
+            self.Sap.setUnits("KN_mm_C")
         elif self.unit_of_sec == 'cm':
-            Saproject().setUnits("KN_cm_C")
+            self.Sap.setUnits("KN_cm_C")
         elif self.unit_of_sec == 'm':
-            Saproject().setUnits("KN_m_C")
-        ret = Saproject().Define.section.PropFrame_SetRectangle(self.name, self.material, self.width, self.depth, -1, self.notes)
+            self.Sap.setUnits("KN_m_C")
+        ret = self.Sap.Define.section.PropFrame_SetRectangle(self.name, self.material, self.width, self.depth, -1, self.notes)
         if ret == 0:
             logger.opt(colors=True).success(f"Section <yellow>{self.name}</yellow> added!")
         else:
@@ -208,16 +229,26 @@ class Section_Rectangle(SapSection):
 
    
 @dataclass
-class SapPoint:
+class SapPoint(ProjectBound):
     x:float
     y:float
     z:float
     name:str=""
     mass: List[float] = field(default_factory=lambda: [0.0 for _ in range(6)])
     restraints:list[Literal['Ux','Uy','Uz','Rx','Ry','Rz']] = field(default_factory=lambda: copy.deepcopy([]))
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def add(self):
-        ret = Saproject().Assign.PointObj.AddCartesian(self.x, self.y, self.z, UserName=self.name)
+        step = self.build_step("Point", self.name, self.x, self.y, self.z)
+        if step == SAME:
+            return [self.name, 0]
+        if step == CHANGED:
+            # move the point of the previous build, objects at it stay connected
+            ret = self.Sap._Model.EditPoint.ChangeCoordinates_1(self.name, self.x, self.y, self.z)
+            if ret == 0:
+                logger.opt(colors=True).success(f"Point <yellow>{self.name}</yellow> : moved to <cyan>({self.x}, {self.y}, {self.z})</cyan>.")
+                return [self.name, ret]
+        ret = self.Sap.Assign.PointObj.AddCartesian(self.x, self.y, self.z, UserName=self.name)
         if ret[1] == 0:
             logger.opt(colors=True).success(f"Point <yellow>{self.name}</yellow> : <cyan>({self.x}, {self.y}, {self.z})</cyan> added.")
         else:
@@ -241,8 +272,10 @@ class SapPoint:
         else:
             raise ValueError("The mass must be either a single float value or a list matching the length of dof.")
         
+        if self.build_step("PointMass", self.name, self.mass) == SAME:
+            return [0]
         # 调用外部接口设置质量
-        ret = Saproject().Assign.PointObj.Set.Mass(self.name, self.mass, Replace = True)
+        ret = self.Sap.Assign.PointObj.Set.Mass(self.name, self.mass, Replace = True)
         
         # 检查返回值并记录日志
         if ret[-1] == 0:
@@ -253,12 +286,14 @@ class SapPoint:
         return ret
 
     def exists(self):
-        return Saproject().Assign.PointObj.Get.CoordCartesian(self.name)[-1] == 0
+        return self.Sap.ModelCache.has("PointObj", self.name)
 
     def fix(self,DOF=list[Literal['Ux','Uy','Uz','Rx','Ry','Rz']]):
         if DOF is not None:
             self.restraints = DOF
-        ret = Saproject().Assign.PointObj.Set.Restraint(self.name,self.restraints)
+        if self.build_step("PointRestraint", self.name, self.restraints) == SAME:
+            return [0]
+        ret = self.Sap.Assign.PointObj.Set.Restraint(self.name,self.restraints)
         if ret[-1] == 0:
             logger.success(f"Restraints at DOF:[{self.restraints}] added to Point {self.name}")
         else:
@@ -266,13 +301,14 @@ class SapPoint:
         return ret
 
 @dataclass
-class SapFrame:
+class SapFrame(ProjectBound):
     node1:Union[SapPoint,str]
     node2:Union[SapPoint,str]
     section:Union[str,Section_General,Section_NonPrismatic]
     
     name:str = ""
     CardinalPoint:Literal['Centroid','Shear Center','Bottom Left','Bottom Center','Bottom Right','Middle Left','Middle Center','Middle Right','Top Left','Top Center','Top Right'] = 'Centroid'
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def define(self):
         if isinstance(self.node1, SapPoint):
@@ -287,9 +323,19 @@ class SapFrame:
             section_name = self.section
         else:
             section_name = self.section.name
-        ret = Saproject().Assign.FrameObj.AddByPoint(namei, namej,propName=section_name, userName = self.name)
+        # frames named by SAP2000 (rigid links) are known to the build manifest by their points
+        key = self.name or f"{namei}~{namej}"
+        step = self.build_step("Frame", key, namei, namej, section_name)
+        if step == SAME:
+            self.name = self.Sap.manifest.name("Frame", key)
+            return
+        if step == CHANGED:
+            self.Sap._Model.FrameObj.Delete(self.Sap.manifest.name("Frame", key))
+        ret = self.Sap.Assign.FrameObj.AddByPoint(namei, namej,propName=section_name, userName = self.name)
         # update name if not specified
         self.name = ret[0]
+        if step is not None:
+            self.Sap.manifest.rename("Frame", key, self.name)
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"Frame element <yellow>{self.name}</yellow> added!")
         else:
@@ -302,8 +348,15 @@ class SapFrame:
             disLoad (float, optional): mass per unit length under unit kN_m . Defaults to 0.0.
             Replace (bool, optional): replace line mass or not. Defaults to True.
         """
+        # the manifest compares the line mass the frame ends up with, changes set it as a whole
+        self._line_mass = disLoad if Replace else getattr(self, "_line_mass", 0.0) + disLoad
+        step = self.build_step("FrameMass", self.name, self._line_mass)
+        if step == SAME:
+            return
+        if step is not None:
+            disLoad, Replace = self._line_mass, True
         # add line mass manually instead(一期+二期恒载)
-        ret = Saproject().Assign.FrameObj.Set.Mass(self.name,disLoad,Replace=Replace)
+        ret = self.Sap.Assign.FrameObj.Set.Mass(self.name,disLoad,Replace=Replace)
         if ret == 0:
             if Replace:
                 logger.opt(colors=True).success(f"element <yellow>{self.name}</yellow> line mass set as {disLoad} ton/m (kN/m/g)!")
@@ -313,7 +366,7 @@ class SapFrame:
             logger.opt(colors=True).error(f"element <yellow>{self.name}</yellow> mass failed to set as {disLoad} ton/m (kN/m/g)!")
 
     def get_section_name(self):
-        ret = Saproject()._Model.FrameObj.GetSection(self.name)
+        ret = self.Sap._Model.FrameObj.GetSection(self.name)
         if ret[-1] == 0:
             return ret[0]
         else:
@@ -324,7 +377,10 @@ class SapFrame:
             newCardinalPoint = CardinalPoint
         else:
             newCardinalPoint = self.CardinalPoint
-        ret = Saproject().Assign.FrameObj.Set.InsertionPoint(self.name, newCardinalPoint, False, False, [0,0,0], [0,0,0], "Local")
+        if self.build_step("FrameInsertion", self.name, newCardinalPoint) == SAME:
+            self.CardinalPoint = CardinalPoint
+            return [0]
+        ret = self.Sap.Assign.FrameObj.Set.InsertionPoint(self.name, newCardinalPoint, False, False, [0,0,0], [0,0,0], "Local")
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"Cardinal Point of Element <yellow>{self.name}</yellow> set as <yellow>{self.CardinalPoint}</yellow>!")
             self.CardinalPoint = CardinalPoint
@@ -343,13 +399,15 @@ class SapFrame:
                 secname = self.section
         else:
             secname = self.section.name
+        if self.build_step("FrameVarying", self.name, secname, float(VarTotalLength), float(RelStartLoc)) == SAME:
+            return
                 
         if not isinstance(self.section, Section_NonPrismatic):
-            ret = Saproject()._Model.FrameObj.GetSectionNonPrismatic(self.name)
+            ret = self.Sap._Model.FrameObj.GetSectionNonPrismatic(self.name)
             if ret[-1] != 0:
                 logger.warning(f"Section {self.section} is not nonprismatic.")
                 raise ValueError(f"Section {self.section} is not nonprismatic.")
-        ret = Saproject().Assign.FrameObj.Set.Section(name=self.name,
+        ret = self.Sap.Assign.FrameObj.Set.Section(name=self.name,
                                                 propName=secname,
                                                 sVarTotalLength=float(VarTotalLength),
                                                 sVarRelStartLoc=float(RelStartLoc))
@@ -365,21 +423,24 @@ class SapFrame:
         rigidlink.define()
         return rigidlink
 
-class SapBase_Fixed:
-    def __init__(self, point: SapPoint, fix_dof = ['Ux', 'Uy', 'Uz', 'Rx', 'Ry', 'Rz']):
+class SapBase_Fixed(ProjectBound):
+    def __init__(self, point: SapPoint, fix_dof = ['Ux', 'Uy', 'Uz', 'Rx', 'Ry', 'Rz'], project: Optional[Saproject] = None):
         self.point = point
+        self.project = project
         self.fix_dof = fix_dof
     
     def auto_build(self):
-        self.fix()
+        with self.activate():
+            self.fix()
     
     def fix(self):
         ret = self.point.fix(DOF=self.fix_dof)
         return ret
 
-class SapBase_6Spring:
-    def __init__(self, point: SapPoint, pier_name, spring_data_name=None,spring_file_path:Path = Path("./Examples/ContinuousBridge6spring.txt")):
+class SapBase_6Spring(ProjectBound):
+    def __init__(self, point: SapPoint, pier_name, spring_data_name=None,spring_file_path:Path = Path("./Examples/ContinuousBridge6spring.txt"), project: Optional[Saproject] = None):
         self.point = point
+        self.project = project
         self.pier_name = pier_name
         self.name = self.pier_name + "_Base"
         self.point.name = self.name
@@ -390,9 +451,10 @@ class SapBase_6Spring:
             self.spring_data_name = spring_data_name
     
     def auto_build(self):
-        self.add_point()
-        self.get_spring_data()
-        self.add_spring()
+        with self.activate():
+            self.add_point()
+            self.get_spring_data()
+            self.add_spring()
     
     def add_point(self):
         ret = self.point.add()
@@ -427,9 +489,11 @@ class SapBase_6Spring:
         """
         if not hasattr(self, "spring_data"):
             self.get_spring_data()
-        if unit != Saproject().Units:
-            Saproject().setUnits(unit)
-        ret = Saproject().Assign.PointObj.Set.SpringCoupled(self.name, self.spring_data, Replace=True)
+        if self.build_step("Spring", self.name, self.spring_data, unit) == SAME:
+            return [0, 0]
+        if unit != self.Sap.Units:
+            self.Sap.setUnits(unit)
+        ret = self.Sap.Assign.PointObj.Set.SpringCoupled(self.name, self.spring_data, Replace=True)
         if ret[1] == 0:
             logger.opt(colors=True).success(f"Spring for Joint: <yellow>{self.name}</yellow> Added! K = <cyan>{self.spring_data}</cyan>")
         else:
@@ -439,7 +503,7 @@ class SapBase_6Spring:
     def connect_with_pier(self):
         raise NotImplementedError
 
-class SapPier(ABC):
+class SapPier(ProjectBound, ABC):
     name: str
     station: float
     notes: str = "Creates by Sap2000py"
@@ -447,7 +511,7 @@ class SapPier(ABC):
 
     @property
     def default_section(self):
-        default_material = Saproject().MaterialList[0]
+        default_material = self.Sap.MaterialList[0]
         # 默认为一个3x5m的矩形
         return Section_General(
             name='default_section',
@@ -490,20 +554,22 @@ class Sap_Double_Box_Pier(SapPier):
     Box_Section:SapSection = None
     Solid_Section:SapSection = None
     Cap_Section:SapSection = None
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
         
     def build(self):
-        self.addsome_empty_attr()
+        with self.activate():
+            self.addsome_empty_attr()
         
-        self.generate_pier_points(side = 'both')
-        self.generate_pier_elements(side = 'both')
+            self.generate_pier_points(side = 'both')
+            self.generate_pier_elements(side = 'both')
         
-        self.generate_base_points()
-        self.generate_cap_elements()
+            self.generate_base_points()
+            self.generate_cap_elements()
         
-        self.add_rigid_link(mode='RigidFrame')
-        # self.add_rigid_link(mode='Body')
-        # self.add_mass()
-        Saproject().RefreshView()
+            self.add_rigid_link(mode='RigidFrame')
+            # self.add_rigid_link(mode='Body')
+            # self.add_mass()
+            self.Sap.RefreshView()
     
     def connect_with_base(self,baseobj:Literal['SapBase_6Spring']):
         self.base = baseobj
@@ -629,9 +695,11 @@ class Sap_Double_Box_Pier(SapPier):
             if not point.exists():
                 logger.opt(colors=True).warning(f"<yellow>{point.name}</yellow> Accidentally does not exist!")
                 point.add()
+        if self.build_step("Constraint", constraint_name, [p.name for p in points]) == SAME:
+            return
         
-        Saproject().Scripts.Group.AddtoGroup(constraint_name,[p.name for p in points], type='Point')
-        ret = Saproject().Assign.PointObj.Set.Constraint(constraint_name,constraint_name,ItemType = 1, Replace=False)
+        self.Sap.Scripts.Group.AddtoGroup(constraint_name,[p.name for p in points], type='Point')
+        ret = self.Sap.Assign.PointObj.Set.Constraint(constraint_name,constraint_name,ItemType = 1, Replace=False)
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"<yellow>{[p.name for p in points]}</yellow> added to constraint : <yellow>{constraint_name}</yellow>")
         else:
@@ -649,10 +717,10 @@ class Sap_Double_Box_Pier(SapPier):
         else:
             if mode == 'Body':
                 body_prop = f"{self.name}_Cap_Pier"
-                Saproject().Define.joint_constraints.Set.Body(body_prop, rigid_dof)
+                self.Sap.Define.joint_constraints.Set.Body(body_prop, rigid_dof)
                 self._add_constraint_for_points(body_prop, flatten([self.cap_top_point, self.pier_bottom_point['left'],self.pier_bottom_point['right']]))        
             elif mode == 'Equal':
-                Saproject().Define.joint_constraints.Set.Equal(self.name+"_Cap_Pier", rigid_dof)
+                self.Sap.Define.joint_constraints.Set.Equal(self.name+"_Cap_Pier", rigid_dof)
                 self._add_constraint_for_points(self.name+"_Cap_Pier", flatten([self.cap_top_point, self.pier_bottom_point['left'],self.pier_bottom_point['right']]))
         
         # add body constraint between pier top and bearing bottom
@@ -665,10 +733,10 @@ class Sap_Double_Box_Pier(SapPier):
             else:
                 if mode == 'Body':
                     body_prop = f"{self.name}_{side}_Pier_Bearing"
-                    Saproject().Define.joint_constraints.Set.Body(body_prop, rigid_dof)
+                    self.Sap.Define.joint_constraints.Set.Body(body_prop, rigid_dof)
                     self._add_constraint_for_points(body_prop, flatten([pier_top_point, bearing_bottom_points]))
                 elif mode == 'Equal':
-                    Saproject().Define.joint_constraints.Set.Equal(self.name+f"_{side}_Pier_Bearing", rigid_dof)
+                    self.Sap.Define.joint_constraints.Set.Equal(self.name+f"_{side}_Pier_Bearing", rigid_dof)
                     self._add_constraint_for_points(self.name+f"_{side}_Pier_Bearing", [pier_top_point]+bearing_bottom_points)
     
     def get_cap_section(self):
@@ -683,8 +751,7 @@ class Sap_Double_Box_Pier(SapPier):
             return
         cap_section = self.get_cap_section()
         
-        if not cap_section.is_defined:
-            cap_section.define()
+        cap_section.define_if_needed()
         # define solid cap
         SapFrame(node1=self.base_point.name, node2=self.cap_point.name,section=cap_section.name,name=self.name+"_base2cap").define()
         SapFrame(node1=self.cap_point.name, node2=self.cap_top_point.name,section=cap_section.name,name=self.name+"_cap2bottom").define()
@@ -713,10 +780,8 @@ class Sap_Double_Box_Pier(SapPier):
                   
         solid_section = self.get_solid_section()
         box_section = self.get_box_section()
-        if not solid_section.is_defined:
-            solid_section.define()
-        if not box_section.is_defined:
-            box_section.define()
+        solid_section.define_if_needed()
+        box_section.define_if_needed()
         
         # define pier
         SapFrame(node1=self.pier_bottom_point[side].name, node2=self.pier_hollow_bottom[side].name,section=solid_section.name,name=self.name+'_'+side+"_bottom2hollowBottom").define()
@@ -732,19 +797,32 @@ class Sap_Double_Box_Pier(SapPier):
             SapFrame(node1=self.hollow_points[side][-1].name, node2=self.pier_hollow_top[side].name, section=box_section.name, name=self.name+'_'+side+"_hollowBottom2Top").define()
         SapFrame(node1=self.pier_hollow_top[side].name, node2=self.pier_top[side].name, section=solid_section.name, name=self.name+'_'+side+"_hollowTop2Top").define()
 
-class Sap_Bearing(ABC):
+class Sap_Bearing(ProjectBound, ABC):
     def __init__(self):
         logger.error('Sap_Bearing is a abstract class!Should not be instantiated!')
         raise ShouldNotInstantiateError('Abstract class Sap_Bearing accidentally instantiated!')
     
+    def _link_step(self,point1:SapPoint=None,point2:SapPoint=None):
+        point1 = point1 or self.start_point
+        point2 = point2 or self.end_point
+        return self.build_step("Link", self.name, point1.name, point2.name, self.linkprop_name)
+
     def add_link(self,point1:SapPoint=None,point2:SapPoint=None):
+        step = self._link_step(point1,point2)
+        if step == SAME:
+            return
+        if step == CHANGED and self.Sap.ModelCache.has("LinkObj", self.name):
+            self.Sap.Assign.Link.Delete(self.name)
+        self._add_link(point1,point2)
+
+    def _add_link(self,point1:SapPoint=None,point2:SapPoint=None):
         if not self.linkprop_instance.is_defined:
             self.linkprop_instance.define_link()
         if not point1:
             point1 = self.start_point
         if not point2:
             point2 = self.end_point
-        ret = Saproject().Assign.Link.AddByPoint(point1.name, point2.name, IsSingleJoint=False, PropName = self.linkprop_name, UserName=self.name)
+        ret = self.Sap.Assign.Link.AddByPoint(point1.name, point2.name, IsSingleJoint=False, PropName = self.linkprop_name, UserName=self.name)
         if ret[1] == 0:
             logger.opt(colors=True).success(f"Link <yellow>{self.name}</yellow> Added!")
         else:
@@ -755,39 +833,31 @@ class Sap_Bearing(ABC):
             point1 = self.start_point
         if not point2:
             point2 = self.end_point
-        ret1 = Saproject().Assign.PointObj.Get.Connectivity(point1.name)
-        ret2 = Saproject().Assign.PointObj.Get.Connectivity(point2.name)
-        if ret1[-1] == 0 and ret2[-1] == 0:
-            # both points exist
-            if ret1[0]>0 and ret2[0]>0:
-                # both points are connected
-                # get {name:linktype} dict, only need to check if type is 7(Link)
-                dict1 = {ret1[2][i]:ret1[1][i]for i in range(ret1[0]) if ret1[1][i]==7}
-                dict2 = {ret2[2][i]:ret2[1][i]for i in range(ret2[0]) if ret2[1][i]==7}
-                commonlink = [link for link in dict1.keys() if link in dict2.keys()]
-                # should only have one common link, but i'll return whole list just in case
-                return commonlink
-        else:
-            logger.error(f"Point {point1.name} or {point2.name} does not exist.")
+        # links at both points, answered by the in-memory mirror instead of two GetConnectivity calls
+        mirror = self.Sap.Mirror
+        if point1.name in mirror and point2.name in mirror:
+            # should only have one common link, but i'll return whole list just in case
+            return mirror.links_between(point1.name, point2.name)
+        logger.error(f"Point {point1.name} or {point2.name} does not exist.")
         return None
 
     def AxialF_under_dead_weight(self,link_name:str):
         # make sure dead load analysis is run
-        if not Saproject().is_locked:
+        if not self.Sap.is_locked:
             # run dead load analysis
-            Saproject().Scripts.Analyze.RemoveCases("All")
-            Saproject().Scripts.Analyze.AddCases(CaseName = ['DEAD'])
-            filepath = Saproject()._Model.GetModelFilename(True)
+            self.Sap.Scripts.Analyze.RemoveCases("All")
+            self.Sap.Scripts.Analyze.AddCases(CaseName = ['DEAD'])
+            filepath = self.Sap._Model.GetModelFilename(True)
             if len(filepath) >0:
-                Saproject().File.Save(filepath)
+                self.Sap.File.Save(filepath)
             else:
                 logger.warning("Model is not saved! Saving as default")
-                Saproject().File.Save()
-            Saproject().Analyze.RunAnalysis()
+                self.Sap.File.Save()
+            self.Sap.Analyze.RunAnalysis()
             
         # read axial force
-        Saproject().Scripts.SelectCombo_Case("DEAD")
-        ret = Saproject().Results.Link.Force(link_name,ItemTypeElm="Element")
+        self.Sap.Scripts.SelectCombo_Case("DEAD")
+        ret = self.Sap.Results.Link.Force(link_name,ItemTypeElm="Element")
         if ret[-1] == 0:
             axialF = max([abs(val) for val in ret[7]])
             return axialF
@@ -822,6 +892,7 @@ class Sap_LinkProp_Linear(Sap_Bearing):
     notes: str = "Linear Created by Sap2000py"
     GUID: str = ""
     _instances: ClassVar = weakref.WeakSet()
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def __hash__(self):
         return hash((self.prop_name, tuple(self.DOF), tuple(self.Fixed), frozenset(self.Ke.items()), frozenset(self.Ce.items()), self.dj2, self.dj3, self.notes, self.GUID))
@@ -831,12 +902,11 @@ class Sap_LinkProp_Linear(Sap_Bearing):
     
     @property
     def is_defined(self):
-        ret = Saproject().Define.section.PropLink.Get.Linear(self.prop_name)
-        return ret[-1]==0
+        return self.Sap.ModelCache.link_prop_type(self.prop_name) == LINK_TYPES["Linear"]
     
     def get_LinkProp_from_Sap(self):
         if self.is_defined:
-            ret = Saproject().Define.section.PropLink.Get.Linear(self.prop_name)
+            ret = self.Sap.Define.section.PropLink.Get.Linear(self.prop_name)
             dofdict = ['U1', 'U2', 'U3', 'R1', 'R2', 'R3']
             DOF:list[Literal['U1', 'U2', 'U3', 'R1', 'R2', 'R3']] = [dofdict[i] for i,dof in enumerate(ret[0]) if dof] 
             Fixed:list[Literal['U1', 'U2', 'U3', 'R1', 'R2', 'R3']] = [dofdict[i] for i,dof in enumerate(ret[1]) if dof] 
@@ -854,8 +924,11 @@ class Sap_LinkProp_Linear(Sap_Bearing):
             return None
     
     def define_link(self):
-        if not self.is_defined:
-            ret = Saproject().Define.section.PropLink.Set.Linear(self.prop_name, DOF=self.DOF, Fixed=self.Fixed, Ke=self.Ke, Ce = self.Ce, dj2=self.dj2, dj3=self.dj3,KeCoupled=self.KeCoupled,CeCoupled=self.CeCoupled, Notes=self.notes)
+        step = self.build_step("LinkProp", self.prop_name, self)
+        if step == SAME:
+            return
+        if step == CHANGED or not self.is_defined:
+            ret = self.Sap.Define.section.PropLink.Set.Linear(self.prop_name, DOF=self.DOF, Fixed=self.Fixed, Ke=self.Ke, Ce = self.Ce, dj2=self.dj2, dj3=self.dj3,KeCoupled=self.KeCoupled,CeCoupled=self.CeCoupled, Notes=self.notes)
             if ret[-1]==0:
                 logger.opt(colors=True).info(f"LinearLink Property <yellow>{self.prop_name}</yellow> defined.")
 
@@ -864,8 +937,9 @@ class Sap_LinkProp_Linear(Sap_Bearing):
         return list(cls._instances)
 
 class Sap_Bearing_Linear(Sap_LinkProp_Linear):
-    def __init__(self,name:str, start_point:SapPoint, end_point:SapPoint, linkprop_name:str):
+    def __init__(self,name:str, start_point:SapPoint, end_point:SapPoint, linkprop_name:str, project: Optional[Saproject] = None):
         self.name = name
+        self.project = project
         self.start_point = start_point
         self.end_point = end_point
         self.linkprop_name = linkprop_name
@@ -895,6 +969,7 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
     notes: str = "MultiLinear Created by Sap2000py"
     GUID: str = ""
     _instances: ClassVar = weakref.WeakSet()
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def __hash__(self) -> int:
         return hash((self.prop_name, tuple(self.DOF), tuple(self.Fixed), tuple(self.NonLinear), frozenset(self.Ke.items()), frozenset(self.Ce.items()), self.dj2, self.dj3, self.notes, self.GUID))
@@ -904,12 +979,11 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
     
     @property
     def is_defined(self):
-        ret = Saproject().Define.section.PropLink.Get.MultiLinearElastic(self.prop_name)
-        return ret[-1]==0
+        return self.Sap.ModelCache.link_prop_type(self.prop_name) == LINK_TYPES["MultiLinearElastic"]
     
     def get_LinkProp_from_Sap(self):
         if self.is_defined:
-            ret = Saproject().Define.section.PropLink.Get.MultiLinearElastic(self.prop_name)
+            ret = self.Sap.Define.section.PropLink.Get.MultiLinearElastic(self.prop_name)
             dofdict = ['U1', 'U2', 'U3', 'R1', 'R2', 'R3']
             DOF:list[Literal['U1', 'U2', 'U3', 'R1', 'R2', 'R3']] = [dofdict[i] for i,dof in enumerate(ret[0]) if dof] 
             Fixed:list[Literal['U1', 'U2', 'U3', 'R1', 'R2', 'R3']] = [dofdict[i] for i,dof in enumerate(ret[1]) if dof] 
@@ -926,7 +1000,7 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
             return None
     
     def __define_link(self):
-        ret = Saproject().Define.section.PropLink.Set.MultiLinearElastic(self.prop_name, DOF=self.DOF, Fixed=self.Fixed, NonLinear = list(self.NonLinear.keys()),Ke=self.Ke,Ce=self.Ce,dj2=self.dj2,dj3=self.dj3,Notes=self.notes)
+        ret = self.Sap.Define.section.PropLink.Set.MultiLinearElastic(self.prop_name, DOF=self.DOF, Fixed=self.Fixed, NonLinear = list(self.NonLinear.keys()),Ke=self.Ke,Ce=self.Ce,dj2=self.dj2,dj3=self.dj3,Notes=self.notes)
         return ret
     
     def __define_NonLinear_points(self):
@@ -936,7 +1010,7 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
         for dof,pointsdict in self.NonLinear.items():
             forcelist = pointsdict['forcelist']
             displist = pointsdict['displist']
-            ret = Saproject().Define.section.PropLink.Set.MultiLinearPoints(self.prop_name, dof, forcelist, displist, Type='Isotropic')
+            ret = self.Sap.Define.section.PropLink.Set.MultiLinearPoints(self.prop_name, dof, forcelist, displist, Type='Isotropic')
             points = "["+", ".join(f"({d:.2f},{f:.2f})" for d,f in zip(displist,forcelist))+"]"
             if ret[-1]==0:
                 logger.opt(colors=True).success(f"Link Property <yellow>{self.prop_name}</yellow> updated with points:{points}.")
@@ -944,7 +1018,10 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
                 logger.opt(colors=True).error(f"Link Property <yellow>{self.prop_name}</yellow> failed to update with points:{points}.")
     
     def define_link(self):
-        if not self.is_defined:
+        step = self.build_step("LinkProp", self.prop_name, self)
+        if step == SAME:
+            return
+        if step == CHANGED or not self.is_defined:
             ret = self.__define_link()
             if ret[-1] == 0:
                 logger.opt(colors=True).success(f"Multi Elastic Linear Link Property <yellow>{self.prop_name}</yellow> defined.")
@@ -992,8 +1069,9 @@ class Sap_LinkProp_MultiLinearElastic(Sap_Bearing):
         return list(cls._instances)
 
 class Sap_Bearing_MultiLinearElastic(Sap_LinkProp_MultiLinearElastic):
-    def __init__(self,name:str,start_point:SapPoint,end_point:SapPoint,linkprop_name:str):
+    def __init__(self,name:str,start_point:SapPoint,end_point:SapPoint,linkprop_name:str, project: Optional[Saproject] = None):
         self.name = name
+        self.project = project
         self.start_point = start_point
         self.end_point = end_point
         self.linkprop_name = linkprop_name
@@ -1014,8 +1092,8 @@ class Sap_Bearing_MultiLinearElastic(Sap_LinkProp_MultiLinearElastic):
             ultimate_disp (float, optional): _description_. Defaults to 1 m.
 
         """
-        if Saproject().Units != 'KN_m_C':
-            Saproject().setUnits('KN_m_C')
+        if self.Sap.Units != 'KN_m_C':
+            self.Sap.setUnits('KN_m_C')
         yield_force = self.AxialF_under_dead_weight(self.name) * mu
         forcelist = [-yield_force,-yield_force,0,yield_force,yield_force]
         displist = [-ultimate_disp,-yield_disp,0,yield_disp,ultimate_disp]
@@ -1032,8 +1110,11 @@ class Sap_Bearing_MultiLinearElastic(Sap_LinkProp_MultiLinearElastic):
             NotImplementedError: _description_
         """
         existing_link = self.get_link_between_points(self.start_point,self.end_point)[0]
-        existing_linkprop = Saproject()._Model.LinkObj.GetProperty(existing_link)[0]
-        [link_type,ret] = Saproject().Define.section.PropLink.Get.TypeOAPI(existing_linkprop)
+        existing_linkprop = self.Sap._Model.LinkObj.GetProperty(existing_link)[0]
+        if existing_linkprop == self.linkprop_name:
+            # already converted by an earlier build of this model (incremental rebuild), start from the linear link again
+            existing_linkprop = getattr(self, "converted_from", existing_linkprop)
+        [link_type,ret] = self.Sap.Define.section.PropLink.Get.TypeOAPI(existing_linkprop)
         if ret==0 and link_type == 'Linear':
             existing_link_instance = [link for link in Sap_LinkProp_Linear.get_instances() if link.prop_name == existing_linkprop][0]
             if isinstance(existing_link_instance, Sap_LinkProp_Linear):
@@ -1063,11 +1144,13 @@ class Sap_Bearing_MultiLinearElastic(Sap_LinkProp_MultiLinearElastic):
         """
         little different from Sap_Bearing.add_link,this function checks if link already exists, if yes, remove the previous one first.
         """
+        if self._link_step() == SAME:
+            return
         exist_link = self.get_link_between_points(self.start_point,self.end_point)
         if exist_link:
             for link in exist_link:
-                Saproject().Assign.Link.Delete(link)
-        super().add_link()
+                self.Sap.Assign.Link.Delete(link)
+        self._add_link()
 
 @dataclass
 class Sap_LinkProp_PlasticWen(Sap_Bearing):
@@ -1085,6 +1168,7 @@ class Sap_LinkProp_PlasticWen(Sap_Bearing):
     dj3: float = 0.0
     notes: str = "PlasticWen Created by Sap2000py."
     _instances: ClassVar = weakref.WeakSet()
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def __hash__(self):
         return hash((
@@ -1108,11 +1192,10 @@ class Sap_LinkProp_PlasticWen(Sap_Bearing):
 
     @property
     def is_defined(self):
-        ret = Saproject().Define.section.PropLink.Get.PlasticWen(self.prop_name)
-        return ret[-1]==0
+        return self.Sap.ModelCache.link_prop_type(self.prop_name) == LINK_TYPES["PlasticWen"]
 
     def __define_link(self):
-        ret = Saproject().Define.section.PropLink.Set.PlasticWen(
+        ret = self.Sap.Define.section.PropLink.Set.PlasticWen(
             self.prop_name,
             DOF=self.DOF,
             Fixed=self.Fixed,
@@ -1130,7 +1213,10 @@ class Sap_LinkProp_PlasticWen(Sap_Bearing):
         return ret
     
     def define_link(self):
-        if not self.is_defined:
+        step = self.build_step("LinkProp", self.prop_name, self)
+        if step == SAME:
+            return
+        if step == CHANGED or not self.is_defined:
             ret = self.__define_link()
             if ret[-1] == 0:
                 logger.opt(colors=True).success(f"Multi Elastic Linear Link Property <yellow>{self.prop_name}</yellow> defined.")
@@ -1205,8 +1291,10 @@ class Sap_Bearing_PlasticWen(Sap_LinkProp_PlasticWen):
     def __init__(self, name: str,
                  start_point: SapPoint,
                  end_point: SapPoint,
-                 linkprop_name: str):
+                 linkprop_name: str,
+                 project: Optional[Saproject] = None):
         self.name = name
+        self.project = project
         self.start_point = start_point
         self.end_point = end_point
         self.linkprop_name = linkprop_name
@@ -1246,8 +1334,11 @@ class Sap_Bearing_PlasticWen(Sap_LinkProp_PlasticWen):
             NotImplementedError: If the link type is not supported.
         """
         existing_link = self.get_link_between_points(self.start_point, self.end_point)[0]
-        existing_linkprop = Saproject()._Model.LinkObj.GetProperty(existing_link)[0]
-        [link_type, ret] = Saproject().Define.section.PropLink.Get.TypeOAPI(existing_linkprop)
+        existing_linkprop = self.Sap._Model.LinkObj.GetProperty(existing_link)[0]
+        if existing_linkprop == self.linkprop_name:
+            # already converted by an earlier build of this model (incremental rebuild), start from the linear link again
+            existing_linkprop = getattr(self, "converted_from", existing_linkprop)
+        [link_type, ret] = self.Sap.Define.section.PropLink.Get.TypeOAPI(existing_linkprop)
         
         if ret == 0 and link_type == 'Linear':
             existing_prop_instance = next(
@@ -1299,13 +1390,15 @@ class Sap_Bearing_PlasticWen(Sap_LinkProp_PlasticWen):
         """
         little different from Sap_Bearing.add_link,this function checks if link already exists, if yes, remove the previous one first.
         """
+        if self._link_step() == SAME:
+            return
         exist_link = self.get_link_between_points(self.start_point,self.end_point)
         if exist_link:
             for link in exist_link:
-                Saproject().Assign.Link.Delete(link)
-        super().add_link()
+                self.Sap.Assign.Link.Delete(link)
+        self._add_link()
 
-class Sap_Girder:
+class Sap_Girder(ProjectBound):
     def __init__(self):
         logger.error('Sap_Girder is a abstract class!Should not be instantiated!')
         raise ShouldNotInstantiateError('Abstract class Sap_Girder accidentally instantiated!')
@@ -1357,6 +1450,7 @@ class Sap_Girder:
                                                                         DOF=linear_link.linkprop_instance.DOF,Fixed=linear_link.linkprop_instance.Fixed,NonLinear={},Ke=linear_link.linkprop_instance.Ke,Ce=linear_link.linkprop_instance.Ce,dj2=linear_link.linkprop_instance.dj2,dj3=linear_link.linkprop_instance.dj3,notes=f"Converted from {linear_link.linkprop_instance.prop_name}")
             new_MultiElastic_link = Sap_Bearing_MultiLinearElastic(new_link_name,
                                                                 linear_link.start_point,linear_link.end_point,linkprop_name=new_linkprop_name)
+            new_MultiElastic_link.converted_from = linear_link.linkprop_name
             new_MultiElastic_link.update_yield_prop_for_existing_linear_link(*args,**kwargs)
             return new_MultiElastic_link
         elif link_type == 'PlasticWen':
@@ -1371,6 +1465,7 @@ class Sap_Girder:
                                                             dj2=linear_link.linkprop_instance.dj2,dj3=linear_link.linkprop_instance.dj3,notes=f"Converted from {linear_link.linkprop_instance.prop_name}")
             new_PlasticWen_link = Sap_Bearing_PlasticWen(new_link_name,
                                                         linear_link.start_point,linear_link.end_point,linkprop_name=new_linkprop_name)
+            new_PlasticWen_link.converted_from = linear_link.linkprop_name
             ignore_flag = kwargs.get('FrictionPendulum', False) # if True, 认为是摩擦摆支座，放开所有水平自由度
             new_PlasticWen_link.update_yield_prop_for_existing_linear_link(ignore_freeF=ignore_flag, *args, **kwargs)
             return new_PlasticWen_link
@@ -1382,9 +1477,11 @@ class Sap_Girder:
             if not point.exists():
                 logger.opt(colors=True).warning(f"<yellow>{point.name}</yellow> Accidentally does not exist!")
                 point.add()
+        if self.build_step("Constraint", constraint_name, [p.name for p in points]) == SAME:
+            return
                 
-        Saproject().Scripts.Group.AddtoGroup(constraint_name,[p.name for p in points], type='Point')
-        ret = Saproject().Assign.PointObj.Set.Constraint(constraint_name,constraint_name,ItemType = 1, Replace=False)
+        self.Sap.Scripts.Group.AddtoGroup(constraint_name,[p.name for p in points], type='Point')
+        ret = self.Sap.Assign.PointObj.Set.Constraint(constraint_name,constraint_name,ItemType = 1, Replace=False)
         if ret[-1] == 0:
             logger.opt(colors=True).success(f"<yellow>{[p.name for p in points]}</yellow> added to constraint : <yellow>{constraint_name}</yellow>")
         else:
@@ -1407,28 +1504,30 @@ class Sap_Box_Girder(Sap_Girder):
     Plan:Literal['方案一','方案二','方案三'] = '方案一'
     DefaultSpan:float = 0.0 # if only one pier for this girder, this value will be used to calculate concentrated mass
     spanCount:int = 1 # only useful for one pier girder, this value will be used to calculate concentrated mass along the bridge
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
            
     def __post_init__(self):
-        # sort pierlist by station
-        self.pierlist = sorted(self.pierlist, key=lambda x: x.station)
-        # makesure the 1st and last pier is intermediate pier
-        if self.pierlist[0].is_intermediate_pier and self.pierlist[-1].is_intermediate_pier:
-            if any([pier.is_intermediate_pier for pier in self.pierlist[1:-1]]):
-                logger.opt(colors=True).error(f"Intermediate pier must be the 1st and last pier. Please check pier: <yellow>{[pier.name for pier in self.pierlist[1:-1] if pier.is_intermediate_pier]}</yellow>")
-                return
-        self.start_intermediate_pier = self.pierlist[0]
-        self.end_intermediate_pier = self.pierlist[-1]
-        self.generate_girder_points()
-        self.girder_section = self.get_girder_section()
-        if len(self.pierlist) > 1:
-            self.generate_girder_elements()
-        else:
-            self.add_mass_for_concentrated_girder()
-            self.add_restraints_for_concentrated_girder()
-        self.add_rigid_link(mode='RigidFrame')
-        # self.add_rigid_link(mode='Body')
-        # self.add_bearing_links(strategy='ideal')
-        Saproject().RefreshView()
+        with self.activate():
+            # sort pierlist by station
+            self.pierlist = sorted(self.pierlist, key=lambda x: x.station)
+            # makesure the 1st and last pier is intermediate pier
+            if self.pierlist[0].is_intermediate_pier and self.pierlist[-1].is_intermediate_pier:
+                if any([pier.is_intermediate_pier for pier in self.pierlist[1:-1]]):
+                    logger.opt(colors=True).error(f"Intermediate pier must be the 1st and last pier. Please check pier: <yellow>{[pier.name for pier in self.pierlist[1:-1] if pier.is_intermediate_pier]}</yellow>")
+                    return
+            self.start_intermediate_pier = self.pierlist[0]
+            self.end_intermediate_pier = self.pierlist[-1]
+            self.generate_girder_points()
+            self.girder_section = self.get_girder_section()
+            if len(self.pierlist) > 1:
+                self.generate_girder_elements()
+            else:
+                self.add_mass_for_concentrated_girder()
+                self.add_restraints_for_concentrated_girder()
+            self.add_rigid_link(mode='RigidFrame')
+            # self.add_rigid_link(mode='Body')
+            # self.add_bearing_links(strategy='ideal')
+            self.Sap.RefreshView()
     
     def add_restraints_for_concentrated_girder(self):
         pier = self.pierlist[0]
@@ -1448,65 +1547,67 @@ class Sap_Box_Girder(Sap_Girder):
         """update bilinear ideal links for girder
         mu(float): frictional coefficient
         """
-        
-        for pier in self.pierlist:
-            bearings = self.bearings[pier.name]
-            for side in ['left','right']:
-                linksdict = {}
-                for key,link in bearings[side].items():
-                    new_link = self._update_ideal_link2bilinear_link(link,link_type=link_type,*args,**kwargs)
-                    linksdict.update({key:new_link})
-                self.bearings[pier.name][side] = linksdict
+        with self.activate():
+            for pier in self.pierlist:
+                bearings = self.bearings[pier.name]
+                for side in ['left','right']:
+                    linksdict = {}
+                    for key,link in bearings[side].items():
+                        new_link = self._update_ideal_link2bilinear_link(link,link_type=link_type,*args,**kwargs)
+                        linksdict.update({key:new_link})
+                    self.bearings[pier.name][side] = linksdict
     
     def update_links_in_Sap(self):
         """update bilinear ideal links for girder in sap
         """
-        if Saproject().is_locked:
-            Saproject().unlockModel()
+        with self.activate():
+            if self.Sap.is_locked:
+                self.Sap.unlockModel()
             
-        for pier in self.pierlist:
-            bearings = self.bearings[pier.name]
-            for side in ['left','right']:
-                for link in bearings[side].values():
-                    link.linkprop_instance.define_link()
-                    link.add_link()
+            for pier in self.pierlist:
+                bearings = self.bearings[pier.name]
+                for side in ['left','right']:
+                    for link in bearings[side].values():
+                        link.linkprop_instance.define_link()
+                        link.add_link()
     
     def add_ideal_bearing_links(self):
-        fixed_link, y_sliding_link, x_sliding_link, both_sliding_link = self._define_ideal_links()
-        if not hasattr(self, "bearings"):
-            self.bearings = {}
-        # 所有墩默认内侧用固定，外侧用滑动
-        for pier in self.pierlist:
-            if pier.name not in self.bearings.keys():
-                self.bearings[pier.name] = {}
-            for side in ['left','right']:
-                if side not in self.bearings[pier.name].keys():
-                    self.bearings[pier.name][side] = {}
+        with self.activate():
+            fixed_link, y_sliding_link, x_sliding_link, both_sliding_link = self._define_ideal_links()
+            if not hasattr(self, "bearings"):
+                self.bearings = {}
+            # 所有墩默认内侧用固定，外侧用滑动
+            for pier in self.pierlist:
+                if pier.name not in self.bearings.keys():
+                    self.bearings[pier.name] = {}
+                for side in ['left','right']:
+                    if side not in self.bearings[pier.name].keys():
+                        self.bearings[pier.name][side] = {}
                 
-                x_fixed = pier in self.fixedpier
-                if x_fixed:
-                    inner_link = fixed_link
-                    outer_link = y_sliding_link
-                else:
-                    inner_link = x_sliding_link
-                    outer_link = both_sliding_link
+                    x_fixed = pier in self.fixedpier
+                    if x_fixed:
+                        inner_link = fixed_link
+                        outer_link = y_sliding_link
+                    else:
+                        inner_link = x_sliding_link
+                        outer_link = both_sliding_link
                     
-                inner_bearing_top = self.girder_bearing_top_points[pier.name][side]['inner']
-                if isinstance(pier.bearing_bottom_point_inner[side],list):
-                    inner_bearing_bottom = [p for p in pier.bearing_bottom_point_inner[side] if p.x == inner_bearing_top.x][0]
-                else:
-                    inner_bearing_bottom = pier.bearing_bottom_point_inner[side]
+                    inner_bearing_top = self.girder_bearing_top_points[pier.name][side]['inner']
+                    if isinstance(pier.bearing_bottom_point_inner[side],list):
+                        inner_bearing_bottom = [p for p in pier.bearing_bottom_point_inner[side] if p.x == inner_bearing_top.x][0]
+                    else:
+                        inner_bearing_bottom = pier.bearing_bottom_point_inner[side]
 
-                link_inner = Sap_Bearing_Linear(f"{self.name}_{pier.name}_{side}_inner_Bearing", inner_bearing_bottom, inner_bearing_top, inner_link.prop_name)
+                    link_inner = Sap_Bearing_Linear(f"{self.name}_{pier.name}_{side}_inner_Bearing", inner_bearing_bottom, inner_bearing_top, inner_link.prop_name)
                 
-                outer_bearing_top = self.girder_bearing_top_points[pier.name][side]['outer']
-                if isinstance(pier.bearing_bottom_point_outer[side],list):
-                    outer_bearing_bottom = [p for p in pier.bearing_bottom_point_outer[side] if p.x == inner_bearing_top.x][0]
-                else:
-                    outer_bearing_bottom = pier.bearing_bottom_point_outer[side]
-                link_outer = Sap_Bearing_Linear(f"{self.name}_{pier.name}_{side}_outer_Bearing", outer_bearing_bottom, outer_bearing_top, outer_link.prop_name)
+                    outer_bearing_top = self.girder_bearing_top_points[pier.name][side]['outer']
+                    if isinstance(pier.bearing_bottom_point_outer[side],list):
+                        outer_bearing_bottom = [p for p in pier.bearing_bottom_point_outer[side] if p.x == inner_bearing_top.x][0]
+                    else:
+                        outer_bearing_bottom = pier.bearing_bottom_point_outer[side]
+                    link_outer = Sap_Bearing_Linear(f"{self.name}_{pier.name}_{side}_outer_Bearing", outer_bearing_bottom, outer_bearing_top, outer_link.prop_name)
                 
-                self.bearings[pier.name][side] = {'inner':link_inner, 'outer':link_outer}
+                    self.bearings[pier.name][side] = {'inner':link_inner, 'outer':link_outer}
         
     def add_rigid_link(self, mode:Literal['RigidFrame','Equal','Body']='Body'):
         rigid_dof = ["UX", "UY", "UZ", "RX", "RY", "RZ"]
@@ -1521,11 +1622,11 @@ class Sap_Box_Girder(Sap_Girder):
                         SapFrame.rigid_link(point1 = girder_point, point2 = point)  
                 else:
                     if mode == 'Equal':
-                        Saproject().Define.joint_constraints.Set.Equal(f"{pier.name}_{side}_Girder", rigid_dof)
+                        self.Sap.Define.joint_constraints.Set.Equal(f"{pier.name}_{side}_Girder", rigid_dof)
                         self._add_constraint_for_points(pier.name+"_"+side+"_girder", flatten([girder_point, bearing_top_points]))
                     elif mode == 'Body':
                         body_prop = f"{pier.name}_{side}_Girder"
-                        Saproject().Define.joint_constraints.Set.Body(body_prop, rigid_dof)
+                        self.Sap.Define.joint_constraints.Set.Body(body_prop, rigid_dof)
                         self._add_constraint_for_points(body_prop, flatten([girder_point, bearing_top_points]))
                 
     def generate_girder_elements(self):
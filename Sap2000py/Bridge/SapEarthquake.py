@@ -2,18 +2,20 @@ from dataclasses import dataclass
 from pathlib import Path
 from loguru import logger
 from Sap2000py import Saproject
-from typing import Literal, Tuple
+from Sap2000py.Saproject import ProjectBound
+from typing import Literal, Optional, Tuple
 from dataclasses import dataclass, field
 from typing import List
 import numpy as np
 
 
 @dataclass
-class SapSpectrumFunc:
+class SapSpectrumFunc(ProjectBound):
     name: str
     times: List[float] = field(default_factory=list)
     values: List[float] = field(default_factory=list)
     damping: float = 0.05
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def get_from_file(self,file_path:Path = Path('../../Examples/ResponseSpectrum_E2_Damping_0.02.txt')):
         times = []
@@ -45,33 +47,34 @@ class SapSpectrumFunc:
         if len(self.times) == 0 or len(self.values) == 0 or len(self.times) != len(self.values):
             logger.error(f"Please check the times and values of the spectrum function! Using Default Spectrum Example in {self.get_from_file()}")
         
-        ret = Saproject().Define.function.ResponseSpectrum.Set_User(self.name,self.times,self.values,self.damping)
+        ret = self.Sap.Define.function.ResponseSpectrum.Set_User(self.name,self.times,self.values,self.damping)
         if ret[-1]==0:
             logger.opt(colors=True).success(f"Response Spectrum Function <yellow>{self.name}</yellow> with damping <yellow>{self.damping}</yellow> defined!")
         else:
             logger.opt(colors=True).error(f"Response Spectrum Function <yellow>{self.name}</yellow> with damping <yellow>{self.damping}</yellow> Failed to define!")
 
 @dataclass
-class SapSpectrumCase:
+class SapSpectrumCase(ProjectBound):
     name: str
     damping: float = 0.05
     CombMethod: Literal['SRSS', 'ABS', 'CQC3'] = 'SRSS'
     Loads: dict[Literal['LoadName', 'LoadFunc', 'LoadSF']] = field(default_factory=dict)
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def define(self):
-        ret = Saproject().Define.loadcases.ResponseSpectrum.SetCase(self.name)
+        ret = self.Sap.Define.loadcases.ResponseSpectrum.SetCase(self.name)
         if ret==0:
             logger.opt(colors=True).success(f"Response Spectrum Case <yellow>{self.name}</yellow> defined!")
         else:
             logger.opt(colors=True).error(f"Response Spectrum Case <yellow>{self.name}</yellow> Failed to define!")
             
-        ret = Saproject().Define.loadcases.ResponseSpectrum.SetDampConstant(self.name,self.damping)
+        ret = self.Sap.Define.loadcases.ResponseSpectrum.SetDampConstant(self.name,self.damping)
         if ret==0:
             logger.opt(colors=True).success(f"Response Spectrum Case <yellow>{self.name}</yellow> damping set as <yellow>{self.damping}</yellow>!")
         else:
             logger.opt(colors=True).error(f"Response Spectrum Case <yellow>{self.name}</yellow> damping failed to set as <yellow>{self.damping}</yellow>!")
         
-        ret = Saproject().Define.loadcases.ResponseSpectrum.SetDirComb(self.name,CombMethod=self.CombMethod)
+        ret = self.Sap.Define.loadcases.ResponseSpectrum.SetDirComb(self.name,CombMethod=self.CombMethod)
         if ret==0:
             logger.opt(colors=True).success(f"Response Spectrum Case <yellow>{self.name}</yellow> Combination Method set as <yellow>{self.CombMethod}</yellow>!")
         else:
@@ -81,7 +84,7 @@ class SapSpectrumCase:
         LoadFunc = self.Loads['LoadFunc']
         LoadSF = self.Loads['LoadSF']
         NumberLoads = len(LoadName)
-        ret = Saproject().Define.loadcases.ResponseSpectrum.SetLoads(self.name,NumberLoads=NumberLoads,LoadName=LoadName,Func=LoadFunc,SF=LoadSF)
+        ret = self.Sap.Define.loadcases.ResponseSpectrum.SetLoads(self.name,NumberLoads=NumberLoads,LoadName=LoadName,Func=LoadFunc,SF=LoadSF)
         if ret[-1]==0:
             logger.opt(colors=True).success(f"Response Spectrum Case <yellow>{self.name}</yellow> Loads set!")
         else:
@@ -92,11 +95,12 @@ class SapSpectrum:
     Case = SapSpectrumCase
 
 @dataclass
-class SapTimeHistoryFunc:
+class SapTimeHistoryFunc(ProjectBound):
     name: str
     times: List[float] = field(default_factory=list)
     values: List[float] = field(default_factory=list)
     g: float = 9.81
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
 
     def unit_convert(self,origin_unit:Literal['m/s^2','cm/s^2','g'],target:Literal['m/s^2','cm/s^2','g'] = 'g'):
         """_summary_
@@ -348,7 +352,7 @@ class SapTimeHistoryFunc:
         if len(self.times) == 0 or len(self.values) == 0 or len(self.times) != len(self.values):
             logger.error(f"Please check the times and values of the time history function! Using Default Time History Example in {self.get_from_file()}")
         
-        ret = Saproject().Define.function.TimeHistory.Set_User(self.name,self.times,self.values)
+        ret = self.Sap.Define.function.TimeHistory.Set_User(self.name,self.times,self.values)
         if ret[-1]==0:
             logger.opt(colors=True).success(f"Time History Function <yellow>{self.name}</yellow> defined!")
         else:
@@ -366,27 +370,28 @@ class SapTimeHistoryFunc:
         return funcs
 
 @dataclass
-class SapModalTimeHistoryCase:
+class SapModalTimeHistoryCase(ProjectBound):
     name: str
     damping: float = 0.05
     nstep: int = 8192
     dt: float = 0.02
     Loads: dict[Literal['LoadName','LoadType', 'LoadFunc', 'LoadSF']] = field(default_factory=dict)
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def define(self):
-        ret = Saproject().Define.loadcases.ModalHistNonLinear.SetCase(self.name)
+        ret = self.Sap.Define.loadcases.ModalHistNonLinear.SetCase(self.name)
         if ret==0:
             logger.opt(colors=True).success(f"Modal Time History Case <yellow>{self.name}</yellow> defined!")
         else:
             logger.opt(colors=True).error(f"Modal Time History Case <yellow>{self.name}</yellow> Failed to define!")
             
-        ret = Saproject().Define.loadcases.ModalHistNonLinear.SetDampConstant(self.name,self.damping)
+        ret = self.Sap.Define.loadcases.ModalHistNonLinear.SetDampConstant(self.name,self.damping)
         if ret==0:
             logger.opt(colors=True).success(f"Modal Time History Case <yellow>{self.name}</yellow> damping set as <yellow>{self.damping}</yellow>!")
         else:
             logger.opt(colors=True).error(f"Modal Time History Case <yellow>{self.name}</yellow> damping failed to set as <yellow>{self.damping}</yellow>!")
         
-        ret = Saproject().Define.loadcases.ModalHistNonLinear.SetTimeStep(self.name,nstep=self.nstep, dt=self.dt)
+        ret = self.Sap.Define.loadcases.ModalHistNonLinear.SetTimeStep(self.name,nstep=self.nstep, dt=self.dt)
         if ret==0:
             logger.opt(colors=True).success(f"Modal Time History Case <yellow>{self.name}</yellow> Time Step set as <yellow>{self.dt}</yellow>s!")
         else:
@@ -397,7 +402,7 @@ class SapModalTimeHistoryCase:
         LoadFunc = self.Loads['LoadFunc']
         LoadSF = self.Loads['LoadSF']
         NumberLoads = len(LoadName)
-        ret = Saproject().Define.loadcases.ModalHistNonLinear.SetLoads(self.name,NumberLoads=NumberLoads,LoadName=LoadName,LoadType = LoadType,Func=LoadFunc,SF=LoadSF)
+        ret = self.Sap.Define.loadcases.ModalHistNonLinear.SetLoads(self.name,NumberLoads=NumberLoads,LoadName=LoadName,LoadType = LoadType,Func=LoadFunc,SF=LoadSF)
         if ret[-1]==0:
             logger.opt(colors=True).success(f"Modal Time History Case <yellow>{self.name}</yellow> Loads set!")
         else:
@@ -405,25 +410,26 @@ class SapModalTimeHistoryCase:
 
     
 @dataclass
-class SapDirTimeHistoryCase:
+class SapDirTimeHistoryCase(ProjectBound):
     name : str
     IntegrationMethod: Literal['Newmark','Wilson','Collocation','Hilber-Hughes-Taylor','Chung and Hulbert'] = 'Newmark'
     Loads: dict[Literal['LoadName','LoadType', 'LoadFunc', 'LoadSF']] = field(default_factory=dict)
+    project: Optional[Saproject] = field(default=None, repr=False, compare=False)
     
     def define(self):
-        ret = Saproject().Define.loadcases.DirHistNonLinear.SetCase(self.name)
+        ret = self.Sap.Define.loadcases.DirHistNonLinear.SetCase(self.name)
         if ret==0:
             logger.opt(colors=True).success(f"Dir Time History Case <yellow>{self.name}</yellow> defined!")
         else:
             logger.opt(colors=True).error(f"Dir Time History Case <yellow>{self.name}</yellow> Failed to define!")
             
-        ret = Saproject().Define.loadcases.DirHistNonLinear.SetTimeIntegration(self.name,self.IntegrationMethod)
+        ret = self.Sap.Define.loadcases.DirHistNonLinear.SetTimeIntegration(self.name,self.IntegrationMethod)
         if ret==0:
             logger.opt(colors=True).success(f"Dir Time History Case <yellow>{self.name}</yellow> Integration Method set as <yellow>{self.IntegrationMethod}</yellow>!")
         else:
             logger.opt(colors=True).error(f"Dir Time History Case <yellow>{self.name}</yellow> Integration Method failed to set as <yellow>{self.IntegrationMethod}</yellow>!")
             
-        ret = Saproject().Define.loadcases.DirHistNonLinear.SetLoads(self.name,NumberLoads=len(self.Loads['LoadName']),LoadName=self.Loads['LoadName'],LoadType=self.Loads['LoadType'],Func=self.Loads['LoadFunc'],SF=self.Loads['LoadSF'])
+        ret = self.Sap.Define.loadcases.DirHistNonLinear.SetLoads(self.name,NumberLoads=len(self.Loads['LoadName']),LoadName=self.Loads['LoadName'],LoadType=self.Loads['LoadType'],Func=self.Loads['LoadFunc'],SF=self.Loads['LoadSF'])
         if ret[-1]==0:
             logger.opt(colors=True).success(f"Dir Time History Case <yellow>{self.name}</yellow> Loads set!")
         else:
@@ -441,7 +447,7 @@ class SapDirTimeHistoryCase:
             Dampd1 (float, optional): damping for 1st mode. Defaults to 0.05.
             Dampd2 (float, optional): damping for 2nd mode. Defaults to 0.05.
         """
-        ret = Saproject().Define.loadcases.DirHistNonLinear.SetDampProportional(self.name,DampType=DampType,Dampa=Dampa, Dampb=Dampb, Dampf1=Dampf1, Dampf2=Dampf2,Dampd1= Dampd1,Dampd2= Dampd2)
+        ret = self.Sap.Define.loadcases.DirHistNonLinear.SetDampProportional(self.name,DampType=DampType,Dampa=Dampa, Dampb=Dampb, Dampf1=Dampf1, Dampf2=Dampf2,Dampd1= Dampd1,Dampd2= Dampd2)
         if ret==0:
             logger.opt(colors=True).success(f"Dir Time History Case <yellow>{self.name}</yellow> Damping set!")
         else:
@@ -0,0 +1,393 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+from Sap2000py.SapProfiler import ModelProxy, remove_proxy
+
+# database tables written by the bulk builder: key fields, fields, in import order
+TABLES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "Joint Coordinates": (("Joint",), ("Joint", "CoordSys", "CoordType", "XorR", "Y", "Z")),
+    "Joint Restraint Assignments": (("Joint",), ("Joint", "U1", "U2", "U3", "R1", "R2", "R3")),
+    "Joint Added Mass Assignments": (("Joint",), ("Joint", "CoordSys", "Mass1", "Mass2", "Mass3",
+                                                  "MMI1", "MMI2", "MMI3")),
+    "Connectivity - Frame": (("Frame",), ("Frame", "JointI", "JointJ")),
+    "Frame Section Assignments": (("Frame",), ("Frame", "AnalSect")),
+    "Frame Added Mass Assignments": (("Frame",), ("Frame", "MassPerLen")),
+    "Connectivity - Link": (("Link",), ("Link", "JointI", "JointJ")),
+    "Link Property Assignments": (("Link",), ("Link", "LinkType", "LinkProp")),
+    "Groups 2 - Assignments": (("GroupName", "ObjectType", "ObjectLabel"), ("GroupName", "ObjectType", "ObjectLabel")),
+}
+# tables that create objects, an existing name is an error instead of an update
+CREATION_TABLES = ("Joint Coordinates", "Connectivity - Frame", "Connectivity - Link")
+GROUP_OBJECT_TYPES = {"PointObj": "Joint", "FrameObj": "Frame", "LinkObj": "Link"}
+# calls that never depend on queued objects, passed through without flushing
+NO_FLUSH = ("Prop", "LoadPatterns.", "LoadCases.", "RespCombo.", "Func.", "GroupDef.SetGroup",
+            "GroupDef.GetNameList")
+
+
+@dataclass
+class TableReport:
+    """Outcome of importing one database table."""
+
+    table: str
+    records: int
+    fatal: int = 0
+    errors: int = 0
+    warnings: int = 0
+    info: int = 0
+    log: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.fatal == 0 and self.errors == 0
+
+
+def _numbers(values) -> np.ndarray:
+    """Floats as the shortest text that reads back to the same value."""
+    values = np.asarray(values, dtype=float)
+    return np.array([repr(v) for v in values.ravel().tolist()], dtype=object).reshape(values.shape)
+
+
+class _Queued:
+    """Stand-in of an API method whose calls are queued by the bulk builder."""
+
+    __slots__ = ("_bulk", "_handler", "_func", "_name")
+
+    def __init__(self, bulk: "SapBulk", handler, func, name: str):
+        self._bulk = bulk
+        self._handler = handler
+        self._func = func
+        self._name = name
+
+    def __call__(self, *args):
+        result = self._handler(*args)
+        if result is None:
+            # not queueable (auto naming, group item types, ...): make the call for real
+            self._bulk.flush()
+            return self._func(*args)
+        # queued objects exist for the model state cache as soon as they are queued
+        self._bulk._Sapobj.ModelCache.observe(self._name, args, result)
+        return result
+
+
+class _Flushing:
+    """Stand-in of any other API method: queued tables are pushed before the call."""
+
+    __slots__ = ("_bulk", "_func")
+
+    def __init__(self, bulk: "SapBulk", func):
+        self._bulk = bulk
+        self._func = func
+
+    def __call__(self, *args):
+        if self._bulk.pending:
+            self._bulk.flush()
+        return self._func(*args)
+
+
+class SapBulk:
+    """Bulk model generation through the database table editing API.
+
+    While active, point, frame and link creation, point restraints, point and
+    frame masses and group assignments made through `_Model` (by SapPoint,
+    SapFrame, the Assign wrappers, Scripts.Group, ...) are not sent one COM
+    call at a time. They are collected in arrays and pushed table by table
+    with `DatabaseTables.SetTableForEditingArray` and `ApplyEditedTables`, and
+    each table's import log goes into `reports`.
+
+    Queued calls answer like SAP2000 would. Any other API call (a read, a
+    selection, RefreshView, ...) pushes the queued tables first, so builder
+    code sees the model it expects. Things the tables cannot express are made
+    as normal calls: objects without a UserName (SAP2000 picks the name),
+    ItemType Group/SelectedObjects and additive masses of objects not created
+    in the block. Group removals are dropped from the group assignment table.
+
+    Points are added as with MergeOff=True: a point at the location of an
+    existing one is not merged into it. A name that is already in the model
+    is reported as an import error, and that row is skipped.
+
+    Example:
+        >>> with Sap.bulk() as bulk:
+        ...     pier.build()
+        ...     girder.build()
+        >>> bulk.ok
+    """
+
+    def __init__(self, Sapobj):
+        """
+        Args:
+            Sapobj: The Saproject the model is built in.
+        """
+        self._Sapobj = Sapobj
+        self._raw = None
+        self._proxy = None
+        self.reports: List[TableReport] = []
+        self._reset()
+        self._handlers = {
+            "PointObj.AddCartesian": self._add_point,
+            "PointObj.SetRestraint": self._restraint,
+            "PointObj.SetMass": self._point_mass,
+            "FrameObj.AddByPoint": self._add_frame,
+            "FrameObj.SetSection": self._frame_section,
+            "FrameObj.SetMass": self._frame_mass,
+            "LinkObj.AddByPoint": self._add_link,
+            "PointObj.SetGroupAssign": self._group_assign("PointObj"),
+            "FrameObj.SetGroupAssign": self._group_assign("FrameObj"),
+            "LinkObj.SetGroupAssign": self._group_assign("LinkObj"),
+        }
+
+    def _reset(self):
+        self.point_names: List[str] = []
+        self.point_xyz: List[Tuple[float, float, float]] = []
+        self.point_csys: List[str] = []
+        self.restraints: Dict[str, Tuple[bool, ...]] = {}
+        self.point_mass: Dict[str, Tuple[str, np.ndarray]] = {}
+        self.frames: Dict[str, Tuple[str, str]] = {}
+        self.frame_sections: Dict[str, str] = {}
+        self.frame_mass: Dict[str, float] = {}
+        self.links: Dict[str, Tuple[str, str, bool]] = {}
+        self.link_props: Dict[str, str] = {}
+        self.groups: Dict[Tuple[str, str, str], None] = {}
+        self.ungroups: Dict[Tuple[str, str, str], None] = {}
+        self._point_set: Dict[str, None] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of queued rows."""
+        return (len(self.point_names) + len(self.restraints) + len(self.point_mass) + len(self.frames)
+                + len(self.frame_sections) + len(self.frame_mass) + len(self.links) + len(self.groups)
+                + len(self.ungroups))
+
+    @property
+    def ok(self) -> bool:
+        """Whether every table imported without errors."""
+        return all(report.ok for report in self.reports)
+
+    # ---- queueing, returning what the COM call would, None when not queueable ----
+    def _add_point(self, x, y, z, Name="", UserName="", CSys="Global", MergeOff=False, MergeNumber=0):
+        if not UserName or UserName in self._point_set:
+            return None
+        self._point_set[UserName] = None
+        self.point_names.append(UserName)
+        self.point_xyz.append((x, y, z))
+        self.point_csys.append(CSys)
+        return [UserName, 0]
+
+    def _restraint(self, Name, Value, ItemType=0):
+        if ItemType != 0:
+            return None
+        self.restraints[Name] = tuple(bool(v) for v in Value)
+        return [Value, 0]
+
+    def _point_mass(self, Name, M, ItemType=0, IsLocalCSys=True, Replace=False):
+        csys = "Local" if IsLocalCSys else "GLOBAL"
+        if ItemType != 0:
+            return None
+        if not Replace:
+            queued = self.point_mass.get(Name)
+            if queued is None and Name not in self._point_set:
+                return None
+            if queued is not None:
+                if queued[0] != csys:
+                    return None
+                self.point_mass[Name] = (csys, queued[1] + np.asarray(M, dtype=float))
+                return [M, 0]
+        self.point_mass[Name] = (csys, np.asarray(M, dtype=float))
+        return [M, 0]
+
+    def _add_frame(self, Point1, Point2, Name="", PropName="Default", UserName=""):
+        if not UserName or UserName in self.frames:
+            return None
+        self.frames[UserName] = (Point1, Point2)
+        if PropName not in ("Default", ""):
+            self.frame_sections[UserName] = PropName
+        return [UserName, 0]
+
+    def _frame_section(self, Name, PropName, ItemType=0, sVarTotalLength=0.0, sVarRelStartLoc=0.0):
+        if ItemType != 0 or sVarTotalLength or sVarRelStartLoc:
+            return None
+        self.frame_sections[Name] = PropName
+        return 0
+
+    def _frame_mass(self, Name, MassOverL, Replace=False, ItemType=0):
+        if ItemType != 0:
+            return None
+        if not Replace:
+            if Name not in self.frame_mass and Name not in self.frames:
+                return None
+            MassOverL += self.frame_mass.get(Name, 0.0)
+        self.frame_mass[Name] = float(MassOverL)
+        return 0
+
+    def _add_link(self, Point1, Point2, Name="", IsSingleJoint=False, PropName="Default", UserName=""):
+        if not UserName or UserName in self.links:
+            return None
+        self.links[UserName] = (Point1, Point1 if IsSingleJoint else Point2, bool(IsSingleJoint))
+        self.link_props[UserName] = PropName
+        return [UserName, 0]
+
+    def _group_assign(self, family: str):
+        objecttype = GROUP_OBJECT_TYPES[family]
+
+        def assign(Name, GroupName, Remove=False, ItemType=0):
+            if ItemType != 0:
+                return None
+            key = (GroupName, objecttype, Name)
+            if Remove:
+                self.groups.pop(key, None)
+                self.ungroups[key] = None
+            else:
+                self.ungroups.pop(key, None)
+                self.groups[key] = None
+            return 0
+
+        return assign
+
+    # ---- ModelProxy hook ----
+    def method(self, func, name: str):
+        handler = self._handlers.get(name)
+        if handler is not None:
+            return _Queued(self, handler, func, name)
+        if name.startswith(NO_FLUSH):
+            return func
+        return _Flushing(self, func)
+
+    # ---- tables ----
+    def _rows(self) -> Dict[str, np.ndarray]:
+        """Queued rows of every table as string arrays, one column per field."""
+        tables = {}
+        if self.point_names:
+            xyz = np.asarray(self.point_xyz, dtype=float).reshape(-1, 3)
+            tables["Joint Coordinates"] = np.column_stack([
+                np.asarray(self.point_names, dtype=object), np.asarray(self.point_csys, dtype=object),
+                np.full(len(xyz), "Cartesian", dtype=object), _numbers(xyz)])
+        if self.restraints:
+            flags = np.asarray(list(self.restraints.values()), dtype=bool)
+            tables["Joint Restraint Assignments"] = np.column_stack([
+                np.asarray(list(self.restraints), dtype=object), np.where(flags, "Yes", "No").astype(object)])
+        if self.point_mass:
+            masses = np.asarray([m for _, m in self.point_mass.values()], dtype=float)
+            tables["Joint Added Mass Assignments"] = np.column_stack([
+                np.asarray(list(self.point_mass), dtype=object),
+                np.asarray([csys for csys, _ in self.point_mass.values()], dtype=object),
+                _numbers(masses)])
+        if self.frames:
+            tables["Connectivity - Frame"] = np.array([(name, i, j) for name, (i, j) in self.frames.items()],
+                                                      dtype=object)
+        if self.frame_sections:
+            tables["Frame Section Assignments"] = np.array(list(self.frame_sections.items()), dtype=object)
+        if self.frame_mass:
+            tables["Frame Added Mass Assignments"] = np.column_stack([
+                np.asarray(list(self.frame_mass), dtype=object), _numbers(list(self.frame_mass.values()))])
+        if self.links:
+            tables["Connectivity - Link"] = np.array([(name, i, j) for name, (i, j, _) in self.links.items()],
+                                                     dtype=object)
+            tables["Link Property Assignments"] = np.array(
+                [(name, "OneJoint" if single else "TwoJoint", self.link_props[name])
+                 for name, (_, _, single) in self.links.items()], dtype=object)
+        if self.groups or self.ungroups:
+            tables["Groups 2 - Assignments"] = np.array(list(self.groups), dtype=object).reshape(-1, 3)
+        return tables
+
+    def _merge(self, table: str, rows: np.ndarray, report: TableReport,
+               removed: Dict[tuple, None] = None) -> Tuple[List[str], int, List[str]]:
+        """Existing records of the table with the queued rows merged in and the removed keys left out, flat as
+        the API wants them."""
+        keys, ours = TABLES[table]
+        ret = self._proxy._target.DatabaseTables.GetTableForEditingArray(table, "", 0, [], 0, [])
+        fields, nrecords, data = list(ret[1] or ()), int(ret[2] or 0), list(ret[3] or ())
+        if ret[-1] != 0 or not fields:
+            fields, records = list(ours), []
+        else:
+            records = [data[k * len(fields):(k + 1) * len(fields)] for k in range(nrecords)]
+        position = {field: fields.index(field) if field in fields else None for field in ours}
+        keycols = [fields.index(field) for field in keys]
+        if removed:
+            records = [record for record in records if tuple(record[c] for c in keycols) not in removed]
+        existing = {tuple(record[c] for c in keycols): k for k, record in enumerate(records)}
+        for row in rows:
+            key = tuple(row[ours.index(field)] for field in keys)
+            if key in existing:
+                if table in CREATION_TABLES:
+                    report.errors += 1
+                    report.log += f"{table}: {key[0]} already exists, skipped\n"
+                    continue
+                if table == "Groups 2 - Assignments":
+                    continue
+                record = records[existing[key]]
+            else:
+                record = [""] * len(fields)
+                existing[key] = len(records)
+                records.append(record)
+            for field, value in zip(ours, row):
+                if position[field] is not None:
+                    record[position[field]] = value
+        return fields, len(records), [value for record in records for value in record]
+
+    def flush(self) -> List[TableReport]:
+        """Push every queued table to SAP2000 now, returns the reports of this flush."""
+        if not self.pending or self._raw is None:
+            return []
+        tables = self._rows()
+        removed = self.ungroups
+        self._reset()
+        reports = []
+        database = self._proxy._target.DatabaseTables
+        for table in TABLES:
+            if table not in tables:
+                continue
+            rows = tables[table]
+            report = TableReport(table, len(rows))
+            fields, nrecords, data = self._merge(table, rows, report,
+                                                 removed if table == "Groups 2 - Assignments" else None)
+            ret = database.SetTableForEditingArray(table, 0, fields, nrecords, data)
+            if ret[-1] != 0:
+                report.fatal += 1
+                report.log += f"{table}: SetTableForEditingArray failed\n"
+            else:
+                fatal, errors, warnings, info, log, ret = database.ApplyEditedTables(True, 0, 0, 0, 0, "")
+                report.fatal += fatal + (ret != 0)
+                report.errors += errors
+                report.warnings += warnings
+                report.info += info
+                report.log += log or ""
+            if report.ok:
+                logger.opt(colors=True).success(f"Table <yellow>{table}</yellow>: {report.records} records imported")
+            else:
+                logger.opt(colors=True).error(f"Table <yellow>{table}</yellow>: {report.fatal} fatal, "
+                                              f"{report.errors} errors\n{report.log}")
+            reports.append(report)
+        self.reports.extend(reports)
+        return reports
+
+    # ---- lifecycle ----
+    @property
+    def active(self) -> bool:
+        return self._raw is not None
+
+    def start(self):
+        """Start queueing the model calls."""
+        if self.active:
+            return self
+        self._raw = self._Sapobj._Model
+        self._proxy = self._Sapobj._Model = ModelProxy(self._raw, self)
+        return self
+
+    def stop(self):
+        """Push the queued tables and take the bulk proxy out of the model pointer."""
+        if not self.active:
+            return self
+        try:
+            self.flush()
+        finally:
+            remove_proxy(self._Sapobj, self._proxy, "bulk build")
+            self._raw = self._proxy = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -1,43 +1,18 @@
-
 from typing import Literal
 
+from Sap2000py.SapWrapper import SapChild, SapWrapper
+
 
-class JointConstraints:
+class JointConstraints(SapWrapper):
     """Constraint class."""
 
-    def __init__(self, sap_obj):
-        """
-        Initialize the constraint class.
+    Set = SapChild("JointConstraintsSet")
+    Get = SapChild("JointConstraintsGet")
 
-        Passing in the parent class object directly is to avoid
-        getting only the last opened SAP2000 window when initializing the
-        parent class instance to get the model pointer in the subclass.
 
-        Args:
-            sap_obj: SAP2000 object.
-        """
-        self.__object = sap_obj._Object
-        self.__model = sap_obj._Model
-        self.Set = JointConstraintsSet(sap_obj)
-        self.Get = JointConstraintsGet(sap_obj)
-
-class JointConstraintsSet:
+class JointConstraintsSet(SapWrapper):
     """Constraint setting class."""
 
-    def __init__(self, sap_obj):
-        """
-        Initialize the constraint setting class.
-
-        Passing in the parent class object directly is to avoid
-        getting only the last opened SAP2000 window when initializing the
-        parent class instance to get the model pointer in the subclass.
-
-        Args:
-            sap_obj: SAP2000 object.
-        """
-        self.__object = sap_obj._Object
-        self.__model = sap_obj._Model
-
     def Body(self, name: str, value: list[Literal["UX", "UY", "UZ", "RX", "RY", "RZ"]], csys: str = "Global"):
         """
         Define a Body constraint.
@@ -215,23 +190,9 @@ class JointConstraintsSet:
         return self.__model.ConstraintDef.SetWeld(name, value_final, tolerance, csys)
 
 
-class JointConstraintsGet:
+class JointConstraintsGet(SapWrapper):
     """Constraint retrieval class."""
 
-    def __init__(self, sap_obj):
-        """
-        Initialize the constraint retrieval class.
-
-        Passing in the parent class object directly is to avoid
-        getting only the last opened SAP2000 window when initializing the
-        parent class instance to get the model pointer in the subclass.
-
-        Args:
-            sap_obj: SAP2000 object.
-        """
-        self.__object = sap_obj._Object
-        self.__model = sap_obj._Model
-
     def Body(self, name: str) -> tuple[list[bool], str, int]:
         """
         Retrieve the definition of a Body constraint.
@@ -7,6 +7,9 @@ from Sap2000py.SapConstraints import JointConstraints
 from Sap2000py.Sapfunctions import Sapfunctions
 from Sap2000py.Sapload import SapLoadCases, SapLoadPatterns
 from Sap2000py.SapMaterial import SapMaterial
+from Sap2000py.SapModal import ModalSummary
+from Sap2000py.SapResultCache import SapResultCache
+from Sap2000py.SapResultTable import ResultTable
 from Sap2000py.SapObj import (
     SapAreaObj,
     SapFrameObj,
@@ -16,18 +19,18 @@ from Sap2000py.SapObj import (
     SapTendonObj,
 )
 from Sap2000py.SapSection import SapSection
+from Sap2000py.SapWrapper import SapChild, SapWrapper
 
 
-class SapFile():
+class SapFile(SapWrapper):
     def __init__(self,Sapobj=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
+        super().__init__(Sapobj)
         self.Sapobj = Sapobj
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model 
 
     def Open(self,FileName : Union[Path , str] = Path('.')/"NewSapProj.sdb"):
         """
@@ -41,10 +44,23 @@ class SapFile():
         """
         # make sure filepath exists
         if type(FileName) == str:FileName = Path(FileName)
-        if not FileName.suffix == '.sdb':
-            logger.critical("File extension must be .sdb")
+        suffix = FileName.suffix.lower()
+        if suffix not in ('.sdb','.$2k','.s2k','.xlsx','.xls','.mdb'):
+            logger.critical("File extension must be .sdb, .$2k, .s2k, .xlsx, .xls or .mdb")
             return -1
-        
+        if suffix != '.sdb':
+            # text, Excel and Access files are imported, there is nothing to create
+            if not FileName.exists():
+                logger.error(f"File {FileName.resolve()} does not exist!")
+                return -1
+            ret = self.__Model.File.OpenFile(str(FileName.resolve()))
+            if(ret!=0):
+                logger.error(f"Cannot import file at path:{FileName}")
+            else:
+                logger.opt(colors=True).success(f"Model imported from <yellow>{FileName}</yellow>")
+            self.Sapobj.setDefaultProjectInfo()
+            return ret
+
         if not FileName.exists():
             if not FileName.parent.resolve().exists():
                 logger.warning(f"Path {FileName.parent.resolve()} does not exist! Creating path...")
@@ -187,16 +203,7 @@ class SapFile():
                            NumberYDivisions,NumberZDivisions)
 
 
-class MassSource:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class MassSource(SapWrapper):
     def SetDefault(self,name):
         """
         ---This function sets the default mass source---
@@ -225,16 +232,7 @@ class MassSource:
         self.__Model.SourceMass.SetMassSource(name,MassFromElements,MassFromMasses,MassFromLoads,
                                                     IsDefault,NumberLoads,LoadPat,SF)
 
-class LoadCombo:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class LoadCombo(SapWrapper):
     def Add(self,name,comboType:Literal['LinearAdd','Envelope','AbsAdd','SRSS','RangeAdd']):
         """
         ---This function adds a new load combination---
@@ -267,52 +265,27 @@ class LoadCombo:
         ret = self.__Model.RespCombo.SetCaseList(name,cnametype,CName,SF)
         return ret
 
-class SapDefinitions:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.material = SapMaterial(Sapobj)
-        self.section = SapSection(Sapobj)
-        self.joint_constraints = JointConstraints(Sapobj)
-        self.function = Sapfunctions(Sapobj)
-        self.loadcases = SapLoadCases(Sapobj)
-        self.loadpatterns = SapLoadPatterns(Sapobj)
-        self.masssource = MassSource(Sapobj)
-        self.loadcombo = LoadCombo(Sapobj)
+class SapDefinitions(SapWrapper):
+    material = SapChild(SapMaterial)
+    section = SapChild(SapSection)
+    joint_constraints = SapChild(JointConstraints)
+    function = SapChild(Sapfunctions)
+    loadcases = SapChild(SapLoadCases)
+    loadpatterns = SapChild(SapLoadPatterns)
+    masssource = SapChild(MassSource)
+    loadcombo = SapChild(LoadCombo)
 
 
-class SapAssign:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.PointObj = SapPointObj(Sapobj)
-        self.FrameObj = SapFrameObj(Sapobj)
-        self.TendonObj = SapTendonObj(Sapobj)
-        self.AreaObj = SapAreaObj(Sapobj)
-        self.SolidObj = SapSolidObj(Sapobj)
-        self.Link = SapLinkObj(Sapobj)
+class SapAssign(SapWrapper):
+    PointObj = SapChild(SapPointObj)
+    FrameObj = SapChild(SapFrameObj)
+    TendonObj = SapChild(SapTendonObj)
+    AreaObj = SapChild(SapAreaObj)
+    SolidObj = SapChild(SapSolidObj)
+    Link = SapChild(SapLinkObj)
 
 
-class SapAnalyze_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-    
+class SapAnalyze_Get(SapWrapper):
     def ActiveDOF(self):
         """
         ---This function retrieves the model global degrees of freedom---
@@ -387,16 +360,7 @@ class SapAnalyze_Get:
         result=self.__Model.Analyze.GetSolverOption_2()
         return result
         
-class SapAnalyze_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class SapAnalyze_Set(SapWrapper):
     def ActiveDOF(self,DOF):
         """
         ---This function sets the model global degrees of freedom---
@@ -473,17 +437,18 @@ class SapAnalyze_Set:
             self.__Model.Analyze.SetSolverOption_3(solver_type_int, process_type_int, NumberParallelRuns, 
                                                 ResponseFileSizeMaxMB, NumberAnalysisThreads, StiffCase)
 
-class SapAnalyze:
+class SapAnalyze(SapWrapper):
+    Get = SapChild(SapAnalyze_Get)
+    Set = SapChild(SapAnalyze_Set)
+
     def __init__(self,Sapobj):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Get = SapAnalyze_Get(Sapobj)
-        self.Set = SapAnalyze_Set(Sapobj)
+        super().__init__(Sapobj)
+        self.__Sapobj = Sapobj
 
     def CreateAnalysisModel(self):
         """
@@ -532,6 +497,7 @@ class SapAnalyze:
         ---
         """
         self.__Model.Analyze.RunAnalysis()
+        self.__Sapobj.Results.Cache.invalidate()
 
     def DeleteResults(self,CaseName):
         """
@@ -540,6 +506,7 @@ class SapAnalyze:
         CaseName(str)-The name of a load case
         """
         ret = self.__Model.Analyze.DeleteResults(CaseName)
+        self.__Sapobj.Results.Cache.invalidate()
         return ret
 
     def ModifyUnDeformedGeometryModeShape(self,CaseName,Mode,MaxDisp,Direction,Original=False):
@@ -558,11 +525,7 @@ class SapAnalyze:
         self.__Model.Analyze.ModifyUndeformedGeometryModeShape(CaseName,Mode,MaxDisp,Direction,Original)
 
 
-class SapResults_Get_Option:
-    def __init__(self,Sapobj):
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class SapResults_Get_Option(SapWrapper):
     def BaseReactLoc(self):
         """
         ---This function retrieves the global coordinates of the location at which the base reactions are reported---
@@ -702,17 +665,9 @@ class SapResults_Get_Option:
         result=self.__Model.Results.Setup.GetOptionSteadyState()
         return result
      
-class SapResults_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Option = SapResults_Get_Option(Sapobj)
-      
+class SapResults_Get(SapWrapper):
+    Option = SapChild(SapResults_Get_Option)
+
     def CaseSelectedForOutput(self,Name):
         """
         ---This function checks if an load case is selected for output---
@@ -753,15 +708,15 @@ class SapResults_Get:
         return result
 
 
-class SapResults_Set_Option:
-    def __init__(self,Sapobj):
+class SapResults_Set_Option(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
     
     def BaseReactLoc(self,gx,gy,gz):
         """
@@ -770,6 +725,7 @@ class SapResults_Set_Option:
         gx,gy,gz(float)-The global coordinates of the location at which the base reactions are reported
         """
         self.__Model.Results.Setup.SetOptionBaseReactLoc(gx,gy,gz)
+        self._Cache.track_option("BaseReactLoc",gx,gy,gz)
 
     def BucklingMode(self,BuckModeStart,BuckModeEnd,BuckModeAll=False):
         """
@@ -781,6 +737,7 @@ class SapResults_Set_Option:
             If it is False, buckling factors are reported for the buckling modes indicated by the BuckModeStart and BuckModeEnd items
         """
         self.__Model.Results.Setup.SetOptionBucklingMode(BuckModeStart,BuckModeEnd,BuckModeAll)
+        self._Cache.track_option("BucklingMode",BuckModeStart,BuckModeEnd,BuckModeAll)
 
     def DirectHist(self,mode:Literal['Envelopes','Step-by-Step','Last Step'] = 'Envelopes'):
         """
@@ -797,6 +754,7 @@ class SapResults_Set_Option:
             'Last Step': 3
         }
         self.__Model.Results.Setup.SetOptionDirectHist(Value[mode])
+        self._Cache.track_option("DirectHist",Value[mode])
 
     def ModalHist(self,mode:Literal['Envelopes','Step-by-Step','Last Step'] = 'Envelopes'):
         """
@@ -813,6 +771,7 @@ class SapResults_Set_Option:
             'Last Step': 3
         }
         self.__Model.Results.Setup.SetOptionModalHist(Value[mode])
+        self._Cache.track_option("ModalHist",Value[mode])
 
     def ModeShape(self,ModeShapeStart,ModeShapeEnd,ModeShapesAll=False):
         """
@@ -824,6 +783,7 @@ class SapResults_Set_Option:
             results are reported for the modes indicated by the ModeShapeStart and ModeShapeEnd items
         """
         self.__Model.Results.Setup.SetOptionModeShape(ModeShapeStart,ModeShapeEnd,ModeShapesAll)
+        self._Cache.track_option("ModeShape",ModeShapeStart,ModeShapeEnd,ModeShapesAll)
 
     def MultiStepStatic(self,mode:Literal['Envelopes','Step-by-Step','Last Step'] = 'Envelopes'):
         """
@@ -840,6 +800,7 @@ class SapResults_Set_Option:
             'Last Step': 3
         }
         self.__Model.Results.Setup.SetOptionMultiStepStatic(Value[mode])
+        self._Cache.track_option("MultiStepStatic",Value[mode])
 
     def MultiValuedCombo(self,mode:Literal['Envelopes','Multiple values, if possible','Correspondence'] = 'Envelopes'):
         """
@@ -856,6 +817,7 @@ class SapResults_Set_Option:
             'Correspondence': 3
         }
         self.__Model.Results.Setup.SetOptionMultiValuedCombo(Value[mode])
+        self._Cache.track_option("MultiValuedCombo",Value[mode])
 
     def NLStatic(self,mode:Literal['Envelopes','Step-by-Step','Last Step'] = 'Envelopes'):
         """
@@ -872,6 +834,7 @@ class SapResults_Set_Option:
             'Last Step': 3
         }
         self.__Model.Results.Setup.SetOptionNLStatic(Value[mode])
+        self._Cache.track_option("NLStatic",Value[mode])
 
     def PSD(self,mode:Literal['RMS','sqrt(PSD)'] = 'RMS'):
         """
@@ -886,6 +849,7 @@ class SapResults_Set_Option:
             'sqrt(PSD)': 2
         }
         self.__Model.Results.Setup.SetOptionPSD(Value[mode])
+        self._Cache.track_option("PSD",Value[mode])
 
     def SteadyState(self,mode:Literal['Envelopes','At Frequencies'] = 'Envelopes', SteadyStateOption:Literal['In and Out of Phase','Magnitude','All'] = 'In and Out of Phase'):
         """
@@ -909,17 +873,19 @@ class SapResults_Set_Option:
             'All': 3
         }
         self.__Model.Results.Setup.SetOptionSteadyState(Value[mode], Value2[SteadyStateOption])
+        self._Cache.track_option("SteadyState",Value[mode], Value2[SteadyStateOption])
 
-class SapResults_Set:
-    def __init__(self,Sapobj):
+class SapResults_Set(SapWrapper):
+    Option = SapChild(SapResults_Set_Option, "_Cache")
+
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Option = SapResults_Set_Option(Sapobj)
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
         
     def CaseSelectedForOutput(self,Name,Selected=True):
         """
@@ -929,6 +895,7 @@ class SapResults_Set:
         Selected(bool)-This item is True if the specified load case is to be selected for output, otherwise it is False
         """
         self.__Model.Results.Setup.SetCaseSelectedForOutput(Name,Selected)
+        self._Cache.track_selected("Case",Name,Selected)
 
     def ComboSelectedForOutput(self,Name,Selected=True):
         """
@@ -938,6 +905,7 @@ class SapResults_Set:
         Selected(bool)-This item is True if the specified load combination is to be selected for output, otherwise it is False
         """
         self.__Model.Results.Setup.SetComboSelectedForOutput(Name,Selected)
+        self._Cache.track_selected("Combo",Name,Selected)
 
     def SectionCutSelectedForOutput(self,Name,Selected):
         """
@@ -949,17 +917,18 @@ class SapResults_Set:
         """
         self.__Model.Results.Setup.SetSectionCutSelectedForOutput(Name,Selected)
 
-class Results_Setup:
-    def __init__(self,Sapobj):
+class Results_Setup(SapWrapper):
+    Get = SapChild(SapResults_Get)
+    Set = SapChild(SapResults_Set, "_Cache")
+
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Get = SapResults_Get(Sapobj)
-        self.Set = SapResults_Set(Sapobj)
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
     def SelectAllSectionCutsForOutput(self,Selected):
         """
@@ -978,19 +947,20 @@ class Results_Setup:
         ---The function deselects all load cases and response combinations for output---
         """
         self.__Model.Results.Setup.DeselectAllCasesAndCombosForOutput()
+        self._Cache.track_deselect_all()
 
 
-class SapResults_Area:
-    def __init__(self,Sapobj):
+class SapResults_Area(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
-    def ForceShell(self,Name,itemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def ForceShell(self,Name,itemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area forces for the specified area elements that are assigned shell section
         properties (not plane or asolid properties). Note that the forces reported are per unit of in-plane length
@@ -1010,6 +980,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects, and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F11,F22,F12,FMax,Fmin,FAngle,FVM,M11,
         M22,M12,MMax,MMin,MAngle,V13,V23,VMax,VAngle]
@@ -1067,10 +1038,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaForceShell(Name,Value[itemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaForceShell",self.__Model.Results.AreaForceShell,Name,Value[itemTypeElm])
+        return ResultTable.from_com("AreaForceShell",result) if as_table else result
 
-    def JointForcePlane(self,Name,ObjectElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def JointForcePlane(self,Name,ObjectElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area joint forces for the point elements at each corner of the specified plane
         elements that have plane-type or asolid-type properties (not shell).
@@ -1090,6 +1061,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for plane elements corresponding to all selected area
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -1112,10 +1084,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaJointForcePlane(Name,Value[ObjectElm])
-        return result
+        result=self._Cache.fetch("AreaJointForcePlane",self.__Model.Results.AreaJointForcePlane,Name,Value[ObjectElm])
+        return ResultTable.from_com("AreaJointForcePlane",result) if as_table else result
 
-    def JointForceShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def JointForceShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area joint forces for the point elements at each corner of the specified area
         elements that have shell-type properties (not plane or asolid).
@@ -1135,6 +1107,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects and the Name item is ignored
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -1157,10 +1130,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaJointForceShell(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaJointForceShell",self.__Model.Results.AreaJointForceShell,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaJointForceShell",result) if as_table else result
 
-    def StrainShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def StrainShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area strains for the specified area elements that are assigned shell section
         properties (not plane or asolid properties). Strains are reported at each point element associated with
@@ -1181,6 +1154,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,E11Top,E22Top,G12Top,E11Bot,E22Bot,G12Bot,
         EMaxTop,EMinTop,EMaxBot,EMinBot,EAngleTop,EAngleBot,EVMTop,EVMBot,G13Avg,G23Avg,GMaxAvg,GAngleAvg]
@@ -1216,10 +1190,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaStrainShell(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaStrainShell",self.__Model.Results.AreaStrainShell,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaStrainShell",result) if as_table else result
 
-    def StrainShellLayered(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def StrainShellLayered(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area strains for the specified area elements that are assigned layered shell
         section properties
@@ -1239,6 +1213,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,Layer,IntPtNum,IntPtLoc,PointElm,LoadCase,StepType,StepNum,E11,E22,G12,EMax,
         EMin,EAngle,EVM,G13Avg,G23Avg,GMaxAvg,GangleAvg]
@@ -1277,10 +1252,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaStrainShellLayered(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaStrainShellLayered",self.__Model.Results.AreaStrainShellLayered,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaStrainShellLayered",result) if as_table else result
 
-    def StressPlane(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def StressPlane(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the stresses for the specified plane elements that are assigned plane or asolid
         section properties (not shell properties).
@@ -1300,6 +1275,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for plane elements corresponding to all selected area
             objects, and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,S11,S22,S33,S12,SMax,SMin,SAngle,SVM]
 
@@ -1323,10 +1299,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaStressPlane(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaStressPlane",self.__Model.Results.AreaStressPlane,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaStressPlane",result) if as_table else result
 
-    def StressShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def StressShell(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area stresses for the specified area elements that are assigned shell section
         properties (not plane or asolid properties). Stresses are reported at each point element associated with
@@ -1347,6 +1323,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,S11Top,S22Top,S12Top,S11Bot,S22Bot,S12Bot,
         SMaxTop,SMinTop,SMaxBot,SMinBot,SAngleTop,SAngleBot,SVMTop,SVMBot,S13Avg,S23Avg,SMaxAvg,SAngleAvg]
@@ -1383,10 +1360,10 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaStressShell(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaStressShell",self.__Model.Results.AreaStressShell,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaStressShell",result) if as_table else result
 
-    def StressShellLayered(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def StressShellLayered(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the area stresses for the specified area elements that are assigned layered shell
         section properties
@@ -1406,6 +1383,7 @@ class SapResults_Area:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for area elements corresponding to all selected area
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,Layer,IntPtNum,IntPtLoc,PointElm,LoadCase,StepType,StepNum,S11,S22,S12,SMax,SMin,
         SAngle,SVM,S13Avg,S23Avg,SMaxAvg,SAngleAvg]
@@ -1446,20 +1424,20 @@ class SapResults_Area:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AreaStressShellLayered(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("AreaStressShellLayered",self.__Model.Results.AreaStressShellLayered,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("AreaStressShellLayered",result) if as_table else result
 
-class SapResults_Frame:
-    def __init__(self,Sapobj):
+class SapResults_Frame(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
-    def Force(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Force(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the frame forces for the specified line elements---
         inputs:
@@ -1477,6 +1455,7 @@ class SapResults_Frame:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for line elements corresponding to all selected line
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,ObjSta,Elm,ElmSta,LoadCase,StepType,StepNum,P,V2,V3,T,M2,M3]
 
@@ -1502,10 +1481,10 @@ class SapResults_Frame:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.FrameForce(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("FrameForce",self.__Model.Results.FrameForce,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("FrameForce",result) if as_table else result
 
-    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the frame joint forces for the point elements at each end of the specified line elements---
         inputs:
@@ -1522,6 +1501,7 @@ class SapResults_Frame:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for line elements corresponding to all selected line
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -1543,20 +1523,20 @@ class SapResults_Frame:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.FrameJointForce(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("FrameJointForce",self.__Model.Results.FrameJointForce,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("FrameJointForce",result) if as_table else result
 
-class SapResults_Joint:
-    def __init__(self,Sapobj):
+class SapResults_Joint(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
-    def Acc(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Acc(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint accelerations for the specified point elements. The accelerations
         reported by this function are relative accelerations
@@ -1576,6 +1556,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1598,10 +1579,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointAcc(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointAcc",self.__Model.Results.JointAcc,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointAcc",result) if as_table else result
 
-    def AccAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def AccAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint absolute accelerations for the specified point elements. Absolute and
         relative accelerations are the same, except when reported for time history load cases subjected to acceleration
@@ -1622,6 +1603,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1644,10 +1626,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointAccAbs(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointAccAbs",self.__Model.Results.JointAccAbs,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointAccAbs",result) if as_table else result
 
-    def Displ(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Displ(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint displacements for the specified point elements. The displacements reported
         by this function are relative displacements
@@ -1667,6 +1649,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1689,10 +1672,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointDispl(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointDispl",self.__Model.Results.JointDispl,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointDispl",result) if as_table else result
 
-    def DisplAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def DisplAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the absolute joint displacements for the specified point elements. Absolute and
         relative displacements are the same except when reported for time history load cases subjected to acceleration
@@ -1713,6 +1696,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1735,10 +1719,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointDisplAbs(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointDisplAbs",self.__Model.Results.JointDisplAbs,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointDisplAbs",result) if as_table else result
 
-    def React(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def React(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint reactions for the specified point elements. The reactions reported are from
         restraints, springs and grounded (one-joint) links---
@@ -1756,6 +1740,7 @@ class SapResults_Joint:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for line elements corresponding to all selected line
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -1777,10 +1762,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointReact(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointReact",self.__Model.Results.JointReact,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointReact",result) if as_table else result
 
-    def Vel(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Vel(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint velocities for the specified point elements. The velocities reported by
         this function are relative velocities
@@ -1800,6 +1785,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1822,10 +1808,10 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointVel(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointVel",self.__Model.Results.JointVel,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointVel",result) if as_table else result
 
-    def VelAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def VelAbs(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint absolute velocities for the specified point elements. Absolute and
         relative velocities are the same, except when reported for time history load cases subjected to acceleration
@@ -1845,6 +1831,7 @@ class SapResults_Joint:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1867,20 +1854,20 @@ class SapResults_Joint:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.JointVelAbs(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("JointVelAbs",self.__Model.Results.JointVelAbs,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("JointVelAbs",result) if as_table else result
 
-class SapResults_Link:
-    def __init__(self,Sapobj):
+class SapResults_Link(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
-    def Deformation(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Deformation(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the link internal deformations---
         inputs:
@@ -1898,6 +1885,7 @@ class SapResults_Link:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -1920,10 +1908,10 @@ class SapResults_Link:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.LinkDeformation(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("LinkDeformation",self.__Model.Results.LinkDeformation,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("LinkDeformation",result) if as_table else result
 
-    def Force(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Force(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the link forces at the point elements at the ends of the specified link elements---
         inputs:
@@ -1941,6 +1929,7 @@ class SapResults_Link:
             the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly selected
             and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,P,V2,V3,T,M2,M3]
 
@@ -1966,10 +1955,10 @@ class SapResults_Link:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.LinkForce(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("LinkForce",self.__Model.Results.LinkForce,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("LinkForce",result) if as_table else result
 
-    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint forces for the point elements at the ends of the specified link elements---
         inputs:
@@ -1986,6 +1975,7 @@ class SapResults_Link:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for line elements corresponding to all selected line
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -2007,22 +1997,41 @@ class SapResults_Link:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.LinkJointForce(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("LinkJointForce",self.__Model.Results.LinkJointForce,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("LinkJointForce",result) if as_table else result
 
-class SapResults_Modal:
-    def __init__(self,Sapobj):
+class SapResults_Modal(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
+        self.__Summary = {}
 
-    def LoadParticipationRatios(self):
+    def Summary(self,LoadCase:str=None,refresh:bool=False):
+        """
+        ---Periods and participating mass ratios of a modal case as NumPy arrays, with the Rayleigh control periods
+        and coefficients. The summary is cached until the model is analysed again, results are deleted or the case
+        selection changes---
+        inputs:
+        LoadCase(str)-name of the modal case, defaults to the first one in ParticipatingMassRatios
+        refresh(bool)-ignore the cached summary
+        return:
+        ModalSummary-Period, MassRatio, SumMassRatio, control_periods(Direction), rayleigh(Direction,Damping)
+        """
+        key = (*self._Cache.state(),LoadCase)
+        if refresh or key not in self.__Summary:
+            self.__Summary = {key:ModalSummary.from_table(self.ParticipatingMassRatios(as_table=True),LoadCase)}
+        return self.__Summary[key]
+
+    def LoadParticipationRatios(self,as_table:bool=False):
         """
         ---This function reports the modal load participation ratios for each selected modal analysis case---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:[index,NumberResults,LoadCase,ItemType,Item,Stat,Dyn]
 
         NumberResults(int)-The total number of results returned by the program
@@ -2040,12 +2049,14 @@ class SapResults_Modal:
         Stat(float list)-This is an array that includes the percent static load participation ratio
         Dyn(float list)-This is an array that includes the percent dynamic load participation ratio
         """
-        result=self.__Model.Results.ModalLoadParticipationRatios()
-        return result
+        result=self._Cache.fetch("ModalLoadParticipationRatios",self.__Model.Results.ModalLoadParticipationRatios)
+        return ResultTable.from_com("ModalLoadParticipationRatios",result) if as_table else result
 
-    def ParticipatingMassRatios(self):
+    def ParticipatingMassRatios(self,as_table:bool=False):
         """
         ---This function reports the modal participating mass ratios for each mode of each selected modal analysis case---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,Period,Ux,Uy,Uz,SumUx,SUmUy,SumUz,Rx,Ry,Rz,SumRx,SumRy,SumRz]
 
@@ -2079,12 +2090,14 @@ class SapResults_Modal:
         SumRz(float list)-This is an array that includes the cumulative sum of the modal participating mass ratios for
             the structure Rz degree of freedom
         """
-        result=self.__Model.Results.ModalParticipatingMassRatios()
-        return result
+        result=self._Cache.fetch("ModalParticipatingMassRatios",self.__Model.Results.ModalParticipatingMassRatios)
+        return ResultTable.from_com("ModalParticipatingMassRatios",result) if as_table else result
 
-    def ParticipationFactors(self):
+    def ParticipationFactors(self,as_table:bool=False):
         """
         ---This function reports the modal participation factors for each mode of each selected modal analysis case---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,Period,Ux,Uy,Uz,Rx,Ry,Rz,ModalMass,ModalStiff]
 
@@ -2112,12 +2125,14 @@ class SapResults_Modal:
         ModalStiff(float list)-This is an array that includes the modal stiffness for the specified mode.  This is a
             measure of the strain energy in the structure as it is deforming in the specified mode. [FL]
         """
-        result=self.__Model.Results.ModalParticipationFactors()
-        return result
+        result=self._Cache.fetch("ModalParticipationFactors",self.__Model.Results.ModalParticipationFactors)
+        return ResultTable.from_com("ModalParticipationFactors",result) if as_table else result
 
-    def Period(self):
+    def Period(self,as_table:bool=False):
         """
         ---SapModel.Results.ModalPeriod(NumberResults, LoadCase, StepType, StepNum, Period, Frequency, CircFreq, EigenValue)---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,Period,Frequency,CricFreq,EigenValue]
 
@@ -2132,10 +2147,10 @@ class SapResults_Modal:
         CircFreq(float list)-This is an array that includes the circular frequency for each result. [rad/s]
         EigenValue(float list)-This is an array that includes the eigenvalue for the specified mode for each result. [rad2/s2]
         """
-        result=self.__Model.Results.ModalPeriod()
-        return result
+        result=self._Cache.fetch("ModalPeriod",self.__Model.Results.ModalPeriod)
+        return ResultTable.from_com("ModalPeriod",result) if as_table else result
 
-    def Shape(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Shape(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the modal displacements (mode shapes) for the specified point elements---
         inputs:
@@ -2152,6 +2167,7 @@ class SapResults_Modal:
             in the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly
             selected and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,LoadCase,StepType,StepNum,U1,U2,U3,R1,R2,R3]
 
@@ -2175,20 +2191,20 @@ class SapResults_Modal:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.ModeShape(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("ModeShape",self.__Model.Results.ModeShape,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("ModeShape",result) if as_table else result
 
-class SapResults_Solid:
-    def __init__(self,Sapobj):
+class SapResults_Solid(SapWrapper):
+    def __init__(self,Sapobj,Cache=None):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
+        self._Cache = Cache if Cache is not None else SapResultCache(Sapobj)
 
-    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def JointForce(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the joint forces for the point elements at each corner of the specified solid elements---
         inputs:
@@ -2205,6 +2221,7 @@ class SapResults_Solid:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for solid elements corresponding to all selected solid
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,F1,F2,F3,M1,M2,M3]
 
@@ -2227,10 +2244,10 @@ class SapResults_Solid:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.SolidJointForce(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("SolidJointForce",self.__Model.Results.SolidJointForce,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("SolidJointForce",result) if as_table else result
 
-    def Strain(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Strain(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the strains for the specified solid elements. Strains are reported at each point
         element associated with the solid element---
@@ -2248,6 +2265,7 @@ class SapResults_Solid:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for solid elements corresponding to all selected solid
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,E11,E22,E33,G12,G13,G23,EMax,EMid,EMin,EVM,
         DirCosMax1,DirCosMax2,DirCosMax3,DirCosMid1,DirCosMid2,DirCosMid3]
@@ -2277,10 +2295,10 @@ class SapResults_Solid:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.SolidStrain(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("SolidStrain",self.__Model.Results.SolidStrain,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("SolidStrain",result) if as_table else result
 
-    def Stress(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def Stress(self,Name,ItemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the stresses for the specified solid elements. Stresses are reported at
         each point element associated with the solid element---
@@ -2298,6 +2316,7 @@ class SapResults_Solid:
             included in the group specified by the Name item.
             If this item is SelectionElm, the result request is for solid elements corresponding to all selected solid
             objects and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,Obj,Elm,PointElm,LoadCase,StepType,StepNum,S11,S22,S33,S12,S13,S23,SMax,SMid,SMin,SVM,
         DirCosMax1,DirCosMax2,DirCosMax3,DirCosMid1,DirCosMid2,DirCosMid3]
@@ -2327,27 +2346,30 @@ class SapResults_Solid:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.SolidStress(Name,Value[ItemTypeElm])
-        return result
+        result=self._Cache.fetch("SolidStress",self.__Model.Results.SolidStress,Name,Value[ItemTypeElm])
+        return ResultTable.from_com("SolidStress",result) if as_table else result
+
+class SapResults(SapWrapper):
+    Setup = SapChild(Results_Setup, "Cache")
+    Area = SapChild(SapResults_Area, "Cache")
+    Frame = SapChild(SapResults_Frame, "Cache")
+    Joint = SapChild(SapResults_Joint, "Cache")
+    Link = SapChild(SapResults_Link, "Cache")
+    Modal = SapChild(SapResults_Modal, "Cache")
+    Solid = SapChild(SapResults_Solid, "Cache")
 
-class SapResults:
     def __init__(self,Sapobj):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Setup = Results_Setup(Sapobj)
-        self.Area = SapResults_Area(Sapobj)
-        self.Frame = SapResults_Frame(Sapobj)
-        self.Joint = SapResults_Joint(Sapobj)
-        self.Link = SapResults_Link(Sapobj)
-        self.Modal = SapResults_Modal(Sapobj)
-        self.Solid = SapResults_Solid(Sapobj)
+        super().__init__(Sapobj)
+        # on-disk cache of the Results calls, disabled until Cache.enable()
+        self.Cache = SapResultCache(Sapobj)
+        self._Cache = self.Cache
         
-    def AssembledJointMass_1(self,MassSourceName,Name,itemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm'):
+    def AssembledJointMass_1(self,MassSourceName,Name,itemTypeElm:Literal['ObjectElm','Element','GroupElm','SelectionElm'] = 'ObjectElm',as_table:bool=False):
         """
         ---This function reports the assembled joint masses for the specified point elements---
         inputs:
@@ -2366,6 +2388,7 @@ class SapResults:
             in the group specified by the Name item.
             If this item is SelectionElm, the result request is for all point elements directly or indirectly
             selected and the Name item is ignored.
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,PointElm,MassSource,U1,U2,U3,R1,R2,R3]
 
@@ -2383,12 +2406,14 @@ class SapResults:
             'GroupElm': 2,
             'SelectionElm': 3
         }
-        result=self.__Model.Results.AssembledJointMass_1(MassSourceName,Name,Value[itemTypeElm])
-        return result
+        result=self._Cache.fetch("AssembledJointMass_1",self.__Model.Results.AssembledJointMass_1,MassSourceName,Name,Value[itemTypeElm])
+        return ResultTable.from_com("AssembledJointMass_1",result) if as_table else result
 
-    def BaseReact(self):
+    def BaseReact(self,as_table:bool=False):
         """
         ---This function reports the structure total base reactions---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,FX,Fy,Fz,Mx,My,Mz,gx,gy,gz]
 
@@ -2402,14 +2427,16 @@ class SapResults:
             X, Y and Z axes, respectively, for each result. [FL]
         gx,gy,gz(float)-These are the global X, Y and Z coordinates of the point at which the base reactions are reported. [L]
         """
-        result=self.__Model.Results.BaseReact()
-        return result
+        result=self._Cache.fetch("BaseReact",self.__Model.Results.BaseReact)
+        return ResultTable.from_com("BaseReact",result) if as_table else result
 
-    def BaseReactWithCentroid(self):
+    def BaseReactWithCentroid(self,as_table:bool=False):
         """
         ---This function reports the structure total base reactions and includes information on the centroid of the
         translational reaction forces
         ---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,Fx,Fy,Fz,Mx,My,Mz,gx,gy,gz,XCentroidForFx,YCentroidForFx,
         ZCentroidForFx,XCentroidForFy,YCentroidForFy,ZCentroidForFy,XCentroidForFz,YCentroidForFz,ZCentroidForFz]
@@ -2430,12 +2457,14 @@ class SapResults:
         XCentroidForFz,YCentroidForFz,ZCentroidForFz(float list)-These are arrays of the global X, Y and Z coordinates,
             respectively, of the centroid of all global Z-direction translational reaction forces for each result
         """
-        result=self.__Model.Results.BaseReactWithCentroid()
-        return result
+        result=self._Cache.fetch("BaseReactWithCentroid",self.__Model.Results.BaseReactWithCentroid)
+        return ResultTable.from_com("BaseReactWithCentroid",result) if as_table else result
 
-    def BucklingFactor(self):
+    def BucklingFactor(self,as_table:bool=False):
         """
         ---This function reports buckling factors obtained from buckling load cases---
+        inputs:
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,LoadCase,StepType,StepNum,Factor]
 
@@ -2446,10 +2475,10 @@ class SapResults:
             the step number is always the buckling mode number
         Factor(float list)-This is an array that includes the buckling factors
         """
-        result=self.__Model.Results.BucklingFactor()
-        return result
+        result=self._Cache.fetch("BucklingFactor",self.__Model.Results.BucklingFactor)
+        return ResultTable.from_com("BucklingFactor",result) if as_table else result
 
-    def GeneralizedDispl(self,Name):
+    def GeneralizedDispl(self,Name,as_table:bool=False):
         """
         ---This function reports the displacement values for the specified generalized displacements---
         inputs:
@@ -2457,6 +2486,7 @@ class SapResults:
             not recognize this name as a defined generalized displacement, it returns results for all selected generalized
             displacements, if any. For example, entering a blank string (i.e., "") for the name will prompt the program
             to return results for all selected generalized displacements
+        as_table(bool)-if True, return a SapResultTable.ResultTable with named columns instead of the raw list
         return:
         [index,NumberResults,GD,LoadCase,StepType,StepNum,DType,Value]
 
@@ -2471,8 +2501,8 @@ class SapResults:
         Value(float list)-This is an array of the generalized displacement values for each result.[L] when DType is
             Translation , [rad] when DType is Rotation
         """
-        result=self.__Model.Results.GeneralizedDispl(Name)
-        return result
+        result=self._Cache.fetch("GeneralizedDispl",self.__Model.Results.GeneralizedDispl,Name)
+        return ResultTable.from_com("GeneralizedDispl",result) if as_table else result
 
     def StepLabel(self):
         """
@@ -2490,17 +2520,18 @@ class SapResults:
         result=self.__Model.Results.StepLabel()
         return result
 
-class SapAnalyze:
+class SapAnalyze(SapWrapper):
+    Get = SapChild(SapAnalyze_Get)
+    Set = SapChild(SapAnalyze_Set)
+
     def __init__(self,Sapobj):
         """
         Passing in the parent class object directly is to avoid 
         getting only the last opened SAP2000 window when initializing the 
         parent class instance to get the model pointer in the subclass.
         """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Get = SapAnalyze_Get(Sapobj)
-        self.Set = SapAnalyze_Set(Sapobj)
+        super().__init__(Sapobj)
+        self.__Sapobj = Sapobj
 
     def CreateAnalysisModel(self):
         """
@@ -2549,6 +2580,7 @@ class SapAnalyze:
         ---
         """
         self.__Model.Analyze.RunAnalysis()
+        self.__Sapobj.Results.Cache.invalidate()
 
     def DeleteResults(self,CaseName):
         """
@@ -2557,6 +2589,7 @@ class SapAnalyze:
         CaseName(str)-The name of a load case
         """
         ret = self.__Model.Analyze.DeleteResults(CaseName)
+        self.__Sapobj.Results.Cache.invalidate()
         return ret
 
     def ModifyUnDeformedGeometryModeShape(self,CaseName,Mode,MaxDisp,Direction,Original=False):
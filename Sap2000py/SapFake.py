@@ -0,0 +1,1176 @@
+import re
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from Sap2000py.SapResultTable import RESULT_FIELDS
+
+
+class FakeReturn(int):
+    """Return value 0 of API calls the fake does not model.
+
+    Compares equal to 0 like a plain return code, and `ret[-1]`/`ret[0]` are 0
+    too, for the calls that return [ByRef values..., ret] on a real model.
+    """
+
+    def __new__(cls):
+        return super().__new__(cls, 0)
+
+    def __getitem__(self, index):
+        return 0
+
+
+OK = FakeReturn()
+
+# GroupDef/SelectObj object type codes
+OBJECT_TYPES = {"PointObj": 1, "FrameObj": 2, "CableObj": 3, "TendonObj": 4,
+                "AreaObj": 5, "SolidObj": 6, "LinkObj": 7}
+# object type whose names a results function reports
+RESULT_OBJECT = {"Joint": 1, "Assembled": 1, "Frame": 2, "Area": 5, "Solid": 6, "Link": 7, "Mode": 1}
+# verbs of SapModel methods, any other unknown SapModel attribute is an interface
+MODEL_METHODS = ("Get", "Set", "Initialize", "Delete", "Change", "Count")
+LINK_PROP_TYPES = {"Linear": 1, "Damper": 2, "Gap": 3, "Hook": 4, "PlasticWen": 5, "RubberIsolator": 6,
+                   "FrictionIsolator": 7, "MultiLinearElastic": 8, "MultiLinearPlastic": 9,
+                   "TCFrictionIsolator": 10}
+
+
+class FakeInterface:
+    """One interface of the fake model (PointObj, FrameObj, Results, ...).
+
+    Public methods of subclasses are wrapped so that every call is counted in
+    FakeSapModel.calls and pays FakeSapModel.latency. Methods that are not
+    modelled are accepted, counted and answer FakeReturn().
+    """
+
+    _name = ""
+
+    def __init__(self, model: "FakeSapModel"):
+        self._model = model
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, func in list(vars(cls).items()):
+            if callable(func) and not name.startswith("_"):
+                setattr(cls, name, cls._timed(name, func))
+
+    @staticmethod
+    def _timed(name, func):
+        def call(self, *args, **kwargs):
+            self._model._tick(f"{self._name}.{name}")
+            return func(self, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = func.__doc__
+        return call
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def unmodelled(*args, **kwargs):
+            self._model._tick(f"{self._name}.{name}")
+            return OK
+
+        return unmodelled
+
+
+class _Table:
+    """Named rows with a float64 coordinate/value block grown by doubling."""
+
+    def __init__(self, width: int, dtype=np.float64):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.data = np.zeros((16, width), dtype=dtype)
+
+    def add(self, name: str, row) -> int:
+        i = len(self.names)
+        if i == len(self.data):
+            self.data = np.vstack([self.data, np.zeros_like(self.data)])
+        self.data[i] = row
+        self.names.append(name)
+        self.index[name] = i
+        return i
+
+    def remove(self, name: str):
+        i = self.index.pop(name)
+        self.names.pop(i)
+        self.data[i:len(self.names)] = self.data[i + 1:len(self.names) + 1]
+        for k in range(i, len(self.names)):
+            self.index[self.names[k]] = k
+
+    def rename(self, old: str, new: str):
+        i = self.index.pop(old)
+        self.names[i] = new
+        self.index[new] = i
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rows(self) -> np.ndarray:
+        return self.data[:len(self.names)]
+
+    def next_name(self) -> str:
+        i = len(self.names) + 1
+        while str(i) in self.index:
+            i += 1
+        return str(i)
+
+
+class _ObjectFamily(FakeInterface):
+    """Behaviour shared by the object interfaces: names, groups, selection."""
+
+    def _table(self) -> _Table:
+        raise NotImplementedError
+
+    def Count(self, *args):
+        return len(self._table())
+
+    def GetNameList(self, *args):
+        names = tuple(self._table().names)
+        return [len(names), names, 0]
+
+    def SetGroupAssign(self, Name, GroupName, Remove=False, ItemType=0):
+        model = self._model
+        if GroupName not in model.groups or Name not in self._table():
+            return 1
+        members = model.groups[GroupName]
+        key = (OBJECT_TYPES[self._name], Name)
+        if Remove:
+            members.pop(key, None)
+        else:
+            members[key] = None
+        return 0
+
+    def GetGroupAssign(self, Name):
+        key = (OBJECT_TYPES[self._name], Name)
+        groups = tuple(group for group, members in self._model.groups.items() if key in members)
+        return [len(groups), groups, 0]
+
+    def SetSelected(self, Name, Selected=True, ItemType=0):
+        key = (OBJECT_TYPES[self._name], Name)
+        if Selected:
+            self._model.selected[key] = None
+        else:
+            self._model.selected.pop(key, None)
+        return 0
+
+    def ChangeName(self, Name, NewName):
+        table = self._table()
+        if Name not in table or NewName in table:
+            return 1
+        table.rename(Name, NewName)
+        model = self._model
+        # group members, the selection and the assignments follow the object
+        old, new = (OBJECT_TYPES[self._name], Name), (OBJECT_TYPES[self._name], NewName)
+        for members in (*model.groups.values(), model.selected):
+            if old in members:
+                keys = [new if key == old else key for key in members]
+                members.clear()
+                members.update(dict.fromkeys(keys))
+        prefix = self._name[:-3]
+        for key in [key for key in model.assignments if key[1] == Name and key[0].startswith(prefix)]:
+            model.assignments[(key[0], NewName)] = model.assignments.pop(key)
+        self._renamed(Name, NewName)
+        return 0
+
+    def _renamed(self, Name, NewName):
+        """Rename the object in the other tables of the model"""
+
+
+class FakePointObj(_ObjectFamily):
+    _name = "PointObj"
+
+    def _table(self):
+        return self._model.points
+
+    def _renamed(self, Name, NewName):
+        # the objects connecting to the point and the merge lookup follow it
+        model = self._model
+        for key, name in model.point_at.items():
+            if name == Name:
+                model.point_at[key] = NewName
+        for table in (model.frames, model.links):
+            table.ends = [tuple(NewName if end == Name else end for end in ends) if Name in ends else ends
+                          for ends in table.ends]
+
+    def AddCartesian(self, x=0.0, y=0.0, z=0.0, Name="", UserName="", CSys="Global", MergeOff=False,
+                     MergeNumber=0):
+        model = self._model
+        key = (round(x, 6), round(y, 6), round(z, 6))
+        if not MergeOff and key in model.point_at:
+            return [model.point_at[key], 0]
+        name = UserName or model.points.next_name()
+        if name in model.points:
+            return [name, 1]
+        model.points.add(name, (x, y, z))
+        model.point_at.setdefault(key, name)
+        return [name, 0]
+
+    def GetCoordCartesian(self, Name, *args):
+        if Name not in self._model.points:
+            return [0.0, 0.0, 0.0, 1]
+        x, y, z = self._model.points.rows()[self._model.points.index[Name]]
+        return [float(x), float(y), float(z), 0]
+
+    def GetAllPoints(self, NumberNames=0, MyName=(), X=(), Y=(), Z=(), CSys="Global"):
+        points = self._model.points
+        x, y, z = points.rows().T.tolist()
+        return [len(points), tuple(points.names), tuple(x), tuple(y), tuple(z), 0]
+
+    def GetConnectivity(self, Name, *args):
+        types, names, numbers = [], [], []
+        for family, table in ((2, self._model.frames), (7, self._model.links)):
+            for k, ends in enumerate(table.ends):
+                if Name in ends:
+                    types.append(family)
+                    names.append(table.names[k])
+                    numbers.append(ends.index(Name) + 1)
+        return [len(names), tuple(types), tuple(names), tuple(numbers), 0]
+
+    def GetCommonTo(self, Name):
+        return [self.GetConnectivity(Name)[0], 0]
+
+    def SetRestraint(self, Name, Value, ItemType=0):
+        if Name not in self._model.points:
+            return [Value, 1]
+        self._model.assignments[("PointRestraint", Name)] = list(Value)
+        return [Value, 0]
+
+    def SetMass(self, Name, M, ItemType=0, IsLocalCSys=True, Replace=False):
+        if Name not in self._model.points:
+            return [M, 1]
+        key = ("PointMass", Name)
+        mass = np.asarray(M, dtype=float)
+        if not Replace and key in self._model.assignments:
+            mass = mass + self._model.assignments[key]
+        self._model.assignments[key] = mass
+        return [M, 0]
+
+    def Delete(self, Name, ItemType=0):
+        model = self._model
+        if Name not in model.points or self.GetConnectivity(Name)[0]:
+            # like SAP2000, points that objects connect to are not deleted
+            return 1
+        x, y, z = model.points.rows()[model.points.index[Name]]
+        model.point_at.pop((round(x, 6), round(y, 6), round(z, 6)), None)
+        model.points.remove(Name)
+        for kind in ("PointRestraint", "PointMass", "PointConstraint"):
+            model.assignments.pop((kind, Name), None)
+        return 0
+
+    def DeleteRestraint(self, Name, ItemType=0):
+        if Name not in self._model.points:
+            return 1
+        self._model.assignments.pop(("PointRestraint", Name), None)
+        return 0
+
+    def DeleteMass(self, Name, ItemType=0):
+        if Name not in self._model.points:
+            return 1
+        self._model.assignments.pop(("PointMass", Name), None)
+        return 0
+
+
+class _LineTable(_Table):
+    """Frames/links: end joint names plus the property of every object."""
+
+    def __init__(self):
+        super().__init__(1)
+        self.ends: List[tuple] = []
+        self.prop: List[str] = []
+
+    def add_line(self, name, ends, prop):
+        self.add(name, 0)
+        self.ends.append(tuple(ends))
+        self.prop.append(prop)
+
+    def remove(self, name):
+        i = self.index[name]
+        super().remove(name)
+        self.ends.pop(i)
+        self.prop.pop(i)
+
+
+class FakeFrameObj(_ObjectFamily):
+    _name = "FrameObj"
+
+    def _table(self):
+        return self._model.frames
+
+    def AddByPoint(self, Point1, Point2, Name="", PropName="Default", UserName=""):
+        model = self._model
+        if Point1 not in model.points or Point2 not in model.points or Point1 == Point2:
+            return [Name, 1]
+        name = UserName or model.frames.next_name()
+        if name in model.frames:
+            return [name, 1]
+        model.frames.add_line(name, (Point1, Point2), PropName)
+        return [name, 0]
+
+    def AddByCoord(self, xi, yi, zi, xj, yj, zj, Name="", PropName="Default", UserName="", CSys="Global"):
+        Point1 = self._model.PointObj.AddCartesian(xi, yi, zi)[0]
+        Point2 = self._model.PointObj.AddCartesian(xj, yj, zj)[0]
+        return self.AddByPoint(Point1, Point2, Name, PropName, UserName)
+
+    def GetPoints(self, Name, *args):
+        frames = self._model.frames
+        if Name not in frames:
+            return ["", "", 1]
+        return [*frames.ends[frames.index[Name]], 0]
+
+    def GetAllFrames(self, *args):
+        frames, points = self._model.frames, self._model.points
+        n = len(frames)
+        point1 = tuple(ends[0] for ends in frames.ends)
+        point2 = tuple(ends[1] for ends in frames.ends)
+        xyz1 = points.rows()[[points.index[name] for name in point1]].T.tolist() if n else [[]] * 3
+        xyz2 = points.rows()[[points.index[name] for name in point2]].T.tolist() if n else [[]] * 3
+        zeros = (0.0,) * n
+        # names, sections, stories, end points, end coordinates, angle, 6 offsets, cardinal points
+        return [n, tuple(frames.names), tuple(frames.prop), ("",) * n, point1, point2, *map(tuple, xyz1),
+                *map(tuple, xyz2), *(zeros,) * 7, (10,) * n, 0]
+
+    def GetSection(self, Name, *args):
+        frames = self._model.frames
+        if Name not in frames:
+            return ["", "", 1]
+        return [frames.prop[frames.index[Name]], "", 0]
+
+    def SetSection(self, Name, PropName, ItemType=0, *args):
+        frames = self._model.frames
+        if Name not in frames:
+            return 1
+        frames.prop[frames.index[Name]] = PropName
+        return 0
+
+    def SetMass(self, Name, MassOverL, Replace=False, ItemType=0):
+        if Name not in self._model.frames:
+            return 1
+        key = ("FrameMass", Name)
+        if not Replace:
+            MassOverL += self._model.assignments.get(key, 0.0)
+        self._model.assignments[key] = float(MassOverL)
+        return 0
+
+    def Delete(self, Name, ItemType=0):
+        if Name not in self._model.frames:
+            return 1
+        self._model.frames.remove(Name)
+        self._model.assignments.pop(("FrameMass", Name), None)
+        return 0
+
+    def DeleteMass(self, Name, ItemType=0):
+        if Name not in self._model.frames:
+            return 1
+        self._model.assignments.pop(("FrameMass", Name), None)
+        return 0
+
+
+class FakeLinkObj(_ObjectFamily):
+    _name = "LinkObj"
+
+    def _table(self):
+        return self._model.links
+
+    def AddByPoint(self, Point1, Point2, Name="", IsSingleJoint=False, PropName="Default", UserName=""):
+        model = self._model
+        if Point1 not in model.points or (not IsSingleJoint and Point2 not in model.points):
+            return [Name, 1]
+        name = UserName or model.links.next_name()
+        if name in model.links:
+            return [name, 1]
+        model.links.add_line(name, (Point1,) if IsSingleJoint else (Point1, Point2), PropName)
+        return [name, 0]
+
+    def GetPoints(self, Name, *args):
+        links = self._model.links
+        if Name not in links:
+            return ["", "", 1]
+        ends = links.ends[links.index[Name]]
+        return [ends[0], ends[-1], 0]
+
+    def GetProperty(self, Name, *args):
+        links = self._model.links
+        if Name not in links:
+            return ["", 1]
+        return [links.prop[links.index[Name]], 0]
+
+    def Delete(self, Name, ItemType=0):
+        if Name not in self._model.links:
+            return 1
+        self._model.links.remove(Name)
+        return 0
+
+
+class FakeGroupDef(FakeInterface):
+    _name = "GroupDef"
+
+    def SetGroup(self, Name, *args):
+        self._model.groups.setdefault(Name, {})
+        return 0
+
+    def GetNameList(self, *args):
+        names = tuple(self._model.groups)
+        return [len(names), names, 0]
+
+    def GetAssignments(self, Name):
+        if Name not in self._model.groups:
+            return [0, (), (), 1]
+        members = list(self._model.groups[Name])
+        return [len(members), tuple(t for t, _ in members), tuple(n for _, n in members), 0]
+
+    def Clear(self, Name):
+        if Name not in self._model.groups:
+            return 1
+        self._model.groups[Name].clear()
+        return 0
+
+    def Delete(self, Name):
+        return 0 if self._model.groups.pop(Name, None) is not None else 1
+
+
+class FakeEditPoint(FakeInterface):
+    _name = "EditPoint"
+
+    def ChangeCoordinates_1(self, Name, x, y, z, NoRefresh=False):
+        model = self._model
+        if Name not in model.points:
+            return 1
+        old = model.points.rows()[model.points.index[Name]]
+        if model.point_at.get(tuple(round(v, 6) for v in old)) == Name:
+            del model.point_at[tuple(round(v, 6) for v in old)]
+        model.points.data[model.points.index[Name]] = (x, y, z)
+        model.point_at.setdefault((round(x, 6), round(y, 6), round(z, 6)), Name)
+        return 0
+
+
+class FakeSelectObj(FakeInterface):
+    _name = "SelectObj"
+
+    def ClearSelection(self):
+        self._model.selected.clear()
+        return 0
+
+    def Group(self, Name, Deselect=False):
+        if Name not in self._model.groups:
+            return 1
+        for key in self._model.groups[Name]:
+            if Deselect:
+                self._model.selected.pop(key, None)
+            else:
+                self._model.selected[key] = None
+        return 0
+
+    def All(self, Deselect=False):
+        return 0
+
+
+class _NamedDefinitions(FakeInterface):
+    """Property/definition interfaces: every Set*/Add* registers its name."""
+
+    _store = ""
+
+    def _names(self) -> dict:
+        return getattr(self._model, self._store)
+
+    def GetNameList(self, *args):
+        names = tuple(self._names())
+        return [len(names), names, 0]
+
+    def Delete(self, Name):
+        return 0 if self._names().pop(Name, None) is not None else 1
+
+    def ChangeName(self, Name, NewName):
+        names = self._names()
+        if Name not in names:
+            return 1
+        names[NewName] = names.pop(Name)
+        return 0
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not name.startswith(("Set", "Add")):
+            return super().__getattr__(name)
+
+        def define(Name="", *args, **kwargs):
+            self._model._tick(f"{self._name}.{name}")
+            self._names().setdefault(Name, {})[name] = args
+            return OK
+
+        return define
+
+
+class FakePropFrame(_NamedDefinitions):
+    _name, _store = "PropFrame", "frame_props"
+
+    def GetSectProps(self, Name):
+        props = self._names().get(Name)
+        if props is None:
+            return [0.0] * 12 + [1]
+        if "SetGeneral" in props:
+            # MatProp, t3, t2, Area, As2, As3, Torsion, I22, I33, ...
+            _, _, _, Area, As2, As3, J, I22, I33 = props["SetGeneral"][:9]
+            return [Area, As2, As3, J, I22, I33] + [0.0] * 6 + [0]
+        if "SetRectangle" in props:
+            _, t3, t2 = props["SetRectangle"][:3]
+            return [t3 * t2, 5 / 6 * t3 * t2, 5 / 6 * t3 * t2, 0.0, t3 * t2**3 / 12, t2 * t3**3 / 12] + [0.0] * 6 + [0]
+        return [0.0] * 12 + [0]
+
+
+class FakePropMaterial(_NamedDefinitions):
+    _name, _store = "PropMaterial", "materials"
+
+    def AddMaterial(self, Name, MatType, Region, Standard, Grade, UserName=""):
+        name = UserName or Grade
+        self._names().setdefault(name, {"MatType": MatType})
+        return [name, 0]
+
+
+class FakePropLink(_NamedDefinitions):
+    _name, _store = "PropLink", "link_props"
+
+    def GetTypeOAPI(self, Name):
+        props = self._names().get(Name)
+        if props is None:
+            return [0, 1]
+        for setter in props:
+            kind = setter[3:]
+            if kind in LINK_PROP_TYPES:
+                return [LINK_PROP_TYPES[kind], 0]
+        return [0, 0]
+
+
+class FakeRespCombo(_NamedDefinitions):
+    _name, _store = "RespCombo", "combos"
+
+
+class FakeLoadPatterns(_NamedDefinitions):
+    _name, _store = "LoadPatterns", "patterns"
+
+    def Add(self, Name, MyType, SelfWTMultiplier=0, AddLoadCase=True):
+        self._names()[Name] = {"Type": MyType}
+        if AddLoadCase:
+            self._model._add_case(Name, "LinearStatic")
+        return 0
+
+
+class FakeCaseFamily(FakeInterface):
+    """LoadCases.StaticLinear, LoadCases.DirHistNonlinear, ...: SetCase defines a case."""
+
+    def __init__(self, model, family):
+        super().__init__(model)
+        self._name = f"LoadCases.{family}"
+        self._family = family
+
+    def SetCase(self, Name, *args):
+        self._model._add_case(Name, self._family)
+        return 0
+
+
+class FakeLoadCases(FakeInterface):
+    _name = "LoadCases"
+
+    def GetNameList(self, *args):
+        names = tuple(self._model.cases)
+        return [len(names), names, 0]
+
+    def Delete(self, Name):
+        return 0 if self._model.cases.pop(Name, None) is not None else 1
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not name[0].isupper() or name.startswith(("Get", "Set", "Change")):
+            return super().__getattr__(name)
+        family = FakeCaseFamily(self._model, name)
+        self.__dict__[name] = family
+        return family
+
+
+class FakeAnalyze(FakeInterface):
+    _name = "Analyze"
+
+    def GetRunCaseFlag(self):
+        names = tuple(self._model.cases)
+        return [len(names), names, tuple(case["run"] for case in self._model.cases.values()), 0]
+
+    def SetRunCaseFlag(self, Name, Run, All=False):
+        targets = self._model.cases.values() if All else [self._model.cases.get(Name)]
+        if None in targets:
+            return 1
+        for case in targets:
+            case["run"] = bool(Run)
+        return 0
+
+    def RunAnalysis(self):
+        for case in self._model.cases.values():
+            if case["run"]:
+                case["status"] = 4
+        return 0
+
+    def GetCaseStatus(self):
+        names = tuple(self._model.cases)
+        return [len(names), names, tuple(case["status"] for case in self._model.cases.values()), 0]
+
+    def DeleteResults(self, Name, All=False):
+        targets = self._model.cases.values() if All else [self._model.cases.get(Name)]
+        if None in targets:
+            return 1
+        for case in targets:
+            case["status"] = 1
+        return 0
+
+
+class FakeResultsSetup(FakeInterface):
+    _name = "Results.Setup"
+
+    def DeselectAllCasesAndCombosForOutput(self):
+        self._model.output.clear()
+        return 0
+
+    def SetCaseSelectedForOutput(self, Name, Selected=True):
+        if Name not in self._model.cases:
+            return 1
+        self._set(Name, Selected)
+        return 0
+
+    def SetComboSelectedForOutput(self, Name, Selected=True):
+        if Name not in self._model.combos:
+            return 1
+        self._set(Name, Selected)
+        return 0
+
+    def _set(self, Name, Selected):
+        if Selected:
+            self._model.output[Name] = None
+        else:
+            self._model.output.pop(Name, None)
+
+    def SetOptionDirectHist(self, Value):
+        self._model.options["DirectHist"] = Value
+        return 0
+
+    def SetOptionModalHist(self, Value):
+        self._model.options["ModalHist"] = Value
+        return 0
+
+    def SetOptionNLStatic(self, Value):
+        self._model.options["NLStatic"] = Value
+        return 0
+
+
+class FakeResults(FakeInterface):
+    """Synthetic, deterministic results of every SapModel.Results function.
+
+    Values are pseudo random, seeded by the function, the object and the case,
+    so the same query always gives the same numbers. Only cases/combos
+    selected for output are reported. History cases give one row per step
+    with Step-by-Step output (FakeSapModel.steps of them), Max/Min rows
+    otherwise.
+    """
+
+    _name = "Results"
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.Setup = FakeResultsSetup(model)
+
+    def __getattr__(self, name: str):
+        if name not in RESULT_FIELDS:
+            return super().__getattr__(name)
+
+        def result(*args):
+            self._model._tick(f"Results.{name}")
+            return self._model._result(name, args)
+
+        return result
+
+
+class FakeDatabaseTables(FakeInterface):
+    """Interactive table editing of the tables the bulk builder writes (see Sap2000py.SapBulk).
+
+    SetTableForEditingArray stages a table, ApplyEditedTables replaces the
+    model content of every staged table by its records, like SAP2000 does.
+    """
+
+    _name = "DatabaseTables"
+    FIELDS = {
+        "Joint Coordinates": ("Joint", "CoordSys", "CoordType", "XorR", "Y", "Z", "SpecialJt"),
+        "Joint Restraint Assignments": ("Joint", "U1", "U2", "U3", "R1", "R2", "R3"),
+        "Joint Added Mass Assignments": ("Joint", "CoordSys", "Mass1", "Mass2", "Mass3", "MMI1", "MMI2", "MMI3"),
+        "Connectivity - Frame": ("Frame", "JointI", "JointJ", "IsCurved"),
+        "Frame Section Assignments": ("Frame", "SectionType", "AutoSelect", "AnalSect"),
+        "Frame Added Mass Assignments": ("Frame", "MassPerLen"),
+        "Connectivity - Link": ("Link", "JointI", "JointJ"),
+        "Link Property Assignments": ("Link", "LinkType", "LinkProp"),
+        "Groups 2 - Assignments": ("GroupName", "ObjectType", "ObjectLabel"),
+    }
+    OBJECT_TYPES = {"Joint": 1, "Frame": 2, "Link": 7}
+
+    def __init__(self, model):
+        super().__init__(model)
+        self._edited: Dict[str, List[dict]] = {}
+
+    def _records(self, table: str) -> List[tuple]:
+        model = self._model
+        assigned = model.assignments
+        if table == "Joint Coordinates":
+            return [(name, "GLOBAL", "Cartesian", *map(repr, map(float, xyz)), "Yes")
+                    for name, xyz in zip(model.points.names, model.points.rows())]
+        if table == "Joint Restraint Assignments":
+            return [(name, *("Yes" if v else "No" for v in value))
+                    for (kind, name), value in assigned.items() if kind == "PointRestraint"]
+        if table == "Joint Added Mass Assignments":
+            return [(name, "Local", *map(repr, map(float, value)))
+                    for (kind, name), value in assigned.items() if kind == "PointMass"]
+        if table == "Frame Added Mass Assignments":
+            return [(name, repr(value)) for (kind, name), value in assigned.items() if kind == "FrameMass"]
+        if table == "Connectivity - Frame":
+            return [(name, *ends, "No") for name, ends in zip(model.frames.names, model.frames.ends)]
+        if table == "Frame Section Assignments":
+            return [(name, "", "N.A.", prop) for name, prop in zip(model.frames.names, model.frames.prop)]
+        if table == "Connectivity - Link":
+            return [(name, ends[0], ends[-1]) for name, ends in zip(model.links.names, model.links.ends)]
+        if table == "Link Property Assignments":
+            return [(name, "OneJoint" if len(ends) == 1 else "TwoJoint", prop)
+                    for name, ends, prop in zip(model.links.names, model.links.ends, model.links.prop)]
+        if table == "Groups 2 - Assignments":
+            types = {code: label for label, code in self.OBJECT_TYPES.items()}
+            return [(group, types[code], name) for group, members in model.groups.items()
+                    for code, name in members if code in types]
+        return []
+
+    def GetTableForEditingArray(self, TableKey, GroupName="", TableVersion=0, FieldsKeysIncluded=(),
+                                NumberRecords=0, TableData=()):
+        if TableKey not in self.FIELDS:
+            return [0, (), 0, (), 1]
+        records = self._records(TableKey)
+        return [1, self.FIELDS[TableKey], len(records), tuple(v for record in records for v in record), 0]
+
+    def SetTableForEditingArray(self, TableKey, TableVersion, FieldsKeysIncluded, NumberRecords, TableData):
+        fields = tuple(FieldsKeysIncluded)
+        if TableKey not in self.FIELDS or NumberRecords * len(fields) != len(TableData):
+            return [TableVersion, FieldsKeysIncluded, TableData, 1]
+        self._edited[TableKey] = [dict(zip(fields, TableData[k * len(fields):(k + 1) * len(fields)]))
+                                  for k in range(NumberRecords)]
+        return [TableVersion, FieldsKeysIncluded, TableData, 0]
+
+    def CancelTableEditing(self):
+        self._edited.clear()
+        return 0
+
+    def ApplyEditedTables(self, FillImportLog=True, NumFatalErrors=0, NumErrorMsgs=0, NumWarnMsgs=0,
+                          NumInfoMsgs=0, ImportLog=""):
+        errors, log = 0, []
+        for table, records in self._edited.items():
+            failed = self._apply(table, records)
+            errors += len(failed)
+            log += [f"{table}: {message}" for message in failed]
+            log.append(f"{table}: {len(records) - len(failed)} records imported")
+        self._edited.clear()
+        return [0, errors, 0, 0, "\n".join(log) if FillImportLog else "", 0]
+
+    def _apply(self, table: str, records: List[dict]) -> List[str]:
+        model = self._model
+        failed = []
+        if table == "Joint Coordinates":
+            model.points = _Table(3)
+            model.point_at = {}
+            for record in records:
+                xyz = tuple(float(record[field]) for field in ("XorR", "Y", "Z"))
+                model.points.add(record["Joint"], xyz)
+                model.point_at.setdefault(tuple(round(v, 6) for v in xyz), record["Joint"])
+        elif table in ("Connectivity - Frame", "Connectivity - Link"):
+            label = table.split(" - ")[1]
+            old = model.frames if label == "Frame" else model.links
+            lines = _LineTable()
+            for record in records:
+                name, ends = record[label], (record["JointI"], record["JointJ"])
+                if any(end not in model.points for end in ends):
+                    failed.append(f"{label} {name} connects a joint that does not exist")
+                    continue
+                prop = old.prop[old.index[name]] if name in old else "Default"
+                lines.add_line(name, ends[:1] if ends[0] == ends[1] else ends, prop)
+            setattr(model, "frames" if label == "Frame" else "links", lines)
+        elif table in ("Frame Section Assignments", "Link Property Assignments"):
+            label, field = ("Frame", "AnalSect") if table.startswith("Frame") else ("Link", "LinkProp")
+            lines = model.frames if label == "Frame" else model.links
+            for record in records:
+                if record[label] not in lines:
+                    failed.append(f"{label} {record[label]} does not exist")
+                    continue
+                lines.prop[lines.index[record[label]]] = record[field]
+        elif table == "Groups 2 - Assignments":
+            for members in model.groups.values():
+                members.clear()
+            for record in records:
+                model.groups.setdefault(record["GroupName"], {})[
+                    (self.OBJECT_TYPES[record["ObjectType"]], record["ObjectLabel"])] = None
+        else:
+            kind, label, fields = {
+                "Joint Restraint Assignments": ("PointRestraint", "Joint", ("U1", "U2", "U3", "R1", "R2", "R3")),
+                "Joint Added Mass Assignments": ("PointMass", "Joint",
+                                                 ("Mass1", "Mass2", "Mass3", "MMI1", "MMI2", "MMI3")),
+                "Frame Added Mass Assignments": ("FrameMass", "Frame", ("MassPerLen",)),
+            }[table]
+            for key in [key for key in model.assignments if key[0] == kind]:
+                del model.assignments[key]
+            for record in records:
+                values = [record[field] for field in fields]
+                if kind == "PointRestraint":
+                    value = [v == "Yes" for v in values]
+                elif kind == "PointMass":
+                    value = np.array([float(v) for v in values])
+                else:
+                    value = float(values[0])
+                model.assignments[(kind, record[label])] = value
+        return failed
+
+
+class FakeFile(FakeInterface):
+    _name = "File"
+
+    def NewBlank(self):
+        self._model._reset()
+        return 0
+
+    def Save(self, FileName=""):
+        if FileName:
+            self._model.filename = str(FileName)
+        return 0
+
+    def OpenFile(self, FileName):
+        self._model._reset()
+        self._model.filename = str(FileName)
+        if str(FileName).lower().endswith((".s2k", ".$2k")):
+            return self._import_text(FileName)
+        return 0
+
+    _FIELD = re.compile(r'(\w+)=("[^"]*"|\S+)')
+
+    def _import_text(self, FileName) -> int:
+        """Reads the tables of a $2k/s2k file the fake models, the others are skipped."""
+        model = self._model
+        tables = model.DatabaseTables
+        editable = {name.upper(): name for name in tables.FIELDS}
+        parsed: Dict[str, List[dict]] = {}
+        current = None
+        try:
+            with open(FileName, encoding="utf-8") as file:
+                for line in file:
+                    if line.startswith("TABLE:"):
+                        current = parsed.setdefault(line.split('"')[1], [])
+                    elif line.startswith("   ") and current is not None:
+                        current.append({field: value.strip('"') for field, value in self._FIELD.findall(line)})
+        except OSError:
+            return 1
+        for name, records in parsed.items():
+            if name in editable:
+                tables._apply(editable[name], records)
+            elif name == "GROUPS 1 - DEFINITIONS":
+                for record in records:
+                    model.groups.setdefault(record["GroupName"], {})
+            elif name == "MATERIAL PROPERTIES 01 - GENERAL":
+                for record in records:
+                    model.materials[record["Material"]] = {"MatType": record.get("Type")}
+            elif name == "FRAME SECTION PROPERTIES 01 - GENERAL":
+                for record in records:
+                    model.frame_props[record["SectionName"]] = {"S2K": record}
+            elif name == "LINK PROPERTY DEFINITIONS 01 - GENERAL":
+                for record in records:
+                    model.link_props[record["Link"]] = {"Set" + record.get("LinkType", ""): ()}
+            elif name == "LOAD PATTERN DEFINITIONS":
+                for record in records:
+                    model.patterns[record["LoadPat"]] = {"Type": record.get("DesignType")}
+            elif name == "LOAD CASE DEFINITIONS":
+                for record in records:
+                    model._add_case(record["Case"], "ModalEigen" if record.get("Type") == "LinModal"
+                                    else "LinearStatic")
+            elif name == "JOINT CONSTRAINT ASSIGNMENTS":
+                for record in records:
+                    model.assignments[("PointConstraint", record["Joint"])] = record["Constraint"]
+        return 0
+
+
+class FakeSapModel:
+    """Pure Python stand-in of SapModel for benchmarks and tests without SAP2000.
+
+    Points, frames, links, groups, sections, link properties, materials, load
+    patterns, cases with their run flags/status and the output selection are
+    kept in NumPy-backed tables and dicts. Calls the fake does not model are
+    accepted and answer 0 (see FakeReturn), so every wrapper of the package
+    runs. `calls` counts the calls per "Interface.Method".
+
+    Example:
+        >>> from Sap2000py import Saproject
+        >>> from Sap2000py.SapFake import FakeSapObject
+        >>> Sap = Saproject()
+        >>> Sap.createSap(SapObject=FakeSapObject(latency=50e-6))
+        >>> Sap.Assign.PointObj.AddCartesian(0, 0, 0)
+        >>> Sap._Model.calls.most_common(5)
+    """
+
+    def __init__(self, latency: float = 0.0, steps: int = 10, modes: int = 12, seed: int = 0):
+        """
+        Args:
+            latency (float): Seconds every API call takes, to mimic the COM round trip. Defaults to 0.
+            steps (int): Output steps of history cases with Step-by-Step output. Defaults to 10.
+            modes (int): Modes of modal cases. Defaults to 12.
+            seed (int): Seed of the synthetic results. Defaults to 0.
+        """
+        self.latency = latency
+        self.steps = steps
+        self.modes = modes
+        self.seed = seed
+        self.calls: Counter = Counter()
+        self.filename = ""
+        self.units = 6
+        self.locked = False
+        self._reset()
+        self.PointObj = FakePointObj(self)
+        self.FrameObj = FakeFrameObj(self)
+        self.LinkObj = FakeLinkObj(self)
+        self.GroupDef = FakeGroupDef(self)
+        self.SelectObj = FakeSelectObj(self)
+        self.EditPoint = FakeEditPoint(self)
+        self.PropFrame = FakePropFrame(self)
+        self.PropMaterial = FakePropMaterial(self)
+        self.PropLink = FakePropLink(self)
+        self.RespCombo = FakeRespCombo(self)
+        self.LoadPatterns = FakeLoadPatterns(self)
+        self.LoadCases = FakeLoadCases(self)
+        self.Analyze = FakeAnalyze(self)
+        self.Results = FakeResults(self)
+        self.File = FakeFile(self)
+        self.DatabaseTables = FakeDatabaseTables(self)
+
+    def _reset(self):
+        self.points = _Table(3)
+        self.point_at: Dict[tuple, str] = {}
+        self.frames = _LineTable()
+        self.links = _LineTable()
+        self.groups: Dict[str, Dict[tuple, None]] = {"ALL": {}}
+        self.selected: Dict[tuple, None] = {}
+        self.assignments: Dict[tuple, object] = {}
+        self.frame_props: Dict[str, dict] = {}
+        self.materials: Dict[str, dict] = {"4000Psi": {}, "A992Fy50": {}}
+        self.link_props: Dict[str, dict] = {}
+        self.combos: Dict[str, dict] = {}
+        self.patterns: Dict[str, dict] = {"DEAD": {}}
+        self.cases: Dict[str, dict] = {}
+        self._add_case("DEAD", "LinearStatic")
+        self._add_case("MODAL", "ModalEigen")
+        self.output: Dict[str, None] = {}
+        self.options: Dict[str, int] = {}
+
+    def _add_case(self, Name: str, family: str):
+        self.cases[Name] = {"type": family, "run": True, "status": 1}
+
+    def _tick(self, name: str):
+        self.calls[name] += 1
+        if self.latency:
+            end = time.perf_counter() + self.latency
+            while time.perf_counter() < end:
+                pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name.startswith(MODEL_METHODS):
+            # unmodelled model level calls (SetProjectInfo, GetMergeTol, ...)
+            def unmodelled(*args):
+                self._tick(name)
+                return OK
+
+            return unmodelled
+        # unmodelled interfaces (AreaObj, ConstraintDef, Func, View, ...)
+        interface = type(f"Fake{name}", (FakeInterface,), {"_name": name})(self)
+        self.__dict__[name] = interface
+        return interface
+
+    # ---- model level calls ----
+    def GetModelFilename(self, IncludePath=True):
+        self._tick("GetModelFilename")
+        return self.filename
+
+    def GetModelFilepath(self):
+        self._tick("GetModelFilepath")
+        return self.filename.rsplit("\\", 1)[0] if "\\" in self.filename else ""
+
+    def GetVersion(self):
+        self._tick("GetVersion")
+        return ["Fake", 0.0, 0]
+
+    def InitializeNewModel(self, Units=6):
+        self._tick("InitializeNewModel")
+        self.units = Units
+        self._reset()
+        return 0
+
+    def GetPresentUnits(self):
+        self._tick("GetPresentUnits")
+        return self.units
+
+    def GetDatabaseUnits(self):
+        self._tick("GetDatabaseUnits")
+        return self.units
+
+    def SetPresentUnits(self, Units):
+        self._tick("SetPresentUnits")
+        self.units = Units
+        return 0
+
+    def GetModelIsLocked(self):
+        self._tick("GetModelIsLocked")
+        return self.locked
+
+    def SetModelIsLocked(self, Locked):
+        self._tick("SetModelIsLocked")
+        self.locked = bool(Locked)
+        return 0
+
+    def GetPresentCoordSystem(self):
+        self._tick("GetPresentCoordSystem")
+        return "Global"
+
+    def GetProjectInfo(self):
+        self._tick("GetProjectInfo")
+        return [1, ("Company Name",), ("Sap2000py",), 0]
+
+    # ---- synthetic results ----
+    def _result_objects(self, kind: str, Name: str, ItemTypeElm: int) -> List[str]:
+        family = next((code for prefix, code in RESULT_OBJECT.items() if kind.startswith(prefix)), None)
+        if family is None:
+            return []
+        if ItemTypeElm == 2:
+            members = self.groups.get(Name, {})
+            return [name for code, name in members if code == family]
+        if ItemTypeElm == 3:
+            return [name for code, name in self.selected if code == family]
+        return [Name]
+
+    def _result(self, kind: str, args: tuple) -> list:
+        fields = RESULT_FIELDS[kind]
+        cases = [name for name in self.output if name in self.combos or self.cases.get(name, {}).get("status") == 4]
+        if "Obj" in fields or "PointElm" in fields:
+            Name = args[0] if args else ""
+            ItemTypeElm = args[1] if len(args) > 1 else 0
+            if kind == "AssembledJointMass_1":
+                Name = args[1] if len(args) > 1 else ""
+                ItemTypeElm = args[2] if len(args) > 2 else 0
+            objects = self._result_objects(kind, Name, ItemTypeElm)
+        else:
+            objects = [""]
+        columns: Dict[str, list] = {field: [] for field in fields}
+        for case in cases:
+            modal = self.cases.get(case, {}).get("type", "").startswith("Modal") and not \
+                self.cases[case]["type"].startswith("ModalHist")
+            history = "Hist" in self.cases.get(case, {}).get("type", "")
+            option = self.options.get("ModalHist" if "ModalHist" in self.cases.get(case, {}).get("type", "")
+                                      else "DirectHist", 1)
+            if kind.startswith("Modal") or modal:
+                if not modal:
+                    continue
+                steps, steptype = np.arange(1, self.modes + 1, dtype=float), "Mode"
+            elif history and option == 2:
+                steps, steptype = np.arange(1, self.steps + 1, dtype=float), "Step"
+            elif case in self.combos or history:
+                steps, steptype = np.array([0.0, 0.0]), None
+            else:
+                steps, steptype = np.array([0.0]), ""
+            for obj in objects:
+                self._rows(kind, fields, columns, case, obj, steps, steptype)
+        n = len(columns[fields[0]]) if fields else 0
+        return [n, *(tuple(columns[field]) for field in fields), 0]
+
+    def _rows(self, kind: str, fields: Sequence[str], columns: Dict[str, list], case: str, obj: str,
+              steps: np.ndarray, steptype: Optional[str]):
+        # sub rows of one object: stations of frames, end joints of frames/links
+        subs = [("", "")]
+        if "ObjSta" in fields:
+            subs = [(str(s), "") for s in (0.0, 0.5, 1.0)]
+        elif "PointElm" in fields and obj:
+            table = self.links if kind.startswith("Link") else self.frames if kind.startswith("Frame") else None
+            ends = table.ends[table.index[obj]] if table is not None and obj in table else (obj,)
+            subs = [("", end) for end in ends]
+        rng = np.random.default_rng([self.seed, zlib.crc32(f"{kind}|{obj}|{case}".encode())])
+        numeric = [field for field in fields if field not in ("Obj", "Elm", "PointElm", "LoadCase", "StepType",
+                                                                "Item", "ItemType", "GD", "DType", "MassSource",
+                                                                "Layer", "StepNum", "ObjSta", "ElmSta")]
+        nrow = len(subs) * len(steps)
+        values = rng.normal(scale=100.0, size=(nrow, len(numeric)))
+        if steptype is None:
+            # Max row first, Min row second
+            values = np.abs(values)
+            values[len(subs):] *= -1
+        if kind.startswith("Modal"):
+            periods = 2.0 / np.arange(1, len(steps) + 1)
+            ratios = rng.dirichlet(np.ones(len(steps)), size=6).T * 0.95
+            for k, field in enumerate(numeric):
+                if field == "Period":
+                    values[:, k] = periods
+                elif field in ("Ux", "Uy", "Uz", "Rx", "Ry", "Rz"):
+                    values[:, k] = ratios[:, "Ux Uy Uz Rx Ry Rz".split().index(field)]
+                elif field.startswith("Sum"):
+                    values[:, k] = np.cumsum(ratios[:, "Ux Uy Uz Rx Ry Rz".split().index(field[3:])])
+                elif field == "Frequency":
+                    values[:, k] = 1 / periods
+        row = 0
+        for s, step in enumerate(steps):
+            label = ("Max" if s == 0 else "Min") if steptype is None else steptype
+            for station, point in subs:
+                for field in fields:
+                    if field in ("Obj", "Elm"):
+                        columns[field].append(obj)
+                    elif field == "PointElm":
+                        columns[field].append(point)
+                    elif field == "LoadCase":
+                        columns[field].append(case)
+                    elif field == "StepType":
+                        columns[field].append(label)
+                    elif field == "StepNum":
+                        columns[field].append(float(step))
+                    elif field in ("ObjSta", "ElmSta"):
+                        columns[field].append(float(station))
+                    elif field in ("Item", "ItemType", "GD", "DType", "MassSource", "Layer"):
+                        columns[field].append("")
+                    else:
+                        columns[field].append(float(values[row, numeric.index(field)]))
+                row += 1
+
+
+class FakeSapObject:
+    """Stand-in of the SAP2000 application object holding a FakeSapModel.
+
+    Inject it with `Saproject().createSap(SapObject=FakeSapObject())`.
+    """
+
+    def __init__(self, latency: float = 0.0, **kwargs):
+        """
+        Args:
+            latency (float): Seconds every API call takes. Defaults to 0.
+            **kwargs: Passed to FakeSapModel (steps, modes, seed).
+        """
+        self.SapModel = FakeSapModel(latency, **kwargs)
+        self.Visible = False
+
+    def ApplicationStart(self, *args):
+        self.SapModel._tick("ApplicationStart")
+        return 0
+
+    def ApplicationExit(self, FileSave=False):
+        self.SapModel._tick("ApplicationExit")
+        return 0
+
+    def Hide(self):
+        self.Visible = False
+        return 0
+
+    def Unhide(self):
+        self.Visible = True
+        return 0
@@ -0,0 +1,286 @@
+import dataclasses
+import hashlib
+import json
+import weakref
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+from Sap2000py.Saproject import ProjectBound
+
+# outcome of a build step, see SapManifest.step
+SAME = "same"
+CHANGED = "changed"
+NEW = "new"
+# steps made on an object of another kind, under the same key
+PARENTS = {"PointMass": "Point", "PointRestraint": "Point", "Spring": "Point", "FrameMass": "Frame",
+           "FrameInsertion": "Frame", "FrameVarying": "Frame", "SectionModifiers": "Section"}
+# kinds that are deleted and made again on a change, the steps on them are made again too
+RECREATED = ("Frame", "Link", "Section")
+# interfaces holding the objects of a kind, checked against the model when a build starts
+INTERFACES = {"Point": "PointObj", "Frame": "FrameObj", "Link": "LinkObj", "Section": "PropFrame",
+              "LinkProp": "PropLink"}
+# calls undoing the steps a build no longer makes, in this order (objects before the points and
+# properties they use), kinds not listed leave nothing to undo
+UNDO = {"PointMass": "PointObj.DeleteMass", "PointRestraint": "PointObj.DeleteRestraint",
+        "Spring": "PointObj.DeleteSpring", "FrameMass": "FrameObj.DeleteMass", "Link": "LinkObj.Delete",
+        "Frame": "FrameObj.Delete", "Point": "PointObj.Delete", "Section": "PropFrame.Delete",
+        "LinkProp": "PropLink.Delete"}
+# manifests of builds without a file, by project
+_LAST: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _fields(obj) -> Dict[str, object]:
+    """Parameters of a builder: its dataclass fields, or its public attributes when the fields are not set."""
+    if dataclasses.is_dataclass(obj) and all(hasattr(obj, f.name) for f in dataclasses.fields(obj)):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if f.compare}
+    return {key: value for key, value in vars(obj).items() if not key.startswith("_") and key != "project"}
+
+
+def _canonical(value, depth: int = 0):
+    """JSON form of a value that does not depend on dict order, object ids or numpy types."""
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, np.generic):
+        return _canonical(value.item(), depth)
+    if isinstance(value, np.ndarray):
+        return _canonical(value.tolist(), depth)
+    if isinstance(value, Path):
+        return value.as_posix()
+    if isinstance(value, dict):
+        return {"{}": sorted([str(key), _canonical(item, depth)] for key, item in value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, depth) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {"set": sorted(json.dumps(_canonical(item, depth), sort_keys=True) for item in value)}
+    kind = type(value).__qualname__
+    if isinstance(value, ProjectBound) or dataclasses.is_dataclass(value):
+        name = getattr(value, "name", None) or getattr(value, "prop_name", None)
+        if depth > 0 and isinstance(name, str):
+            # other builders are referred to by name, they hash their own parameters
+            return [kind, name]
+        if depth < 4:
+            return [kind, {key: _canonical(item, depth + 1) for key, item in _fields(value).items()}]
+    # meshes, geometries and other heavy objects only count by their type
+    return kind
+
+
+def content_hash(*values) -> str:
+    """
+    Stable hash of builder parameters, the same in every session and on every machine.
+
+    Builders (dataclasses and ProjectBound objects) hash their fields, `project` left out. Builders found
+    inside another one count by class and name, numpy values as the Python numbers they hold.
+
+    Args:
+        *values: The parameters.
+
+    Returns:
+        str: Hex SHA-1 digest.
+    """
+    text = json.dumps(_canonical(list(values)), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class SapManifest:
+    """Manifest of what a build made in the model, to rebuild only what changed.
+
+    Every model changing step of the bridge builders (a point added, a mass
+    set, a link property defined, ...) is claimed with `step(kind, key,
+    *content)`. The manifest keeps the content hash of the steps made on
+    each key and compares them with the previous build's: an unchanged step
+    is skipped, a changed one is made (an object whose definition changed is
+    moved, redefined or made again), and what the previous build made but
+    this one did not is deleted when the build ends. Rebuilding after one
+    bearing stiffness changed redefines that link property only.
+
+    Steps are compared in the order a key is claimed, once one step of a key
+    is made the later ones are made as well. Objects missing from the model
+    when the build starts (deleted by hand, a new model) are made again,
+    objects that exist without being in the manifest are taken over. Edits
+    made around the package to objects in the manifest are not seen.
+
+    The manifest is saved as JSON to `path` at the end of the build, without
+    a path it is kept in memory for the next build of the same project.
+
+    Example:
+        >>> with Sap.incremental("bridge.manifest.json"):
+        ...     pier1.build()
+        ...     girder.update_links_in_Sap()
+    """
+
+    def __init__(self, Sapobj, path: Union[str, Path, None] = None):
+        """
+        Args:
+            Sapobj: The Saproject the build is made in.
+            path (str or Path, optional): Manifest file, read at the start and written at the end of the build.
+        """
+        self._Sapobj = Sapobj
+        self.path = None if path is None else Path(path)
+        self._previous: Dict[str, dict] = {}
+        self._current: Dict[str, dict] = {}
+        self._diverged = set()
+        self._outer = None
+        self.active = False
+        self.counts: Counter = Counter()
+
+    # ---- lifecycle ----
+    def start(self):
+        """Read the previous manifest and make this one the project's `manifest`."""
+        if self.active:
+            return self
+        if self.path is not None and self.path.exists():
+            self._previous = json.loads(self.path.read_text(encoding="utf-8")).get("entries", {})
+        elif self.path is None:
+            self._previous = dict(_LAST.get(self._Sapobj, {}))
+        self._current = {}
+        self._diverged = set()
+        self.counts = Counter()
+        self._check_model()
+        self._outer = self._Sapobj.manifest
+        self._Sapobj.manifest = self
+        self.active = True
+        return self
+
+    def stop(self, failed: bool = False):
+        """
+        Delete what the previous build made and this one did not, then save the manifest.
+
+        Args:
+            failed (bool): The build stopped on an error: nothing is deleted, the manifest keeps the
+                previous build's entries for the keys not claimed yet.
+        """
+        if not self.active:
+            return self
+        try:
+            if failed:
+                # keys whose steps were all skipped still hold the previous build's state
+                changed = {key: entry for key, entry in self._current.items() if key in self._diverged}
+                entries = {**self._previous, **changed}
+            else:
+                self._delete_stale()
+                entries = self._current
+            if self.path is None:
+                _LAST[self._Sapobj] = entries
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps({"version": 1, "entries": entries}, indent=1), encoding="utf-8")
+        finally:
+            self._Sapobj.manifest = self._outer
+            self._outer = None
+            self.active = False
+        logger.opt(colors=True).success(
+            f"Incremental build: <cyan>{self.counts[NEW]}</cyan> new, <cyan>{self.counts[CHANGED]}</cyan> changed, "
+            f"<cyan>{self.counts[SAME]}</cyan> unchanged, <cyan>{self.counts['deleted']}</cyan> deleted")
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop(failed=exc_type is not None)
+
+    # ---- steps ----
+    def step(self, kind: str, key: str, *content, name: Optional[str] = None) -> str:
+        """
+        Claim a build step and tell whether it has to be made.
+
+        Args:
+            kind (str): What the step makes, e.g. "Point", "PointMass", "LinkProp" (see PARENTS and UNDO).
+            key (str): The object the step is made on, unique per kind.
+            *content: Everything the step depends on.
+            name (str, optional): Name of the object in SAP2000 if it is not the key.
+
+        Returns:
+            str: SAME (the model has it, skip the step), CHANGED (the model has an older version of it)
+                or NEW (the model does not have it).
+        """
+        digest = content_hash(*content)
+        entry_key = f"{kind}:{key}"
+        previous = self._previous.get(entry_key)
+        entry = self._current.get(entry_key)
+        if entry is None:
+            entry = self._current[entry_key] = {"name": previous["name"] if previous else (name or key), "steps": []}
+        steps = entry["steps"]
+        if steps and steps[-1] == digest:
+            # the same step again
+            return SAME
+        position = len(steps)
+        steps.append(digest)
+        if previous is None:
+            interface = INTERFACES.get(kind)
+            exists = interface is not None and self._Sapobj.ModelCache.has(interface, entry["name"])
+            status = CHANGED if exists else NEW
+        elif (entry_key not in self._diverged and position < len(previous["steps"])
+              and previous["steps"][position] == digest):
+            status = SAME
+        else:
+            status = CHANGED
+        if status != SAME:
+            self._diverged.add(entry_key)
+            if kind in RECREATED:
+                # made again from scratch, so are the steps on it
+                self._forget_children(kind, key)
+        self.counts[status] += 1
+        return status
+
+    def name(self, kind: str, key: str) -> str:
+        """Name in SAP2000 of the object claimed as kind/key, the one of the previous build until it is renamed."""
+        entry = self._current.get(f"{kind}:{key}") or self._previous.get(f"{kind}:{key}")
+        return key if entry is None else entry["name"]
+
+    def rename(self, kind: str, key: str, name: str):
+        """Record the name SAP2000 gave the object claimed as kind/key (auto named objects)."""
+        entry = self._current.get(f"{kind}:{key}")
+        if entry is not None:
+            entry["name"] = name
+
+    # ---- model ----
+    def _forget_children(self, kind: str, key: str):
+        for child, parent in PARENTS.items():
+            if parent == kind:
+                self._previous.pop(f"{child}:{key}", None)
+
+    def _check_model(self):
+        """Forget previous entries whose object is not in the model any more, they are made again."""
+        missing = []
+        for entry_key, entry in self._previous.items():
+            interface = INTERFACES.get(entry_key.partition(":")[0])
+            if interface is not None and not self._Sapobj.ModelCache.has(interface, entry["name"]):
+                missing.append(entry_key)
+        for entry_key in missing:
+            del self._previous[entry_key]
+            self._forget_children(*entry_key.split(":", 1))
+        if missing:
+            logger.warning(f"{len(missing)} objects of the previous build are not in the model, they are made again")
+
+    def _delete_stale(self):
+        """Undo the previous build's steps that this build did not make."""
+        stale: List[str] = [entry_key for entry_key in self._previous if entry_key not in self._current]
+        for entry_key, entry in self._current.items():
+            previous = self._previous.get(entry_key)
+            if previous is not None and entry_key not in self._diverged and len(entry["steps"]) < len(previous["steps"]):
+                # the model holds the state of steps this build stopped making, it is made again next time
+                logger.warning(f"{entry_key} changed its build steps, it is removed and made on the next build")
+                stale.append(entry_key)
+        gone = set(stale)
+        Model = self._Sapobj._Model
+        for kind, call in UNDO.items():
+            interface, method = call.split(".")
+            for entry_key in reversed(stale):
+                entry_kind, _, key = entry_key.partition(":")
+                if entry_kind != kind or f"{PARENTS.get(kind)}:{key}" in gone:
+                    # deleted with the object it is made on
+                    continue
+                ret = getattr(getattr(Model, interface), method)(self._previous[entry_key]["name"])
+                if (ret[-1] if isinstance(ret, (list, tuple)) else ret) == 0:
+                    self.counts["deleted"] += 1
+                else:
+                    logger.warning(f"{call} of {entry_key} failed")
+        for entry_key in stale:
+            self._current.pop(entry_key, None)
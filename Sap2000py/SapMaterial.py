@@ -1,16 +1,11 @@
 from typing import Literal
-class SapMaterial:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = SapMaterial_Set(Sapobj)
-        self.Get = SapMaterial_Get(Sapobj)
-        
+from Sap2000py.SapWrapper import SapChild, SapWrapper
+
+
+class SapMaterial(SapWrapper):
+    Set = SapChild("SapMaterial_Set")
+    Get = SapChild("SapMaterial_Get")
+
     def AddMaterial(self,name,matType,region,standard,grade):
         """
         ---adds a new standard material property to the model---
@@ -30,16 +25,7 @@ class SapMaterial:
         self.__Model.PropMaterial.ChangeName(nameList,name)
 
 
-class SapMaterial_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-    
+class SapMaterial_Set(SapWrapper):
     def SSCurve(self,matName:str,strainList:list[float],stressList:list[float]):
         """
         ---sets the material stress-strain curve for existing material ---
@@ -199,16 +185,7 @@ class SapMaterial_Set:
         """
         self.__Model.PropMaterial.SetOTendon_1(matName,Fy,Fu,SSType,SSHysType,FinalSlope)
 
-class SapMaterial_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class SapMaterial_Get(SapWrapper):
     def NameList(self, MatType:Literal['All','Steel','Concrete','NoDesign','Aluminum','ColdFormed','Rebar','Tendon'] = 'All'):
         """
         Retrieves the names of all defined material properties of the specified type.
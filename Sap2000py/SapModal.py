@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from typing import Literal, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+Direction = Literal["Ux", "Uy", "Uz", "Rx", "Ry", "Rz"]
+DIRECTIONS = ("Ux", "Uy", "Uz", "Rx", "Ry", "Rz")
+
+
+def rayleigh_coefficients(T1: float, T2: float, Damping1: float = 0.05, Damping2: float = None) -> Tuple[float, float]:
+    """Mass and stiffness proportional coefficients of Rayleigh damping.
+
+    Solves  xi_i = a/(2*w_i) + b*w_i/2  at the two control periods.
+
+    Args:
+        T1 (float): First control period [s].
+        T2 (float): Second control period [s].
+        Damping1 (float): Damping ratio at T1. Defaults to 0.05.
+        Damping2 (float, optional): Damping ratio at T2, defaults to Damping1.
+
+    Returns:
+        tuple[float, float]: (a, b), use as
+            case.set_damping_rayleigh(DampType='MassStiffness', Dampa=a, Dampb=b)
+    """
+    Damping2 = Damping1 if Damping2 is None else Damping2
+    w1, w2 = 2 * np.pi / T1, 2 * np.pi / T2
+    if np.isclose(w1, w2):
+        raise ValueError("Rayleigh damping needs two different control periods")
+    a = 2 * w1 * w2 * (Damping1 * w2 - Damping2 * w1) / (w2**2 - w1**2)
+    b = 2 * (Damping2 * w2 - Damping1 * w1) / (w2**2 - w1**2)
+    return float(a), float(b)
+
+
+@dataclass(frozen=True)
+class ModalSummary:
+    """Periods and participating mass ratios of one modal case as NumPy arrays.
+
+    Attributes:
+        LoadCase (str): Name of the modal case.
+        Period (ndarray): Period of every mode [s].
+        MassRatio (ndarray): Participating mass ratios, shape (mode, 6) in DIRECTIONS order.
+        SumMassRatio (ndarray): Cumulative participating mass ratios, shape (mode, 6).
+    """
+
+    LoadCase: str
+    Period: NDArray[np.float64]
+    MassRatio: NDArray[np.float64]
+    SumMassRatio: NDArray[np.float64]
+
+    @classmethod
+    def from_table(cls, table, LoadCase: str = None) -> "ModalSummary":
+        """Build from Results.Modal.ParticipatingMassRatios(as_table=True).
+
+        Args:
+            table (ResultTable): ModalParticipatingMassRatios table.
+            LoadCase (str, optional): Modal case to keep, defaults to the first one in the table.
+        """
+        if LoadCase is None:
+            LoadCase = str(table["LoadCase"][0]) if len(table) else ""
+        table = table.where(LoadCase=LoadCase)
+        order = np.argsort(table["StepNum"], kind="stable")
+        return cls(LoadCase=LoadCase,
+                   Period=table["Period"][order],
+                   MassRatio=table.numeric(["Ux", "Uy", "Uz", "Rx", "Ry", "Rz"])[order],
+                   SumMassRatio=table.numeric(["SumUx", "SumUy", "SumUz", "SumRx", "SumRy", "SumRz"])[order])
+
+    @property
+    def NumberModes(self) -> int:
+        return len(self.Period)
+
+    @property
+    def Frequency(self) -> NDArray[np.float64]:
+        return 1 / self.Period
+
+    def first_mode_over(self, Direction: Direction, Threshold: float = 0.1) -> int:
+        """Index of the first mode whose mass ratio in Direction is greater than Threshold, -1 if none."""
+        over = self.MassRatio[:, DIRECTIONS.index(Direction)] > Threshold
+        return int(np.argmax(over)) if over.any() else -1
+
+    def first_mode_sum_over(self, Direction: Direction, Threshold: float = 0.9) -> int:
+        """Index of the first mode whose cumulative mass ratio in Direction is greater than Threshold, -1 if none."""
+        # cumulative ratios never decrease, so a binary search is enough
+        index = int(np.searchsorted(self.SumMassRatio[:, DIRECTIONS.index(Direction)], Threshold, side="right"))
+        return index if index < self.NumberModes else -1
+
+    def control_periods(self, Direction: Direction, RatioThreshold: float = 0.1,
+                        SumThreshold: float = 0.9) -> Tuple[float, float]:
+        """Rayleigh control periods of a direction.
+
+        Args:
+            Direction (str): One of "Ux", "Uy", "Uz", "Rx", "Ry", "Rz".
+            RatioThreshold (float): T1 is the period of the first mode with mass ratio above it. Defaults to 0.1.
+            SumThreshold (float): T2 is the period of the first mode with cumulative ratio above it. Defaults to 0.9.
+
+        Returns:
+            tuple[float, float]: (T1, T2), nan where no mode reaches the threshold.
+        """
+        i1 = self.first_mode_over(Direction, RatioThreshold)
+        i2 = self.first_mode_sum_over(Direction, SumThreshold)
+        return (float(self.Period[i1]) if i1 >= 0 else np.nan,
+                float(self.Period[i2]) if i2 >= 0 else np.nan)
+
+    def rayleigh(self, Direction: Direction, Damping: float = 0.05, RatioThreshold: float = 0.1,
+                 SumThreshold: float = 0.9, T2: float = None) -> Tuple[float, float]:
+        """Rayleigh (a, b) at the control periods of a direction.
+
+        Args:
+            Direction (str): One of "Ux", "Uy", "Uz", "Rx", "Ry", "Rz".
+            Damping (float): Damping ratio at both control periods. Defaults to 0.05.
+            RatioThreshold (float): See control_periods.
+            SumThreshold (float): See control_periods.
+            T2 (float, optional): Override the second control period, e.g. min(T2x, T2z).
+
+        Returns:
+            tuple[float, float]: (a, b) for set_damping_rayleigh(DampType='MassStiffness', Dampa=a, Dampb=b)
+        """
+        T1, T2_ = self.control_periods(Direction, RatioThreshold, SumThreshold)
+        return rayleigh_coefficients(T1, T2_ if T2 is None else T2, Damping, Damping)
+
+    def significant_modes(self, Threshold: float = 0.01, Limit: int = None) -> NDArray[np.int64]:
+        """Indices of the modes with a translational mass ratio above Threshold, at most Limit of them."""
+        modes = np.flatnonzero((self.MassRatio[:, :3] > Threshold).any(axis=1))
+        return modes if Limit is None else modes[:Limit]
@@ -0,0 +1,224 @@
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from Sap2000py.SapProfiler import ModelProxy
+
+# interfaces whose name lists are cached, SapModel.<interface>.GetNameList
+NAMED = ("PointObj", "FrameObj", "LinkObj", "AreaObj", "SolidObj", "CableObj", "TendonObj", "PropFrame",
+         "PropMaterial", "PropLink", "PropArea", "GroupDef", "LoadPatterns", "LoadCases", "RespCombo",
+         "ConstraintDef", "Func")
+OBJECTS = ("PointObj", "FrameObj", "LinkObj", "AreaObj", "SolidObj", "CableObj", "TendonObj")
+# calls after which nothing cached can be trusted, File.Save and the other File calls keep the model
+RESETS = ("File.New", "File.OpenFile", "InitializeNewModel", "DatabaseTables.ApplyEditedTables", "EditGeneral.",
+          "EditPoint.", "EditFrame.", "EditArea.", "EditSolid.")
+# PropLink.GetTypeOAPI codes of the link property setters
+LINK_TYPES = {"Linear": 1, "Damper": 2, "Gap": 3, "Hook": 4, "PlasticWen": 5, "Isolator1": 6, "Isolator2": 7,
+              "MultiLinearElastic": 8, "MultiLinearPlastic": 9, "Isolator3": 10}
+
+
+def _succeeded(result) -> bool:
+    if isinstance(result, (list, tuple)):
+        return bool(result) and result[-1] == 0
+    return result == 0
+
+
+class _Observed:
+    """Stand-in of a model changing API method: the call is made, then the cache is updated."""
+
+    __slots__ = ("_func", "_name", "_cache")
+
+    def __init__(self, func, name: str, cache: "SapModelCache"):
+        self._func = func
+        self._name = name
+        self._cache = cache
+
+    def __call__(self, *args):
+        result = self._func(*args)
+        self._cache.observe(self._name, args, result)
+        return result
+
+
+class SapModelCache:
+    """Read-through cache of model state that is queried often and changes rarely.
+
+    Name lists (sections, materials, link properties, groups, cases, objects,
+    ...), link property types and the database units are read from SAP2000
+    once and answered from memory afterwards, so existence checks are set
+    lookups instead of API calls.
+
+    The cache is kept right by the calls that change the model: Saproject
+    routes `_Model` through a ModelProxy that sees every Set/Add/Delete/
+    ChangeName call and updates exactly the entries it affects, e.g. a
+    successful `PropFrame.SetRectangle("Pier", ...)` adds "Pier" to the
+    cached PropFrame names, `PropLink.SetLinear("B1", ...)` forgets the cached
+    type of "B1". Opening a file, a new model, table imports and interactive
+    edits clear everything. Changes made around the package (another script,
+    the SAP2000 GUI) are not seen, call `clear()` after them.
+
+    Example:
+        >>> Sap.ModelCache.has("PropFrame", "Pier")
+        >>> Sap.ModelCache.names("GroupDef")
+        >>> Sap.ModelCache.hits, Sap.ModelCache.misses
+    """
+
+    def __init__(self, Sapobj):
+        """
+        Args:
+            Sapobj: The Saproject whose model is cached.
+        """
+        self._Sapobj = Sapobj
+        self._names: Dict[str, Dict[str, None]] = {}
+        self._link_types: Dict[str, Optional[int]] = {}
+        self._units: Optional[int] = None
+        self._generation = 0
+        self._removals: Counter = Counter()
+        self._listeners = []
+        self.hits = 0
+        self.misses = 0
+
+    def attach(self, model) -> ModelProxy:
+        """Forget everything and return the proxy of a new model pointer, stored as Saproject._Model."""
+        self.clear()
+        return ModelProxy(model, self)
+
+    def clear(self):
+        """Forget every cached value."""
+        self._names.clear()
+        self._link_types.clear()
+        self._units = None
+        self._generation += 1
+        for listener in self._listeners:
+            listener.clear()
+
+    def subscribe(self, listener):
+        """Pass the model changes on to listener (e.g. SapModelMirror).
+
+        listener.observe(path, args, result) gets every successful watched call, listener.clear() every
+        reset: a new model, a file opened, a table import, an interactive edit.
+        """
+        self._listeners.append(listener)
+
+    # ---- reads ----
+    def _namelist(self, interface: str) -> Dict[str, None]:
+        names = self._names.get(interface)
+        if names is None:
+            self.misses += 1
+            ret = getattr(self._Sapobj._Model, interface).GetNameList()
+            names = self._names[interface] = dict.fromkeys(ret[1] or ()) if ret[-1] == 0 else {}
+        else:
+            self.hits += 1
+        return names
+
+    def names(self, interface: str) -> Tuple[str, ...]:
+        """Names defined in an interface, e.g. names("PropMaterial"), in SAP2000's order."""
+        return tuple(self._namelist(interface))
+
+    def has(self, interface: str, name: str) -> bool:
+        """Whether a name is defined in an interface, e.g. has("PointObj", "P1")."""
+        return name in self._namelist(interface)
+
+    def link_prop_type(self, name: str) -> Optional[int]:
+        """PropLink.GetTypeOAPI code of a link property (see LINK_TYPES), None if it is not defined."""
+        if name in self._link_types:
+            self.hits += 1
+            return self._link_types[name]
+        self.misses += 1
+        ret = self._Sapobj._Model.PropLink.GetTypeOAPI(name)
+        linktype = self._link_types[name] = ret[0] if ret[-1] == 0 else None
+        return linktype
+
+    def units(self) -> int:
+        """Database units of the model (GetDatabaseUnits)."""
+        if self._units is None:
+            self.misses += 1
+            self._units = self._Sapobj._Model.GetDatabaseUnits()
+        else:
+            self.hits += 1
+        return self._units
+
+    def revision(self, interface: str) -> Tuple[int, int]:
+        """Moves when the model is replaced or names of an interface are removed, renamed or made by
+        another interface (points of FrameObj.AddByCoord), derived data such as the joint registry
+        rebuilds when it moves."""
+        return self._generation, self._removals[interface]
+
+    # ---- invalidation ----
+    def _add(self, interface: str, name):
+        if interface in self._names and isinstance(name, str) and name:
+            self._names[interface][name] = None
+
+    def _drop(self, interface: str):
+        self._names.pop(interface, None)
+        self._removals[interface] += 1
+
+    def observe(self, path: str, args: tuple, result):
+        """Update the cache after the API call `path` (e.g. "PropFrame.SetRectangle") returned result."""
+        if path.startswith(RESETS):
+            self.clear()
+            return
+        if not _succeeded(result):
+            return
+        for listener in self._listeners:
+            listener.observe(path, args, result)
+        interface, _, method = path.partition(".")
+        method = method.rsplit(".", 1)[-1]
+        if method.startswith("Add") and interface in OBJECTS:
+            # objects get the name SAP2000 picked, coordinates may have created points
+            self._add(interface, result[0] if isinstance(result, (list, tuple)) else None)
+            if "Coord" in method and interface != "PointObj":
+                self._drop("PointObj")
+        elif method.startswith("Delete") and interface in OBJECTS:
+            # ItemType group/selection deletes many, points take their objects with them
+            self._drop(interface)
+            if interface == "PointObj":
+                for other in OBJECTS[1:]:
+                    self._drop(other)
+        elif method in ("Delete", "ChangeName"):
+            self._removals[interface] += 1
+            if method == "ChangeName" and interface in self._names and len(args) > 1:
+                self._names[interface].pop(args[0], None)
+                self._add(interface, args[1])
+            elif interface in self._names and args:
+                self._names[interface].pop(args[0], None)
+            if interface == "PropLink" and args:
+                self._link_types.pop(args[0], None)
+                if method == "ChangeName":
+                    self._link_types.pop(args[1], None)
+        elif interface == "PropMaterial" and method == "AddMaterial":
+            self._add(interface, result[0])
+        elif interface == "LoadPatterns" and method == "Add":
+            self._add(interface, args[0])
+            if len(args) < 4 or args[3]:
+                self._add("LoadCases", args[0])
+        elif interface == "LoadCases" and method == "SetCase":
+            self._add(interface, args[0])
+        elif interface == "GroupDef" and method == "SetGroup":
+            self._add(interface, args[0])
+        elif interface in ("PropFrame", "PropLink", "PropArea", "ConstraintDef", "Func", "RespCombo",
+                           "PropMaterial") and method.startswith(("Set", "Add")) and args:
+            # Set<Type>(Name, ...) defines or redefines Name
+            if interface == "PropLink":
+                self._link_types.pop(args[0], None)
+                if method[3:] not in LINK_TYPES:
+                    return
+            if interface == "PropFrame" and method.startswith("SetModifiers"):
+                return
+            self._add(interface, args[0])
+
+    @staticmethod
+    def watches(path: str) -> bool:
+        """Whether the API call `path` can change cached state."""
+        if path.startswith(RESETS):
+            return True
+        interface, _, method = path.partition(".")
+        method = method.rsplit(".", 1)[-1]
+        if interface == "SelectObj":
+            # the selection, for listeners
+            return True
+        return interface in NAMED and method.startswith(("Set", "Add", "Delete", "ChangeName", "Clear"))
+
+    # ---- ModelProxy hook ----
+    def method(self, func, name: str):
+        if self.watches(name):
+            return _Observed(func, name, self)
+        return func
@@ -0,0 +1,326 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+# object type codes of PointObj.GetConnectivity
+FRAME = 2
+LINK = 7
+# objects/points added since the CSR adjacency or the KD-tree was built are scanned until there are this many
+TAIL = 1024
+
+
+class _Grown:
+    """Names and a row block grown by doubling, deleted rows keep their place with the name removed."""
+
+    def __init__(self, width: int, dtype, fill):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.data = np.full((64, width), fill, dtype=dtype)
+        self._fill = fill
+
+    def add(self, name: str, row) -> int:
+        i = len(self.names)
+        if i == len(self.data):
+            self.data = np.vstack([self.data, np.full_like(self.data, self._fill)])
+        self.data[i] = row
+        self.names.append(name)
+        self.index[name] = i
+        return i
+
+    def delete(self, name: str) -> bool:
+        i = self.index.pop(name, None)
+        if i is None:
+            return False
+        self.data[i] = self._fill
+        self.names[i] = ""
+        return True
+
+    def rename(self, old: str, new: str) -> bool:
+        i = self.index.pop(old, None)
+        if i is None:
+            return False
+        self.names[i] = new
+        self.index[new] = i
+        return True
+
+    def rows(self) -> np.ndarray:
+        return self.data[:len(self.names)]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class SapModelMirror:
+    """In-memory copy of the model geometry that answers geometric queries without API calls.
+
+    Points (names, coordinates), frames and links (names, end point rows) are
+    kept as NumPy arrays. A KD-tree of the coordinates (an x-sorted index
+    without scipy) and a CSR adjacency from points to the frames and links at
+    them are built when a query needs them, so nearest point, points in a
+    box, objects connected to a point and links between two points are
+    answered locally.
+
+    The mirror is read from SAP2000 on the first query (PointObj.GetAllPoints,
+    FrameObj.GetAllFrames and the "Connectivity - Link" table) and kept in step
+    with the calls made through `_Model`, it listens to the SapModelCache:
+    points added in the global system, frames and links added by point are
+    appended, single frames and links deleted or any object renamed are
+    changed in place. Anything else that changes the geometry (a new model, a
+    table import, interactive edits, deleted points, adding by coordinates)
+    marks it stale and it is read again on the next query. Changes made around
+    the package are seen after `rebuild()`.
+
+    Example:
+        >>> Sap.Mirror.nearest([10.0, 0.0, 25.0])
+        >>> Sap.Mirror.points_in_box([0, -5, 0], [40, 5, 30])
+        >>> Sap.Mirror.links_between("P1_Bottom", "G1_Top")
+    """
+
+    def __init__(self, Sapobj):
+        """
+        Args:
+            Sapobj: The Saproject whose model is mirrored.
+        """
+        self._Sapobj = Sapobj
+        self._reset()
+        self.stale = True
+        Sapobj.ModelCache.subscribe(self)
+
+    def _reset(self):
+        self._points = _Grown(3, np.float64, np.nan)
+        self._objects = {FRAME: _Grown(2, np.int64, -1), LINK: _Grown(2, np.int64, -1)}
+        self._tree = None
+        self._tree_n = 0
+        self._by_x = None
+        self._csr = None
+        self._csr_n = {FRAME: 0, LINK: 0}
+
+    # ---- sync ----
+    def clear(self):
+        """Mark the mirror stale, it is read from SAP2000 again on the next query."""
+        self.stale = True
+
+    def sync(self):
+        """Read the model if the mirror is stale."""
+        if self.stale:
+            self.rebuild()
+
+    def rebuild(self):
+        """Read points, frames and links from SAP2000 (three API calls)."""
+        self._reset()
+        Model = self._Sapobj._Model
+        ret = Model.PointObj.GetAllPoints(0, [], [], [], [], "Global")
+        if ret[-1] == 0 and ret[0]:
+            for name, xyz in zip(ret[1], np.column_stack(ret[2:5])):
+                self._points.add(name, xyz)
+        ret = Model.FrameObj.GetAllFrames(0, [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [],
+                                          [], "Global")
+        if ret[-1] == 0 and ret[0]:
+            for name, i, j in zip(ret[1], ret[4], ret[5]):
+                self._add_object(FRAME, name, i, j)
+        ret = Model.DatabaseTables.GetTableForEditingArray("Connectivity - Link", "", 0, [], 0, [])
+        fields = list(ret[1] or ())
+        if ret[-1] == 0 and {"Link", "JointI", "JointJ"} <= set(fields):
+            data, width = list(ret[3] or ()), len(fields)
+            name, i, j = (fields.index(field) for field in ("Link", "JointI", "JointJ"))
+            for k in range(int(ret[2] or 0)):
+                record = data[k * width:(k + 1) * width]
+                self._add_object(LINK, record[name], record[i], record[j] or record[i])
+        self.stale = False
+
+    def observe(self, path: str, args: tuple, result):
+        """Apply a successful model changing call (see SapModelCache.subscribe)."""
+        if self.stale:
+            return
+        interface, _, method = path.partition(".")
+        family = {"FrameObj": FRAME, "LinkObj": LINK}.get(interface)
+        if interface == "PointObj" and method == "AddCartesian":
+            name = result[0]
+            if name not in self._points.index:
+                if len(args) > 5 and args[5] != "Global":
+                    self.stale = True
+                else:
+                    self._points.add(name, [float(value) for value in args[:3]])
+        elif family is not None and method == "AddByPoint":
+            single = family == LINK and len(args) > 3 and args[3]
+            self._add_object(family, result[0], args[0], args[0] if single else args[1])
+        elif method == "ChangeName" and len(args) > 1 and (family is not None or interface == "PointObj"):
+            table = self._points if family is None else self._objects[family]
+            table.rename(args[0], args[1])
+        elif family is not None and method == "Delete" and (len(args) < 2 or args[1] == 0):
+            self._objects[family].delete(args[0])
+        elif interface in ("PointObj", "FrameObj", "LinkObj") and method.startswith(("Add", "Delete")):
+            # coordinates, other systems, groups and selections: read it again
+            self.stale = True
+
+    def _add_object(self, family: int, name: str, i: str, j: str):
+        points = self._points.index
+        if i not in points or j not in points:
+            self.stale = True
+            return
+        self._objects[family].add(name, (points[i], points[j]))
+
+    # ---- points ----
+    def __contains__(self, name: str) -> bool:
+        """Whether a point of this name exists."""
+        self.sync()
+        return name in self._points.index
+
+    @property
+    def points(self) -> List[str]:
+        """Names of the points, in model order."""
+        self.sync()
+        return [name for name in self._points.names if name]
+
+    @property
+    def frames(self) -> List[str]:
+        """Names of the frames, in model order."""
+        self.sync()
+        return [name for name in self._objects[FRAME].names if name]
+
+    @property
+    def links(self) -> List[str]:
+        """Names of the links, in model order."""
+        self.sync()
+        return [name for name in self._objects[LINK].names if name]
+
+    def coordinates(self, name: str) -> Optional[NDArray[np.float64]]:
+        """Global coordinates of a point, None if it does not exist."""
+        self.sync()
+        row = self._points.index.get(name)
+        return None if row is None else self._points.data[row].copy()
+
+    def _search(self):
+        """KD-tree (None without scipy) and x order of the points up to _tree_n, rebuilt once the tail outgrows TAIL."""
+        n = len(self._points.names)
+        if self._tree is None or n - self._tree_n > max(TAIL, self._tree_n // 4):
+            xyz = self._points.rows()
+            known = np.flatnonzero(~np.isnan(xyz[:, 0]))
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                self._tree = (None, known)
+            else:
+                self._tree = (cKDTree(xyz[known]), known)
+            order = known[np.argsort(xyz[known, 0], kind="stable")]
+            self._by_x = (order, xyz[order, 0])
+            self._tree_n = n
+        return n
+
+    def nearest(self, xyz, k: int = 1) -> List[Tuple[str, float]]:
+        """
+        The k points closest to a location.
+
+        Args:
+            xyz: Global coordinates of the location.
+            k (int): Number of points. Defaults to 1.
+
+        Returns:
+            list[tuple[str, float]]: (name, distance) of the points, closest first.
+        """
+        self.sync()
+        n = self._search()
+        xyz = np.asarray(xyz, dtype=float)
+        tree, known = self._tree
+        found = []
+        if tree is not None and tree.n:
+            distances, rows = tree.query(xyz, k=min(k, tree.n))
+            found = list(zip(np.atleast_1d(distances).tolist(), known[np.atleast_1d(rows)].tolist()))
+        elif tree is None and len(known):
+            # no scipy: the k-th closest of the 2k points nearest in x bounds the x slab to search
+            order, x = self._by_x
+            at = np.searchsorted(x, xyz[0])
+            probe = order[max(at - k, 0):at + k]
+            bound = np.sort(np.linalg.norm(self._points.data[probe] - xyz, axis=1))[min(k, len(probe)) - 1]
+            rows = order[np.searchsorted(x, xyz[0] - bound, "left"):np.searchsorted(x, xyz[0] + bound, "right")]
+            distances = np.linalg.norm(self._points.data[rows] - xyz, axis=1)
+            found = list(zip(distances.tolist(), rows.tolist()))
+        tail = self._points.data[self._tree_n:n]
+        if len(tail):
+            distances = np.linalg.norm(tail - xyz, axis=1)
+            found += [(d, self._tree_n + r) for r, d in enumerate(distances.tolist()) if d == d]
+        found.sort()
+        return [(self._points.names[row], distance) for distance, row in found[:k]]
+
+    def points_in_box(self, lower, upper) -> List[str]:
+        """
+        Points inside an axis aligned box, boundary included.
+
+        Args:
+            lower: Smallest global x, y, z of the box.
+            upper: Largest global x, y, z of the box.
+
+        Returns:
+            list[str]: Names of the points, in model order.
+        """
+        self.sync()
+        n = self._search()
+        lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+        order, x = self._by_x
+        candidates = order[np.searchsorted(x, lower[0], "left"):np.searchsorted(x, upper[0], "right")]
+        candidates = np.concatenate([candidates, np.arange(self._tree_n, n)])
+        xyz = self._points.data[candidates]
+        inside = candidates[((xyz >= lower) & (xyz <= upper)).all(axis=1)]
+        return [self._points.names[row] for row in np.sort(inside).tolist()]
+
+    # ---- connectivity ----
+    def _adjacency(self):
+        """CSR point -> (type, object row) of the frames and links up to _csr_n, rebuilt once the tail outgrows TAIL."""
+        sizes = {family: len(objects.names) for family, objects in self._objects.items()}
+        tail = sum(sizes[family] - self._csr_n[family] for family in sizes)
+        if self._csr is None or tail > max(TAIL, sum(self._csr_n.values()) // 4):
+            points, families, rows = [], [], []
+            for family, objects in self._objects.items():
+                ends = objects.rows()
+                single = ends[:, 0] == ends[:, 1]
+                for end, mask in ((0, ends[:, 0] >= 0), (1, (ends[:, 1] >= 0) & ~single)):
+                    live = np.flatnonzero(mask)
+                    points.append(ends[live, end])
+                    rows.append(live)
+                    families.append(np.full(len(live), family, dtype=np.int8))
+            points = np.concatenate(points)
+            order = np.argsort(points, kind="stable")
+            indptr = np.zeros(len(self._points.names) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(points, minlength=len(self._points.names)), out=indptr[1:])
+            self._csr = (indptr, np.concatenate(families)[order], np.concatenate(rows)[order])
+            self._csr_n = sizes
+        return self._csr
+
+    def connected(self, point: str) -> List[Tuple[int, str]]:
+        """
+        Frames and links connected to a point.
+
+        Args:
+            point (str): Name of the point.
+
+        Returns:
+            list[tuple[int, str]]: (type, name) of the objects, type 2 frame, 7 link as in
+                PointObj.GetConnectivity. Empty if the point does not exist.
+        """
+        self.sync()
+        p = self._points.index.get(point)
+        if p is None:
+            return []
+        indptr, families, rows = self._adjacency()
+        found = []
+        if p + 1 < len(indptr):
+            found = list(zip(families[indptr[p]:indptr[p + 1]].tolist(), rows[indptr[p]:indptr[p + 1]].tolist()))
+        for family, objects in self._objects.items():
+            first = self._csr_n[family]
+            ends = objects.data[first:len(objects.names)]
+            found += [(family, first + r) for r in np.flatnonzero((ends == p).any(axis=1)).tolist()]
+        names = [(family, self._objects[family].names[row]) for family, row in found]
+        return [(family, name) for family, name in names if name]
+
+    def _between(self, family: int, point1: str, point2: str) -> List[str]:
+        at1 = {name for kind, name in self.connected(point1) if kind == family}
+        return [name for kind, name in self.connected(point2) if kind == family and name in at1]
+
+    def links_between(self, point1: str, point2: str) -> List[str]:
+        """Names of the links from point1 to point2 (either direction)."""
+        return self._between(LINK, point1, point2)
+
+    def frames_between(self, point1: str, point2: str) -> List[str]:
+        """Names of the frames from point1 to point2 (either direction)."""
+        return self._between(FRAME, point1, point2)
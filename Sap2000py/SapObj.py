@@ -1,11 +1,10 @@
 
 from typing import Literal
 from loguru import logger
-class SapPointObj_Get:
-    def __init__(self, Sapobj):
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
+from Sap2000py.SapWrapper import SapChild, SapWrapper
 
+
+class SapPointObj_Get(SapWrapper):
     def CommonTo(self,name:str)->int:
         """
         ---This function returns the total number of objects (line, area, solid and link) that connect to the
@@ -272,11 +271,7 @@ class SapPointObj_Get:
         ret=self.__Model.PointObj.GetSpringCoupled(name,k)
         return ret
 
-class SapPointObj_Set:
-    def __init__(self,Sapobj):
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class SapPointObj_Set(SapWrapper):
     def Constraint(self,name:str,ConstraintName,ItemType=0,Replace=True):
         """
         ---This function makes joint constraint assignments to point objects.---
@@ -527,17 +522,9 @@ class SapPointObj_Set:
         ret = self.__Model.PointObj.SetSpringCoupled(name,k,ItemType,IsLocalCSys,Replace)
         return ret
 
-class SapPointObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Get = SapPointObj_Get(Sapobj)
-        self.Set = SapPointObj_Set(Sapobj)
+class SapPointObj(SapWrapper):
+    Get = SapChild(SapPointObj_Get)
+    Set = SapChild(SapPointObj_Set)
 
     def AddCartesian(self,x,y,z,Name="",UserName="",CSys="Global",MergeOff=False,MergeNumber=0):
         """
@@ -658,16 +645,7 @@ class SapPointObj:
         return ret
 
 
-class FrameObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class FrameObj_Set(SapWrapper):
     def AutoMesh(self,name,autoMesh,AutoMeshAtPoints,AutoMeshAtLines,
                                     umSegs,AutoMeshMaxLength,ItemType=0):
         """
@@ -1349,16 +1327,7 @@ class FrameObj_Set:
         ret = self.__Model.FrameObj.SetTCLimits(name,LimitCompressionExists,LimitCompression,LimitTensionExists,LimitTension,itemType)
         return ret
 
-class FrameObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class FrameObj_Get(SapWrapper):
     def AutoMesh(self,name):
         """
         ---This function retrieves the automatic meshing assignments to frame objects---
@@ -1824,17 +1793,9 @@ class FrameObj_Get:
         ret=self.__Model.FrameObj.GetTransformationMatrix(name)
         return ret
 
-class SapFrameObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = FrameObj_Set(Sapobj)
-        self.Get = FrameObj_Get(Sapobj)
+class SapFrameObj(SapWrapper):
+    Set = SapChild(FrameObj_Set)
+    Get = SapChild(FrameObj_Get)
 
     def AddByCoord(self,xi,yi,zi,xj,yj,zj,propName="Default",userName="",Csys="Global"):
         """
@@ -1921,16 +1882,7 @@ class SapFrameObj:
 
 
 
-class CableObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class CableObj_Set(SapWrapper):
     def CableData(self,name,CableType,NumSegs,Weight,ProjectedLoad,Value,UseDeformedGeom=False,
                                      ModelUsingFrames=False):
         """
@@ -2168,16 +2120,7 @@ class CableObj_Set:
         ret = self.__Model.CableObj.SetProperty(name,PropName,itemType)
         return ret
 
-class CableObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class CableObj_Get(SapWrapper):
     def CableData(self,name):
         """
         ---This function retrieves definition data for a specified cable object.---
@@ -2448,17 +2391,9 @@ class CableObj_Get:
             ret=self.__Model.CableObj.GetTransformationMatrix(name)
             return ret
 
-class SapCableObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = CableObj_Set(Sapobj)
-        self.Get = CableObj_Get(Sapobj)
+class SapCableObj(SapWrapper):
+    Set = SapChild(CableObj_Set)
+    Get = SapChild(CableObj_Get)
 
     def AddByCoord(self,xi,yi,zi,xj,yj,zj,propName="Default",UserName="",CSys="Global"):
         """
@@ -2522,16 +2457,7 @@ class SapCableObj:
 
 
 
-class TendonObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class TendonObj_Set(SapWrapper):
     def Discretization(self,name,Value,itemType=0):
         """
         ---This function assigns a maximum discretization length to tendon objects---
@@ -2797,16 +2723,7 @@ class TendonObj_Set:
         ret = self.__Model.TendonObj.SetTendonData(name,NumberPoints,MyType,x,y,z,CSys)
         return ret
 
-class TendonObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class TendonObj_Get(SapWrapper):
     def Discretization(self,name):
         """
         ---This function retrieves the maximum discretization length assignment for tendon objects---
@@ -3089,17 +3006,9 @@ class TendonObj_Get:
         ret=self.__Model.TendonObj.GetTransformationMatrix(name)
         return ret
 
-class SapTendonObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = TendonObj_Set(Sapobj)
-        self.Get = TendonObj_Get(Sapobj)
+class SapTendonObj(SapWrapper):
+    Set = SapChild(TendonObj_Set)
+    Get = SapChild(TendonObj_Get)
 
     def AddByCoord(self,xi,yi,zi,xj,yj,zj,PropName="Default",UserName="",CSsy="Global"):
         """
@@ -3153,16 +3062,7 @@ class SapTendonObj:
         return ret
 
 
-class AreaObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class AreaObj_Set(SapWrapper):
     def AutoMesh(self,name,MeshType,n1=2,n2=2,MaxSize1=0,MaxSize2=0,PointOnEdgeFromLine=False,
                                    PointOnEdgeFromPoint=False,ExtendCookieCutLines=False,
                                    Rotation=0,MaxSizeGeneral=0,LocalAxesOnEdge=False,LocalAxesOnFace=False,
@@ -3708,16 +3608,7 @@ class AreaObj_Set:
         ret = self.__Model.AreaObj.SetThickness(name,ThinknessType,ThinknessPattern,ThicknessPatternSF,Thickness,itemType)
         return ret
 
-class AreaObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class AreaObj_Get(SapWrapper):
     def AutoMesh(self,name):
         """
         ---This function retrieves the automatic meshing assignments to area objects---
@@ -4250,17 +4141,9 @@ class AreaObj_Get:
         ret=self.__Model.AreaObj.GetTransformationMatrix(name)
         return ret
 
-class SapAreaObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = AreaObj_Set(Sapobj)
-        self.Get = AreaObj_Get(Sapobj)
+class SapAreaObj(SapWrapper):
+    Set = SapChild(AreaObj_Set)
+    Get = SapChild(AreaObj_Get)
 
     def AddByCoord(self,NumberPoints,x,y,z,PropName="Default",UserName="",CSys="Global"):
         """
@@ -4324,16 +4207,7 @@ class SapAreaObj:
         return ret
 
 
-class SolidObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class SolidObj_Set(SapWrapper):
     def AutoMesh(self,name,MeshType,n1=2,n2=2,n3=2,MaxSize1=0,MaxSize2=0,MaxSize3=0,RestraintsOnEdge=False,
                                     RestraintOnFace=False):
         """
@@ -4620,16 +4494,7 @@ class SolidObj_Set:
         ret = self.__Model.SolidObj.SetSpring(Name,MyType,s,SimpleSpringType,LinkProp,Face,SpringLocalOneType,Dir,Outward,Vec,Ang,Replace,CSys,itemType)
         return ret
 
-class SolidObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class SolidObj_Get(SapWrapper):
     def AutoMesh(self,name):
         """
         ---The name of an existing solid object---
@@ -4951,17 +4816,9 @@ class SolidObj_Get:
         ret=self.__Model.SolidObj.GetTransformationMatrix(Name)
         return ret
 
-class SapSolidObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = SolidObj_Set(Sapobj)
-        self.Get = SolidObj_Get(Sapobj)
+class SapSolidObj(SapWrapper):
+    Set = SapChild(SolidObj_Set)
+    Get = SapChild(SolidObj_Get)
 
     def AddByCoord(self,x,y,z,PropName="Default",UserName="",CSys="Global"):
         """
@@ -5012,16 +4869,7 @@ class SapSolidObj:
         return ret
 
 
-class LinkObj_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class LinkObj_Set(SapWrapper):
     def GroupAssign(self,Name,GroupName,Remove=False,itemType=0):
         """
         ---This function adds or removes link objects from a specified group---
@@ -5166,16 +5014,7 @@ class LinkObj_Set:
         ret = self.__Model.LinkObj.SetPropertyFD(Name,PropName,itemType)
         return ret
 
-class LinkObj_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class LinkObj_Get(SapWrapper):
     def Elm(self,Name):
         """
         ---This function retrieves the name of the link element (analysis model link) associated with a specified
@@ -5390,17 +5229,9 @@ class LinkObj_Get:
         ret=self.__Model.LinkObj.GetTransformationMatrix(Name)
         return ret
 
-class SapLinkObj:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = LinkObj_Set(Sapobj)
-        self.Get = LinkObj_Get(Sapobj)
+class SapLinkObj(SapWrapper):
+    Set = SapChild(LinkObj_Set)
+    Get = SapChild(LinkObj_Get)
 
     def AddByCoord(self,xi,yi,zi,xj,yj,zj,IsSingleJoint=False,PropName="Default",
                                   UserName="",CSys="Global"):
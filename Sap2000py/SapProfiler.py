@@ -0,0 +1,292 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+# plain values returned by COM properties, handed back without a proxy
+_PLAIN = (int, float, str, bytes, bool, tuple, list, dict, type(None))
+
+
+def payload_size(value) -> int:
+    """Approximate bytes marshalled for an argument: 8 per number, utf-8 length of strings, sum over sequences."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bool, int, float)):
+        return 8
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(v) for v in value)
+    if isinstance(value, dict):
+        return sum(payload_size(k) + payload_size(v) for k, v in value.items())
+    return 8
+
+
+class CallStats:
+    """Latencies and argument payloads of one API method."""
+
+    __slots__ = ("name", "durations", "payload")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.durations: List[float] = []
+        self.payload = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def total(self) -> float:
+        return float(sum(self.durations))
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.durations, q)) if self.durations else 0.0
+
+
+class _Method:
+    """Timed stand-in of one COM method."""
+
+    __slots__ = ("_func", "_stats", "_profiler")
+
+    def __init__(self, func, stats: CallStats, profiler: "SapProfiler"):
+        self._func = func
+        self._stats = stats
+        self._profiler = profiler
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self._func(*args)
+        finally:
+            end = time.perf_counter()
+            stats = self._stats
+            stats.durations.append(end - start)
+            stats.payload += payload_size(args)
+            if self._profiler.trace:
+                self._profiler._events.append((stats.name, start, end, threading.get_ident()))
+
+
+class ModelProxy:
+    """Stand-in of SapModel (or one of its interfaces) that times every method call.
+
+    Attribute access is forwarded to the COM object: methods come back timed,
+    interfaces (PointObj, FrameObj, Results, ...) come back as nested proxies,
+    plain property values as they are. Both are cached per name.
+    """
+
+    def __init__(self, target, profiler: "SapProfiler", path: str = ""):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_profiler", profiler)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_members", {})
+
+    def __getattr__(self, name: str):
+        members = self._members
+        if name in members:
+            return members[name]
+        value = getattr(self._target, name)
+        path = f"{self._path}.{name}" if self._path else name
+        if callable(value):
+            member = self._profiler.method(value, path)
+        elif isinstance(value, _PLAIN):
+            # property values can change, never cached
+            return value
+        else:
+            member = ModelProxy(value, self._profiler, path)
+        members[name] = member
+        return member
+
+    def __setattr__(self, name: str, value):
+        setattr(self._target, name, value)
+
+    def __repr__(self) -> str:
+        return f"ModelProxy({self._path or 'SapModel'})"
+
+
+def remove_proxy(Sapobj, proxy: ModelProxy, owner: str) -> bool:
+    """Take proxy out of Saproject._Model, the model it wraps takes its place.
+
+    The proxy is the model pointer, or is wrapped by proxies started after it
+    (blocks closed out of order): the one wrapping it is pointed past it. If
+    the model was replaced while the proxy was in place (openSap, createSap),
+    it is left as it is.
+
+    Args:
+        Sapobj: The Saproject.
+        proxy (ModelProxy): The proxy put in place at start.
+        owner (str): Who put the proxy in place, for the warning.
+
+    Returns:
+        bool: Whether the proxy was found.
+    """
+    # proxies closed earlier may have pointed this one past theirs
+    raw = proxy._target
+    outer, current = None, Sapobj._Model
+    while isinstance(current, ModelProxy):
+        if current is proxy:
+            if outer is None:
+                Sapobj._Model = raw
+            else:
+                object.__setattr__(outer, "_target", raw)
+                # its cached members wrap the proxy's ones
+                outer._members.clear()
+            return True
+        outer, current = current, current._target
+    logger.warning(f"The model was replaced while the {owner} was active, it is left as it is")
+    return False
+
+
+class SapProfiler:
+    """Opt-in profiler of the SAP2000 API calls made through a Saproject.
+
+    While started, Saproject._Model is replaced by a ModelProxy, so every
+    wrapper (SapObj, SapDeal, SapSection, Sapload, Scripts, ...) is profiled
+    without changes, they all look the model pointer up at call time. When
+    stopped the proxy is taken out again, the calls go through the model
+    cache's proxy only (see SapModelCache). A model opened or created while
+    profiling is left as it is.
+
+    Example:
+        >>> with Sap.profile(trace=True) as prof:
+        ...     bridge.build()
+        >>> print(prof.report())
+        >>> prof.to_chrome_trace("build.trace.json")   # chrome://tracing or ui.perfetto.dev
+        >>> prof.to_speedscope("build.speedscope.json")  # www.speedscope.app
+    """
+
+    def __init__(self, Sapobj, trace: bool = False):
+        """
+        Args:
+            Sapobj: The Saproject whose model calls are profiled.
+            trace (bool): Also keep every call as an event for the trace exports. Defaults to False.
+        """
+        self._Sapobj = Sapobj
+        self.trace = trace
+        self._stats: Dict[str, CallStats] = {}
+        self._events: List[tuple] = []
+        self._raw = None
+        self._proxy: Optional[ModelProxy] = None
+        self._start: Optional[float] = None
+        self.wall_time = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._raw is not None
+
+    def stats(self, name: str) -> CallStats:
+        """Statistics of one API method, e.g. "PointObj.AddCartesian"."""
+        if name not in self._stats:
+            self._stats[name] = CallStats(name)
+        return self._stats[name]
+
+    def method(self, func, name: str) -> _Method:
+        """Stand-in of one API method, built once per method by ModelProxy."""
+        return _Method(func, self.stats(name), self)
+
+    def start(self):
+        """Route the model calls through the profiling proxy."""
+        if self.active:
+            return self
+        self._raw = self._Sapobj._Model
+        self._proxy = self._Sapobj._Model = ModelProxy(self._raw, self)
+        self._start = time.perf_counter()
+        return self
+
+    def stop(self):
+        """Take the profiling proxy out of the model pointer."""
+        if not self.active:
+            return self
+        self.wall_time += time.perf_counter() - self._start
+        remove_proxy(self._Sapobj, self._proxy, type(self).__name__)
+        self._raw = self._proxy = None
+        return self
+
+    def reset(self):
+        """Drop every statistic and event."""
+        self._stats.clear()
+        self._events.clear()
+        self.wall_time = 0.0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def com_time(self) -> float:
+        """Seconds spent inside API calls."""
+        return sum(stats.total for stats in self._stats.values())
+
+    def table(self, sort: str = "total") -> List[Dict[str, Union[str, int, float]]]:
+        """Statistics of every method as rows, sorted in descending order.
+
+        Args:
+            sort (str): Column to sort on: "total", "count", "mean", "p50", "p95", "p99", "max" or "payload".
+
+        Returns:
+            list[dict]: One row per method, times in milliseconds, payload in bytes.
+        """
+        rows = []
+        for stats in self._stats.values():
+            if not stats.count:
+                continue
+            durations = np.asarray(stats.durations) * 1e3
+            p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+            rows.append({"method": stats.name, "count": stats.count, "total": float(durations.sum()),
+                         "mean": float(durations.mean()), "p50": float(p50), "p95": float(p95),
+                         "p99": float(p99), "max": float(durations.max()), "payload": stats.payload})
+        return sorted(rows, key=lambda row: row[sort], reverse=True)
+
+    def report(self, sort: str = "total", limit: int = 30) -> str:
+        """Text table of the slowest methods, plus the share of the wall time spent in COM."""
+        wall = self.wall_time + (time.perf_counter() - self._start if self.active else 0.0)
+        com = self.com_time
+        lines = [f"wall {wall:.3f} s, API calls {com:.3f} s ({com / wall:.0%} of wall), "
+                 f"Python and the rest {wall - com:.3f} s" if wall else "nothing profiled",
+                 f"{'method':<50}{'count':>8}{'total ms':>12}{'mean ms':>10}{'p50':>9}{'p95':>9}"
+                 f"{'p99':>9}{'max':>9}{'payload B':>12}"]
+        for row in self.table(sort)[:limit]:
+            lines.append(f"{row['method']:<50}{row['count']:>8}{row['total']:>12.1f}{row['mean']:>10.3f}"
+                         f"{row['p50']:>9.3f}{row['p95']:>9.3f}{row['p99']:>9.3f}{row['max']:>9.3f}"
+                         f"{row['payload']:>12}")
+        return "\n".join(lines)
+
+    def _check_events(self) -> bool:
+        if not self._events:
+            logger.warning("No call events recorded, start the profiler with trace=True")
+            return False
+        return True
+
+    def to_chrome_trace(self, path: Union[str, Path]):
+        """Write the call events in the Chrome trace event format (chrome://tracing, Perfetto)."""
+        if not self._check_events():
+            return
+        origin = self._events[0][1]
+        events = [{"name": name, "cat": name.split(".")[0], "ph": "X", "pid": 0, "tid": tid,
+                   "ts": (start - origin) * 1e6, "dur": (end - start) * 1e6}
+                  for name, start, end, tid in self._events]
+        Path(path).write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+    def to_speedscope(self, path: Union[str, Path], name: str = "Sap2000py"):
+        """Write the call events as a speedscope evented profile (www.speedscope.app)."""
+        if not self._check_events():
+            return
+        origin = self._events[0][1]
+        frames: Dict[str, int] = {}
+        events = []
+        for method, start, end, _ in self._events:
+            frame = frames.setdefault(method, len(frames))
+            events.append({"type": "O", "frame": frame, "at": (start - origin) * 1e6})
+            events.append({"type": "C", "frame": frame, "at": (end - origin) * 1e6})
+        profile = {"type": "evented", "name": name, "unit": "microseconds", "startValue": 0,
+                   "endValue": events[-1]["at"], "events": events}
+        document = {"$schema": "https://www.speedscope.app/file-format-schema.json",
+                    "shared": {"frames": [{"name": method} for method in frames]},
+                    "profiles": [profile], "name": name, "exporter": "Sap2000py"}
+        Path(path).write_text(json.dumps(document), encoding="utf-8")
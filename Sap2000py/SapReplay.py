@@ -0,0 +1,279 @@
+import base64
+import gzip
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from Sap2000py.SapProfiler import SapProfiler, _Method
+
+FORMAT = "Sap2000py-session"
+VERSION = 1
+# float sequences at least this long are stored as base64 float64 instead of JSON numbers
+PACK_MIN = 16
+
+
+class ReplayError(LookupError):
+    """A call of the replayed script was not in the recording."""
+
+
+def encode(value):
+    """JSON-ready form of a COM argument or return value.
+
+    Tuples (the arrays COM hands back) keep their type, long float/int
+    tuples and NumPy arrays are packed as base64 with their dtype.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.ndarray):
+        return {"nd": base64.b64encode(np.ascontiguousarray(value).tobytes()).decode("ascii"),
+                "dtype": value.dtype.str, "shape": list(value.shape)}
+    if isinstance(value, tuple):
+        if len(value) >= PACK_MIN:
+            kind = type(value[0])
+            if kind in (float, int) and all(type(v) is kind for v in value):
+                array = np.asarray(value, dtype=np.float64 if kind is float else np.int64)
+                return {"tuple": base64.b64encode(array.tobytes()).decode("ascii"), "dtype": array.dtype.str}
+        return {"tuple": [encode(v) for v in value]}
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, dict):
+        return {"dict": [[encode(k), encode(v)] for k, v in value.items()]}
+    if isinstance(value, np.generic):
+        return value.item()
+    return {"repr": repr(value)}
+
+
+def decode(value):
+    """Inverse of encode."""
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "tuple" in value:
+        items = value["tuple"]
+        if isinstance(items, str):
+            return tuple(np.frombuffer(base64.b64decode(items), dtype=value["dtype"]).tolist())
+        return tuple(decode(v) for v in items)
+    if "nd" in value:
+        array = np.frombuffer(base64.b64decode(value["nd"]), dtype=value["dtype"])
+        return array.reshape(value["shape"]).copy()
+    if "dict" in value:
+        return {decode(k): decode(v) for k, v in value["dict"]}
+    return value["repr"]
+
+
+def _open(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _key(args: tuple) -> str:
+    return json.dumps(encode(args), separators=(",", ":"))
+
+
+class _RecordedMethod(_Method):
+    """Timed stand-in of one COM method that also writes the call to the session file."""
+
+    __slots__ = ()
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        result = self._func(*args)
+        duration = time.perf_counter() - start
+        stats = self._stats
+        stats.durations.append(duration)
+        self._profiler._write(stats.name, args, result, duration)
+        return result
+
+
+class SapRecorder(SapProfiler):
+    """Records every SAP2000 API call of a Saproject to a JSON-lines file.
+
+    One line per call: method, arguments, return value and duration, NumPy
+    payloads packed as base64. A ".gz" suffix compresses the file. The
+    recording is served back offline by ReplaySapObject, so a session
+    captured once on a SAP2000 workstation can be replayed in a loop on any
+    machine to profile the Python side of the package.
+
+    Only method calls are recorded, property reads of SapModel are not.
+    Being a SapProfiler, it reports call statistics too.
+
+    Example:
+        >>> with Sap.record("bridge.jsonl.gz"):
+        ...     bridge.build()
+        ...     Sap.Scripts.GetResults.Cube_by_Group("Pier", ["E2"], "LinkForce")
+        >>> # later, anywhere
+        >>> Sap.createSap(SapObject=ReplaySapObject("bridge.jsonl.gz"))
+    """
+
+    def __init__(self, Sapobj, path: Union[str, Path]):
+        """
+        Args:
+            Sapobj: The Saproject whose model calls are recorded.
+            path (str or Path): Session file, overwritten.
+        """
+        super().__init__(Sapobj)
+        self.path = Path(path)
+        self._file = None
+        self.calls = 0
+
+    def method(self, func, name: str) -> _RecordedMethod:
+        return _RecordedMethod(func, self.stats(name), self)
+
+    def _write(self, name: str, args: tuple, result, duration: float):
+        self._file.write(json.dumps({"m": name, "a": encode(args), "r": encode(result), "t": duration},
+                                    separators=(",", ":")) + "\n")
+        self.calls += 1
+
+    def start(self):
+        """Open the session file and route the model calls through the recording proxy."""
+        if self.active:
+            return self
+        self._file = _open(self.path, "w")
+        self._file.write(json.dumps({"format": FORMAT, "version": VERSION}) + "\n")
+        return super().start()
+
+    def stop(self):
+        """Take the recording proxy out of the model pointer and close the session file."""
+        if not self.active:
+            return self
+        super().stop()
+        self._file.close()
+        self._file = None
+        return self
+
+
+class _ReplayMethod:
+    __slots__ = ("_model", "_name")
+
+    def __init__(self, model: "ReplayModel", name: str):
+        self._model = model
+        self._name = name
+
+    def __call__(self, *args):
+        return self._model._answer(self._name, args)
+
+
+class _ReplayInterface:
+    """PointObj, Results, Results.Setup, ... of a replayed model."""
+
+    def __init__(self, model: "ReplayModel", path: str):
+        self._model = model
+        self._path = path
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        member = self._model._member(f"{self._path}.{name}")
+        self.__dict__[name] = member
+        return member
+
+
+class ReplayModel:
+    """SapModel stand-in answering calls from a session written by SapRecorder.
+
+    Calls are matched on method and arguments. The answers of repeated
+    identical calls come back in their recorded order and start over when
+    used up, so the recorded script can be replayed in a loop. A call that
+    was never recorded raises ReplayError, or with `strict=False` gets the
+    next recorded answer of the same method whatever its arguments.
+    """
+
+    def __init__(self, path: Union[str, Path], strict: bool = True, latency: bool = False):
+        """
+        Args:
+            path (str or Path): Session file written by SapRecorder.
+            strict (bool): Raise ReplayError on calls with unrecorded arguments. Defaults to True.
+            latency (bool): Wait the recorded duration of every call, to replay at SAP2000 speed.
+                Defaults to False.
+        """
+        self.strict = strict
+        self.latency = latency
+        self._answers: Dict[str, Dict[str, List[Tuple[object, float]]]] = defaultdict(lambda: defaultdict(list))
+        self._cursor: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._any: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        self._any_cursor: Dict[str, int] = defaultdict(int)
+        self.calls = 0
+        with _open(Path(path), "r") as file:
+            header = json.loads(file.readline())
+            if header.get("format") != FORMAT:
+                raise ValueError(f"{path} is not a Sap2000py session recording")
+            for line in file:
+                record = json.loads(line)
+                key = json.dumps(record["a"], separators=(",", ":"))
+                answers = self._answers[record["m"]][key]
+                self._any[record["m"]].append((key, len(answers)))
+                answers.append((record["r"], record["t"]))
+        self._interfaces = {name.rsplit(".", 1)[0] for name in self._answers if "." in name}
+        self._interfaces |= {name.rsplit(".", k)[0] for name in self._interfaces for k in range(name.count(".") + 1)}
+
+    def rewind(self):
+        """Serve every answer from the start again."""
+        self._cursor.clear()
+        self._any_cursor.clear()
+
+    def _member(self, name: str):
+        if name in self._answers:
+            return _ReplayMethod(self, name)
+        if name in self._interfaces:
+            return _ReplayInterface(self, name)
+        # an unrecorded method fails when called, not when looked up: the bulk builder looks up
+        # methods whose queued calls never reached the recorder
+        return _ReplayMethod(self, name)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        member = self._member(name)
+        self.__dict__[name] = member
+        return member
+
+    def _answer(self, name: str, args: tuple):
+        self.calls += 1
+        key = _key(args)
+        answers = self._answers.get(name, {}).get(key)
+        if answers is None:
+            if self.strict or not self._any.get(name):
+                raise ReplayError(f"SapModel.{name}{args} was not recorded")
+            position = self._any_cursor[name]
+            self._any_cursor[name] = (position + 1) % len(self._any[name])
+            key, index = self._any[name][position]
+            answers = self._answers[name][key]
+        else:
+            index = self._cursor[name, key]
+            self._cursor[name, key] = (index + 1) % len(answers)
+        result, duration = answers[index]
+        if self.latency:
+            end = time.perf_counter() + duration
+            while time.perf_counter() < end:
+                pass
+        return decode(result)
+
+
+class ReplaySapObject:
+    """Stand-in of the SAP2000 application object serving a recorded session.
+
+    Inject it with `Saproject().createSap(SapObject=ReplaySapObject(path))`,
+    the arguments are those of ReplayModel.
+    """
+
+    def __init__(self, path: Union[str, Path], strict: bool = True, latency: bool = False):
+        self.SapModel = ReplayModel(path, strict, latency)
+        self.Visible = False
+
+    def ApplicationStart(self, *args):
+        return 0
+
+    def ApplicationExit(self, FileSave=False):
+        return 0
+
+    def Hide(self):
+        return 0
+
+    def Unhide(self):
+        return 0
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+# eItemTypeElm codes of the Results calls taking (Name, ItemTypeElm) as their last arguments
+GROUP_ELM = 2
+SELECTION_ELM = 3
+
+
+class SapResultCache:
+    """Persistent on-disk cache of SapModel.Results calls.
+
+    Entries are compressed .npz files keyed by the model file (path, mtime and
+    size), the cases/combos selected for output, the output options, the result
+    function and its arguments. Entries of a model live in their own sub folder,
+    so RunAnalysis/DeleteResults can drop them at once. The total size of the
+    cache folder is bounded, the least recently used entries are evicted first.
+
+    The cache is disabled by default. It is only used when the case selection
+    is known, i.e. after Results.Setup.DeselectAllCasesAndCombosForOutput
+    (SelectCombo_Case always starts with it), so a result is never served for a
+    selection made outside Sap2000py. Results of the selected objects
+    (SelectionElm) are never cached, results of a group (GroupElm) are keyed by
+    the group's members as well. SetGroupAssign, GroupDef and SelectObj calls
+    made through the model drop the model's entries.
+
+    Example:
+        >>> Sap.Results.Cache.enable()
+        >>> Sap.Scripts.SelectCombo_Case("E2X")
+        >>> Sap.Results.Joint.Displ("Bearing", ItemTypeElm="GroupElm")  # COM call, stored
+        >>> Sap.Results.Joint.Displ("Bearing", ItemTypeElm="GroupElm")  # read from disk
+    """
+
+    def __init__(self, Sapobj):
+        """
+        Args:
+            Sapobj: The parent Saproject object.
+        """
+        self._Sapobj = Sapobj
+        self.enabled = False
+        self.CacheDir = Path.home() / ".Sap2000py" / "ResultCache"
+        self.MaxBytes = 1 << 30
+        # None means the selection is unknown, results are not cached then
+        self._selection: Optional[set] = None
+        self._options: dict = {}
+        self.hits = 0
+        self.misses = 0
+        # bumped on every invalidation, in-memory caches of results (e.g. the modal summary) key on it
+        self.generation = 0
+        # a group or the selection was edited, the model's entries are dropped before the next fetch
+        self._stale = False
+        Sapobj.ModelCache.subscribe(_ModelEdits(self))
+
+    def enable(self, CacheDir: Union[str, Path, None] = None, MaxBytes: int = 1 << 30):
+        """Turn the cache on.
+
+        Args:
+            CacheDir (str or Path, optional): Folder of the cache, defaults to ~/.Sap2000py/ResultCache.
+            MaxBytes (int): Size bound of the cache folder, defaults to 1 GiB.
+        """
+        if CacheDir is not None:
+            self.CacheDir = Path(CacheDir)
+        self.MaxBytes = int(MaxBytes)
+        self.CacheDir.mkdir(parents=True, exist_ok=True)
+        self.enabled = True
+
+    def disable(self):
+        """Turn the cache off, files on disk are kept"""
+        self.enabled = False
+
+    # ---- tracking of the output setup ----
+    def track_deselect_all(self):
+        """All cases and combos deselected for output, the selection is known from now on"""
+        self._selection = set()
+
+    def track_selected(self, Type: str, Name: str, Selected: bool):
+        """A load case ("Case") or combination ("Combo") selected/deselected for output"""
+        if self._selection is None:
+            return
+        if Selected:
+            self._selection.add((Type, Name))
+        else:
+            self._selection.discard((Type, Name))
+
+    def track_option(self, Option: str, *Values):
+        """An output option (DirectHist, ModalHist, ...) set"""
+        self._options[Option] = list(Values)
+
+    # ---- cache ----
+    def fetch(self, kind: str, func: Callable, *args):
+        """Return func(*args) from the cache, or call it and store the result.
+
+        Args:
+            kind (str): name of the SapModel.Results function, e.g. "JointDispl"
+            func (Callable): the COM function
+            *args: arguments of the COM function
+
+        Returns:
+            the COM result list [NumberResults, col1, ..., ret]
+        """
+        if not self.enabled or self._selection is None:
+            return func(*args)
+        if len(args) >= 2 and args[-1] == SELECTION_ELM:
+            # the selection can change in the GUI, nothing to key it on
+            return func(*args)
+        if self._stale:
+            self._stale = False
+            self.invalidate()
+        folder, key = self._key(kind, args)
+        if key is None:
+            return func(*args)
+        path = folder / f"{key}.npz"
+        if path.exists():
+            try:
+                result = self._load(path)
+                os.utime(path)
+                self.hits += 1
+                return result
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Broken result cache entry {path.name}, fetch again: {e}")
+        self.misses += 1
+        result = func(*args)
+        if result[-1] == 0:
+            self._store(folder, path, result)
+        return result
+
+    def invalidate(self, ModelPath: Optional[str] = None):
+        """Drop every entry of a model, the current model by default"""
+        self.generation += 1
+        ModelPath = self._model_path() if ModelPath is None else ModelPath
+        if not ModelPath:
+            return
+        folder = self.CacheDir / self._model_folder(ModelPath)
+        if folder.exists():
+            shutil.rmtree(folder, ignore_errors=True)
+            logger.debug(f"Result cache of {ModelPath} invalidated")
+
+    def clear(self):
+        """Drop every entry of every model"""
+        if self.CacheDir.exists():
+            shutil.rmtree(self.CacheDir, ignore_errors=True)
+        if self.enabled:
+            self.CacheDir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        """Bytes used by the cache folder"""
+        return sum(p.stat().st_size for p in self.CacheDir.glob("*/*.npz"))
+
+    def state(self) -> tuple:
+        """Model path, analysis generation and case selection, what in-memory result caches key on"""
+        selection = None if self._selection is None else tuple(sorted(self._selection))
+        return self._model_path(), self.generation, selection
+
+    def _model_path(self) -> str:
+        return self._Sapobj._Model.GetModelFilename(True)
+
+    @staticmethod
+    def _model_folder(ModelPath: str) -> str:
+        return hashlib.sha1(os.path.normcase(os.path.abspath(ModelPath)).encode()).hexdigest()[:16]
+
+    def _key(self, kind: str, args: tuple):
+        ModelPath = self._model_path()
+        if not ModelPath or not os.path.exists(ModelPath):
+            return None, None
+        members = None
+        if len(args) >= 2 and args[-1] == GROUP_ELM:
+            # groups can be edited without saving the model
+            NumberItems, ObjectType, ObjectName, ret = self._Sapobj._Model.GroupDef.GetAssignments(args[-2])
+            if ret != 0:
+                return None, None
+            members = sorted(zip(map(int, ObjectType or ()), ObjectName or ()))
+        stat = os.stat(ModelPath)
+        content = json.dumps([os.path.abspath(ModelPath), stat.st_mtime_ns, stat.st_size,
+                              sorted(self._selection), sorted(self._options.items()), kind, list(args), members],
+                             ensure_ascii=False, default=str)
+        return self.CacheDir / self._model_folder(ModelPath), hashlib.sha1(content.encode()).hexdigest()
+
+    @staticmethod
+    def _load(path: Path) -> list:
+        with np.load(path, allow_pickle=False) as data:
+            ncol = int(data["ncol"])
+            columns = [tuple(data[f"c{i}"].tolist()) for i in range(ncol)]
+            return [int(data["n"]), *columns, int(data["ret"])]
+
+    def _store(self, folder: Path, path: Path, result: list):
+        folder.mkdir(parents=True, exist_ok=True)
+        columns = {f"c{i}": np.asarray(column) for i, column in enumerate(result[1:-1])}
+        tmp = path.with_suffix(".tmp.npz")
+        try:
+            np.savez_compressed(tmp, n=result[0], ncol=len(columns), ret=result[-1], **columns)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write result cache entry: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = [(p.stat(), p) for p in self.CacheDir.glob("*/*.npz")]
+        total = sum(stat.st_size for stat, _ in entries)
+        if total <= self.MaxBytes:
+            return
+        # least recently used first, hits touch the mtime
+        for stat, p in sorted(entries, key=lambda e: e[0].st_mtime_ns):
+            p.unlink(missing_ok=True)
+            total -= stat.st_size
+            if total <= self.MaxBytes:
+                break
+
+
+class _ModelEdits:
+    """Listener of SapModelCache marking a SapResultCache stale when a group or the selection changes."""
+
+    def __init__(self, cache: SapResultCache):
+        self._cache = cache
+
+    def observe(self, path: str, args: tuple, result):
+        interface, _, method = path.partition(".")
+        method = method.rsplit(".", 1)[-1]
+        if interface in ("GroupDef", "SelectObj") or method in ("SetGroupAssign", "SetSelected"):
+            self._cache._stale = True
+
+    def clear(self):
+        pass
@@ -0,0 +1,259 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Column layout of every SapModel.Results function, without the leading
+# NumberResults and the trailing return code of the COM list
+RESULT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "AreaForceShell": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                       "F11", "F22", "F12", "FMax", "FMin", "FAngle", "FVM",
+                       "M11", "M22", "M12", "MMax", "MMin", "MAngle",
+                       "V13", "V23", "VMax", "VAngle"),
+    "AreaJointForcePlane": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                            "F1", "F2", "F3", "M1", "M2", "M3"),
+    "AreaJointForceShell": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                            "F1", "F2", "F3", "M1", "M2", "M3"),
+    "AreaStrainShell": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                        "E11Top", "E22Top", "G12Top", "E11Bot", "E22Bot", "G12Bot",
+                        "EMaxTop", "EMinTop", "EMaxBot", "EMinBot", "EAngleTop", "EAngleBot",
+                        "EVMTop", "EVMBot", "G13Avg", "G23Avg", "GMaxAvg", "GAngleAvg"),
+    "AreaStrainShellLayered": ("Obj", "Elm", "Layer", "IntPtNum", "IntPtLoc", "PointElm",
+                               "LoadCase", "StepType", "StepNum",
+                               "E11", "E22", "G12", "EMax", "EMin", "EAngle", "EVM",
+                               "G13Avg", "G23Avg", "GMaxAvg", "GAngleAvg"),
+    "AreaStressPlane": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                        "S11", "S22", "S33", "S12", "SMax", "SMin", "SAngle", "SVM"),
+    "AreaStressShell": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                        "S11Top", "S22Top", "S12Top", "S11Bot", "S22Bot", "S12Bot",
+                        "SMaxTop", "SMinTop", "SMaxBot", "SMinBot", "SAngleTop", "SAngleBot",
+                        "SVMTop", "SVMBot", "S13Avg", "S23Avg", "SMaxAvg", "SAngleAvg"),
+    "AreaStressShellLayered": ("Obj", "Elm", "Layer", "IntPtNum", "IntPtLoc", "PointElm",
+                               "LoadCase", "StepType", "StepNum",
+                               "S11", "S22", "S12", "SMax", "SMin", "SAngle", "SVM",
+                               "S13Avg", "S23Avg", "SMaxAvg", "SAngleAvg"),
+    "FrameForce": ("Obj", "ObjSta", "Elm", "ElmSta", "LoadCase", "StepType", "StepNum",
+                   "P", "V2", "V3", "T", "M2", "M3"),
+    "FrameJointForce": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                        "F1", "F2", "F3", "M1", "M2", "M3"),
+    "JointAcc": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "JointAccAbs": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "JointDispl": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "JointDisplAbs": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "JointReact": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "F1", "F2", "F3", "M1", "M2", "M3"),
+    "JointVel": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "JointVelAbs": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "LinkDeformation": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "LinkForce": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                  "P", "V2", "V3", "T", "M2", "M3"),
+    "LinkJointForce": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                       "F1", "F2", "F3", "M1", "M2", "M3"),
+    "ModalLoadParticipationRatios": ("LoadCase", "ItemType", "Item", "Stat", "Dyn"),
+    "ModalParticipatingMassRatios": ("LoadCase", "StepType", "StepNum", "Period",
+                                     "Ux", "Uy", "Uz", "SumUx", "SumUy", "SumUz",
+                                     "Rx", "Ry", "Rz", "SumRx", "SumRy", "SumRz"),
+    "ModalParticipationFactors": ("LoadCase", "StepType", "StepNum", "Period",
+                                  "Ux", "Uy", "Uz", "Rx", "Ry", "Rz", "ModalMass", "ModalStiff"),
+    "ModalPeriod": ("LoadCase", "StepType", "StepNum", "Period", "Frequency", "CircFreq", "EigenValue"),
+    "ModeShape": ("Obj", "Elm", "LoadCase", "StepType", "StepNum", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "SolidJointForce": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                        "F1", "F2", "F3", "M1", "M2", "M3"),
+    "SolidStrain": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                    "E11", "E22", "E33", "G12", "G13", "G23", "EMax", "EMid", "EMin", "EVM",
+                    "DirCosMax1", "DirCosMax2", "DirCosMax3", "DirCosMid1", "DirCosMid2", "DirCosMid3"),
+    "SolidStress": ("Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+                    "S11", "S22", "S33", "S12", "S13", "S23", "SMax", "SMid", "SMin", "SVM",
+                    "DirCosMax1", "DirCosMax2", "DirCosMax3", "DirCosMid1", "DirCosMid2", "DirCosMid3"),
+    "AssembledJointMass_1": ("PointElm", "MassSource", "U1", "U2", "U3", "R1", "R2", "R3"),
+    "BaseReact": ("LoadCase", "StepType", "StepNum", "Fx", "Fy", "Fz", "Mx", "My", "Mz", "gx", "gy", "gz"),
+    "BaseReactWithCentroid": ("LoadCase", "StepType", "StepNum", "Fx", "Fy", "Fz", "Mx", "My", "Mz",
+                              "gx", "gy", "gz",
+                              "XCentroidForFx", "YCentroidForFx", "ZCentroidForFx",
+                              "XCentroidForFy", "YCentroidForFy", "ZCentroidForFy",
+                              "XCentroidForFz", "YCentroidForFz", "ZCentroidForFz"),
+    "BucklingFactor": ("LoadCase", "StepType", "StepNum", "Factor"),
+    "GeneralizedDispl": ("GD", "LoadCase", "StepType", "StepNum", "DType", "Value"),
+}
+
+# Columns holding names, stored as category codes plus a lookup array
+CATEGORY_FIELDS = frozenset({"Obj", "Elm", "PointElm", "LoadCase", "StepType", "Layer",
+                             "MassSource", "ItemType", "Item", "GD", "DType"})
+
+
+class ResultTable:
+    """Columnar view of a SapModel.Results call.
+
+    Numeric columns are contiguous float64 arrays, name columns (Obj, Elm,
+    LoadCase, StepType, ...) are int32 category codes plus a lookup array of
+    the unique names, so large shell/solid results are not kept as Python
+    lists of str and float.
+
+    Example:
+        >>> table = Sap.Results.Joint.Displ("Bearing", ItemTypeElm="GroupElm", as_table=True)
+        >>> table["U3"]                      # float64 array
+        >>> table.numeric(["U1", "U2", "U3"])  # N by 3 float64 array
+        >>> table["Obj"]                     # decoded names
+    """
+
+    def __init__(self, kind: str, numeric: Dict[str, NDArray[np.float64]],
+                 codes: Dict[str, NDArray[np.int32]], categories: Dict[str, NDArray[np.str_]],
+                 fields: Sequence[str], ret: int = 0):
+        """
+        Args:
+            kind (str): name of the SapModel.Results function, e.g. "JointDispl"
+            numeric (dict): float64 column arrays by field name
+            codes (dict): int32 category codes by field name
+            categories (dict): unique names of every category field
+            fields (Sequence[str]): column order
+            ret (int): return code of the COM call, 0 means success
+        """
+        self.kind = kind
+        self.ret = ret
+        self._fields = tuple(fields)
+        self._numeric = numeric
+        self._codes = codes
+        self._categories = categories
+
+    @classmethod
+    def from_com(cls, kind: str, result: Sequence) -> "ResultTable":
+        """Build a table from the list returned by SapModel.Results.<kind>.
+
+        Args:
+            kind (str): name of the SapModel.Results function, one of RESULT_FIELDS
+            result (Sequence): [NumberResults, col1, col2, ..., ret]
+
+        Returns:
+            ResultTable
+        """
+        if kind not in RESULT_FIELDS:
+            raise KeyError(f"No column layout for Results.{kind}")
+        fields = RESULT_FIELDS[kind]
+        columns = result[1:-1]
+        if len(columns) != len(fields):
+            raise ValueError(f"Results.{kind} returned {len(columns)} columns, expected {len(fields)}")
+        data = dict(zip(fields, columns))
+        return cls.from_columns(kind, data, fields, ret=result[-1])
+
+    @classmethod
+    def from_columns(cls, kind: str, data: Dict[str, Iterable], fields: Sequence[str] = None,
+                     ret: int = 0) -> "ResultTable":
+        """Build a table from a dict of columns, name fields get category encoded.
+
+        Args:
+            kind (str): name of the result
+            data (dict): column values by field name
+            fields (Sequence[str], optional): column order, default is the order of data
+            ret (int): return code, 0 means success
+
+        Returns:
+            ResultTable
+        """
+        fields = tuple(data) if fields is None else tuple(fields)
+        numeric, codes, categories = {}, {}, {}
+        for field in fields:
+            values = data[field]
+            if field in CATEGORY_FIELDS:
+                categories[field], inverse = np.unique(np.asarray(values, dtype=np.str_), return_inverse=True)
+                codes[field] = inverse.ravel().astype(np.int32)
+            else:
+                numeric[field] = np.ascontiguousarray(values, dtype=np.float64)
+        return cls(kind, numeric, codes, categories, fields, ret=ret)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """All column names in COM order"""
+        return self._fields
+
+    @property
+    def numeric_fields(self) -> Tuple[str, ...]:
+        """Names of the float64 columns"""
+        return tuple(f for f in self._fields if f in self._numeric)
+
+    @property
+    def category_fields(self) -> Tuple[str, ...]:
+        """Names of the category encoded columns"""
+        return tuple(f for f in self._fields if f in self._codes)
+
+    def __len__(self) -> int:
+        for column in (*self._numeric.values(), *self._codes.values()):
+            return len(column)
+        return 0
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._fields
+
+    def __getitem__(self, field: str) -> NDArray:
+        """Numeric column as float64 array, category column decoded to names"""
+        if field in self._numeric:
+            return self._numeric[field]
+        if field in self._codes:
+            return self._categories[field][self._codes[field]]
+        raise KeyError(f"Results.{self.kind} has no column {field}, columns: {self._fields}")
+
+    def codes(self, field: str) -> NDArray[np.int32]:
+        """Category codes of a name column, index into categories(field)"""
+        return self._codes[field]
+
+    def categories(self, field: str) -> NDArray[np.str_]:
+        """Sorted unique names of a name column"""
+        return self._categories[field]
+
+    def numeric(self, fields: Sequence[str] = None) -> NDArray[np.float64]:
+        """Stack numeric columns into a C contiguous N by len(fields) array
+
+        Args:
+            fields (Sequence[str], optional): numeric columns, default all numeric columns
+
+        Returns:
+            NDArray[np.float64]
+        """
+        fields = self.numeric_fields if fields is None else fields
+        if len(fields) == 0:
+            return np.zeros((len(self), 0))
+        return np.column_stack([self._numeric[f] for f in fields])
+
+    def filter(self, mask: Union[NDArray[np.bool_], NDArray[np.int_]]) -> "ResultTable":
+        """Row subset by boolean mask or index array, categories are kept as they are"""
+        numeric = {f: np.ascontiguousarray(v[mask]) for f, v in self._numeric.items()}
+        codes = {f: np.ascontiguousarray(v[mask]) for f, v in self._codes.items()}
+        return ResultTable(self.kind, numeric, codes, dict(self._categories), self._fields, ret=self.ret)
+
+    def where(self, **conditions: str) -> "ResultTable":
+        """Row subset by category value, e.g. table.where(LoadCase="DEAD")"""
+        mask = np.ones(len(self), dtype=bool)
+        for field, value in conditions.items():
+            hit = np.flatnonzero(self._categories[field] == value)
+            code = hit[0] if len(hit) else -1
+            mask &= self._codes[field] == code
+        return self.filter(mask)
+
+    def save(self, path: Union[str, Path]):
+        """Store the table as a compressed .npz file, reload it with ResultTable.load.
+
+        Args:
+            path (str or Path): file name, ".npz" is appended by NumPy if missing
+        """
+        arrays = {"kind": np.array(self.kind), "fields": np.array(self._fields, dtype=np.str_),
+                  "ret": np.array(self.ret)}
+        arrays.update({f"n_{f}": v for f, v in self._numeric.items()})
+        arrays.update({f"c_{f}": v for f, v in self._codes.items()})
+        arrays.update({f"k_{f}": v for f, v in self._categories.items()})
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ResultTable":
+        """Read a table written by ResultTable.save"""
+        with np.load(path, allow_pickle=False) as data:
+            fields = tuple(data["fields"].tolist())
+            numeric = {f: data[f"n_{f}"] for f in fields if f"n_{f}" in data}
+            codes = {f: data[f"c_{f}"] for f in fields if f"c_{f}" in data}
+            categories = {f: data[f"k_{f}"] for f in fields if f"k_{f}" in data}
+            return cls(str(data["kind"]), numeric, codes, categories, fields, ret=int(data["ret"]))
+
+    def to_dict(self) -> Dict[str, List]:
+        """Plain dict of lists, in COM column order"""
+        return {f: self[f].tolist() for f in self._fields}
+
+    def __repr__(self) -> str:
+        return f"ResultTable({self.kind}, rows={len(self)}, fields={list(self._fields)})"
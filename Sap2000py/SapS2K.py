@@ -0,0 +1,314 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Literal, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+# text written per table in one go, keeps memory flat for 1e5+ rows
+CHUNK_ROWS = 20000
+DOFS = ("U1", "U2", "U3", "R1", "R2", "R3")
+DOF_NAMES = {"Ux": 0, "Uy": 1, "Uz": 2, "Rx": 3, "Ry": 4, "Rz": 5}
+# tables in the order SAP2000 reads them, definitions before the objects using them
+TABLE_ORDER = (
+    "PROGRAM CONTROL",
+    "MATERIAL PROPERTIES 01 - GENERAL",
+    "MATERIAL PROPERTIES 02 - BASIC MECHANICAL PROPERTIES",
+    "FRAME SECTION PROPERTIES 01 - GENERAL",
+    "LINK PROPERTY DEFINITIONS 01 - GENERAL",
+    "LINK PROPERTY DEFINITIONS 02 - LINEAR",
+    "CONSTRAINT DEFINITIONS - BODY",
+    "JOINT COORDINATES",
+    "CONNECTIVITY - FRAME",
+    "CONNECTIVITY - LINK",
+    "FRAME SECTION ASSIGNMENTS",
+    "LINK PROPERTY ASSIGNMENTS",
+    "JOINT RESTRAINT ASSIGNMENTS",
+    "JOINT CONSTRAINT ASSIGNMENTS",
+    "JOINT ADDED MASS ASSIGNMENTS",
+    "FRAME ADDED MASS ASSIGNMENTS",
+    "GROUPS 1 - DEFINITIONS",
+    "GROUPS 2 - ASSIGNMENTS",
+    "LOAD PATTERN DEFINITIONS",
+    "LOAD CASE DEFINITIONS",
+    "CASE - STATIC 1 - LOAD ASSIGNMENTS",
+    "CASE - MODAL 1 - GENERAL",
+)
+
+
+def _quote(text: str) -> str:
+    # values with blanks are quoted
+    return f'"{text}"' if " " in text or not text else text
+
+
+def _text(value) -> str:
+    """One value as SAP2000 writes it, floats with the shortest exact repr."""
+    if isinstance(value, (bool, np.bool_)):
+        return "Yes" if value else "No"
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    return _quote(str(value))
+
+
+def _column(values, n: int) -> List[str]:
+    """One column of n values as text."""
+    array = np.asarray(values)
+    if len(array) != n:
+        raise ValueError(f"column of {len(array)} values in a table of {n} rows")
+    if array.dtype.kind == "f":
+        return [repr(v) for v in array.tolist()]
+    if array.dtype.kind == "b":
+        return ["Yes" if v else "No" for v in array.tolist()]
+    return [_quote(str(v)) for v in array.tolist()]
+
+
+def _names(names, added: int, n: int) -> List[str]:
+    """Given names as text, or numbers following the `added` objects of the kind written so far."""
+    if names is None:
+        return [str(k) for k in range(added + 1, added + n + 1)]
+    return [str(name) for name in names]
+
+
+class S2KModel:
+    """
+    Whole model written as a SAP2000 text file ($2k/s2k) and loaded with one File.OpenFile
+
+    The model is collected as arrays, one call per kind of object, and every
+    table is streamed to the file in chunks: no API call is made until the
+    single import. It needs neither the DatabaseTables API nor a running
+    SAP2000 to write the file.
+
+    Example:
+        s2k = S2KModel(units="KN, m, C")
+        s2k.add_material("C50",E=3.45e7,U=0.2,A=1e-5,UnitWeight=25.0)
+        s2k.add_rectangle("Pier","C50",t3=2.0,t2=3.0)
+        s2k.add_joints(xyz,names)                      # xyz: (n,3) array
+        s2k.add_frames(names[:-1],names[1:],"Pier")
+        s2k.add_restraints(names[:1],["Ux","Uy","Uz","Rx","Ry","Rz"])
+        s2k.add_group("Pier","Frame",s2k.frame_names)
+        s2k.load(Sap,"Model.s2k")
+    """
+    def __init__(self,units:str = "KN, m, C",version:str = "22.0.0"):
+        """
+        input:
+            units(str):units of every value in the file, as SAP2000 writes them, e.g. "KN, m, C"
+            version(str):SAP2000 version written in PROGRAM CONTROL
+        """
+        self.tables:Dict[str,List[Dict[str,object]]] = {}
+        self.joint_names:List[str] = []
+        self.frame_names:List[str] = []
+        self.link_names:List[str] = []
+        self.groups:Dict[str,None] = {"ALL":None}
+        self.table("PROGRAM CONTROL",1,ProgramName="SAP2000",Version=version,CurrUnits=units)
+
+    def table(self,name:str,n:int,**columns):
+        """
+        add n rows to a table, the generic route for tables without a helper
+        input:
+            name(str):table name, e.g. "JOINT COORDINATES"
+            n(int):number of rows
+            **columns:field=array of n values or one value for every row
+        """
+        self.tables.setdefault(name.upper(),[]).append({"n":n,**columns})
+        return self
+
+    # ---- definitions ----
+    def add_material(self,name:str,Type:Literal["Concrete","Steel","Other"] = "Concrete",E:float = 3.0e7,
+                     U:float = 0.2,A:float = 1e-5,UnitWeight:float = 25.0,UnitMass:float = None):
+        """isotropic material, UnitMass defaults to UnitWeight/9.80665"""
+        if UnitMass is None:
+            UnitMass = UnitWeight/9.80665
+        self.table("MATERIAL PROPERTIES 01 - GENERAL",1,Material=name,Type=Type,SymType="Isotropic",TempDepend="No")
+        self.table("MATERIAL PROPERTIES 02 - BASIC MECHANICAL PROPERTIES",1,Material=name,UnitWeight=float(UnitWeight),
+                   UnitMass=float(UnitMass),E1=float(E),G12=float(E/(2*(1+U))),U12=float(U),A1=float(A))
+        return self
+
+    def add_rectangle(self,name:str,material:str,t3:float,t2:float):
+        """rectangular frame section, depth t3 and width t2"""
+        self.table("FRAME SECTION PROPERTIES 01 - GENERAL",1,SectionName=name,Material=material,Shape="Rectangular",
+                   t3=float(t3),t2=float(t2))
+        return self
+
+    def add_general_section(self,name:str,material:str,Area:float,I33:float,I22:float,TorsConst:float,
+                            AS2:float = 0.0,AS3:float = 0.0,t3:float = 1.0,t2:float = 1.0):
+        """general frame section from its properties (the sections Section_General defines)"""
+        self.table("FRAME SECTION PROPERTIES 01 - GENERAL",1,SectionName=name,Material=material,Shape="General",
+                   t3=float(t3),t2=float(t2),Area=float(Area),TorsConst=float(TorsConst),I33=float(I33),
+                   I22=float(I22),AS2=float(AS2),AS3=float(AS3))
+        return self
+
+    def add_link_linear(self,name:str,stiffness:Sequence[float],mass:float = 0.0):
+        """linear link property, stiffness of U1,U2,U3,R1,R2,R3, 0 leaves the DOF free"""
+        self.table("LINK PROPERTY DEFINITIONS 01 - GENERAL",1,Link=name,LinkType="Linear",Mass=float(mass),Weight=0.0)
+        stiffness = np.asarray(stiffness,dtype=float)
+        # the table takes translational stiffness as TransKE/TransCE, rotational as RotKE/RotCE
+        for dofs,KE,CE in (((0,1,2),"TransKE","TransCE"),((3,4,5),"RotKE","RotCE")):
+            active = [k for k in dofs if k < len(stiffness) and stiffness[k]]
+            if active:
+                self.table("LINK PROPERTY DEFINITIONS 02 - LINEAR",len(active),Link=name,
+                           DOF=[DOFS[k] for k in active],Fixed="No",**{KE:stiffness[active],CE:0.0})
+        return self
+
+    def add_body_constraint(self,name:str,joints:Sequence[str]):
+        """body constraint on every DOF tying the joints together"""
+        self.table("CONSTRAINT DEFINITIONS - BODY",1,Name=name,CoordSys="GLOBAL",
+                   **{dof:"Yes" for dof in ("UX","UY","UZ","RX","RY","RZ")})
+        self.table("JOINT CONSTRAINT ASSIGNMENTS",len(joints),Joint=list(joints),Constraint=name,Type="Body")
+        return self
+
+    # ---- objects ----
+    def add_joints(self,xyz,names:Sequence[str] = None) -> List[str]:
+        """
+        input:
+            xyz(ndarray):(n,3) global coordinates
+            names(list):joint names, default numbers following the joints added so far
+        output:
+            list:names of the joints
+        """
+        xyz = np.asarray(xyz,dtype=float).reshape(-1,3)
+        names = _names(names,len(self.joint_names),len(xyz))
+        self.table("JOINT COORDINATES",len(xyz),Joint=names,CoordSys="GLOBAL",CoordType="Cartesian",
+                   XorR=xyz[:,0],Y=xyz[:,1],Z=xyz[:,2],SpecialJt="Yes")
+        self.joint_names.extend(names)
+        return names
+
+    def add_frames(self,jointi:Sequence[str],jointj:Sequence[str],section:Union[str,Sequence[str]],
+                   names:Sequence[str] = None) -> List[str]:
+        """frames between joints jointi[k] and jointj[k], section is one name or one per frame"""
+        n = len(jointi)
+        names = _names(names,len(self.frame_names),n)
+        self.table("CONNECTIVITY - FRAME",n,Frame=names,JointI=list(jointi),JointJ=list(jointj),IsCurved="No")
+        self.table("FRAME SECTION ASSIGNMENTS",n,Frame=names,SectionType="",AutoSelect="N.A.",AnalSect=section,
+                   MatProp="Default")
+        self.frame_names.extend(names)
+        return names
+
+    def add_links(self,jointi:Sequence[str],jointj:Sequence[str],prop:Union[str,Sequence[str]],
+                  names:Sequence[str] = None) -> List[str]:
+        """two joint links between joints jointi[k] and jointj[k]"""
+        n = len(jointi)
+        names = _names(names,len(self.link_names),n)
+        self.table("CONNECTIVITY - LINK",n,Link=names,JointI=list(jointi),JointJ=list(jointj))
+        self.table("LINK PROPERTY ASSIGNMENTS",n,Link=names,LinkType="TwoJoint",LinkProp=prop)
+        self.link_names.extend(names)
+        return names
+
+    def add_restraints(self,joints:Sequence[str],DOF:Sequence[Literal['Ux','Uy','Uz','Rx','Ry','Rz']]):
+        """same restraints on every joint"""
+        flags = [dof in DOF for dof in DOF_NAMES]
+        self.table("JOINT RESTRAINT ASSIGNMENTS",len(joints),Joint=list(joints),
+                   **{field:flag for field,flag in zip(DOFS,flags)})
+        return self
+
+    def add_joint_masses(self,joints:Sequence[str],mass):
+        """mass(ndarray):(n,6) or one row of six U1,U2,U3,R1,R2,R3 masses for every joint"""
+        mass = np.broadcast_to(np.asarray(mass,dtype=float),(len(joints),6))
+        self.table("JOINT ADDED MASS ASSIGNMENTS",len(joints),Joint=list(joints),CoordSys="Local",
+                   **{field:mass[:,k] for k,field in enumerate(("Mass1","Mass2","Mass3","MMI1","MMI2","MMI3"))})
+        return self
+
+    def add_frame_masses(self,frames:Sequence[str],mass_per_length):
+        """line masses, one value or one per frame"""
+        self.table("FRAME ADDED MASS ASSIGNMENTS",len(frames),Frame=list(frames),
+                   MassPerLen=np.broadcast_to(np.asarray(mass_per_length,dtype=float),(len(frames),)))
+        return self
+
+    def add_group(self,name:str,ObjectType:Literal["Joint","Frame","Link","Area","Solid"],labels:Sequence[str]):
+        """group with its members, call again to add members of another type"""
+        if name not in self.groups:
+            self.groups[name] = None
+            self.table("GROUPS 1 - DEFINITIONS",1,GroupName=name,Selection="Yes",SectionCut="Yes",Steel="Yes",
+                       Concrete="Yes",Aluminum="Yes",ColdFormed="Yes",Stage="Yes",Bridge="Yes",AutoSeismic="No",
+                       AutoWind="No",SelDesSteel="No",SelDesAlum="No",SelDesCold="No",MassWeight="Yes")
+        self.table("GROUPS 2 - ASSIGNMENTS",len(labels),GroupName=name,ObjectType=ObjectType,ObjectLabel=list(labels))
+        return self
+
+    # ---- loads ----
+    def add_load_pattern(self,name:str,DesignType:str = "Dead",SelfWtMult:float = 0.0,case:bool = True):
+        """load pattern, with the linear static case of the same name if case is True"""
+        self.table("LOAD PATTERN DEFINITIONS",1,LoadPat=name,DesignType=DesignType,SelfWtMult=float(SelfWtMult))
+        if case:
+            self.add_static_case(name,[name])
+        return self
+
+    def add_static_case(self,name:str,patterns:Sequence[str],factors:Sequence[float] = None):
+        """linear static case of load patterns"""
+        factors = np.ones(len(patterns)) if factors is None else np.asarray(factors,dtype=float)
+        self.table("LOAD CASE DEFINITIONS",1,Case=name,Type="LinStatic",InitialCond="Zero",DesignType="Dead",
+                   RunCase="Yes")
+        self.table("CASE - STATIC 1 - LOAD ASSIGNMENTS",len(patterns),Case=name,LoadType="Load pattern",
+                   LoadName=list(patterns),LoadSF=factors)
+        return self
+
+    def add_modal_case(self,name:str = "MODAL",MaxNumModes:int = 12,MinNumModes:int = 1):
+        """eigen modal case"""
+        self.table("LOAD CASE DEFINITIONS",1,Case=name,Type="LinModal",InitialCond="Zero",DesignType="Other",
+                   RunCase="Yes")
+        self.table("CASE - MODAL 1 - GENERAL",1,Case=name,ModeType="Eigen",MaxNumModes=MaxNumModes,
+                   MinNumModes=MinNumModes,EigenShift=0.0,EigenCutoff=0.0,EigenTol=1e-9,AutoShift="Yes")
+        return self
+
+    # ---- output ----
+    def rows(self,name:str) -> int:
+        """number of rows of a table"""
+        return sum(block["n"] for block in self.tables.get(name.upper(),[]))
+
+    def _lines(self,block:Dict[str,object]):
+        """text lines of one block of rows, CHUNK_ROWS at a time"""
+        n = block["n"]
+        # one line template per block, values shared by every row are written into it
+        parts,arrays = [],[]
+        for field,values in block.items():
+            if field == "n":
+                continue
+            if isinstance(values,(str,int,float,bool,np.generic)):
+                parts.append(f"{field}={_text(values)}".replace("{","{{").replace("}","}}"))
+            else:
+                parts.append(f"{field}={{}}")
+                arrays.append(values)
+        template = "   "+"   ".join(parts)+"\n"
+        for start in range(0,n,CHUNK_ROWS):
+            stop = min(start+CHUNK_ROWS,n)
+            if not arrays:
+                yield template*(stop-start)
+                continue
+            columns = [_column(values[start:stop],stop-start) for values in arrays]
+            yield "".join(map(template.format,*columns))
+
+    def write(self,path:Union[str,Path]) -> Path:
+        """
+        stream every table to a $2k/s2k file
+        input:
+            path(str|Path):file name, the suffix must be .s2k or .$2k
+        output:
+            Path:the absolute path written
+        """
+        path = Path(path).resolve()
+        if path.suffix.lower() not in (".s2k",".$2k"):
+            raise ValueError(f"{path.name} must have a .s2k or .$2k suffix")
+        path.parent.mkdir(parents=True,exist_ok=True)
+        order = [name for name in TABLE_ORDER if name in self.tables]
+        order += [name for name in self.tables if name not in TABLE_ORDER]
+        with open(path,"w",encoding="utf-8",newline="\r\n") as file:
+            file.write(f"File {path} was saved on {datetime.now():%m/%d/%y} at {datetime.now():%H:%M:%S}\n\n")
+            for name in order:
+                file.write(f'TABLE:  "{name}"\n')
+                for block in self.tables[name]:
+                    for lines in self._lines(block):
+                        file.write(lines)
+                file.write(" \n")
+            file.write("END TABLE DATA\n")
+        logger.opt(colors=True).success(f"Model written to <yellow>{path}</yellow>: {len(self.joint_names)} joints, "
+                                        f"{len(self.frame_names)} frames, {len(self.link_names)} links")
+        return path
+
+    def load(self,Sapobj,path:Union[str,Path]) -> int:
+        """
+        write the file and import it in SAP2000 with a single File.OpenFile
+        input:
+            Sapobj(Saproject):the project the model is loaded in
+            path(str|Path):file name, .s2k or .$2k
+        output:
+            int:return value of the import, 0 for success
+        """
+        return Sapobj.File.Open(self.write(path))
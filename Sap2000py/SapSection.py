@@ -1,15 +1,9 @@
 from typing import Literal,List
-class SapSection:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self._Sapobj = Sapobj
-        self.PropLink = PropLink(Sapobj)
+from Sap2000py.SapWrapper import SapChild, SapWrapper
+
+
+class SapSection(SapWrapper):
+    PropLink = SapChild("PropLink")
 
     def PropFrame_SetRectangle(self, sectName: str, matName: str, t3: float, t2: float, Color=-1, Notes="", GUID = ""):
         """
@@ -203,17 +197,7 @@ class SapSection:
         ret = self.__Model.PropFrame.SetRectangle(Name, MatProp, t3, t2, Color, Notes, GUID)
         return ret
 
-class PropLink_Set:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model 
-        self._Sapobj = Sapobj
-        
+class PropLink_Set(SapWrapper):
     def Linear(self,name: str,
                DOF:list[Literal['U1','U2','U3','R1','R2','R3']] = [],
                Fixed:list[Literal['U1','U2','U3','R1','R2','R3']] = [],
@@ -990,16 +974,7 @@ class PropLink_Set:
         ret = self.__Model.PropLink.SetWeightAndMass(name,w,mass,R1,R2,R3)
         return ret
 
-class PropLink_Get:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model 
-    
+class PropLink_Get(SapWrapper):
     def Damper(self, name: str) -> list:
         """
         Retrieves link property data for an exponential damper-type link property.
@@ -1508,16 +1483,8 @@ class PropLink_Get:
         ret = self.__Model.PropLink.GetWeightAndMass(name)
         return ret
 
-class PropLink:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.Set = PropLink_Set(Sapobj)
-        self.Get = PropLink_Get(Sapobj)
+class PropLink(SapWrapper):
+    Set = SapChild(PropLink_Set)
+    Get = SapChild(PropLink_Get)
 
     
@@ -0,0 +1,66 @@
+import sys
+from typing import Union
+
+
+class SapWrapper:
+    """Base class of the API wrappers (Saproject.File, .Define, .Assign, ...).
+
+    Passing in the parent class object directly is to avoid getting only the
+    last opened SAP2000 window when initializing the parent class instance to
+    get the model pointer in the subclass.
+
+    The model pointers are not copied: `self.__Model` and `self.__Object` of a
+    subclass (name mangled to `_<Class>__Model`, `self.__model` alike) are
+    looked up on the parent Saproject at call time, so after attaching to a new
+    SAP2000 instance every wrapper, cached or not, talks to the new one.
+    """
+
+    def __init__(self, Sapobj):
+        """
+        Args:
+            Sapobj: The parent Saproject object.
+        """
+        self._Sapobj = Sapobj
+
+    def __getattr__(self, name: str):
+        # only called when normal lookup fails, i.e. for the mangled pointers
+        if name.endswith(("__Model", "__model")):
+            return self._Sapobj._Model
+        if name.endswith(("__Object", "__object")):
+            return self._Sapobj._Object
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+class SapChild:
+    """Sub wrapper built on first access and cached on the instance.
+
+    Example:
+        >>> class SapPointObj(SapWrapper):
+        ...     Get = SapChild(SapPointObj_Get)
+        ...     Set = SapChild("SapPointObj_Set")    # defined later in the module
+        ...     Area = SapChild(SapResults_Area, "_Cache")  # SapResults_Area(Sapobj, self._Cache)
+    """
+
+    def __init__(self, cls: Union[type, str], *args: str):
+        """
+        Args:
+            cls (type or str): Wrapper class, or its name in the module of the owner class.
+            *args (str): Attributes of the owner passed to the wrapper after Sapobj.
+        """
+        self.cls = cls
+        self.args = args
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.module = owner.__module__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cls = self.cls
+        if isinstance(cls, str):
+            cls = self.cls = getattr(sys.modules[self.module], cls)
+        value = cls(instance._Sapobj, *(getattr(instance, arg) for arg in self.args))
+        # plain attribute from now on, the descriptor is not called again
+        instance.__dict__[self.name] = value
+        return value
@@ -1,26 +1,12 @@
 from typing import Literal, Union
-class Sapfunctions:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.ResponseSpectrum = fun_ResponseSpectrum(Sapobj)
-        self.TimeHistory = fun_TimeHistory(Sapobj)
+from Sap2000py.SapWrapper import SapChild, SapWrapper
 
-class fun_ResponseSpectrum:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-    
+
+class Sapfunctions(SapWrapper):
+    ResponseSpectrum = SapChild("fun_ResponseSpectrum")
+    TimeHistory = SapChild("fun_TimeHistory")
+
+class fun_ResponseSpectrum(SapWrapper):
     def Set_Chinese2010(self,name,JGJ32010AlphaMax,JGJ32010SI,JGJ32010Tg,JGJ32010PTDF,DampRatio):
         """
         ---This function defines a Chinese 2010 response spectrum function.---
@@ -111,16 +97,7 @@ class fun_ResponseSpectrum:
         return ret
 
 
-class fun_TimeHistory:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class fun_TimeHistory(SapWrapper):
     def Set_User(self,name,myTime,value):
         """
         ---This function defines a user time history function.---
@@ -1,14 +1,8 @@
 from typing import Literal
-class SapLoadPatterns:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+from Sap2000py.SapWrapper import SapChild, SapWrapper
+
+
+class SapLoadPatterns(SapWrapper):
     def Add(self,name,myType,SelfWTMultiplier=0,AddLoadCase=True):
         """
         ---This function adds a new load pattern---
@@ -30,16 +24,7 @@ class SapLoadPatterns:
         ret = self.__Model.LoadPatterns.Add(name,myType,SelfWTMultiplier,AddLoadCase)
         return ret
 
-class load_StaticLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_StaticLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a static linear load case---
@@ -79,16 +64,7 @@ class load_StaticLinear:
         ret = self.__Model.LoadCases.StaticLinear.SetLoads(name,numberLoads,loadType,loadName,scaleFactor)
         return ret
 
-class load_StaticLinearMultistep:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_StaticLinearMultistep(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a static linear multistep analysis case.---
@@ -143,16 +119,7 @@ class load_StaticLinearMultistep:
                 stepRange,firstLoadStep,lastLoadStep,startCaseStep,extrapolateOption)
         return ret
 
-class load_StaticNonLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_StaticNonLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a static NonLinear analysis case---
@@ -320,16 +287,7 @@ class load_StaticNonLinear:
         ret = self.__Model.LoadCases.StaticNonLinear.SetTargetForceParameters(name,TolConvF,MaxIter,AccelFact,NoStop)
         return ret
 
-class load_Buckling:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class load_Buckling(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a buckling load case.---
@@ -382,16 +340,7 @@ class load_Buckling:
         ret = self.__Model.LoadCases.Buckling.SetParameters(name,NumBucklingModes,EigenTol)
         return ret
 
-class load_DirHistLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class load_DirHistLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a linear direct integration time history load case---
@@ -507,16 +456,7 @@ class load_DirHistLinear:
         ret = self.__Model.LoadCases.DirHistLinear.SetTimeStep(name,nstep,DT)
         return ret
 
-class load_DirHistNonLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class load_DirHistNonLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a NonLinear direct integration time history load case---
@@ -682,16 +622,7 @@ class load_DirHistNonLinear:
         ret = self.__Model.LoadCases.DirHistNonLinear.SetTimeStep(name,nstep,DT)
         return ret
 
-class load_ModalEigen:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class load_ModalEigen(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a modal eigen load case---
@@ -765,16 +696,7 @@ class load_ModalEigen:
         ret = self.__Model.LoadCases.ModalEigen.SetParameters(name,EigenShiftFreq,EigenCutOff,EigenTol,AllowAutoFreqShift)
         return ret
 
-class load_ModalRitz:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_ModalRitz(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a modal ritz load case---
@@ -833,16 +755,7 @@ class load_ModalRitz:
         ret = self.__Model.LoadCases.ModalRitz.SetNumberModes(name,MaxModes,MinModes)
         return ret
 
-class load_ModalHistLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        
+class load_ModalHistLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a linear modal history analysis case---
@@ -956,16 +869,7 @@ class load_ModalHistLinear:
         ret = self.__Model.LoadCases.ModHistLinear.SetTimeStep(name,nstep,DT)
         return ret
 
-class load_ModalHistNonLinear:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_ModalHistNonLinear(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a NonLinear modal history analysis case.---
@@ -1123,16 +1027,7 @@ class load_ModalHistNonLinear:
         ret = self.__Model.LoadCases.ModHistNonLinear.SetTimeStep(name,nstep,dt)
         return ret
 
-class load_ResponseSpectrum:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-
+class load_ResponseSpectrum(SapWrapper):
     def SetCase(self,name):
         """
         ---This function initializes a response spectrum analysis case---
@@ -1293,23 +1188,15 @@ class load_ResponseSpectrum:
         ret = self.__Model.LoadCases.ResponseSpectrum.SetModalComb_1(name,MyType,F1,F2,PeriodicRigidCombType,td)
         return ret
 
-class SapLoadCases:
-    def __init__(self,Sapobj):
-        """
-        Passing in the parent class object directly is to avoid 
-        getting only the last opened SAP2000 window when initializing the 
-        parent class instance to get the model pointer in the subclass.
-        """
-        self.__Object = Sapobj._Object 
-        self.__Model = Sapobj._Model
-        self.StaticLinear = load_StaticLinear(Sapobj)
-        self.StaticLinearMultistep = load_StaticLinearMultistep(Sapobj)
-        self.StaticNonLinear = load_StaticNonLinear(Sapobj)
-        self.Buckling = load_Buckling(Sapobj)
-        self.DirHistLinear = load_DirHistLinear(Sapobj)
-        self.DirHistNonLinear = load_DirHistNonLinear(Sapobj)
-        self.ModalEigen = load_ModalEigen(Sapobj)
-        self.ModalRitz = load_ModalRitz(Sapobj)
-        self.ModalHistLinear = load_ModalHistLinear(Sapobj)
-        self.ModalHistNonLinear = load_ModalHistNonLinear(Sapobj)
-        self.ResponseSpectrum = load_ResponseSpectrum(Sapobj)
+class SapLoadCases(SapWrapper):
+    StaticLinear = SapChild(load_StaticLinear)
+    StaticLinearMultistep = SapChild(load_StaticLinearMultistep)
+    StaticNonLinear = SapChild(load_StaticNonLinear)
+    Buckling = SapChild(load_Buckling)
+    DirHistLinear = SapChild(load_DirHistLinear)
+    DirHistNonLinear = SapChild(load_DirHistNonLinear)
+    ModalEigen = SapChild(load_ModalEigen)
+    ModalRitz = SapChild(load_ModalRitz)
+    ModalHistLinear = SapChild(load_ModalHistLinear)
+    ModalHistNonLinear = SapChild(load_ModalHistNonLinear)
+    ResponseSpectrum = SapChild(load_ResponseSpectrum)
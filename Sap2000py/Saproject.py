@@ -1,13 +1,20 @@
 import sys
-import comtypes.client
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
 import numpy as np
 from numpy.typing import NDArray
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 from loguru import logger
 from datetime import datetime
 from pathlib import Path
 import json
 
+from Sap2000py.SapWrapper import SapWrapper
+
+# project of the innermost Saproject.activate() block of the running context
+_active_project: ContextVar = ContextVar("Sap2000py_active_project", default=None)
+
 
 class SapMeta(type):
     """Meta class for ensuring the Saproject singleton pattern.
@@ -15,31 +22,39 @@ class SapMeta(type):
     This metaclass is used to enforce a singleton design pattern for the
     Saproject class, ensuring only one instance is created. This class should
     not be inherited.
-    """
 
-    __instance = None
+    The singleton is created on the first `Saproject()` call, not when the
+    class is defined, so importing the package does not touch COM. Inside a
+    `with project.activate():` block `Saproject()` returns that project
+    instead, see `Saproject.activate`.
+    """
 
     def __init__(self, class_name, class_bases, class_dic):
-        """Initializes the singleton instance."""
-        self.__instance = object.__new__(self)
-        self.__init__(self.__instance)
+        """Initializes the metaclass, the singleton is created on demand."""
+        super().__init__(class_name, class_bases, class_dic)
+        self.__instance = None
 
     def __call__(self, *args, **kwargs):
         """Ensures only one instance of the Saproject class exists.
 
-        If the instance is already created and no arguments are passed,
-        the existing instance is returned. Otherwise, a new instance is
-        created and returned.
+        If no arguments are passed, the active project is returned, which is
+        the singleton (created on the first call) outside of any activate
+        block. Otherwise, a new instance is created and returned.
         """
         if args or kwargs:
             obj = object.__new__(self)
             self.__init__(obj, *args, **kwargs)
             return obj
-        else:
-            return self.__instance
+        active = _active_project.get()
+        if active is not None:
+            return active
+        if self.__instance is None:
+            self.__instance = object.__new__(self)
+            self.__init__(self.__instance)
+        return self.__instance
 
 
-class SapScripts:
+class SapScripts(SapWrapper):
     """SAP2000 script class.
 
     This class integrates some commonly used SAP2000 scripts under the
@@ -52,19 +67,40 @@ class SapScripts:
         Args:
             Sapobj: The parent Saproject object.
         """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
         self.Sapobj = Sapobj
 
+    @cached_property
+    def GetResults(self):
         from Sap2000py.Scripts.GetResults import GetResults
 
-        self.GetResults = GetResults(Sapobj)
+        return GetResults(self.Sapobj)
+
+    @cached_property
+    def Analyze(self):
         from Sap2000py.Scripts.Analyze import SapAnalyze
 
-        self.Analyze = SapAnalyze(Sapobj)
+        return SapAnalyze(self.Sapobj)
+
+    @cached_property
+    def Group(self):
         from Sap2000py.Scripts.Group import SapGroup
 
-        self.Group = SapGroup(Sapobj)
+        return SapGroup(self.Sapobj)
+
+    @cached_property
+    def Joints(self):
+        """Joint registry of the model, see Sap2000py.Scripts.Build_Model.JointRegistry."""
+        from Sap2000py.Scripts.Build_Model import JointRegistry
+
+        return JointRegistry(self.Sapobj)
+
+    @cached_property
+    def Frames(self):
+        """Frame connectivity registry of the model, see Sap2000py.Scripts.Build_Model.FrameRegistry."""
+        from Sap2000py.Scripts.Build_Model import FrameRegistry
+
+        return FrameRegistry(self.Sapobj)
 
     def AddCommonMaterialSet(self, standard: Literal["GB", "JTG", "TB", "User"] = "GB"):
         """Adds common material sets for China.
@@ -80,70 +116,106 @@ class SapScripts:
 
         CommonMaterialSet_China(self.Sapobj, standard)
 
-    def AddJoints(self, Cartesian_coord: NDArray[np.float64] = np.empty(shape=(0, 3))):
+    def AddJoints(
+        self,
+        Cartesian_coord: NDArray[np.float64] = np.empty(shape=(0, 3)),
+        names: Union[list[str], None] = None,
+    ) -> list[str]:
         """Adds joints using Cartesian coordinates.
 
+        Coordinates within `Joints.tolerance` of a joint of the model (or of
+        an earlier row) are not added again, repeated calls only add what is
+        new, see `Joints`.
+
         Args:
             Cartesian_coord (ndarray): Nx3 array or Nx2 array (for 2D models)
                 of Cartesian coordinates.
+            names (list[str], optional): User names of the joints, one per
+                row. Defaults to SAP2000's names.
+
+        Returns:
+            list[str]: Name of the existing or new joint of every row, None
+                where the joint could not be added.
         """
         from .Scripts.Build_Model import Add_Joints_Cartesian
 
-        Add_Joints_Cartesian(self.Sapobj, Cartesian_coord)
+        return Add_Joints_Cartesian(self.Sapobj, Cartesian_coord, names).names
+
+    def AddElements(
+        self,
+        Connections: NDArray[np.float64] = np.empty(shape=(0, 2)),
+        section: Union[str, list[str]] = "Default",
+        names: Union[list[str], None] = None,
+    ) -> list[str]:
+        """Adds frame elements by their connections.
 
-    def AddElements(self, Connections: NDArray[np.float64] = np.empty(shape=(0, 2))):
-        """Adds elements by their connections.
+        Joint pairs that are frames already, in either order, are not added
+        again, see `Frames`. Larger batches are pushed through the database
+        tables, see `Saproject.bulk`.
 
         Args:
-            Connections (ndarray): Nx2 array of connections.
+            Connections (ndarray): Nx2 array of joint names.
+            section (str or list[str]): Frame section, one for all rows or one
+                per row. Defaults to "Default".
+            names (list[str], optional): User names of the frames, one per
+                row. Defaults to the lowest unused numbers.
+
+        Returns:
+            list[str]: Name of the existing or new frame of every row, None
+                where the frame could not be added.
         """
         from .Scripts.Build_Model import Add_Elements
 
-        Add_Elements(self.Sapobj, Connections)
+        return Add_Elements(self.Sapobj, Connections, section, names).names
 
-    def SelectCombo_Case(self, Combo_CaseList: Union[list[str], str]):
+    def SelectCombo_Case(self, Combo_CaseList: Union[list[str], str]) -> list[str]:
         """Selects the specified combination or case for output.
 
         Deselects all combinations and cases for output, then selects the
-        specified combinations or cases.
+        specified combinations or cases. The combo and case name lists are
+        read once, so every name costs a single Set call.
 
         Args:
             Combo_CaseList (list or str): List of combination or case names to
                 be selected for output.
+
+        Returns:
+            list[str]: Names that were selected, in the order given.
         """
         self.Sapobj.Results.Setup.DeselectAllCasesAndCombosForOutput()
         if isinstance(Combo_CaseList, str):
             Combo_CaseList = [Combo_CaseList]
+        combos = set(self.__Model.RespCombo.GetNameList()[1] or ())
+        cases = set(self.__Model.LoadCases.GetNameList()[1] or ())
+        selected = []
         for combo_case in Combo_CaseList:
-            self.Sapobj.Results.Setup.Set.ComboSelectedForOutput(combo_case, True)
-            ret = self.Sapobj.Results.Setup.Get.ComboSelectedForOutput(combo_case)
-            if ret[1] != 0:
+            if combo_case in combos:
+                self.Sapobj.Results.Setup.Set.ComboSelectedForOutput(combo_case, True)
+            elif combo_case in cases:
                 self.Sapobj.Results.Setup.Set.CaseSelectedForOutput(combo_case, True)
-                ret = self.Sapobj.Results.Setup.Get.CaseSelectedForOutput(combo_case)
-            if not ret[0]:
+            else:
                 logger.warning(
                     f"[orange1]{combo_case}[/orange1] may not be name of a combo/case, please check!"
                 )
+                continue
+            selected.append(combo_case)
+        return selected
 
     @staticmethod
     def writecell(WorkSheet, dataArray: NDArray[np.float64], startCell: str):
         """Writes a 2D numpy array to the specified worksheet starting from a given cell.
 
+        For many matrices, collect them in a Scripts.Export.ResultExporter
+        and write them in one pass.
+
         Args:
             WorkSheet: Pointer to the target worksheet.
             dataArray (ndarray): 2D numpy array to be written to the worksheet.
             startCell (str): Top-left corner of the matrix in Excel notation (e.g., 'A1').
         """
-        import re
-        from openpyxl.utils import column_index_from_string
+        from Sap2000py.Scripts.Export import write_blocks
 
-        colname, rowname = re.findall(r"\d+|\D+", startCell)
-        rownum = int(rowname)
-        colnum = column_index_from_string(colname)
-        m, n = dataArray.shape
-        for i in range(m):
-            for j in range(n):
-                WorkSheet.cell(rownum + i, colnum + j, value=dataArray[i, j])
+        write_blocks(WorkSheet, dataArray, startCell)
 
 
 class Saproject(metaclass=SapMeta):
@@ -165,10 +237,17 @@ class Saproject(metaclass=SapMeta):
             results.
         Scripts: An instance of the `SapScripts` class that provides access
             to additional script-based functionalities.
+        ModelCache: An instance of the `SapModelCache` class, name lists and
+            units read once and kept up to date by the wrappers' calls.
+        Mirror: An instance of the `SapModelMirror` class, points, frames and
+            links held in memory for nearest point, box and connectivity queries.
 
     Attributes:
-        _Object: A reference to the SAP2000 application object.
-        _Model: A reference to the SAP2000 model object.
+        _Object: A reference to the SAP2000 application object, connects on
+            first access.
+        _Model: A reference to the SAP2000 model object, connects on first
+            access.
+        is_connected: Whether the SAP2000 pointers have been created.
         SapVersion: Returns the current SAP2000 program version.
         ProjectInfo: Returns the project information as a dictionary.
         FilePath: Returns the file path of the current model.
@@ -180,9 +259,12 @@ class Saproject(metaclass=SapMeta):
         Unitid: Returns the unit ID of the current SAP2000 model.
         Units: Returns the unit name of the current SAP2000 model.
         is_locked: Checks if the model is locked.
+        manifest: The build manifest of the enclosing `incremental` block,
+            None outside of any.
 
 
     Methods:
+        connect: Connects to SAP2000 now instead of on first use.
         createSap: Opens the SAP2000 program and initializes the API instance.
         openSap: Starts the SAP2000 application and initializes a new model.
         closeSap: Closes the SAP2000 program.
@@ -198,6 +280,13 @@ class Saproject(metaclass=SapMeta):
         getCoordSystem: Logs and returns the name of the present coordinate
             system.
         RefreshView: Refreshes the view window.
+        profile: Profiles the SAP2000 API calls made in a with block.
+        record: Records the SAP2000 API calls made in a with block for replay.
+        bulk: Builds the model made in a with block through database tables.
+        incremental: Makes only what changed since the last build in a with
+            block.
+        activate: Makes this project the one `Saproject()` returns in a with
+            block.
 
     Example:
         The following example demonstrates how to use the Saproject class:
@@ -238,25 +327,129 @@ class Saproject(metaclass=SapMeta):
     def __init__(self, AttachToInstance: Literal[True, False] = True):
         """Initializes the Saproject instance.
 
+        Nothing is connected here: SAP2000 is attached to (or started) on the
+        first access to `_Object`/`_Model` or on an explicit `connect()`, and
+        the File/Define/Assign/Analyze/Results/Scripts wrappers and their sub
+        wrappers are built on first access. Wrappers look the model pointer up
+        here at call time, see Sap2000py.SapWrapper. Post-processing code that
+        never calls the API can import and use the package on machines
+        without SAP2000.
+
         Args:
             AttachToInstance (bool): Whether to attach to an existing SAP2000
                 instance. Defaults to True.
         """
-        self.createSap(AttachToInstance)
-        from Sap2000py.SapDeal import (
-            SapFile,
-            SapDefinitions,
-            SapAssign,
-            SapAnalyze,
-            SapResults,
-        )
+        self._AttachToInstance = AttachToInstance
+        self.__Object = None
+        self.__Model = None
+        self.manifest = None
+
+    @property
+    def _Object(self):
+        """SAP2000 application object, connects on first access."""
+        if self.__Object is None:
+            self.connect()
+        return self.__Object
+
+    @_Object.setter
+    def _Object(self, value):
+        self.__Object = value
+
+    @property
+    def _Model(self):
+        """SAP2000 model object, connects on first access."""
+        if self.__Model is None:
+            self.connect()
+        return self.__Model
+
+    @_Model.setter
+    def _Model(self, value):
+        self.__Model = value
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the SAP2000 pointers have been created."""
+        return self.__Object is not None
+
+    def connect(
+        self,
+        AttachToInstance: Union[bool, None] = None,
+        SpecifyPath: Literal[True, False] = False,
+        ProgramPath: str = "",
+        SapObject=None,
+    ):
+        """Connects to SAP2000 now instead of on first use.
+
+        Calling it again re-attaches, every wrapper built so far uses the new
+        pointers from then on.
+
+        Args:
+            AttachToInstance (bool, optional): Attach to a running API instance
+                if True, defaults to the value given to Saproject().
+            SpecifyPath (bool): If True, the path to the SAP2000 program must
+                be specified.
+            ProgramPath (str): Path to the SAP2000 program if SpecifyPath is
+                True.
+            SapObject (optional): Use this object instead of a COM instance,
+                see `createSap`.
+        """
+        if AttachToInstance is None:
+            AttachToInstance = self._AttachToInstance
+        self.createSap(AttachToInstance, SpecifyPath, ProgramPath, SapObject)
+
+    @cached_property
+    def ModelCache(self):
+        """An instance of the `SapModelCache` class, name lists and units read once."""
+        from Sap2000py.SapModelCache import SapModelCache
+
+        return SapModelCache(self)
+
+    @cached_property
+    def Mirror(self):
+        """An instance of the `SapModelMirror` class, the model geometry held in memory."""
+        from Sap2000py.SapModelMirror import SapModelMirror
+
+        return SapModelMirror(self)
+
+    @cached_property
+    def File(self):
+        """An instance of the `SapFile` class, built on first access."""
+        from Sap2000py.SapDeal import SapFile
 
-        self.File = SapFile(self)
-        self.Define = SapDefinitions(self)
-        self.Assign = SapAssign(self)
-        self.Analyze = SapAnalyze(self)
-        self.Results = SapResults(self)
-        self.Scripts = SapScripts(self)
+        return SapFile(self)
+
+    @cached_property
+    def Define(self):
+        """An instance of the `SapDefinitions` class, built on first access."""
+        from Sap2000py.SapDeal import SapDefinitions
+
+        return SapDefinitions(self)
+
+    @cached_property
+    def Assign(self):
+        """An instance of the `SapAssign` class, built on first access."""
+        from Sap2000py.SapDeal import SapAssign
+
+        return SapAssign(self)
+
+    @cached_property
+    def Analyze(self):
+        """An instance of the `SapAnalyze` class, built on first access."""
+        from Sap2000py.SapDeal import SapAnalyze
+
+        return SapAnalyze(self)
+
+    @cached_property
+    def Results(self):
+        """An instance of the `SapResults` class, built on first access."""
+        from Sap2000py.SapDeal import SapResults
+
+        return SapResults(self)
+
+    @cached_property
+    def Scripts(self):
+        """An instance of the `SapScripts` class, built on first access."""
+        return SapScripts(self)
 
     @classmethod
     def new(cls, *args, **kwargs):
@@ -370,7 +563,7 @@ class Saproject(metaclass=SapMeta):
     @property
     def Unitid(self):
         """unit ID of the current SAP2000 model."""
-        return self._Model.GetDatabaseUnits()
+        return self.ModelCache.units()
 
     @property
     def Units(self):
@@ -384,27 +577,40 @@ class Saproject(metaclass=SapMeta):
 
     @property
     def MaterialList(self):
-        return list(self._Model.PropMaterial.GetNameList()[1])
+        return list(self.ModelCache.names("PropMaterial"))
 
     def createSap(
         self,
         AttachToInstance: Literal[True, False] = False,
         SpecifyPath: Literal[True, False] = False,
         ProgramPath: str = "",
+        SapObject=None,
     ):
         """Create SAP2000 Object and Model Pointer
 
         Using comtypes to create a SAP2000 object and model pointer. Default object is **"SAP2000v1.Helper"** and **""CSI.SAP2000.API.SapObject""**
 
+        comtypes is imported here, so the package imports on machines without it.
+
         Args:
             AttachToInstance (bool): Attach to a running API instance if True.
             SpecifyPath (bool): If True, the path to the SAP2000 program must
                 be specified.
             ProgramPath (str): Path to the SAP2000 program if SpecifyPath is
                 True.
+            SapObject (optional): Object standing in for the SAP2000 API
+                object, e.g. `Sap2000py.SapFake.FakeSapObject()` to run and
+                benchmark scripts without SAP2000. comtypes is not needed then.
         """
+        if SapObject is not None:
+            self._Object = SapObject
+            self._Model = self.ModelCache.attach(SapObject.SapModel)
+            return
+        import comtypes.client
+
         helper = comtypes.client.CreateObject("SAP2000v1.Helper")
         helper = helper.QueryInterface(comtypes.gen.SAP2000v1.cHelper)
+        sap_object = None
         if AttachToInstance:
             try:
                 sap_object = helper.GetObject("CSI.SAP2000.API.SapObject")
@@ -432,12 +638,12 @@ class Saproject(metaclass=SapMeta):
                     logger.error("Cannot start a new instance of the program.")
                     sys.exit(-1)
         self._Object = sap_object
-        self._Model = sap_object.SapModel
+        self._Model = self.ModelCache.attach(sap_object.SapModel)
 
     def openSap(self):
         """Starts the SAP2000 application and initializes a new model."""
         self._Object.ApplicationStart()
-        self._Model = self._Object.SapModel
+        self._Model = self.ModelCache.attach(self._Object.SapModel)
         self._Model.InitializeNewModel()
         self._Object.Visible = True
 
@@ -667,6 +873,172 @@ class Saproject(metaclass=SapMeta):
         ret = self._Model.View.RefreshView(Window, Zoom)
         return ret
 
+    def profile(self, trace: Literal[True, False] = False):
+        """Profiles the SAP2000 API calls, use as a context manager.
+
+        Every call made through `_Model` (by any wrapper or script) is timed
+        while the block runs, see Sap2000py.SapProfiler.
+
+        Args:
+            trace (bool): Also keep every call for the Chrome trace and
+                speedscope exports. Defaults to False.
+
+        Returns:
+            SapProfiler: The profiler, `report()` gives the table.
+
+        Example:
+            ```python
+            with Sap.profile(trace=True) as prof:
+                bridge.build()
+            print(prof.report())
+            prof.to_chrome_trace("build.trace.json")
+            ```
+        """
+        from Sap2000py.SapProfiler import SapProfiler
+
+        return SapProfiler(self, trace)
+
+    def record(self, path: Union[str, Path]):
+        """Records the SAP2000 API calls to a session file, use as a context manager.
+
+        Every call made through `_Model` while the block runs is written with
+        its arguments and return value, see Sap2000py.SapReplay. Replay the
+        file without SAP2000 with
+        `createSap(SapObject=Sap2000py.SapReplay.ReplaySapObject(path))`.
+
+        Args:
+            path (str or Path): Session file, ".gz" compresses it.
+
+        Returns:
+            SapRecorder: The recorder, a SapProfiler as well.
+
+        Example:
+            ```python
+            with Sap.record("bridge.jsonl.gz"):
+                bridge.build()
+            ```
+        """
+        from Sap2000py.SapReplay import SapRecorder
+
+        return SapRecorder(self, path)
+
+    def bulk(self):
+        """Builds the model through the database table editing API, use as a context manager.
+
+        Points, frames, links, restraints, masses and group assignments made
+        in the block are collected and pushed one table at a time on exit,
+        instead of one API call each, see Sap2000py.SapBulk.
+
+        Returns:
+            SapBulk: The bulk builder, `reports` holds the import log of every table.
+
+        Example:
+            ```python
+            with Sap.bulk() as bulk:
+                pier.build()
+            print(bulk.ok)
+            ```
+        """
+        from Sap2000py.SapBulk import SapBulk
+
+        return SapBulk(self)
+
+    def incremental(self, path: Union[str, Path, None] = None):
+        """Rebuilds only what changed since the last build, use as a context manager.
+
+        The bridge builders claim every step they make in a build manifest
+        and skip the ones the previous build already made with the same
+        content, objects the previous build made and this one did not are
+        deleted on exit, see Sap2000py.SapManifest.
+
+        Args:
+            path (str or Path, optional): Manifest file, read on entry and
+                written on exit. Defaults to None, the manifest of the last
+                build of this project held in memory.
+
+        Returns:
+            SapManifest: The manifest, `counts` holds the new, changed,
+                unchanged and deleted steps.
+
+        Example:
+            ```python
+            with Sap.incremental("bridge.manifest.json"):
+                pier.build()
+                girder.update_links_in_Sap()
+            ```
+        """
+        from Sap2000py.SapManifest import SapManifest
+
+        return SapManifest(self, path)
+
+    @contextmanager
+    def activate(self):
+        """Makes this project the active one, use as a context manager.
+
+        Inside the block `Saproject()` returns this project instead of the
+        global singleton, so code written against `Saproject()` (the bridge
+        and earthquake builders, scripts) drives this model. The active
+        project is a context variable: blocks nest, and every thread or
+        asyncio task has its own, a new thread starts with the singleton.
+
+        Returns:
+            Saproject: This project.
+
+        Example:
+            ```python
+            Sap2 = Saproject.new()
+            Sap2.createSap(AttachToInstance=False)
+            with Sap2.activate():
+                pier.build()  # built in the second SAP2000 instance
+            ```
+        """
+        token = _active_project.set(self)
+        try:
+            yield self
+        finally:
+            _active_project.reset(token)
+
+
+class ProjectBound:
+    """Mixin of objects that build in a Saproject (bridge and earthquake classes).
+
+    `project` is the Saproject to build in, None (the default) uses the
+    active project: the one of the enclosing `Saproject.activate()` block,
+    the global `Saproject()` outside of any.
+
+    Attributes:
+        Sap: The project this object builds in.
+        content_hash: Stable hash of the object's parameters, what the build
+            manifest of `Saproject.incremental` compares.
+    """
+
+    project: Optional[Saproject] = None
+
+    @property
+    def Sap(self) -> Saproject:
+        """The project this object builds in."""
+        return Saproject() if self.project is None else self.project
+
+    def activate(self):
+        """Makes `Sap` the active project in a with block, objects created inside follow it."""
+        return self.Sap.activate()
+
+    @property
+    def content_hash(self) -> str:
+        """Stable hash of the parameters of this object, see Sap2000py.SapManifest.content_hash."""
+        from Sap2000py.SapManifest import content_hash
+
+        return content_hash(self)
+
+    def build_step(self, kind: str, key: str, *content, name: Optional[str] = None) -> Optional[str]:
+        """Claims a build step in the manifest of `Sap.incremental()`, see SapManifest.step.
+
+        Returns:
+            str or None: SAME, CHANGED or NEW, None outside of an incremental build (make the step).
+        """
+        manifest = self.Sap.manifest
+        return None if manifest is None else manifest.step(kind, key, *content, name=name)
+
 
 if __name__ == "__main__":
     sys.path.append(".")
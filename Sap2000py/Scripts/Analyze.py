@@ -1,11 +1,12 @@
+from Sap2000py.SapWrapper import SapWrapper
 
-class SapAnalyze:
+
+class SapAnalyze(SapWrapper):
     def __init__(self,Sapobj):
         """
         Choose cases to run and Analyze model
         """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
+        super().__init__(Sapobj)
         self.CaseFlags = {1:'Not run',2:'Could not start',3:'Not finished',4:'Finished'}
 
     def AddCases(self,CaseName="All"):
@@ -55,6 +56,7 @@ class SapAnalyze:
         i = 1
         while not allflag:
             self.__Model.Analyze.RunAnalysis()
+            self._Sapobj.Results.Cache.invalidate()
             CaseStatus = self.GetCaseStatus()
             for Name in CaseRunFlags[1]:
                 allflag = True
@@ -92,6 +94,7 @@ class SapAnalyze:
                 nonameflag = True
             else:
                 self.__Model.Analyze.DeleteResults(Name)
+                self._Sapobj.Results.Cache.invalidate()
 
         if nonameflag:
             print('You have entered the wrong CaseName, please check in the Caselist below:')
@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 from loguru import logger
-from Sap2000py.Scripts.extract_polygon_from_dxf import DXF2Polygons
 from typing import Literal
 from itertools import chain
 
@@ -61,7 +60,7 @@ class SapPoint:
         return ret
 
     def exists(self):
-        return Sap.Assign.PointObj.Get.CoordCartesian(self.name)[-1] == 0
+        return Sap.ModelCache.has("PointObj", self.name)
 
 @dataclass
 class SapBase_6Spring():
@@ -265,6 +264,8 @@ class Sap_Double_Box_Pier:
         return result
 
     def get_solid_section(self):
+        from Sap2000py.Scripts.extract_polygon_from_dxf import DXF2Polygons
+
         if self.Height_of_pier >= 50:
             sec = DXF2Polygons(file_path=r'Test\TongZhouSha_H_above_50.dxf', unit_of_dxf='cm', show_log=False)
         elif self.Height_of_pier >= 40:
@@ -285,6 +286,8 @@ class Sap_Double_Box_Pier:
         return solid_section
     
     def get_box_section(self):
+        from Sap2000py.Scripts.extract_polygon_from_dxf import DXF2Polygons
+
         if self.Height_of_pier >= 50:
             sec = DXF2Polygons(file_path=r'Test\TongZhouSha_H_above_50.dxf', unit_of_dxf='cm', show_log=False)
         elif self.Height_of_pier >= 40:
@@ -525,6 +528,8 @@ class Sap_Box_Girder:
         Sap.RefreshView()
     
     def get_girder_section(self):
+        from Sap2000py.Scripts.extract_polygon_from_dxf import DXF2Polygons
+
         sec = DXF2Polygons(file_path= r'Test\TongZhouSha_Main_Girder_1.dxf', unit_of_dxf='cm', show_log=False)
         girder_section = Section_General(
             name = self.name+"_girder",
@@ -1,50 +1,392 @@
+from itertools import product
+
 import numpy as np
+from numpy.typing import NDArray
+
+
+class JointRegistry:
+    """
+    Joints of the model by coordinates, kept in a spatial hash so coordinates closer than tolerance are one joint
+    Joints are read from SAP2000 on first use (PointObj.GetAllPoints, one call) and again after the model is
+    replaced or points are deleted, joints added through add() are registered as they are added.
+    input:
+        Sapobj(Saproject)
+        tolerance(float)-coordinates closer than this [L] are the same joint, 0 merges equal coordinates only
+    """
+    # hash cell edge in tolerances, a coordinate looks into the neighbour cell only within tolerance of a side
+    CELL = 16
+
+    def __init__(self,Sapobj,tolerance:float=1e-6):
+        self._Sapobj = Sapobj
+        self._tolerance = tolerance
+        self._revision = None
+        self.clear()
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    @tolerance.setter
+    def tolerance(self,value:float):
+        self._tolerance = value
+        self._cells = {}
+        self._hash(0)
+
+    @property
+    def coords(self) -> NDArray[np.float64]:
+        """Nx3 coordinates of the registered joints, row i is joint names[i]"""
+        return self._xyz[:len(self.names)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def clear(self):
+        """Forget every joint, they are read from SAP2000 again on next use"""
+        self.names = []
+        self._points = []
+        self._xyz = np.empty(shape=(64,3))
+        self._cells = {}
+        self._revision = None
+
+    def sync(self):
+        """Reads the joints of the model if it changed since the last read"""
+        cache = self._Sapobj.ModelCache
+        if cache.revision("PointObj") == self._revision:
+            return
+        self.clear()
+        ret = self._Sapobj._Model.PointObj.GetAllPoints(0,[],[],[],[],"Global")
+        if ret[-1] == 0 and ret[0]:
+            self._append(np.column_stack(ret[2:5]),list(ret[1]))
+        self._revision = cache.revision("PointObj")
+
+    def find(self,Cartesian_coord) -> list:
+        """
+        Names of the joints at the coordinates
+        input:
+            Cartesian_coord(ndarray)-Nx3 array or Nx2 array in 2D model
+        output:
+            list[str]:joint name of every row, None where there is no joint
+        """
+        self.sync()
+        xyz = _as_xyz(Cartesian_coord)
+        rows = [self._find(p,key,near) for p,key,near in zip(xyz.tolist(),*self._keys(xyz))]
+        return [self.names[row] if row >= 0 else None for row in rows]
+
+    def add(self,Cartesian_coord,names=None) -> list:
+        """
+        Adds the coordinates that are not joints yet, rows that repeat a joint (or an earlier row) are merged
+        input:
+            Cartesian_coord(ndarray)-Nx3 array or Nx2 array in 2D model
+            names(list[str])-user names of the new joints, one per row, default names if None
+        output:
+            list[str]:name of the existing or new joint of every row, None where the joint could not be added
+        """
+        self.sync()
+        xyz = _as_xyz(Cartesian_coord)
+        first = len(self.names)
+        rows = []
+        for i,(p,key,near) in enumerate(zip(xyz.tolist(),*self._keys(xyz))):
+            row = self._find(p,key,near)
+            if row < 0:
+                row = len(self._points)
+                self._points.append(p)
+                self.names.append(names[i] if names is not None else "")
+                self._cells.setdefault(key,[]).append(row)
+            rows.append(row)
+        self._grow(first,np.asarray(self._points[first:]).reshape(-1,3))
+        AddCartesian = self._Sapobj.Assign.PointObj.AddCartesian
+        failed = set()
+        for row in range(first,len(self.names)):
+            x,y,z = self._points[row]
+            ret = AddCartesian(x,y,z,UserName=self.names[row])
+            if ret[-1] != 0:
+                print('Add joint ',self._points[row],' failed!')
+                failed.add(row)
+            else:
+                self.names[row] = ret[0]
+        if failed:
+            remap = self._drop(first,failed)
+            rows = [remap.get(row,row) for row in rows]
+        return [self.names[row] if row >= 0 else None for row in rows]
+
+    # ---- spatial hash ----
+    def _keys(self,xyz):
+        """hash cells of the coordinates and the neighbour cell (-1/0/+1) within tolerance on each axis"""
+        if self._tolerance <= 0:
+            return list(map(tuple,xyz.tolist())),[None]*len(xyz)
+        scaled = xyz/(self._tolerance*self.CELL)
+        cells = np.floor(scaled)
+        frac = scaled-cells
+        near = (frac > 1-1/self.CELL).astype(np.int8)-(frac < 1/self.CELL)
+        return list(map(tuple,cells.astype(np.int64).tolist())),[n if any(n) else None for n in near.tolist()]
+
+    def _find(self,p,key,near) -> int:
+        tol2 = self._tolerance**2
+        cells = [key] if near is None else product(*((k,k+d) if d else (k,) for k,d in zip(key,near)))
+        for cell in cells:
+            for row in self._cells.get(cell,()):
+                q = self._points[row]
+                if (p[0]-q[0])**2+(p[1]-q[1])**2+(p[2]-q[2])**2 <= tol2:
+                    return row
+        return -1
+
+    def _drop(self,first,failed) -> dict:
+        """
+        forget the rows from first on that are in failed, the rows after them move up
+        output:
+            dict:new row of every row from first on, -1 for the rows dropped
+        """
+        keys,_ = self._keys(self.coords[first:])
+        for key in set(keys):
+            cell = [row for row in self._cells[key] if row < first]
+            if cell:
+                self._cells[key] = cell
+            else:
+                del self._cells[key]
+        kept = [row for row in range(first,len(self.names)) if row not in failed]
+        remap = dict.fromkeys(failed,-1)
+        remap.update((row,new) for new,row in enumerate(kept,first))
+        self._xyz[first:first+len(kept)] = self._xyz[kept]
+        self.names[first:] = [self.names[row] for row in kept]
+        self._points[first:] = [self._points[row] for row in kept]
+        self._hash(first)
+        return remap
+
+    def _append(self,xyz,names):
+        first = len(self.names)
+        self.names.extend(names)
+        self._points.extend(map(tuple,xyz.tolist()))
+        self._grow(first,xyz)
+        self._hash(first)
+
+    def _grow(self,first,xyz):
+        end = first+len(xyz)
+        if end > len(self._xyz):
+            self._xyz = np.vstack([self._xyz,np.empty(shape=(max(end,2*len(self._xyz))-len(self._xyz),3))])
+        self._xyz[first:end] = xyz
+
+    def _hash(self,first):
+        keys,_ = self._keys(self.coords[first:])
+        for row,key in enumerate(keys,first):
+            self._cells.setdefault(key,[]).append(row)
+
+
+def _as_xyz(Cartesian_coord) -> NDArray[np.float64]:
+    """Nx3 float coordinates, z=0 for Nx2 input"""
+    xyz = np.asarray(Cartesian_coord,dtype=float)
+    if xyz.size == 0:
+        return np.empty(shape=(0,3))
+    xyz = np.atleast_2d(xyz)
+    if xyz.shape[1] == 2:
+        xyz = np.column_stack([xyz,np.zeros(len(xyz))])
+    return xyz
+
+
 class Add_Joints_Cartesian:
-    def __init__(self,Sapobj,Cartesian_coord):
+    def __init__(self,Sapobj,Cartesian_coord,names=None):
         """
-        Add Joints by Cartesian coordinate system
+        Add Joints by Cartesian coordinate system, coordinates that are joints already are not added again
+        (see JointRegistry, Sapobj.Scripts.Joints)
         input Cartesian_coord(ndarray)-Nx3 array or Nx2 array in 2D model
+        input names(list[str])-user names of the joints, one per row, optional
+        self.names(list[str])-name of the new or existing joint of every row, None where it could not be added
         """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
-        N0 = Sapobj.coord_joints.shape[0] if 'coord_joints' in Sapobj.__dict__ else 0
-        all_joints = Sapobj.coord_joints if N0 else np.empty(shape=(0,Cartesian_coord.shape[1]))
-        # Add new coords
-        N,dim = Cartesian_coord.shape
-        uniqueN = N
-        for i in range(N):
-            if (Cartesian_coord[i]==all_joints).all(-1).any():
-                uniqueN -= 1  # point already exists
-                print('coordinates ',Cartesian_coord[i],' duplicates! please check!')
-            else:
-                if dim==2:
-                    Sapobj.Assign.PointObj.AddCartesian(Cartesian_coord[i,0],Cartesian_coord[i,1])
-                if dim==3:
-                    Sapobj.Assign.PointObj.AddCartesian(Cartesian_coord[i,0],Cartesian_coord[i,1],Cartesian_coord[i,2])
-                all_joints = np.vstack((all_joints, Cartesian_coord[i]))
-        Sapobj.coord_joints = all_joints
+        registry = Sapobj.Scripts.Joints
+        registry.sync()
+        N0 = len(registry)
+        self.names = registry.add(Cartesian_coord,names)
+        Sapobj.coord_joints = registry.coords
+        # rows whose joint could not be added are None, they are neither new nor duplicates
+        N = len(self.names)-self.names.count(None)
+        uniqueN = len(registry)-N0
         print(uniqueN,' Joints Added to the Model!')
         if N != uniqueN:print(N-uniqueN,' joints duplicates! please check!')
         
-class Add_Elements:
-    def __init__(self,Sapobj,Connections):
-        """
-        Add Elements by Connections
-        input Connections(ndarray)-Nx2 array
-        """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
-        N0 = Sapobj.Connections.shape[0] if 'Connections' in Sapobj.__dict__ else 0
-        all_connections = Sapobj.Connections if N0 else np.empty(shape=(0,Connections.shape[1]))
-        # Add new connections
-        N,dim = Connections.shape
-        uniqueN = N
-        for i in range(N):
-            if (Connections[i]==all_connections).all(-1).any():
-                uniqueN -= 1  # element connection already exists
-                print('Connections ',Connections[i],' duplicates! please check!')
+class FrameRegistry:
+    """
+    Frames of the model by connectivity, a hash of the joint pair regardless of its order (and the section)
+    Frames are read from SAP2000 on first use (FrameObj.GetAllFrames, one call) and again after the model is
+    replaced or frames/points are deleted or renamed, frames added through add() are registered as they are
+    added. Section changes made around the registry are seen after clear().
+    input:
+        Sapobj(Saproject)
+        by_section(bool)-frames between the same joints are different frames if their sections differ
+    """
+    # batches with at least this many new frames go through the database tables (Sapobj.bulk())
+    BULK = 32
+
+    def __init__(self,Sapobj,by_section:bool=False):
+        self._Sapobj = Sapobj
+        self.by_section = by_section
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def connectivity(self) -> NDArray:
+        """Nx2 joint names of the registered frames, row i is frame names[i]"""
+        return np.array(self._ends,dtype=str).reshape(-1,2)
+
+    def clear(self):
+        """Forget every frame, they are read from SAP2000 again on next use"""
+        self.names = []
+        self.sections = []
+        self._ends = []
+        self._rows = {}
+        self._revision = None
+
+    def _current(self):
+        cache = self._Sapobj.ModelCache
+        return cache.revision("FrameObj"),cache.revision("PointObj")
+
+    def sync(self):
+        """Reads the frames of the model if it changed since the last read"""
+        if self._current() == self._revision:
+            return
+        self.clear()
+        ret = self._Sapobj._Model.FrameObj.GetAllFrames(0,[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],"Global")
+        if ret[-1] == 0 and ret[0]:
+            for name,section,i,j in zip(ret[1],ret[2],ret[4],ret[5]):
+                self._register(name,i,j,section)
+        self._revision = self._current()
+
+    def key(self,i:str,j:str,section:str="Default") -> tuple:
+        """Registry key of a frame between joints i and j"""
+        pair = (i,j) if i <= j else (j,i)
+        return pair+(section,) if self.by_section else pair
+
+    def find(self,Connections,section="Default") -> list:
+        """
+        Names of the frames between the joints
+        input:
+            Connections(ndarray)-Nx2 array of joint names
+            section(str/list[str])-section of every row, only used if by_section
+        output:
+            list[str]:frame name of every row, None where there is no frame
+        """
+        self.sync()
+        pairs = _pairs(Connections)
+        rows = (self._rows.get(self.key(i,j,s)) for (i,j),s in zip(pairs,_each(section,len(pairs))))
+        return [None if row is None else self.names[row] for row in rows]
+
+    def add(self,Connections,section="Default",names=None) -> list:
+        """
+        Adds the joint pairs that are not frames yet, [i,j] and [j,i] are the same frame
+        input:
+            Connections(ndarray)-Nx2 array of joint names
+            section(str/list[str])-frame section, one for all rows or one per row
+            names(list[str])-user names of the new frames, one per row, lowest unused numbers if None
+        output:
+            list[str]:name of the existing or new frame of every row, None where the frame could not be added
+        """
+        self.sync()
+        pairs = _pairs(Connections)
+        sections = _each(section,len(pairs))
+        first = len(self.names)
+        rows = []
+        for k,((i,j),s) in enumerate(zip(pairs,sections)):
+            row = self._rows.get(self.key(i,j,s))
+            if row is None:
+                row = self._register(names[k] if names is not None else "",i,j,s)
+            rows.append(row)
+        if len(self.names)-first >= self.BULK:
+            with self._Sapobj.bulk():
+                failed = self._create(first)
+            # queued frames always look added, the rows the table import rejected are found in the model
+            failed |= self._missing(first)
+        else:
+            failed = self._create(first)
+        if failed:
+            remap = self._drop(first,failed)
+            rows = [remap.get(row,row) for row in rows]
+        return [self.names[row] if row >= 0 else None for row in rows]
+
+    def _register(self,name,i,j,section) -> int:
+        row = len(self.names)
+        self.names.append(name)
+        self.sections.append(section)
+        self._ends.append((i,j))
+        self._rows[self.key(i,j,section)] = row
+        return row
+
+    def _missing(self,first) -> set:
+        """Rows from first on whose frame is not in SAP2000 between its joints"""
+        ret = self._Sapobj._Model.FrameObj.GetAllFrames(0,[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],[],"Global")
+        ends = {name:{i,j} for name,i,j in zip(ret[1],ret[4],ret[5])} if ret[-1] == 0 and ret[0] else {}
+        return {row for row in range(first,len(self.names)) if ends.get(self.names[row]) != set(self._ends[row])}
+
+    def _drop(self,first,failed) -> dict:
+        """
+        forget the rows from first on that are in failed, the rows after them move up
+        output:
+            dict:new row of every row from first on, -1 for the rows dropped
+        """
+        kept = [row for row in range(first,len(self.names)) if row not in failed]
+        remap = dict.fromkeys(failed,-1)
+        remap.update((row,new) for new,row in enumerate(kept,first))
+        for row in range(first,len(self.names)):
+            self._rows.pop(self.key(*self._ends[row],self.sections[row]),None)
+        self.names[first:] = [self.names[row] for row in kept]
+        self.sections[first:] = [self.sections[row] for row in kept]
+        self._ends[first:] = [self._ends[row] for row in kept]
+        for row in range(first,len(self.names)):
+            self._rows[self.key(*self._ends[row],self.sections[row])] = row
+        return remap
+
+    def _create(self,first) -> set:
+        """Adds the frames registered from row first on to SAP2000, returns the rows that failed"""
+        unnamed = (row for row in range(first,len(self.names)) if not self.names[row])
+        used = set(self._Sapobj.ModelCache.names("FrameObj")).union(self.names)
+        number = 0
+        for row in unnamed:
+            # SAP2000's default names, so the frames can be queued in the tables
+            number += 1
+            while str(number) in used:
+                number += 1
+            self.names[row] = str(number)
+        AddByPoint = self._Sapobj.Assign.FrameObj.AddByPoint
+        failed = set()
+        for row in range(first,len(self.names)):
+            (i,j),section = self._ends[row],self.sections[row]
+            ret = AddByPoint(i,j,propName=section,userName=self.names[row])
+            if ret[-1] != 0:
+                print('Add element ',[i,j],' failed!')
+                failed.add(row)
             else:
-                self.__Model.FrameObj.AddByPoint(Connections[i,0],Connections[i,1])
-                all_connections = np.vstack((all_connections, Connections[i]))
-        Sapobj.Connections = all_connections
+                self.names[row] = ret[0]
+        return failed
+
 
+def _pairs(Connections) -> list:
+    """joint name pairs of Nx2 connections, integer joint numbers become names"""
+    pairs = np.asarray(Connections)
+    if pairs.dtype.kind == "f":
+        pairs = pairs.astype(np.int64)
+    return [(str(i),str(j)) for i,j in pairs.reshape(-1,2).tolist()]
+
+
+def _each(value,n) -> list:
+    """value of every row, a str is the value of all rows"""
+    return [value]*n if isinstance(value,str) else list(value)
+
+
+class Add_Elements:
+    def __init__(self,Sapobj,Connections,section="Default",names=None):
+        """
+        Add Elements by Connections, joint pairs that are frames already (in either order) are not added again
+        (see FrameRegistry, Sapobj.Scripts.Frames)
+        input Connections(ndarray)-Nx2 array of joint names
+        input section(str/list[str])-frame section, one for all rows or one per row
+        input names(list[str])-user names of the frames, one per row, optional
+        self.names(list[str])-name of the new or existing frame of every row, None where it could not be added
+        """
+        registry = Sapobj.Scripts.Frames
+        registry.sync()
+        N0 = len(registry)
+        self.names = registry.add(Connections,section,names)
+        Sapobj.Connections = registry.connectivity
+        # rows whose frame could not be added are None, they are neither new nor duplicates
+        N = len(self.names)-self.names.count(None)
+        uniqueN = len(registry)-N0
+        if N != uniqueN:print(N-uniqueN,' elements duplicates! please check!')
@@ -0,0 +1,146 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from Sap2000py.Scripts.GetResults import reduce_by_code
+
+
+class RecordEnvelope:
+    """
+    Running envelope of several ground-motion records, updated in place record by record
+
+    Memory is O(items x components): the running max/min/absmax with the record and step of the peak,
+    and the sums needed for the statistics of the record peaks (the absmax of every record):
+        MeanOfMaxima = mean of the record peaks, what an AbsAdd combo with SF=1/n of Envelopes gives
+        MaxOfMaxima  = max of the record peaks
+        SRSS         = square root of the sum of squares of the record peaks
+
+    Example:
+        envelope = RecordEnvelope(["U1","U2","U3","R1","R2","R3"])
+        for case in cases:
+            envelope.update_table(case, Sap.Results.Link.Deformation("Bearing","GroupElm",as_table=True))
+        envelope.MeanOfMaxima
+    """
+    def __init__(self,fields:Sequence[str],keep_records:bool = False):
+        """
+        input:
+            fields(list):component names, the second axis of every array
+            keep_records(bool):also keep the peak of every record in RecordPeaks (O(records x items x components))
+        """
+        self.fields = list(fields)
+        self.keep_records = keep_records
+        self.records:List[str] = []
+        self.names:List[str] = []
+        self._index:Dict[str,int] = {}
+        ncomp = len(self.fields)
+        self.Max = np.full((0,ncomp),-np.inf)
+        self.Min = np.full((0,ncomp),np.inf)
+        self.AbsMax = np.zeros((0,ncomp))
+        self.PeakRecord = np.full((0,ncomp),-1,dtype=np.int64)
+        self.PeakStep = np.full((0,ncomp),np.nan)
+        self._count = np.zeros((0,ncomp),dtype=np.int64)
+        self._sum = np.zeros((0,ncomp))
+        self._sumsq = np.zeros((0,ncomp))
+        self.RecordPeaks:List[NDArray[np.float64]] = []
+
+    def _rows(self,names:NDArray) -> NDArray[np.int64]:
+        """item row of every unique name, new names grow the arrays"""
+        new = [name for name in names if name not in self._index]
+        if new:
+            for name in new:
+                self._index[name] = len(self.names)
+                self.names.append(name)
+            grow = len(new),len(self.fields)
+            self.Max = np.vstack([self.Max,np.full(grow,-np.inf)])
+            self.Min = np.vstack([self.Min,np.full(grow,np.inf)])
+            self.AbsMax = np.vstack([self.AbsMax,np.zeros(grow)])
+            self.PeakRecord = np.vstack([self.PeakRecord,np.full(grow,-1,dtype=np.int64)])
+            self.PeakStep = np.vstack([self.PeakStep,np.full(grow,np.nan)])
+            self._count = np.vstack([self._count,np.zeros(grow,dtype=np.int64)])
+            self._sum = np.vstack([self._sum,np.zeros(grow)])
+            self._sumsq = np.vstack([self._sumsq,np.zeros(grow)])
+            self.RecordPeaks = [np.vstack([peak,np.full(grow,np.nan)]) for peak in self.RecordPeaks]
+        return np.array([self._index[name] for name in names],dtype=np.int64)
+
+    def update(self,record:str,names:Sequence[str],steps:Optional[Sequence[float]],values:NDArray):
+        """
+        add one record
+        input:
+            record(str):name of the record (load case)
+            names(list):item name of every result row
+            steps(list|None):step of every result row, None if unknown (Envelopes output)
+            values(ndarray):n by len(fields) result values
+        """
+        values = np.asarray(values,dtype=np.float64).reshape(len(names),len(self.fields))
+        if len(values) == 0:
+            # a record without results leaves the envelope as it is
+            return
+        steps = np.full(len(names),np.nan) if steps is None else np.asarray(steps,dtype=np.float64)
+        uniquenames,codes = np.unique(np.asarray(names),return_inverse=True)
+        codes = codes.ravel()
+        rows = self._rows(uniquenames.tolist())
+        recordindex = len(self.records)
+        self.records.append(record)
+        nitem = len(uniquenames)
+
+        # every code of np.unique appears, so the reduced rows are item 0..nitem-1
+        _,RecordPeak,RecordMax,RecordMin = reduce_by_code(codes,values)
+
+        # step of the record peak: rows sorted by item then by decreasing |value|, first row of each item wins
+        RecordPeakStep = np.empty((nitem,len(self.fields)))
+        starts = None
+        for k in range(len(self.fields)):
+            order = np.lexsort((-np.fabs(values[:,k]),codes))
+            if starts is None:
+                sortedcodes = codes[order]
+                starts = np.flatnonzero(np.r_[True,sortedcodes[1:] != sortedcodes[:-1]])
+            RecordPeakStep[:,k] = steps[order[starts]]
+
+        self.Max[rows] = np.maximum(self.Max[rows],RecordMax)
+        self.Min[rows] = np.minimum(self.Min[rows],RecordMin)
+        higher = RecordPeak > self.AbsMax[rows]
+        self.AbsMax[rows] = np.where(higher,RecordPeak,self.AbsMax[rows])
+        self.PeakRecord[rows] = np.where(higher,recordindex,self.PeakRecord[rows])
+        self.PeakStep[rows] = np.where(higher,RecordPeakStep,self.PeakStep[rows])
+        self._count[rows] += 1
+        self._sum[rows] += RecordPeak
+        self._sumsq[rows] += RecordPeak**2
+        if self.keep_records:
+            peaks = np.full((len(self.names),len(self.fields)),np.nan)
+            peaks[rows] = RecordPeak
+            self.RecordPeaks.append(peaks)
+
+    def update_table(self,record:str,table,by:str = "Obj"):
+        """
+        add one record from a ResultTable, e.g. Results.Link.Force(...,as_table=True)
+        """
+        self.update(record,table[by],table["StepNum"] if "StepNum" in table else None,table.numeric(self.fields))
+
+    @property
+    def MeanOfMaxima(self) -> NDArray[np.float64]:
+        with np.errstate(invalid="ignore",divide="ignore"):
+            return self._sum/self._count
+
+    @property
+    def MaxOfMaxima(self) -> NDArray[np.float64]:
+        return self.AbsMax
+
+    @property
+    def SRSS(self) -> NDArray[np.float64]:
+        return np.sqrt(self._sumsq)
+
+    @property
+    def PeakRecordName(self) -> NDArray:
+        """record (load case) name of the peak, "" where no record had a result"""
+        names = np.array(self.records+[""],dtype=object)
+        return names[self.PeakRecord]
+
+    def sorted(self):
+        """
+        names in sorted order with the matching row order, like the *_by_Group extractors
+        output:
+            Namelist(list),order(ndarray):use array[order] to reorder
+        """
+        order = np.argsort(np.asarray(self.names,dtype=np.str_),kind="stable")
+        return [self.names[i] for i in order],order
@@ -0,0 +1,172 @@
+import csv
+from pathlib import Path
+from typing import Dict, List, Literal, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def anchor_to_rowcol(anchor:str) -> Tuple[int,int]:
+    """
+    ---Excel cell name to 1-based (row,col), e.g. "D22" -> (22,4)---
+    """
+    anchor = anchor.replace("$","").upper()
+    col = 0
+    for i,char in enumerate(anchor):
+        if char.isdigit():
+            return int(anchor[i:]),col
+        col = col*26 + ord(char) - 64
+    raise ValueError(f"{anchor} is not a cell name like 'A1'")
+
+
+def write_blocks(WorkSheet,dataArray:NDArray,startCell:Union[str,Tuple[int,int]]):
+    """
+    ---write a 2D array into an openpyxl worksheet, cell by cell so existing cells keep their style---
+    input:
+        WorkSheet:openpyxl worksheet
+        dataArray(ndarray):2D array, 1D is written as a column
+        startCell(str|tuple):top left corner, "D22" or (row,col)
+    """
+    rownum,colnum = anchor_to_rowcol(startCell) if isinstance(startCell,str) else startCell
+    rows = np.asarray(dataArray)
+    if rows.ndim == 1:
+        rows = rows.reshape(-1,1)
+    # tolist converts every numpy scalar once, instead of one dataArray[i,j] lookup per cell
+    rows = rows.tolist()
+    for i,row in enumerate(rows,rownum):
+        for j,value in enumerate(row,colnum):
+            # existing cells keep their style, number format and comments
+            WorkSheet.cell(i,j).value = value
+
+
+class ResultExporter:
+    """
+    Collect (array,sheet,anchor) jobs and write them in one pass to Excel, CSV or Parquet
+    Excel "update" mode builds one openpyxl cell per value like writecell and is about as fast,
+    "write_only" and CSV are the fast outputs for large reports
+
+    Example:
+        exporter = ResultExporter()
+        exporter.add(EleAbsForce[:,[2]],"PierBottom","D22")
+        exporter.add(EleAbsForce[:,[2,0,4]],"PierBottom","D30")
+        exporter.to_excel("Report.xlsx")                      # update the existing workbook
+        exporter.to_excel("NewReport.xlsx",mode="write_only")  # stream a new workbook
+        exporter.to_csv("Report")                              # Report/PierBottom.csv
+    """
+    def __init__(self,jobs:List[Tuple[NDArray,str,str]] = None):
+        """
+        input:
+            jobs(list):[(array,sheet,anchor),...], anchor like "A1"
+        """
+        self.jobs:List[Tuple[NDArray,str,str]] = []
+        for job in jobs or []:
+            self.add(*job)
+
+    def add(self,dataArray:NDArray,sheet:str,anchor:str = "A1") -> "ResultExporter":
+        """
+        add a job, 1D arrays are written as a column
+        """
+        dataArray = np.asarray(dataArray)
+        if dataArray.ndim == 1:
+            dataArray = dataArray.reshape(-1,1)
+        self.jobs.append((dataArray,sheet,anchor))
+        return self
+
+    def sheets(self) -> Dict[str,List[Tuple[NDArray,int,int]]]:
+        """
+        jobs grouped by sheet, in the order the sheets first appear: {sheet:[(array,row,col),...]}
+        """
+        grouped:Dict[str,List[Tuple[NDArray,int,int]]] = {}
+        for dataArray,sheet,anchor in self.jobs:
+            grouped.setdefault(sheet,[]).append((dataArray,*anchor_to_rowcol(anchor)))
+        return grouped
+
+    @staticmethod
+    def compose_rows(blocks:List[Tuple[NDArray,int,int]]) -> List[list]:
+        """
+        lay the blocks of one sheet out as full rows (None for empty cells), later blocks overwrite earlier ones
+        """
+        rows:Dict[int,list] = {}
+        for dataArray,rownum,colnum in blocks:
+            width = dataArray.shape[1]
+            for i,values in enumerate(dataArray.tolist(),rownum):
+                row = rows.setdefault(i,[])
+                if len(row) < colnum-1+width:
+                    row.extend([None]*(colnum-1+width-len(row)))
+                row[colnum-1:colnum-1+width] = values
+        if not rows:
+            return []
+        return [rows.get(i,[]) for i in range(1,max(rows)+1)]
+
+    def to_excel(self,filename:Union[str,Path],mode:Literal["update","write_only"] = "update"):
+        """
+        write every job to an .xlsx workbook
+        input:
+            filename(str|Path):workbook path
+            mode(str):
+                "update", open the workbook if it exists (keeps formats, formulas and other cells) and write the blocks,
+                    sheets the workbook doesn't have yet are filled row by row, existing sheets cell by cell
+                "write_only", stream a new workbook row by row, the fastest for new reports, an existing file is replaced
+        """
+        import openpyxl
+
+        filename = Path(filename)
+        if mode == "write_only":
+            wb = openpyxl.Workbook(write_only=True)
+            for sheet,blocks in self.sheets().items():
+                ws = wb.create_sheet(sheet)
+                for row in self.compose_rows(blocks):
+                    ws.append(row)
+            wb.save(filename)
+            return
+        if filename.exists():
+            wb = openpyxl.load_workbook(filename)
+        else:
+            wb = openpyxl.Workbook()
+            wb.remove(wb.active)
+        for sheet,blocks in self.sheets().items():
+            if sheet not in wb.sheetnames:
+                # nothing to keep on a new sheet: whole rows are appended, no cell lookup per value
+                ws = wb.create_sheet(sheet)
+                for row in self.compose_rows(blocks):
+                    ws.append({col:value for col,value in enumerate(row,1) if value is not None})
+                continue
+            ws = wb[sheet]
+            for dataArray,rownum,colnum in blocks:
+                write_blocks(ws,dataArray,(rownum,colnum))
+        wb.save(filename)
+
+    def to_csv(self,folder:Union[str,Path]) -> List[Path]:
+        """
+        write one <sheet>.csv per sheet into folder, blocks keep their anchor position
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True,exist_ok=True)
+        written = []
+        for sheet,blocks in self.sheets().items():
+            path = folder/f"{sheet}.csv"
+            with open(path,"w",newline="",encoding="utf-8") as f:
+                writer = csv.writer(f)
+                for row in self.compose_rows(blocks):
+                    writer.writerow(["" if value is None else value for value in row])
+            written.append(path)
+        return written
+
+    def to_parquet(self,folder:Union[str,Path]) -> List[Path]:
+        """
+        write one <sheet>_<anchor>.parquet per job into folder, columns are named c0,c1,..., needs pyarrow
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("to_parquet needs pyarrow, please pip install pyarrow") from e
+        folder = Path(folder)
+        folder.mkdir(parents=True,exist_ok=True)
+        written = []
+        for dataArray,sheet,anchor in self.jobs:
+            table = pa.table({f"c{j}":np.ascontiguousarray(dataArray[:,j]) for j in range(dataArray.shape[1])})
+            path = folder/f"{sheet}_{anchor}.parquet"
+            pq.write_table(table,path)
+            written.append(path)
+        return written
@@ -1,13 +1,28 @@
+from typing import Literal
+
 import numpy as np
-class GetResults:
-    def __init__(self,Sapobj):
-        """
-        Get Results from Sap easily, you just need to relax
-        """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
-        self._Sapobj = Sapobj
 
+from Sap2000py.SapWrapper import SapWrapper
+
+# Results path and component columns used by the *_by_Group extractors
+GROUP_RESULTS = {
+    "JointReact": ("Joint", "React", ["F1", "F2", "F3", "M1", "M2", "M3"]),
+    "JointDispl": ("Joint", "Displ", ["U1", "U2", "U3", "R1", "R2", "R3"]),
+    "ElementForce": ("Frame", "Force", ["P", "V2", "V3", "T", "M2", "M3"]),
+    "ElementJointForce": ("Frame", "JointForce", ["F1", "F2", "F3", "M1", "M2", "M3"]),
+    "LinkForce": ("Link", "Force", ["P", "V2", "V3", "T", "M2", "M3"]),
+    "LinkJointForce": ("Link", "JointForce", ["F1", "F2", "F3", "M1", "M2", "M3"]),
+    "LinkDeformation": ("Link", "Deformation", ["U1", "U2", "U3", "R1", "R2", "R3"]),
+}
+# SapModel.GroupDef.GetAssignments object type and SapModel object of each result group
+GROUP_OBJECTS = {"Joint":(1,"PointObj"),"Frame":(2,"FrameObj"),"Link":(7,"LinkObj")}
+ResultType = Literal["JointReact", "JointDispl", "ElementForce", "ElementJointForce",
+                     "LinkForce", "LinkJointForce", "LinkDeformation"]
+
+class GetResults(SapWrapper):
+    """
+    Get Results from Sap easily, you just need to relax
+    """
     def JointReact_by_Group(self,Name,Dealflag = True):
         """
         Get JointReaction by group and return a np.array:[F1,F2,F3,M1,M2,M3]
@@ -23,13 +38,13 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[F1,F2,F3,M1,M2,M3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.Joint.React(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 6,12
+        table = self._Sapobj.Results.Joint.React(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["F1", "F2", "F3", "M1", "M2", "M3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
     def JointDispl_by_Group(self,Name,Dealflag = True):
         """
@@ -48,13 +63,13 @@ class GetResults:
             MinReaction (ndarray): Minimum displacements and rotations in np.array: [U1, U2, U3, R1, R2, R3].
         """
         # get result by group name
-        ret = self._Sapobj.Results.Joint.Displ(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 6,12
+        table = self._Sapobj.Results.Joint.Displ(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["U1", "U2", "U3", "R1", "R2", "R3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
     def ElementForce_by_Group(self,Name,Dealflag = True):
         """
@@ -71,13 +86,13 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[P,V2,V3,T,M2,M3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.Frame.Force(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 8,14
+        table = self._Sapobj.Results.Frame.Force(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["P", "V2", "V3", "T", "M2", "M3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
     
     def ElementJointForce_by_Group(self,Name,Dealflag = True):
         """
@@ -94,13 +109,13 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[F1,F2,F3,M1,M2,M3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.Frame.JointForce(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 7,13
+        table = self._Sapobj.Results.Frame.JointForce(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["F1", "F2", "F3", "M1", "M2", "M3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
     def LinkForce_by_Group(self,Name,Dealflag = True):
         """
@@ -117,13 +132,13 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[P,V2,V3,T,M2,M3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.Link.Force(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 7,13
+        table = self._Sapobj.Results.Link.Force(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["P", "V2", "V3", "T", "M2", "M3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
     def LinkJointForce_by_Group(self,Name,Dealflag = True):
         """
@@ -140,13 +155,13 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[F1,F2,F3,M1,M2,M3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.LinkJointForce(Name,ItemTypeElm="GroupElm")
-        colstart,colend = 7,13
+        table = self._Sapobj.Results.Link.JointForce(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["F1", "F2", "F3", "M1", "M2", "M3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
     def LinkDeformation_by_Group(self,Name,Dealflag = True):
         """
@@ -163,37 +178,207 @@ class GetResults:
         MinReaction(ndarray):results in np.array:[U1,U2,U3,R1,R2,R3]
         """
         # get result by group name
-        ret = self._Sapobj.Results.Link.Deformation(Name, ItemTypeElm="GroupElm")
-        colstart,colend = 6,12
+        table = self._Sapobj.Results.Link.Deformation(Name, ItemTypeElm="GroupElm", as_table=True)
+        fields = ["U1", "U2", "U3", "R1", "R2", "R3"]
         if Dealflag:
-            uniquelist,AbsReaction,MaxReaction,MinReaction = deal_with_item(ret,colstart,colend)
+            uniquelist,AbsReaction,MaxReaction,MinReaction = reduce_table(table,fields)
             return uniquelist,AbsReaction,MaxReaction,MinReaction
         else:
-            return ret[1],ret[colstart:colend]
+            return table["Obj"].tolist(),[table[field] for field in fields]
 
+    def Cube_by_Group(self,Name,Combo_CaseList,Result:ResultType = "LinkForce"):
+        """
+        Get the results of several cases/combos for a group in one fetch, and split them into
+        [case,item,component] cubes
+        input:
+            Name(str):the Group's name you want to extract
+            Combo_CaseList(list|str):names of the load cases or load combinations
+            Result(str):one of "JointReact","JointDispl","ElementForce","ElementJointForce",
+                "LinkForce","LinkJointForce","LinkDeformation", components are the same as the *_by_Group method
+        output:
+        CaseList(list):case/combo names selected, first axis of the cubes
+        Namelist(list):Item Name List with order, second axis of the cubes
+        AbsCube(ndarray):max absolute value, shape (case,item,component), nan if the case has no result for the item
+        MaxCube(ndarray):max value, shape (case,item,component)
+        MinCube(ndarray):min value, shape (case,item,component)
+        """
+        group,method,fields = GROUP_RESULTS[Result]
+        # one selection pass for every case/combo, then a single Results call
+        CaseList = self._Sapobj.Scripts.SelectCombo_Case(Combo_CaseList)
+        table = getattr(getattr(self._Sapobj.Results,group),method)(Name, ItemTypeElm="GroupElm", as_table=True)
+        Namelist,AbsCube,MaxCube,MinCube = cube_from_table(table,fields,CaseList)
+        return CaseList,Namelist,AbsCube,MaxCube,MinCube
 
-def deal_with_item(results,colstart,colend):
-    reaction = np.transpose(np.array(results[colstart:colend]))
-    # get all item in the out put
-    itemtext = results[1]
-    # Get Item Name List with order
-    uniquelist = sorted(list(set(itemtext)))
-    # find duplicates
-    indexdict = find_duplicates(itemtext)
-    MaxReaction = np.zeros((len(uniquelist),reaction.shape[1]))
-    MinReaction = np.zeros((len(uniquelist),reaction.shape[1]))
-    AbsReaction = np.zeros((len(uniquelist),reaction.shape[1]))
-    try:
-        sorted_indices = sorted(range(len(uniquelist)), key=lambda i: int(uniquelist[i].split('_')[1][1:]))
-    except:
-        sorted_indices = range(len(uniquelist))
-    for i in sorted_indices:
-        itemreaction = reaction[indexdict[uniquelist[i]],:]
-        MaxReaction[i,:] = np.max(itemreaction,0)
-        MinReaction[i,:] = np.min(itemreaction,0)
-        AbsReaction[i,:] = np.max(np.fabs(itemreaction),0)
-    return uniquelist,AbsReaction,MaxReaction,MinReaction
 
+    def History_by_Group(self,Name,Case,Result:ResultType,Path,HistType:Literal["DirectHist","ModalHist"] = "DirectHist",
+                         ChunkSize = 1,dtype = np.float64):
+        """
+        Stream the step-by-step history of a group into a np.memmap file laid out as [step,element,component],
+        element by element (or chunk by chunk), so peak memory does not grow with the number of steps/records.
+        Rows of the same step (frame stations, link ends) keep the signed value of max absolute.
+        A partially written file with the same layout is resumed, finished elements are skipped.
+        input:
+            Name(str):the Group's name you want to extract
+            Case(str):name of the time history case/combo
+            Result(str):one of "JointReact","JointDispl","ElementForce","ElementJointForce",
+                "LinkForce","LinkJointForce","LinkDeformation"
+            Path(str|Path):data file of the memmap, the layout and progress go to <Path>.json
+            HistType(str):"DirectHist" or "ModalHist", which output option is set to Step-by-Step
+            ChunkSize(int):elements fetched per Results call, 1 uses ObjectElm, more select the chunk and use SelectionElm
+            dtype:dtype of the memmap, float32 halves the file
+        output:
+            history(StepHistory):history.data[step,element,component], history.names, history.steps, history.fields
+        """
+        from Sap2000py.Scripts.StepHistory import StepHistory, reduce_per_step
+
+        group,method,fields = GROUP_RESULTS[Result]
+        objtype,objname = GROUP_OBJECTS[group]
+        NumberItems,ObjectType,ObjectName,ret = self.__Model.GroupDef.GetAssignments(Name)
+        names = sorted(name for name,t in zip(ObjectName,ObjectType) if t == objtype)
+
+        history = StepHistory(Path,names,fields,dtype)
+        if history.resume() and history.complete:
+            return history
+
+        getattr(self._Sapobj.Results.Setup.Set.Option,HistType)("Step-by-Step")
+        self._Sapobj.Scripts.SelectCombo_Case(Case)
+        fetch = getattr(getattr(self._Sapobj.Results,group),method)
+        todo = [i for i in range(len(names)) if not history.done[i]]
+        for start in range(0,len(todo),ChunkSize):
+            chunk = todo[start:start+ChunkSize]
+            if ChunkSize == 1:
+                table = fetch(names[chunk[0]], ItemTypeElm="ObjectElm", as_table=True)
+            else:
+                self.__Model.SelectObj.ClearSelection()
+                for i in chunk:
+                    getattr(self.__Model,objname).SetSelected(names[i],True)
+                table = fetch("", ItemTypeElm="SelectionElm", as_table=True)
+            objects = table.categories("Obj").tolist()
+            for i in chunk:
+                if names[i] not in objects:
+                    # no result for this element, left as nan
+                    history.done[i] = True
+                    continue
+                rows = table.codes("Obj") == objects.index(names[i])
+                steps,values = reduce_per_step(table["StepNum"][rows],table.numeric(fields)[rows])
+                history.write(i,steps,values)
+            history.flush()
+            del table
+        if ChunkSize != 1:
+            self.__Model.SelectObj.ClearSelection()
+        if history.data is None:
+            # no element returned a result
+            history.allocate([])
+        return history
+
+
+    def Envelope_by_Group(self,Name,RecordCases,Result:ResultType,StepByStep = False,
+                          HistType:Literal["DirectHist","ModalHist"] = "ModalHist",keep_records = False):
+        """
+        Envelope of several records (time history cases) for a group, computed in Python instead of an AbsAdd combo.
+        Each record is selected and fetched once, the running envelope is updated in place.
+        input:
+            Name(str):the Group's name you want to extract
+            RecordCases(list):names of the time history cases, one per record
+            Result(str):one of "JointReact","JointDispl","ElementForce","ElementJointForce",
+                "LinkForce","LinkJointForce","LinkDeformation"
+            StepByStep(bool):set the HistType output option to Step-by-Step, so PeakStep holds the step of the peak,
+                otherwise it is set to Envelopes and PeakStep is the StepNum SAP2000 reports for the envelope
+            HistType(str):"DirectHist" or "ModalHist"
+            keep_records(bool):keep the peak of every record in envelope.RecordPeaks
+        output:
+            envelope(RecordEnvelope):envelope.names, Max, Min, AbsMax, PeakRecordName, PeakStep,
+                MeanOfMaxima, MaxOfMaxima, SRSS, arrays are (item,component)
+        """
+        from Sap2000py.Scripts.Envelope import RecordEnvelope
+
+        group,method,fields = GROUP_RESULTS[Result]
+        fetch = getattr(getattr(self._Sapobj.Results,group),method)
+        getattr(self._Sapobj.Results.Setup.Set.Option,HistType)("Step-by-Step" if StepByStep else "Envelopes")
+        envelope = RecordEnvelope(fields,keep_records)
+        for case in RecordCases:
+            if not self._Sapobj.Scripts.SelectCombo_Case(case):
+                continue
+            table = fetch(Name, ItemTypeElm="GroupElm", as_table=True)
+            envelope.update_table(case,table)
+            del table
+        return envelope
+
+
+def reduce_by_code(codes,values):
+    """
+    ---reduce result rows to one row per integer code with np.maximum/np.minimum.reduceat---
+    input:
+        codes(ndarray):1 by N non-negative integer code of each result row
+        values(ndarray):N by M result values
+    output:
+        uniquecodes(ndarray):sorted unique codes
+        AbsReaction,MaxReaction,MinReaction(ndarray):n by M, one row per unique code
+    """
+    values = np.asarray(values,dtype=np.float64)
+    if values.ndim == 1:
+        values = values.reshape(-1,1)
+    codes = np.asarray(codes).ravel()
+    if len(codes) == 0:
+        empty = np.zeros((0,values.shape[1]))
+        return codes,empty,empty.copy(),empty.copy()
+    # stable sort keeps the rows of each item together, reduceat works on the segment starts
+    order = np.argsort(codes,kind="stable")
+    sortedcodes = codes[order]
+    starts = np.flatnonzero(np.r_[True,sortedcodes[1:] != sortedcodes[:-1]])
+    grouped = values[order]
+    MaxReaction = np.maximum.reduceat(grouped,starts,axis=0)
+    MinReaction = np.minimum.reduceat(grouped,starts,axis=0)
+    AbsReaction = np.maximum(np.fabs(MaxReaction),np.fabs(MinReaction))
+    return sortedcodes[starts],AbsReaction,MaxReaction,MinReaction
+
+
+def reduce_by_item(itemtext,values):
+    """
+    ---reduce result rows to one row per item---
+    input:
+        itemtext(list|ndarray):1 by N item names, one per result row
+        values(ndarray):N by M result values
+    output:
+        uniquelist(list):Item Name List with order(sorted like sorted(set(itemtext)))
+        AbsReaction(ndarray):max absolute value of each item, n by M
+        MaxReaction(ndarray):max value of each item, n by M
+        MinReaction(ndarray):min value of each item, n by M
+    """
+    if len(itemtext) == 0:
+        _,AbsReaction,MaxReaction,MinReaction = reduce_by_code([],values)
+        return [],AbsReaction,MaxReaction,MinReaction
+    uniquearray,inverse = np.unique(np.asarray(itemtext),return_inverse=True)
+    _,AbsReaction,MaxReaction,MinReaction = reduce_by_code(inverse,values)
+    return uniquearray.tolist(),AbsReaction,MaxReaction,MinReaction
+
+
+def reduce_table(table,fields,by = "Obj"):
+    """
+    ---reduce a ResultTable to one row per item, works on the category codes directly---
+    input:
+        table(ResultTable):result table, e.g. Results.Joint.React(...,as_table=True)
+        fields(list):numeric columns to reduce, e.g. ["F1","F2","F3","M1","M2","M3"]
+        by(str):category column that names the item
+    output:
+        uniquelist,AbsReaction,MaxReaction,MinReaction, see reduce_by_item
+    """
+    uniquecodes,AbsReaction,MaxReaction,MinReaction = reduce_by_code(table.codes(by),table.numeric(fields))
+    # categories are sorted, so the item order is the same as reduce_by_item
+    return table.categories(by)[uniquecodes].tolist(),AbsReaction,MaxReaction,MinReaction
+
+
+def deal_with_item(results,colstart,colend):
+    """
+    ---get the abs/max/min value of each item from a Sap results list---
+    input:
+        results(list):return of Sap Results function, results[1] is the item name
+        colstart,colend(int):column range of the values in results
+    output:
+        uniquelist,AbsReaction,MaxReaction,MinReaction, see reduce_by_item
+    """
+    reaction = np.transpose(np.array(results[colstart:colend],dtype=np.float64))
+    return reduce_by_item(results[1],reaction)
 
 
 def find_duplicates(lst):
@@ -203,11 +388,39 @@ def find_duplicates(lst):
     output(dict)
     """
     index_all={}
-    for i in range(len(lst)):
-        target=lst[i]
-        index_=[] # initialize a position list
-        for index,nums in enumerate(lst):
-            if nums==target:
-                index_.append(index)
-        index_all[target]=index_
-    return index_all
\ No newline at end of file
+    for index,target in enumerate(lst):
+        index_all.setdefault(target,[]).append(index)
+    return index_all
+
+
+def cube_from_table(table,fields,caselist = None,by = "Obj"):
+    """
+    ---group a ResultTable by LoadCase and item into dense [case,item,component] cubes---
+    input:
+        table(ResultTable):result table with a LoadCase column
+        fields(list):numeric columns to reduce, the component axis
+        caselist(list):case/combo order of the first axis, default the sorted LoadCase names of the table,
+            rows of cases not in caselist are dropped
+        by(str):category column that names the item
+    output:
+        Namelist(list):Item Name List with order
+        AbsCube,MaxCube,MinCube(ndarray):shape (case,item,component), nan where a case has no row for an item
+    """
+    casenames = table.categories("LoadCase").tolist()
+    caselist = casenames if caselist is None else list(caselist)
+    # map the table's LoadCase codes to the position in caselist, -1 for cases not asked for
+    position = {case:i for i,case in enumerate(caselist)}
+    casemap = np.array([position.get(case,-1) for case in casenames],dtype=np.int64)
+    casecodes = casemap[table.codes("LoadCase")] if len(casemap) else np.zeros(0,dtype=np.int64)
+    itemnames = table.categories(by)
+    nitem = len(itemnames)
+    keep = casecodes >= 0
+    keys = casecodes[keep]*nitem + table.codes(by)[keep]
+    uniquekeys,AbsReaction,MaxReaction,MinReaction = reduce_by_code(keys,table.numeric(fields)[keep])
+    shape = (len(caselist),nitem,len(fields))
+    AbsCube,MaxCube,MinCube = (np.full(shape,np.nan) for _ in range(3))
+    caseindex,itemindex = np.divmod(uniquekeys,max(nitem,1))
+    AbsCube[caseindex,itemindex] = AbsReaction
+    MaxCube[caseindex,itemindex] = MaxReaction
+    MinCube[caseindex,itemindex] = MinReaction
+    return itemnames.tolist(),AbsCube,MaxCube,MinCube
@@ -1,21 +1,80 @@
+from contextlib import nullcontext
+from typing import Dict, Literal, Optional, Tuple
+from Sap2000py.SapWrapper import SapWrapper
 
-from typing import Literal
-class SapGroup:
-    def __init__(self,Sapobj):
+# assignments/removals of at least this many objects are pushed through the group assignment table
+BULK = 32
+
+
+class SapGroup(SapWrapper):
+    """
+    Group scripts on a local index: group name -> (type id, object name) of its members.
+    A group is read with one GroupDef.GetAssignments call when it is first needed, and kept up to date by
+    the SetGroupAssign/GroupDef calls made through the model (see SapModelCache.subscribe).
+    """
+    def __init__(self, Sapobj):
+        super().__init__(Sapobj)
+        self._members: Dict[str, Dict[Tuple[int, str], None]] = {}
+        Sapobj.ModelCache.subscribe(self)
+
+    def _group(self, GroupName:str) -> Optional[Dict[Tuple[int, str], None]]:
+        """
+        members of a group, read from SAP2000 once
+        output:
+            members(dict|None):{(type id,name):None}, None if the group doesn't exist
+        """
+        members = self._members.get(GroupName)
+        if members is None:
+            if not self._Sapobj.ModelCache.has("GroupDef",GroupName):
+                return None
+            NumberItems,ObjectType,ObjectName,ret = self.__Model.GroupDef.GetAssignments(GroupName)
+            if ret != 0:
+                return None
+            members = self._members[GroupName] = dict.fromkeys(zip(map(int,ObjectType or ()),ObjectName or ()))
+        return members
+
+    def clear(self):
         """
-        Choose cases to run and Analyze model
+        forget the index, groups are read again when needed
         """
-        self.__Object = Sapobj._Object
-        self.__Model = Sapobj._Model
-        self._Sapobj = Sapobj
+        self._members.clear()
+
+    def observe(self, path:str, args:tuple, result):
+        """
+        update the index after a successful API call (SapModelCache listener)
+        """
+        interface, _, method = path.partition(".")
+        method = method.rsplit(".", 1)[-1]
+        if method == "SetGroupAssign" and interface.endswith("Obj") and len(args) > 1:
+            members = self._members.get(args[1])
+            if members is None:
+                return
+            if len(args) > 3 and args[3] != 0:
+                # ItemType Group/SelectedObjects: read the group again
+                del self._members[args[1]]
+                return
+            key = (self._Sapobj.Objectdict.get(interface[:-3]), args[0])
+            if len(args) > 2 and args[2]:
+                members.pop(key, None)
+            else:
+                members[key] = None
+        elif interface == "GroupDef" and args:
+            if method == "Clear" and args[0] in self._members:
+                self._members[args[0]] = {}
+            elif method in ("Delete", "ChangeName"):
+                self._members.pop(args[0], None)
+                if len(args) > 1:
+                    self._members.pop(args[1], None)
+        elif interface.endswith("Obj") and method in ("Delete", "ChangeName"):
+            # objects leave or rename in every group they belong to
+            self._members.clear()
 
     def GetGroupNames(self):
         """
         Get group names,return NameList.
         """
-        NumberNames, NameList,ret = self.__Model.GroupDef.GetNameList()
-        return NameList
-    
+        return self._Sapobj.ModelCache.names("GroupDef")
+
     def Select(self,GroupName):
         """
         Select group by GroupName
@@ -28,11 +87,11 @@ class SapGroup:
 
         nonameflag = False
         for Name in GroupName:
-            if Name not in self.GetGroupNames():
+            if not self._Sapobj.ModelCache.has("GroupDef",Name):
                 print('GroupName "{}"dosen\'t exist!'.format(Name))
                 nonameflag = True
             else:
-                self.__Model.SelectObj.Group(GroupName)
+                self.__Model.SelectObj.Group(Name)
 
         if nonameflag:
             print('You have entered the wrong GroupName, please check in the Caselist below:')
@@ -53,23 +112,16 @@ class SapGroup:
         if type(GroupName)==str:
             GroupName = [GroupName]
         nonameflag = False
+        typestr = {typeid:typename for typename,typeid in self._Sapobj.Objectdict.items()}
         ElementList = {}
         for Name in GroupName:
-            if Name not in self.GetGroupNames():
+            members = self._group(Name)
+            if members is None:
                 print('GroupName "{}"dosen\'t exist!'.format(Name))
                 nonameflag = True
             else:
-                NumberElements,typelist,elementList,ret = self.__Model.GroupDef.GetAssignments(Name)
-                # Change typelist to typestr_list
-                typestr_list = []
-                for types in typelist:
-                    typestr = self._Sapobj.Scripts.lookup(self._Sapobj.ObjDict,types)
-                    typestr_list.append(typestr)
-                
-                # combine elementList and typestr_list to a new list
-                newlist = [tstr+':'+ele for tstr,ele in zip(typestr_list,elementList)]
-                # update the ElementList
-                ElementList.update(dict.fromkeys(newlist))
+                # update the ElementList with 'type:name' of every member
+                ElementList.update(dict.fromkeys(f'{typestr[typeid]}:{ele}' for typeid,ele in members))
 
         if nonameflag:
             print('You have entered the wrong GroupName, please check in the Caselist below:')
@@ -78,7 +130,7 @@ class SapGroup:
 
     def AddtoGroup(self,GroupName:str,namelist,type:Literal['Point','Frame','Cable','Tendon','Area','Solid','Link']):
         """
-        Add elements to group
+        Add elements to group, elements already in the group are skipped
         input:
             GroupName(str):group name
             idlist(list):element id list
@@ -86,21 +138,26 @@ class SapGroup:
                         'Tendon':4,'Area':5,'Solid':6,'Link':7}
         """
         Objstr = type+'Obj'
-        SapModel = self.__Model
+        typeid = self._Sapobj.Objectdict[type]
 
         # check if this group exists
-        allgroups = self.GetGroupNames()
-        if GroupName not in allgroups:
-            SapModel.GroupDef.SetGroup(GroupName)
+        if not self._Sapobj.ModelCache.has("GroupDef",GroupName):
+            if self.__Model.GroupDef.SetGroup(GroupName) == 0:
+                self._members[GroupName] = {}
 
         # Change type to list
         if isinstance(namelist,str):
             namelist = [namelist]
 
-        for name in namelist:
-            ret = eval(f'SapModel.{Objstr}.SetGroupAssign(name, GroupName)')
-            if ret != 0:
-                print(f'Add {Objstr}:{name} to group {GroupName} failed!')
+        members = self._group(GroupName) or {}
+        newnames = [name for name in dict.fromkeys(namelist) if (typeid,name) not in members]
+        # large batches go to SAP2000 as one group assignment table
+        with self._Sapobj.bulk() if len(newnames) >= BULK else nullcontext():
+            SetGroupAssign = getattr(self.__Model,Objstr).SetGroupAssign
+            for name in newnames:
+                ret = SetGroupAssign(name, GroupName)
+                if ret != 0:
+                    print(f'Add {Objstr}:{name} to group {GroupName} failed!')
 
     def RemovefromGroup(self,GroupName:str,dellist,typeStr:str):
         """
@@ -112,23 +169,25 @@ class SapGroup:
                         'Tendon':4,'Area':5,'Solid':6,'Link':7}
         """
         Objstr = typeStr+'Obj'
-        # Delete from existing elements
-        EleList = dict.fromkeys(self.GetElements(GroupName))
-        for id2del in dellist:
-            # key in EleList is like {'Frame:id'}
-            elekey = typeStr+':'+id2del
-            if elekey in EleList:
-                del EleList[elekey]
+        typeid = self._Sapobj.Objectdict[typeStr]
+        if isinstance(dellist,str):
+            dellist = [dellist]
+
+        members = self._group(GroupName)
+        if members is None:
+            print('GroupName "{}"dosen\'t exist!'.format(GroupName))
+            return
+        delnames = []
+        for id2del in dict.fromkeys(dellist):
+            if (typeid,id2del) in members:
+                delnames.append(id2del)
             else:
-                print('The element {} is not in group {}!'.format(elekey,GroupName))
-        
-        # clear current group
-        self.__Model.GroupDef.Clear(GroupName)
-
-        # create the group again
-        for ele in EleList.keys():
-            typestr = ele.split(':')[0]
-            eleid = ele.split(':')[1]
-            self.AddtoGroup(GroupName,eleid,typestr)
-
-        
\ No newline at end of file
+                print('The element {} is not in group {}!'.format(typeStr+':'+id2del,GroupName))
+
+        # only the removed elements are sent, large batches as one group assignment table
+        with self._Sapobj.bulk() if len(delnames) >= BULK else nullcontext():
+            SetGroupAssign = getattr(self.__Model,Objstr).SetGroupAssign
+            for name in delnames:
+                ret = SetGroupAssign(name, GroupName, True)
+                if ret != 0:
+                    print(f'Remove {Objstr}:{name} from group {GroupName} failed!')
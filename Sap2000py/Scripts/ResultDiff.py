@@ -0,0 +1,202 @@
+from pathlib import Path
+from typing import Dict, Literal, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from Sap2000py.SapResultCache import SapResultCache
+from Sap2000py.SapResultTable import ResultTable
+
+# numeric columns that locate a row rather than hold a result
+LOCATION_FIELDS = ("ObjSta", "ElmSta", "IntPtNum", "IntPtLoc", "StepNum")
+
+
+def _as_table(result, kind:str = None) -> ResultTable:
+    """ResultTable, file written by ResultTable.save or SapResultCache, or raw COM list together with its kind"""
+    if isinstance(result,ResultTable):
+        return result
+    if isinstance(result,(str,Path)):
+        with np.load(result,allow_pickle=False) as data:
+            cached = "ncol" in data
+        if not cached:
+            return ResultTable.load(result)
+        # entry of the result cache, the raw COM list
+        result = SapResultCache._load(Path(result))
+    if kind is None:
+        raise ValueError("kind is needed to read a raw COM result list, e.g. kind='JointDispl'")
+    return ResultTable.from_com(kind,result)
+
+
+def _shared_codes(a:ResultTable,b:ResultTable,field:str,decimals:int) -> Tuple[NDArray[np.int64],NDArray[np.int64]]:
+    """codes of one key column of both tables in one vocabulary"""
+    if field in a.category_fields:
+        union = np.union1d(a.categories(field),b.categories(field))
+        mapa = np.searchsorted(union,a.categories(field))
+        mapb = np.searchsorted(union,b.categories(field))
+        return mapa[a.codes(field)].astype(np.int64),mapb[b.codes(field)].astype(np.int64)
+    values = np.round(np.concatenate([a[field],b[field]]),decimals)
+    _,inverse = np.unique(values,return_inverse=True)
+    inverse = inverse.ravel().astype(np.int64)
+    return inverse[:len(a)],inverse[len(a):]
+
+
+def _compact(keya:NDArray[np.int64],keyb:NDArray[np.int64]) -> Tuple[NDArray[np.int64],NDArray[np.int64],int]:
+    """renumber keys of both tables to 0..n-1, n is at most the number of rows"""
+    _,inverse = np.unique(np.concatenate([keya,keyb]),return_inverse=True)
+    inverse = inverse.ravel().astype(np.int64)
+    return inverse[:len(keya)],inverse[len(keya):],int(inverse.max())+1 if len(inverse) else 0
+
+
+def _occurrence(key:NDArray[np.int64]) -> NDArray[np.int64]:
+    """0 for the first row of every key, 1 for the second, ... (rows in table order)"""
+    order = np.argsort(key,kind="stable")
+    sortedkey = key[order]
+    starts = np.r_[True,sortedkey[1:] != sortedkey[:-1]] if len(key) else np.zeros(0,dtype=bool)
+    runstart = np.maximum.accumulate(np.where(starts,np.arange(len(key)),0))
+    occurrence = np.empty(len(key),dtype=np.int64)
+    occurrence[order] = np.arange(len(key))-runstart
+    return occurrence
+
+
+def row_keys(a:ResultTable,b:ResultTable,key:Sequence[str],decimals:int = 6) -> Tuple[NDArray[np.int64],NDArray[np.int64]]:
+    """
+    ---one int64 key per row of both tables, equal keys mean the same (object, element, case, step, ...)---
+    input:
+        a,b(ResultTable):tables of the same query
+        key(list):key columns, present in both tables
+        decimals(int):rounding of numeric key columns (stations, steps) before they are compared
+    output:
+        keya,keyb(ndarray):row keys, unique within each table (repeated rows are told apart by their order)
+    """
+    keya = np.zeros(len(a),dtype=np.int64)
+    keyb = np.zeros(len(b),dtype=np.int64)
+    size = 1
+    for field in key:
+        codea,codeb = _shared_codes(a,b,field,decimals)
+        width = int(max(codea.max(initial=-1),codeb.max(initial=-1)))+1
+        # mixed radix, renumber first when the next column would overflow int64
+        if size*max(width,1) >= 2**62:
+            keya,keyb,size = _compact(keya,keyb)
+        keya = keya*width+codea
+        keyb = keyb*width+codeb
+        size *= max(width,1)
+    keya,keyb,size = _compact(keya,keyb)
+    occa,occb = _occurrence(keya),_occurrence(keyb)
+    if occa.any() or occb.any():
+        width = int(max(occa.max(),occb.max()))+1
+        keya,keyb,size = _compact(keya*width+occa,keyb*width+occb)
+    return keya,keyb
+
+
+class ResultDiff:
+    """
+    Row aligned comparison of two result tables of the same query, e.g. two variants of a model
+
+    Rows are matched by hashed (object, element, point, case, step, station) keys with a sort based
+    intersection, O(n log n) for n rows, differences are computed on the matched rows at once:
+        Delta   = B - A
+        AbsDiff = |B - A|
+        RelDiff = |B - A| / max(|A|, |B|, atol)
+
+    Example:
+        a = Sap.Results.Frame.Force("Pier",ItemTypeElm="GroupElm",as_table=True)
+        a.save("RunA.npz")
+        ... modify the model, run again ...
+        b = Sap.Results.Frame.Force("Pier",ItemTypeElm="GroupElm",as_table=True)
+        diff = ResultDiff("RunA.npz",b)
+        diff.summary()
+        diff.top(10,by="rel")
+    """
+    def __init__(self,a,b,fields:Sequence[str] = None,key:Sequence[str] = None,kind:str = None,
+                 atol:float = 1e-9,decimals:int = 6):
+        """
+        input:
+            a,b:ResultTable, path of a file written by ResultTable.save, path of a result cache entry
+                or raw COM list (the last two need kind)
+            fields(list):numeric columns compared, default every result column of both tables
+            key(list):columns that identify a row, default the name columns and LOCATION_FIELDS of both tables
+            kind(str):Results function of raw COM lists, e.g. "FrameForce"
+            atol(float):floor of the denominator of RelDiff
+            decimals(int):rounding of numeric key columns before they are compared
+        """
+        self.a = _as_table(a,kind)
+        self.b = _as_table(b,kind)
+        if self.a.kind != self.b.kind:
+            raise ValueError(f"Cannot compare Results.{self.a.kind} with Results.{self.b.kind}")
+        common = [field for field in self.a.fields if field in self.b]
+        if key is None:
+            key = [field for field in common if field in self.a.category_fields or field in LOCATION_FIELDS]
+        self.key = list(key)
+        if fields is None:
+            fields = [field for field in common if field in self.a.numeric_fields and field not in self.key]
+        self.fields = list(fields)
+        self.atol = atol
+
+        keya,keyb = row_keys(self.a,self.b,self.key,decimals)
+        _,self.IndexA,self.IndexB = np.intersect1d(keya,keyb,assume_unique=True,return_indices=True)
+        self.OnlyA = np.flatnonzero(~np.isin(keya,keyb,assume_unique=True))
+        self.OnlyB = np.flatnonzero(~np.isin(keyb,keya,assume_unique=True))
+
+        self.A = self.a.numeric(self.fields)[self.IndexA]
+        self.B = self.b.numeric(self.fields)[self.IndexB]
+        self.Delta = self.B-self.A
+        self.AbsDiff = np.fabs(self.Delta)
+        self.RelDiff = self.AbsDiff/np.maximum(np.maximum(np.fabs(self.A),np.fabs(self.B)),atol)
+
+    def __len__(self) -> int:
+        """number of matched rows"""
+        return len(self.IndexA)
+
+    def summary(self) -> Dict[str,Dict[str,float]]:
+        """
+        output:
+            dict:{field:{"MaxAbs","MaxRel","RMS"}} over the matched rows, plus {"Rows":{"Matched","OnlyA","OnlyB"}}
+        """
+        summary = {"Rows":{"Matched":len(self),"OnlyA":len(self.OnlyA),"OnlyB":len(self.OnlyB)}}
+        if len(self):
+            MaxAbs = self.AbsDiff.max(axis=0)
+            MaxRel = self.RelDiff.max(axis=0)
+            RMS = np.sqrt(np.mean(self.Delta**2,axis=0))
+            for k,field in enumerate(self.fields):
+                summary[field] = {"MaxAbs":float(MaxAbs[k]),"MaxRel":float(MaxRel[k]),"RMS":float(RMS[k])}
+        return summary
+
+    def top(self,k:int = 10,field:str = None,by:Literal["abs","rel"] = "abs") -> Dict[str,NDArray]:
+        """
+        the k largest differences, partial sort so it stays linear in the number of rows
+        input:
+            k(int):number of outliers
+            field(str):column ranked, default every (row, column) pair is ranked
+            by(str):"abs" ranks AbsDiff, "rel" ranks RelDiff
+        output:
+            dict:key columns of table a, "Field", "A", "B", "AbsDiff", "RelDiff", largest first
+        """
+        matrix = self.AbsDiff if by == "abs" else self.RelDiff
+        if field is not None:
+            matrix = matrix[:,[self.fields.index(field)]]
+        flat = matrix.ravel()
+        k = min(k,len(flat))
+        if k == 0:
+            picked = np.zeros(0,dtype=np.int64)
+        else:
+            picked = np.argpartition(-flat,k-1)[:k]
+            picked = picked[np.argsort(-flat[picked],kind="stable")]
+        rows,cols = np.divmod(picked,matrix.shape[1]) if matrix.shape[1] else (picked,picked)
+        if field is not None:
+            cols = np.full(len(rows),self.fields.index(field))
+        out = self.rows(self.IndexA[rows])
+        out["Field"] = np.array(self.fields,dtype=np.str_)[cols]
+        for name,array in (("A",self.A),("B",self.B),("AbsDiff",self.AbsDiff),("RelDiff",self.RelDiff)):
+            out[name] = array[rows,cols]
+        return out
+
+    def rows(self,index:NDArray,table:Literal["a","b"] = "a") -> Dict[str,NDArray]:
+        """key columns of some rows of table a or b, e.g. diff.rows(diff.OnlyB,"b")"""
+        source = self.a if table == "a" else self.b
+        return {field:source[field][index] for field in self.key}
+
+    def exceeding(self,rtol:float = 1e-3,atol:float = None) -> NDArray[np.bool_]:
+        """matched rows where any column differs by more than atol + rtol*max(|A|,|B|), like np.isclose"""
+        atol = self.atol if atol is None else atol
+        limit = atol+rtol*np.maximum(np.fabs(self.A),np.fabs(self.B))
+        return (self.AbsDiff > limit).any(axis=1)
@@ -0,0 +1,158 @@
+from typing import Dict, Literal, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from Sap2000py.Scripts.GetResults import reduce_by_code
+
+
+def principal_2d(s11:NDArray,s22:NDArray,s12:NDArray):
+    """
+    ---in-plane principal values and angle, vectorized---
+    input:
+        s11,s22,s12(ndarray):direct and shear components (stress, membrane force or plate moment)
+    output:
+        smax,smin(ndarray):principal values
+        angle(ndarray):angle from the local 1 axis to the direction of smax, counter clockwise [deg]
+    """
+    s11,s22,s12 = (np.asarray(s,dtype=np.float64) for s in (s11,s22,s12))
+    center = (s11+s22)/2
+    radius = np.hypot((s11-s22)/2,s12)
+    angle = np.degrees(0.5*np.arctan2(2*s12,s11-s22))
+    return center+radius,center-radius,angle
+
+
+def von_mises_2d(s11:NDArray,s22:NDArray,s12:NDArray) -> NDArray[np.float64]:
+    """
+    ---plane stress von Mises value sqrt(s11^2 - s11*s22 + s22^2 + 3*s12^2)---
+    """
+    s11,s22,s12 = (np.asarray(s,dtype=np.float64) for s in (s11,s22,s12))
+    return np.sqrt(s11*s11-s11*s22+s22*s22+3*s12*s12)
+
+
+class ShellStressPost:
+    """
+    Post-processor of shell results given as a ResultTable, one row per element corner
+
+    Example:
+        table = Sap.Results.Area.StressShell("Deck",ItemTypeElm="GroupElm",as_table=True)
+        post = ShellStressPost(table,dtype=np.float32)
+        top = post.principal("Top")                 # {"SMax","SMin","SAngle","SVM"}
+        joints = post.nodal_average(top["SVM"])     # corner values averaged to joints
+        env = post.element_envelope(top)            # per element max/min/absmax
+    """
+    # component columns of the tables post-processed
+    COMPONENTS = {
+        "AreaStressShell":{"Top":("S11Top","S22Top","S12Top"),"Bot":("S11Bot","S22Bot","S12Bot")},
+        "AreaForceShell":{"F":("F11","F22","F12"),"M":("M11","M22","M12")},
+        "AreaStressPlane":{"":("S11","S22","S12")},
+        "AreaStressShellLayered":{"":("S11","S22","S12")},
+    }
+
+    def __init__(self,table,dtype = np.float64):
+        """
+        input:
+            table(ResultTable):AreaStressShell, AreaForceShell, AreaStressPlane or AreaStressShellLayered table
+            dtype:dtype of the outputs, float32 halves them
+        """
+        if table.kind not in self.COMPONENTS:
+            raise ValueError(f"ShellStressPost does not handle Results.{table.kind}")
+        self.table = table
+        self.dtype = np.dtype(dtype)
+        self._joint_rows = None
+        self._incidence = None
+
+    def principal(self,face:Literal["Top","Bot","F","M",""] = "Top") -> Dict[str,NDArray]:
+        """
+        principal values, angle and von Mises of every corner row
+        input:
+            face(str):"Top"/"Bot" for StressShell, "F" (membrane force)/"M" (plate moment) for ForceShell,
+                "" for StressPlane and StressShellLayered
+        output:
+            dict:{"SMax","SMin","SAngle","SVM"} arrays, one value per row
+        """
+        s11,s22,s12 = (self.table[field] for field in self.COMPONENTS[self.table.kind][face])
+        smax,smin,angle = principal_2d(s11,s22,s12)
+        return {"SMax":smax.astype(self.dtype),"SMin":smin.astype(self.dtype),
+                "SAngle":angle.astype(self.dtype),"SVM":von_mises_2d(s11,s22,s12).astype(self.dtype)}
+
+    def joint_rows(self) -> Tuple[NDArray,NDArray]:
+        """
+        joint-output row of every corner row, one joint-output row per joint, load case and step
+        output:
+            inverse(ndarray):joint-output row of every corner row
+            keys(ndarray):joint,LoadCase,StepType codes and StepNum of every joint-output row
+        """
+        if self._joint_rows is None:
+            table = self.table
+            keys = np.column_stack([table.codes("PointElm"),table.codes("LoadCase"),
+                                    table.codes("StepType"),table["StepNum"]])
+            uniquekeys,inverse = np.unique(keys,axis=0,return_inverse=True)
+            self._joint_rows = inverse.ravel(),uniquekeys
+        return self._joint_rows
+
+    def incidence(self):
+        """
+        sparse (joint-output row) x (corner row) incidence matrix, needs scipy
+        output:
+            matrix(scipy.sparse.csr_matrix),keys(ndarray):joint,LoadCase,StepType codes and StepNum of every matrix row
+        """
+        if self._incidence is None:
+            from scipy.sparse import csr_matrix
+
+            inverse,keys = self.joint_rows()
+            nrow = len(inverse)
+            matrix = csr_matrix((np.ones(nrow),(inverse,np.arange(nrow))),shape=(len(keys),nrow))
+            self._incidence = matrix,keys
+        return self._incidence
+
+    def nodal_average(self,values:NDArray) -> Dict[str,NDArray]:
+        """
+        average corner values to joints, per load case and step
+        (a scipy sparse product when scipy is installed, np.add.at otherwise)
+        input:
+            values(ndarray):one value per row, or rows by components
+        output:
+            dict:{"Joint","LoadCase","StepType","StepNum","Value"}, Value has one row per joint, case and step
+        """
+        values = np.asarray(values,dtype=np.float64)
+        inverse,keys = self.joint_rows()
+        try:
+            matrix,_ = self.incidence()
+        except ImportError:
+            summed = np.zeros((len(keys),*values.shape[1:]))
+            np.add.at(summed,inverse,values)
+        else:
+            summed = matrix @ values
+        count = np.bincount(inverse,minlength=len(keys))
+        average = summed/(count if values.ndim == 1 else count[:,None])
+        table = self.table
+        codes = keys[:,:3].astype(np.int64)
+        return {"Joint":table.categories("PointElm")[codes[:,0]],
+                "LoadCase":table.categories("LoadCase")[codes[:,1]],
+                "StepType":table.categories("StepType")[codes[:,2]],
+                "StepNum":keys[:,3],
+                "Value":average.astype(self.dtype)}
+
+    def element_envelope(self,values:Dict[str,NDArray],fields:Sequence[str] = None) -> Dict[str,NDArray]:
+        """
+        max/min/absmax of every element over its corners, load cases and steps
+        input:
+            values(dict):arrays with one value per row, e.g. the output of principal()
+            fields(list):keys of values to envelope, default all
+        output:
+            dict:{"Elm","Fields","Max","Min","AbsMax"}, arrays are element by field
+        """
+        fields = list(values) if fields is None else list(fields)
+        stacked = np.column_stack([values[field] for field in fields])
+        uniquecodes,AbsMax,Max,Min = reduce_by_code(self.table.codes("Elm"),stacked)
+        return {"Elm":self.table.categories("Elm")[uniquecodes],"Fields":np.array(fields),
+                "Max":Max.astype(self.dtype),"Min":Min.astype(self.dtype),"AbsMax":AbsMax.astype(self.dtype)}
+
+    def top_bottom_envelope(self) -> Dict[str,Dict[str,NDArray]]:
+        """
+        element envelopes of the principal values and von Mises at the top and bottom faces of StressShell
+        output:
+            dict:{"Top":element_envelope,"Bot":element_envelope}
+        """
+        return {face:self.element_envelope(self.principal(face)) for face in ("Top","Bot")}
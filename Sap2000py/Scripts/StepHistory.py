@@ -0,0 +1,174 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class StepHistory:
+    """
+    Step-by-step time history of a group stored in a np.memmap laid out as [step,element,component]
+
+    The data file is <Path> (raw array), the layout and the progress are kept in <Path>.json,
+    so a partially written history can be resumed and a finished one reopened with StepHistory.open.
+    The steps are the union of the steps of the elements written, the file is laid out again when
+    an element brings steps that are not in it yet
+    """
+    def __init__(self,Path_:Union[str,Path],names:Sequence[str],fields:Sequence[str],dtype = np.float64):
+        """
+        input:
+            Path_(str|Path):data file of the memmap
+            names(list):element names, second axis
+            fields(list):component names, third axis
+            dtype:dtype of the memmap, float64 by default, float32 halves the file
+        """
+        self.path = Path(Path_)
+        self.names = list(names)
+        self.fields = list(fields)
+        self.dtype = np.dtype(dtype)
+        self.steps: Optional[NDArray[np.float64]] = None
+        self.done = np.zeros(len(self.names),dtype=bool)
+        self.data: Optional[np.memmap] = None
+
+    @property
+    def meta_path(self) -> Path:
+        return self.path.with_name(self.path.name+".json")
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.done.all())
+
+    def resume(self) -> bool:
+        """
+        reopen a partially written file with the same layout, return False if there is nothing to resume
+        """
+        if not (self.meta_path.exists() and self.path.exists()):
+            return False
+        with open(self.meta_path,encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["names"] != self.names or meta["fields"] != self.fields or meta["dtype"] != self.dtype.str:
+            return False
+        steps = np.asarray(meta["steps"],dtype=np.float64)
+        if self.path.stat().st_size != len(steps)*len(self.names)*len(self.fields)*self.dtype.itemsize:
+            # stopped while the file was laid out again
+            return False
+        self.steps = steps
+        self.done = np.asarray(meta["done"],dtype=bool)
+        self.data = self._map(self.path,"r+")
+        return True
+
+    @property
+    def shape(self):
+        return (0 if self.steps is None else len(self.steps),len(self.names),len(self.fields))
+
+    def _map(self,Path_:Path,mode:str):
+        """
+        memmap of the data file, an in-memory array when there is no data (empty files can't be mapped)
+        """
+        if 0 in self.shape:
+            return np.empty(self.shape,dtype=self.dtype)
+        return np.memmap(Path_,dtype=self.dtype,mode=mode,shape=self.shape)
+
+    def allocate(self,steps:Sequence[float]):
+        """
+        create the data file once the steps are known
+        """
+        self.steps = np.unique(np.asarray(steps,dtype=np.float64))
+        self.path.parent.mkdir(parents=True,exist_ok=True)
+        self.path.touch()
+        self.data = self._map(self.path,"w+")
+        self.data[:] = np.nan
+        self._write_meta()
+
+    def _extend(self,steps:NDArray):
+        """
+        lay the file out again on the union of its steps and steps, the written elements are copied over
+        """
+        old,oldsteps = self.data,self.steps
+        self.steps = np.union1d(oldsteps,steps)
+        tmp = self.path.with_name(self.path.name+".tmp")
+        data = self._map(tmp,"w+")
+        data[:] = np.nan
+        data[np.searchsorted(self.steps,oldsteps)] = old
+        if isinstance(data,np.memmap):
+            data.flush()
+        # the old map has to be closed before its file is replaced
+        del data,old
+        self.data = None
+        os.replace(tmp,self.path)
+        self.data = self._map(self.path,"r+")
+        self._write_meta()
+
+    def write(self,index:int,steps:NDArray,values:NDArray):
+        """
+        write the history of one element
+        input:
+            index(int):element index, second axis
+            steps(ndarray):step value of each row
+            values(ndarray):n by len(fields), one row per step
+        """
+        steps = np.asarray(steps,dtype=np.float64)
+        if self.data is None:
+            self.allocate(steps)
+        elif not np.isin(steps,self.steps).all():
+            self._extend(steps)
+        self.data[np.searchsorted(self.steps,steps),index,:] = values
+        self.done[index] = True
+
+    def flush(self):
+        """
+        flush the memmap before recording the progress, so a crash never marks unwritten data as done
+        """
+        if self.data is not None:
+            if isinstance(self.data,np.memmap):
+                self.data.flush()
+            self._write_meta()
+
+    def _write_meta(self):
+        meta = {"names":self.names,"fields":self.fields,"dtype":self.dtype.str,
+                "steps":self.steps.tolist(),"done":self.done.tolist()}
+        tmp = self.meta_path.with_name(self.meta_path.name+".tmp")
+        with open(tmp,"w",encoding="utf-8") as f:
+            json.dump(meta,f,ensure_ascii=False)
+        os.replace(tmp,self.meta_path)
+
+    @classmethod
+    def open(cls,Path_:Union[str,Path],mode:str = "r") -> "StepHistory":
+        """
+        open a written history
+        input:
+            Path_(str|Path):data file of the memmap
+            mode(str):np.memmap mode, read only by default
+        """
+        Path_ = Path(Path_)
+        with open(Path_.with_name(Path_.name+".json"),encoding="utf-8") as f:
+            meta = json.load(f)
+        history = cls(Path_,meta["names"],meta["fields"],np.dtype(meta["dtype"]))
+        history.steps = np.asarray(meta["steps"],dtype=np.float64)
+        history.done = np.asarray(meta["done"],dtype=bool)
+        history.data = history._map(Path_,mode)
+        return history
+
+
+def reduce_per_step(steps:NDArray,values:NDArray):
+    """
+    ---one row per step, keeping the signed value of max absolute among rows of the same step
+    (frame stations, link ends)---
+    input:
+        steps(ndarray):step value of each row
+        values(ndarray):n by m
+    output:
+        uniquesteps(ndarray):sorted steps
+        reduced(ndarray):len(uniquesteps) by m
+    """
+    from Sap2000py.Scripts.GetResults import reduce_by_code
+
+    uniquesteps,inverse = np.unique(steps,return_inverse=True)
+    if len(uniquesteps) == len(steps):
+        # one row per step already, only reorder
+        order = np.argsort(inverse.ravel(),kind="stable")
+        return uniquesteps,np.asarray(values,dtype=np.float64)[order]
+    _,_,MaxValue,MinValue = reduce_by_code(inverse,values)
+    return uniquesteps,np.where(MaxValue >= -MinValue,MaxValue,MinValue)
@@ -1,13 +1,9 @@
-import ezdxf
+# ezdxf, sectionproperties, matplotlib and geopandas are imported by the methods that need them
 from shapely.geometry import Polygon,MultiPolygon,MultiPoint,Point
 from shapely.ops import unary_union,triangulate
 from shapely.validation import make_valid,explain_validity # 需要Shapely >= 1.8a3版本
-from sectionproperties.pre import Geometry, CompoundGeometry
-from sectionproperties.analysis import Section
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-import geopandas as gpd
 # from typing import Literial
 from functools import total_ordering
 
@@ -15,7 +11,11 @@ class DXF2Polygons:
     """
     read dxf file and extract polygons, output unit is meter
     """
-    def __init__(self, file_path, unit_of_dxf='m', show_log=False):
+    def __init__(self, file_path, unit_of_dxf='m', show_log=False, show_plot=False):
+        """
+        show_plot(bool):plot every polygon found and the section meshes while parsing (needs matplotlib and geopandas)
+        """
+        self.show_plot = show_plot
         if show_log:
             from loguru import logger
             self.log = True
@@ -42,12 +42,16 @@ class DXF2Polygons:
     def plot(self):
         if self.log:
             self.logger.info("Plotting the combined polygon...")
-            
+        self.plot_polygon(self.combined_polygon)
+
+    @staticmethod
+    def plot_polygon(polygon):
         import matplotlib.pyplot as plt
         import geopandas as gpd
-        p = gpd.GeoSeries(self.combined_polygon)
+
+        p = gpd.GeoSeries(polygon)
         p.plot()
-        plt.show()    
+        plt.show()
 
     def get_geometry_from_entity(self,entity):
         """从实体中获取几何信息"""
@@ -222,6 +226,8 @@ class DXF2Polygons:
 
     def get_polygons_from_dxf(self,file_path, unit_of_dxf='m'):
         """从 DXF 文件中提取封闭的多边形图形"""
+        import ezdxf
+
         doc = ezdxf.readfile(file_path)
         msp = doc.modelspace()
 
@@ -247,9 +253,8 @@ class DXF2Polygons:
                 if np.linalg.norm(np.array(points[0]) - np.array(points[-1])) < 1e-4:
                     unique_points = points[:-1]
                 polygon = Polygon(unique_points)
-                p = gpd.GeoSeries(polygon)
-                p.plot()
-                plt.show()
+                if self.show_plot:
+                    self.plot_polygon(polygon)
                 if polygon.is_valid:
                     polygons.append(polygon)
                     if self.log:
@@ -269,9 +274,8 @@ class DXF2Polygons:
                         polygons.append(valid_polygon)
                         if self.log:
                             self.logger.success(f"Successfully fixed the invalid polygon with {len(unique_points)} points")
-                        p = gpd.GeoSeries(valid_polygon)
-                        p.plot()
-                        plt.show()
+                        if self.show_plot:
+                            self.plot_polygon(valid_polygon)
                     except Exception as e:
                         if self.log:
                             self.logger.error(f"Failed to fix the invalid polygon! Detail: {e}. Ignored!")
@@ -306,16 +310,21 @@ class DXF2Polygons:
         width = bounds[2] - bounds[0]
         height = bounds[3] - bounds[1]
         
+        from sectionproperties.pre import Geometry, CompoundGeometry
+        from sectionproperties.analysis import Section
+
         if isinstance(polygon,MultiPolygon):
 
             geom = CompoundGeometry(polygon)
-            geom.plot_geometry()
+            if self.show_plot:
+                geom.plot_geometry()
             geom.create_mesh(mesh_sizes=[polygon.area/10]) # 最大单元面积不大于多边形面积的1/100
         else:
             geom = Geometry(polygon)
             geom.create_mesh(mesh_sizes=[polygon.area/10]) # 最大单元面积不大于多边形面积的1/100
         sec = Section(geometry=geom)
-        sec.plot_mesh(materials=False)
+        if self.show_plot:
+            sec.plot_mesh(materials=False)
 
         Ixx = 0
         Iyy = 0
@@ -0,0 +1,70 @@
+"""
+Bulk builder benchmark: one API call per object vs database tables
+
+Builds a girder-like grid (named points and frames, two line masses per
+frame, group assignments, links, joint masses) on the fake SapModel with a
+per-call latency, once call by call and once inside `with Sap.bulk()`, and
+checks that both give the same model.
+
+    python benchmarks/bench_bulk.py [stations] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.Saproject import Saproject
+from Sap2000py.SapFake import FakeSapObject
+
+
+def build(Sap, stations):
+    Assign = Sap.Assign
+    for k in range(stations):
+        for j in range(4):
+            Assign.PointObj.AddCartesian(float(k), float(j), 0.0, UserName=f"P{k}_{j}")
+    for k in range(stations - 1):
+        for j in range(4):
+            name = f"F{k}_{j}"
+            Assign.FrameObj.AddByPoint(f"P{k}_{j}", f"P{k + 1}_{j}", propName="Girder", userName=name)
+            Assign.FrameObj.Set.Mass(name, 1.5, Replace=True)
+            Assign.FrameObj.Set.Mass(name, 0.5, Replace=False)
+            Sap.Scripts.Group.AddtoGroup("Girder", name, "Frame")
+        Assign.Link.AddByPoint(f"P{k}_0", f"P{k}_1", PropName="Bearing", UserName=f"L{k}")
+        Assign.PointObj.Set.Mass(f"P{k}_0", [1.0, 1.0, 1.0, 0.0, 0.0, 0.0], Replace=True)
+    Assign.PointObj.Set.Restraint("P0_0", ["Ux", "Uy", "Uz"])
+
+
+def state(model):
+    return (model.points.names, model.points.rows().tolist(), model.frames.names, model.frames.ends,
+            model.frames.prop, model.links.names, model.links.ends, model.links.prop,
+            {key: getattr(value, "tolist", lambda: value)() for key, value in model.assignments.items()},
+            {group: sorted(members) for group, members in model.groups.items()})
+
+
+def main():
+    stations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    states = []
+    for bulk in (False, True):
+        Sap.createSap(SapObject=FakeSapObject(latency=latency))
+        Sap.openSap()
+        Sap._Model.GroupDef.SetGroup("Girder")
+        start = time.perf_counter()
+        if bulk:
+            with Sap.bulk() as builder:
+                build(Sap, stations)
+        else:
+            build(Sap, stations)
+        elapsed = time.perf_counter() - start
+        print(f"{'bulk' if bulk else 'per call':>8}: {elapsed * 1e3:8.1f} ms, {sum(Sap._Model.calls.values())} API calls")
+        states.append(state(Sap._Model))
+    print("tables:", ", ".join(f"{report.table} {report.records}" for report in builder.reports))
+    assert builder.ok and states[0] == states[1], "bulk build differs from the call by call build"
+
+
+if __name__ == "__main__":
+    main()
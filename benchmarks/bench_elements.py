@@ -0,0 +1,67 @@
+"""
+Frame registry benchmark: Scripts.AddElements
+
+A chain of joints is connected twice, the second time with every pair
+reversed, on the fake SapModel with a per-call latency. The old script
+(compare each row with every connection, vstack per frame, one AddByPoint
+each) sees the reversed pairs as new frames, it is timed for 1e3 rows.
+The FrameRegistry merges them and pushes new frames through the database
+tables.
+
+    python benchmarks/bench_elements.py [max_frames] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.Saproject import Saproject
+
+
+def scan(Sap, connections):
+    """Add_Elements before the registry."""
+    all_connections = np.empty(shape=(0, 2))
+    for row in connections:
+        if not (row == all_connections).all(-1).any():
+            Sap._Model.FrameObj.AddByPoint(row[0], row[1])
+            all_connections = np.vstack((all_connections, row))
+    return len(all_connections)
+
+
+def model(Sap, n, latency):
+    Sap.createSap(SapObject=FakeSapObject(latency=latency))
+    Sap.openSap()
+    xyz = np.column_stack([np.arange(n + 1, dtype=float), np.zeros(n + 1), np.zeros(n + 1)])
+    with Sap.bulk():
+        names = Sap.Scripts.AddJoints(xyz, [f"J{k}" for k in range(n + 1)])
+    pairs = np.column_stack([names[:-1], names[1:]])
+    return np.vstack([pairs, pairs[:, ::-1]])
+
+
+def main():
+    largest = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100000
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    n = 1000
+    while n <= largest:
+        connections = model(Sap, n, latency)
+        start = time.perf_counter()
+        frames = len(set(Sap.Scripts.AddElements(connections)))
+        line = f"{n:>7} frames: registry {time.perf_counter() - start:7.3f} s ({frames} frames)"
+        if n <= 1000:
+            connections = model(Sap, n, latency)
+            start = time.perf_counter()
+            frames = scan(Sap, connections)
+            line += f"   scan {time.perf_counter() - start:7.3f} s ({frames} frames)"
+        print(line)
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark of Sap2000py.Scripts.Export against the cell by cell SapScripts.writecell
+
+A report workbook is simulated by many small result matrices on a few sheets.
+
+    python benchmarks/bench_export.py
+"""
+import gc
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+from openpyxl.utils import column_index_from_string
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Sap2000py.Scripts.Export import ResultExporter, write_blocks
+
+
+def legacy_writecell(WorkSheet, dataArray, startCell):
+    """SapScripts.writecell before Scripts.Export"""
+    colname, rowname = re.findall(r"\d+|\D+", startCell)
+    rownum = int(rowname)
+    colnum = column_index_from_string(colname)
+    m, n = dataArray.shape
+    for i in range(m):
+        for j in range(n):
+            WorkSheet.cell(rownum + i, colnum + j, value=dataArray[i, j])
+
+
+def report_jobs(nmatrix=300, rows=60, cols=6, nsheet=5, seed=0):
+    rng = np.random.default_rng(seed)
+    jobs = []
+    for k in range(nmatrix):
+        sheet = f"Sheet{k % nsheet}"
+        anchor = f"{'ABCDEFGH'[(k // nsheet) % 8]}{1 + (k // (8 * nsheet)) * (rows + 2)}"
+        jobs.append((rng.normal(size=(rows, cols)), sheet, anchor))
+    return jobs
+
+
+def timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+    return best
+
+
+if __name__ == "__main__":
+    jobs = report_jobs()
+    ncell = sum(a.size for a, _, _ in jobs)
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+
+        def legacy():
+            wb = openpyxl.Workbook()
+            for dataArray, sheet, anchor in jobs:
+                ws = wb[sheet] if sheet in wb.sheetnames else wb.create_sheet(sheet)
+                legacy_writecell(ws, dataArray, anchor)
+            wb.save(folder / "legacy.xlsx")
+
+        def cells_only(write):
+            wb = openpyxl.Workbook()
+            for dataArray, sheet, anchor in jobs:
+                ws = wb[sheet] if sheet in wb.sheetnames else wb.create_sheet(sheet)
+                write(ws, dataArray, anchor)
+
+        exporter = ResultExporter(jobs)
+        results = {
+            "cells only, writecell": timed(lambda: cells_only(legacy_writecell)),
+            "cells only, write_blocks": timed(lambda: cells_only(write_blocks)),
+            "writecell (legacy)": timed(legacy),
+            "to_excel update, new": timed(lambda: (folder / "new.xlsx").unlink(missing_ok=True) or
+                                          exporter.to_excel(folder / "new.xlsx")),
+            "to_excel update, existing": timed(lambda: exporter.to_excel(folder / "update.xlsx")),
+            "to_excel write_only": timed(lambda: exporter.to_excel(folder / "stream.xlsx", mode="write_only")),
+            "to_csv": timed(lambda: exporter.to_csv(folder / "csv")),
+        }
+        try:
+            results["to_parquet"] = timed(lambda: exporter.to_parquet(folder / "parquet"))
+        except ImportError:
+            pass
+
+        # both workbooks hold the same values
+        a = openpyxl.load_workbook(folder / "legacy.xlsx")["Sheet3"]
+        for name in ("stream.xlsx", "new.xlsx", "update.xlsx"):
+            b = openpyxl.load_workbook(folder / name)["Sheet3"]
+            assert [c.value for r in a.iter_rows() for c in r if c.value is not None] == \
+                   [c.value for r in b.iter_rows() for c in r if c.value is not None]
+
+    print(f"{len(jobs)} matrices, {ncell} cells")
+    for name, seconds in results.items():
+        print(f"{name:>26}: {seconds:8.3f} s")
@@ -0,0 +1,62 @@
+"""
+Offline benchmark of a build - analyze - extract session on the fake SapModel
+
+Sap2000py.SapFake.FakeSapObject stands in for SAP2000, so the run is
+deterministic and needs neither Windows nor comtypes. A pier-like grid of
+points, frames and links is built through the Saproject wrappers, grouped,
+run with Scripts.Analyze.RunAll and extracted with Scripts.GetResults. The
+per-call latency mimics the COM round trip (about 50 us out of process), so
+the numbers show how many API calls a script makes and what they cost.
+
+    python benchmarks/bench_fake_model.py [levels] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Sap2000py.Saproject import Saproject
+from Sap2000py.SapFake import FakeSapObject
+
+
+def session(Sap, levels):
+    Assign = Sap.Assign
+    start = time.perf_counter()
+    points = []
+    for k in range(levels + 1):
+        points.append([Assign.PointObj.AddCartesian(x, y, float(k))[0] for x in (0.0, 4.0) for y in (0.0, 4.0)])
+    frames, links = [], []
+    for k in range(levels):
+        for p1, p2 in zip(points[k], points[k + 1]):
+            frames.append(Assign.FrameObj.AddByPoint(p1, p2)[0])
+        links.append(Assign.Link.AddByPoint(points[k][0], points[k][3])[0])
+    Sap.Scripts.Group.AddtoGroup("Pier", frames, "Frame")
+    Sap.Scripts.Group.AddtoGroup("Pier", links, "Link")
+    Sap.Scripts.Group.AddtoGroup("Pier", [p for level in points for p in level], "Point")
+    built = time.perf_counter()
+    Sap.Scripts.Analyze.RunAll()
+    run = time.perf_counter()
+    GetResults = Sap.Scripts.GetResults
+    GetResults.Cube_by_Group("Pier", ["DEAD"], "ElementForce")
+    GetResults.Cube_by_Group("Pier", ["DEAD"], "LinkForce")
+    GetResults.Cube_by_Group("Pier", ["DEAD"], "JointDispl")
+    done = time.perf_counter()
+    return built - start, run - built, done - run
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    Sap = Saproject()
+    for label, lat in (("no latency", 0.0), (f"{latency * 1e6:.0f} us/call", latency)):
+        Sap.createSap(SapObject=FakeSapObject(latency=lat))
+        Sap.openSap()
+        build, run, extract = session(Sap, levels)
+        calls = Sap._Model.calls
+        print(f"{label:>12}: build {build * 1e3:8.1f} ms  analyze {run * 1e3:6.1f} ms  "
+              f"extract {extract * 1e3:6.1f} ms  ({sum(calls.values())} API calls)")
+    print("most called:", ", ".join(f"{name} x{count}" for name, count in calls.most_common(5)))
+
+
+if __name__ == "__main__":
+    main()
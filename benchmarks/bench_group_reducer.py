@@ -0,0 +1,66 @@
+"""
+Benchmark of the group result reducer in Sap2000py.Scripts.GetResults
+
+Synthetic results look like a time-history output of a group: every item
+repeats over the steps, values are [F1,F2,F3,M1,M2,M3].
+
+    python benchmarks/bench_group_reducer.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Sap2000py.Scripts.GetResults import reduce_by_item
+
+
+def legacy_deal_with_item(itemtext, reaction):
+    """the O(N^2) find_duplicates + per item loop used before reduce_by_item"""
+    uniquelist = sorted(list(set(itemtext)))
+    index_all = {}
+    for i in range(len(itemtext)):
+        index_all[itemtext[i]] = [index for index, nums in enumerate(itemtext) if nums == itemtext[i]]
+    MaxReaction = np.zeros((len(uniquelist), reaction.shape[1]))
+    MinReaction = np.zeros((len(uniquelist), reaction.shape[1]))
+    AbsReaction = np.zeros((len(uniquelist), reaction.shape[1]))
+    for i, name in enumerate(uniquelist):
+        itemreaction = reaction[index_all[name], :]
+        MaxReaction[i, :] = np.max(itemreaction, 0)
+        MinReaction[i, :] = np.min(itemreaction, 0)
+        AbsReaction[i, :] = np.max(np.fabs(itemreaction), 0)
+    return uniquelist, AbsReaction, MaxReaction, MinReaction
+
+
+def synthetic_rows(nrows, nitems=500, seed=0):
+    rng = np.random.default_rng(seed)
+    names = [f"Bearing_B{i}" for i in range(nitems)]
+    itemtext = [names[i % nitems] for i in range(nrows)]
+    reaction = rng.normal(size=(nrows, 6)) * 1e3
+    return itemtext, reaction
+
+
+def timeit(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+if __name__ == "__main__":
+    # correctness against the legacy implementation
+    itemtext, reaction = synthetic_rows(3000, nitems=50)
+    new, old = reduce_by_item(itemtext, reaction), legacy_deal_with_item(itemtext, reaction)
+    assert new[0] == old[0]
+    for a, b in zip(new[1:], old[1:]):
+        np.testing.assert_allclose(a, b)
+
+    print(f"{'rows':>10} {'legacy(s)':>12} {'reduce_by_item(s)':>18}")
+    for nrows in (10**3, 10**4, 10**5, 10**6):
+        itemtext, reaction = synthetic_rows(nrows)
+        legacy = timeit(legacy_deal_with_item, itemtext, reaction, repeat=1) if nrows <= 10**4 else float("nan")
+        new = timeit(reduce_by_item, itemtext, reaction)
+        print(f"{nrows:>10} {legacy:>12.4f} {new:>18.4f}")
@@ -0,0 +1,83 @@
+"""
+Group index benchmark: Scripts.Group on 1e4-member groups
+
+Joints are added to a group in two overlapping halves, 10% of them are
+removed, and the members are read back, on the fake SapModel with a per-call
+latency. The old scripts (one eval'd SetGroupAssign per name, removal by
+clearing the group and adding every remaining member again) are compared
+with the group index, which sends only the difference and pushes large
+batches through the group assignment table.
+
+    python benchmarks/bench_groups.py [members] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.Saproject import Saproject
+
+
+def legacy_add(Sap, GroupName, namelist, Objstr="PointObj"):
+    """AddtoGroup before the index."""
+    SapModel = Sap._Model
+    if GroupName not in SapModel.GroupDef.GetNameList()[1]:
+        SapModel.GroupDef.SetGroup(GroupName)
+    for name in namelist:
+        eval(f'SapModel.{Objstr}.SetGroupAssign(name, GroupName)')
+
+
+def legacy_elements(Sap, GroupName):
+    NumberElements, typelist, elementList, ret = Sap._Model.GroupDef.GetAssignments(GroupName)
+    return list(dict.fromkeys(f"Point:{ele}" for ele in elementList))
+
+
+def legacy_remove(Sap, GroupName, dellist):
+    """RemovefromGroup before the index."""
+    EleList = dict.fromkeys(legacy_elements(Sap, GroupName))
+    for id2del in dellist:
+        del EleList["Point:" + id2del]
+    Sap._Model.GroupDef.Clear(GroupName)
+    for ele in EleList:
+        legacy_add(Sap, GroupName, [ele.split(":")[1]])
+
+
+def run(Sap, n, latency, legacy):
+    Sap.createSap(SapObject=FakeSapObject(latency=latency))
+    Sap.openSap()
+    with Sap.bulk():
+        names = Sap.Scripts.AddJoints([[float(k), 0.0, 0.0] for k in range(n)], [f"J{k}" for k in range(n)])
+    calls = sum(Sap._Model.calls.values())
+    Group = Sap.Scripts.Group
+    start = time.perf_counter()
+    if legacy:
+        legacy_add(Sap, "Deck", names[:n * 3 // 4])
+        legacy_add(Sap, "Deck", names[n // 4:])
+        legacy_remove(Sap, "Deck", names[::10])
+        members = legacy_elements(Sap, "Deck")
+    else:
+        Group.AddtoGroup("Deck", names[:n * 3 // 4], "Point")
+        Group.AddtoGroup("Deck", names[n // 4:], "Point")
+        Group.RemovefromGroup("Deck", names[::10], "Point")
+        members = Group.GetElements("Deck")
+    elapsed = time.perf_counter() - start
+    return members, elapsed, sum(Sap._Model.calls.values()) - calls
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10000
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    results = {}
+    for legacy in (True, False):
+        members, elapsed, calls = results[legacy] = run(Sap, n, latency, legacy)
+        print(f"{'old' if legacy else 'index':>5}: {elapsed:7.3f} s, {calls} API calls, {len(members)} members")
+    assert sorted(results[True][0]) == sorted(results[False][0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Incremental rebuild benchmark: Saproject.incremental
+
+A continuous bridge (double box piers on fixed bases, one box girder,
+ideal bearings) is built on the fake SapModel with a per-call latency,
+then built again inside `with Sap.incremental()`: unchanged, with one
+bearing stiffness changed and with the piers raised. A fresh build of the
+last bridge is compared with the incrementally rebuilt model.
+
+    python benchmarks/bench_incremental.py [piers] [latency_us]
+"""
+import gc
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.Bridge.Continuous_Bridge import (SapBase_Fixed, Sap_Bearing_Linear, Sap_Box_Girder,
+                                                Sap_Double_Box_Pier, Sap_LinkProp_Linear, Section_Rectangle)
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.Saproject import Saproject
+
+
+def new_model(Sap, latency):
+    Sap.createSap(SapObject=FakeSapObject(latency=latency))
+    Sap.openSap()
+    for material in ("C40", "C60"):
+        Sap._Model.PropMaterial.AddMaterial(material, 2, "China", "JTG", material)
+
+
+def bridge(piers, height=30.0, stiffness=1e5):
+    gc.collect()
+    built = []
+    for k in range(piers):
+        pier = Sap_Double_Box_Pier(f"#{k + 1}", 40.0 * k, 0.0, height, 3.0, 3.0, 4.0, 6.0, Height_of_cap=2.0,
+                                   is_intermediate_pier=k in (0, piers - 1),
+                                   Box_Section=Section_Rectangle("Box", "C40", 2.0, 3.0),
+                                   Solid_Section=Section_Rectangle("Solid", "C40", 2.0, 3.0),
+                                   Cap_Section=Section_Rectangle("Cap", "C40", 2.0, 3.0))
+        pier.build()
+        SapBase_Fixed(pier.base_point).auto_build()
+        built.append(pier)
+    girder = Sap_Box_Girder("G", built, built[piers // 2:piers // 2 + 1])
+    girder.add_ideal_bearing_links()
+    # one extra bearing whose stiffness is the parameter studied
+    study = Sap_LinkProp_Linear("Study", DOF=["U1", "U2"], Ke={"U1": 1e7, "U2": stiffness})
+    study.define_link()
+    Sap_Bearing_Linear("StudyBearing", built[0].base_point, built[1].base_point, "Study")
+
+
+def state(model):
+    frames = sorted(("" if name.isdigit() else name, ends) for name, ends in zip(model.frames.names, model.frames.ends))
+    return (sorted(zip(model.points.names, model.points.rows().tolist())), frames,
+            sorted(zip(model.links.names, model.links.ends, model.links.prop)), sorted(model.link_props.items()),
+            sorted((key, str(getattr(value, "tolist", lambda: value)())) for key, value in model.assignments.items()))
+
+
+def timed(Sap, label, **changes):
+    Sap._Model.calls.clear()
+    start = time.perf_counter()
+    with Sap.incremental() as manifest:
+        bridge(**changes)
+    elapsed = time.perf_counter() - start
+    counts = ", ".join(f"{manifest.counts[key]} {key}" for key in ("new", "changed", "same", "deleted"))
+    print(f"{label:>16}: {elapsed * 1e3:8.1f} ms, {sum(Sap._Model.calls.values()):6d} API calls ({counts})")
+
+
+def main():
+    piers = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    new_model(Sap, latency)
+    timed(Sap, "first build", piers=piers)
+    timed(Sap, "unchanged", piers=piers)
+    timed(Sap, "one stiffness", piers=piers, stiffness=2e5)
+    timed(Sap, "piers raised", piers=piers, stiffness=2e5, height=31.0)
+    rebuilt = state(Sap._Model)
+    new_model(Sap, latency)
+    timed(Sap, "fresh build", piers=piers, stiffness=2e5, height=31.0)
+    assert state(Sap._Model) == rebuilt, "incremental rebuild differs from a fresh build"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Joint registry benchmark: duplicate checks of Scripts.AddJoints
+
+Half of the rows repeat the other half shifted by less than the merge
+tolerance. The rows are added on the fake SapModel (no latency) by the old
+script (compare each row with every joint, vstack the array per joint), up
+to 1e4 rows, and by the JointRegistry spatial hash, up to max_joints. The
+last line adds max_joints named rows inside `with Sap.bulk()`.
+
+    python benchmarks/bench_joints.py [max_joints]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.Saproject import Saproject
+
+
+def scan(Sap, xyz):
+    """Add_Joints_Cartesian before the registry."""
+    all_joints = np.empty(shape=(0, 3))
+    for row in xyz:
+        if not (row == all_joints).all(-1).any():
+            Sap.Assign.PointObj.AddCartesian(*row.tolist())
+            all_joints = np.vstack((all_joints, row))
+    return len(all_joints)
+
+
+def fresh(Sap):
+    Sap.createSap(SapObject=FakeSapObject())
+    Sap.openSap()
+    Sap.Scripts.Joints.tolerance = 1e-3
+
+
+def rows(n):
+    xyz = np.random.default_rng(0).random((n, 3)) * 1000.0
+    xyz[n // 2:] = xyz[:n // 2] + 1e-5
+    return xyz
+
+
+def main():
+    largest = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100000
+    logger.remove()
+    Sap = Saproject()
+    n = 1000
+    while n <= largest:
+        xyz = rows(n)
+        fresh(Sap)
+        start = time.perf_counter()
+        unique = len(set(Sap.Scripts.Joints.add(xyz)))
+        line = f"{n:>7} rows: registry {(time.perf_counter() - start) * 1e3:8.1f} ms ({unique} joints)"
+        if n <= 10000:
+            fresh(Sap)
+            start = time.perf_counter()
+            exact = scan(Sap, xyz)
+            line += f"   scan {(time.perf_counter() - start) * 1e3:9.1f} ms ({exact} joints, exact match only)"
+        print(line)
+        n *= 10
+    fresh(Sap)
+    xyz = rows(largest)
+    start = time.perf_counter()
+    with Sap.bulk():
+        names = Sap.Scripts.Joints.add(xyz, [f"J{k}" for k in range(len(xyz))])
+    print(f"{largest} rows named, in bulk: {(time.perf_counter() - start) * 1e3:8.1f} ms ({len(set(names))} joints)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Model mirror benchmark: link lookups and nearest joints
+
+A chain of joints is connected by links, then the link between every pair
+of neighbours is looked up as Sap_Bearing.get_link_between_points did (two
+PointObj.GetConnectivity calls) and through Sap.Mirror, on the fake SapModel
+with a per-call latency. The second block finds the joint nearest to every
+joint moved by a small offset, once by reading all coordinates with
+GetAllPoints per query and once by the mirror's KD-tree (the first query
+imports scipy and builds the tree).
+
+    python benchmarks/bench_mirror.py [joints] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.Saproject import Saproject
+
+
+def connectivity(Sap, point1, point2):
+    """get_link_between_points before the mirror."""
+    ret1 = Sap._Model.PointObj.GetConnectivity(point1)
+    ret2 = Sap._Model.PointObj.GetConnectivity(point2)
+    links1 = {ret1[2][i] for i in range(ret1[0]) if ret1[1][i] == 7}
+    return [ret2[2][i] for i in range(ret2[0]) if ret2[1][i] == 7 and ret2[2][i] in links1]
+
+
+def scan(Sap, xyz):
+    ret = Sap._Model.PointObj.GetAllPoints(0, [], [], [], [], "Global")
+    distances = np.linalg.norm(np.column_stack(ret[2:5]) - xyz, axis=1)
+    return ret[1][int(np.argmin(distances))]
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    Sap.createSap(SapObject=FakeSapObject(latency=latency))
+    Sap.openSap()
+    xyz = np.random.default_rng(0).random((n, 3)) * 100.0
+    with Sap.bulk():
+        names = Sap.Scripts.AddJoints(xyz, [f"J{k}" for k in range(n)])
+        for k in range(n - 1):
+            Sap._Model.LinkObj.AddByPoint(names[k], names[k + 1], "", False, "Default", f"L{k}")
+    pairs = list(zip(names[:-1], names[1:]))
+
+    start = time.perf_counter()
+    old = [connectivity(Sap, *pair) for pair in pairs]
+    line = f"{len(pairs)} link lookups: GetConnectivity {time.perf_counter() - start:7.3f} s"
+    calls = sum(Sap._Model.calls.values())
+    start = time.perf_counter()
+    new = [Sap.Mirror.links_between(*pair) for pair in pairs]
+    print(f"{line}   mirror {time.perf_counter() - start:7.3f} s "
+          f"({sum(Sap._Model.calls.values()) - calls} API calls, read included)")
+    assert old == new
+
+    targets = xyz + 1e-3
+    start = time.perf_counter()
+    old = [scan(Sap, target) for target in targets[:200]]
+    line = f"{n} nearest joints: GetAllPoints {(time.perf_counter() - start) * n / 200:7.3f} s (from 200)"
+    start = time.perf_counter()
+    new = [Sap.Mirror.nearest(target)[0][0] for target in targets]
+    print(f"{line}   mirror {time.perf_counter() - start:7.3f} s")
+    assert old == new[:200] and new == names
+
+
+if __name__ == "__main__":
+    main()
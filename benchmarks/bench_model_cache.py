@@ -0,0 +1,76 @@
+"""
+Model cache benchmark: existence checks by API call vs the read-through cache
+
+A pier-like build (points, frames, a section, link properties and groups)
+asks before every definition whether the section, link property, point and
+group already exist, as Sap_Double_Box_Pier.build does. The checks are made
+once with a GetNameList / GetTypeOAPI call each and once through
+Sap.ModelCache, on the fake SapModel with a per-call latency.
+
+    python benchmarks/bench_model_cache.py [points] [latency_us]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.SapModelCache import LINK_TYPES
+from Sap2000py.Saproject import Saproject
+
+
+class Direct:
+    """The checks as made before the cache, one API call each."""
+
+    def __init__(self, Sap):
+        self._Sap = Sap
+
+    def has(self, interface, name):
+        return name in (getattr(self._Sap._Model, interface).GetNameList()[1] or ())
+
+    def link_prop_type(self, name):
+        ret = self._Sap._Model.PropLink.GetTypeOAPI(name)
+        return ret[0] if ret[-1] == 0 else None
+
+
+def build(Sap, checks, points):
+    SapModel = Sap._Model
+    for k in range(points):
+        if not checks.has("PropFrame", "Pier"):
+            SapModel.PropFrame.SetRectangle("Pier", "C40", 2.0, 2.0)
+        if checks.link_prop_type("Bearing") != LINK_TYPES["Linear"]:
+            SapModel.PropLink.SetLinear("Bearing", [True] * 6, [False] * 6, [1e6] * 6, [0.0] * 6, 0.0, 0.0)
+        name = f"P{k}"
+        if not checks.has("PointObj", name):
+            SapModel.PointObj.AddCartesian(0.0, 0.0, 0.5 * k, "", name)
+        if k and not checks.has("FrameObj", f"F{k}"):
+            SapModel.FrameObj.AddByPoint(f"P{k - 1}", name, "", "Pier", f"F{k}")
+        if not checks.has("GroupDef", "Pier"):
+            SapModel.GroupDef.SetGroup("Pier")
+        SapModel.PointObj.SetGroupAssign(name, "Pier")
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    for cached in (False, True):
+        Sap.createSap(SapObject=FakeSapObject(latency=latency))
+        Sap.openSap()
+        start = time.perf_counter()
+        build(Sap, Sap.ModelCache if cached else Direct(Sap), points)
+        elapsed = time.perf_counter() - start
+        calls = Sap._Model.calls
+        queries = calls["PropFrame.GetNameList"] + calls["PointObj.GetNameList"] + calls["FrameObj.GetNameList"] \
+            + calls["GroupDef.GetNameList"] + calls["PropLink.GetTypeOAPI"]
+        print(f"{'cache' if cached else 'direct':>6}: {elapsed * 1e3:8.1f} ms, {sum(calls.values())} API calls "
+              f"({queries} queries)")
+    print(f"cache hits {Sap.ModelCache.hits}, misses {Sap.ModelCache.misses}")
+    assert Sap.ModelCache.has("FrameObj", f"F{points - 1}") and len(Sap.ModelCache.names("PointObj")) == points
+
+
+if __name__ == "__main__":
+    main()
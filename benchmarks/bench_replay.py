@@ -0,0 +1,52 @@
+"""
+Replay benchmark: Python overhead of a recorded session
+
+Records the bench_fake_model session once (pass a session file written by
+Saproject.record on a SAP2000 workstation to use a real one, with a script
+that makes the same calls), then replays it in a loop with ReplaySapObject.
+Without latency the replay time is Sap2000py's own overhead.
+
+    python benchmarks/bench_replay.py [session.jsonl.gz] [loops]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_fake_model import session
+from Sap2000py.Saproject import Saproject
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.SapReplay import ReplaySapObject
+
+LEVELS = 100
+
+
+def main():
+    loops = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    Sap = Saproject()
+    if len(sys.argv) > 1:
+        path = Path(sys.argv[1])
+    else:
+        path = Path(tempfile.gettempdir()) / "Sap2000py_bench_session.jsonl.gz"
+        Sap.createSap(SapObject=FakeSapObject())
+        Sap.openSap()
+        with Sap.record(path) as recorder:
+            session(Sap, LEVELS)
+        print(f"recorded {recorder.calls} calls to {path} ({path.stat().st_size / 1024:.0f} KiB)")
+    start = time.perf_counter()
+    replay = ReplaySapObject(path)
+    print(f"loaded in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    Sap.createSap(SapObject=replay)
+    for loop in range(loops):
+        replay.SapModel.rewind()
+        replay.SapModel.calls = 0
+        start = time.perf_counter()
+        session(Sap, LEVELS)
+        elapsed = time.perf_counter() - start
+        print(f"replay {loop}: {elapsed * 1e3:7.1f} ms, {elapsed / replay.SapModel.calls * 1e6:5.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of the run-to-run result diff in Sap2000py.Scripts.ResultDiff
+
+Two synthetic FrameForce tables of 10^6 rows, the second one shuffled with a
+few rows missing and a few values changed, as two variants of a model give.
+The time is expected to grow like n log n.
+
+    python benchmarks/bench_result_diff.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Sap2000py.SapResultTable import ResultTable
+from Sap2000py.Scripts.ResultDiff import ResultDiff
+
+
+def synthetic_tables(nrows, nframes=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = np.array([f"Pier_F{i}" for i in range(nframes)])[rng.integers(0, nframes, nrows)]
+    data = {"Obj": frames, "ObjSta": rng.integers(0, 5, nrows).astype(float), "Elm": frames,
+            "ElmSta": np.zeros(nrows), "LoadCase": np.array(["E2X", "E2Y", "E2Z"])[rng.integers(0, 3, nrows)],
+            "StepType": np.full(nrows, "Max"), "StepNum": rng.integers(0, 20, nrows).astype(float)}
+    for field in ("P", "V2", "V3", "T", "M2", "M3"):
+        data[field] = rng.normal(size=nrows) * 1e3
+    a = ResultTable.from_columns("FrameForce", data)
+    keep = rng.permutation(nrows)[:-10]
+    changed = {field: values[keep].copy() for field, values in data.items()}
+    changed["M3"][:10] *= 1.5
+    b = ResultTable.from_columns("FrameForce", changed)
+    return a, b
+
+
+def main():
+    for nrows in (10**4, 10**5, 10**6):
+        a, b = synthetic_tables(nrows)
+        start = time.perf_counter()
+        diff = ResultDiff(a, b)
+        top = diff.top(10)
+        elapsed = time.perf_counter() - start
+        rows = diff.summary()["Rows"]
+        print(f"{nrows:>8} rows  {elapsed:8.3f} s  matched {rows['Matched']}  only A {rows['OnlyA']}"
+              f"  top field {top['Field'][0]}")
+
+
+if __name__ == "__main__":
+    main()
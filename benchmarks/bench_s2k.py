@@ -0,0 +1,87 @@
+"""
+S2K fast path benchmark: per-object API calls vs one text file import
+
+For 1e3, 1e4 and 1e5 joints a line of joints with a frame between
+neighbours, all frames in a group and the first joint fixed, is built
+    per call  Assign.PointObj.AddCartesian / FrameObj.AddByPoint / GroupAssign
+    s2k       S2KModel arrays, written to a .s2k file, one File.Open import
+on the fake SapModel with a per-call latency, and both models are compared.
+The s2k time is split in writing the file and importing it. The import is
+the fake's own parser and SAP2000 reads at its own speed, so it is shown but
+not meant as a prediction.
+
+    python benchmarks/bench_s2k.py [max_joints] [latency_us]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from loguru import logger
+
+from Sap2000py.SapFake import FakeSapObject
+from Sap2000py.SapS2K import S2KModel
+from Sap2000py.Saproject import Saproject
+
+
+def per_call(Sap, xyz):
+    Assign = Sap.Assign
+    names = [Assign.PointObj.AddCartesian(x, y, z, UserName=f"J{k}")[0] for k, (x, y, z) in enumerate(xyz.tolist())]
+    frames = [Assign.FrameObj.AddByPoint(i, j, propName="Pier", userName=f"F{k}")[0]
+              for k, (i, j) in enumerate(zip(names[:-1], names[1:]))]
+    Sap._Model.GroupDef.SetGroup("Pier")
+    for frame in frames:
+        Assign.FrameObj.Set.GroupAssign(frame, "Pier")
+    Assign.PointObj.Set.Restraint(names[0], ["Ux", "Uy", "Uz", "Rx", "Ry", "Rz"])
+
+
+def s2k(Sap, xyz, path):
+    model = S2KModel()
+    model.add_material("C40", E=3.25e7)
+    model.add_rectangle("Pier", "C40", t3=2.0, t2=2.0)
+    names = model.add_joints(xyz, [f"J{k}" for k in range(len(xyz))])
+    frames = model.add_frames(names[:-1], names[1:], "Pier", [f"F{k}" for k in range(len(xyz) - 1)])
+    model.add_group("Pier", "Frame", frames)
+    model.add_restraints(names[:1], ["Ux", "Uy", "Uz", "Rx", "Ry", "Rz"])
+    model.add_load_pattern("DEAD", SelfWtMult=1.0)
+    start = time.perf_counter()
+    model.write(path)
+    written = time.perf_counter()
+    Sap.File.Open(path)
+    return written - start, time.perf_counter() - written
+
+
+def main():
+    largest = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100000
+    latency = float(sys.argv[2]) * 1e-6 if len(sys.argv) > 2 else 50e-6
+    logger.remove()
+    Sap = Saproject()
+    path = Path(tempfile.gettempdir()) / "Sap2000py_bench.s2k"
+    n = 1000
+    while n <= largest:
+        xyz = np.column_stack([np.zeros(n), np.zeros(n), np.arange(n, dtype=float) * 0.5])
+        models = []
+        for route in (per_call, s2k):
+            Sap.createSap(SapObject=FakeSapObject(latency=latency))
+            Sap.openSap()
+            start = time.perf_counter()
+            if route is per_call:
+                per_call(Sap, xyz)
+                calls = time.perf_counter() - start
+            else:
+                write, load = s2k(Sap, xyz, path)
+                build = time.perf_counter() - start
+            model = Sap._Model
+            models.append((model.points.names, model.points.rows().tolist(), model.frames.names, model.frames.ends,
+                           model.frames.prop, sorted(model.groups["Pier"])))
+        print(f"{n:>7} joints: per call {calls:8.3f} s   s2k {build:7.3f} s (write {write:6.3f} s, "
+              f"import {load:6.3f} s, {path.stat().st_size / 1e6:.1f} MB)")
+        assert models[0] == models[1], "s2k import differs from the call by call build"
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
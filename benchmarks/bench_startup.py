@@ -0,0 +1,85 @@
+"""
+Startup benchmark of the lazy Saproject wrapper tree
+
+A stand-in model object replaces the COM pointers, so only the Python side
+is measured:
+    lazy   Saproject() and the first call through one subsystem
+    full   every wrapper of the tree built, what Saproject() used to pay
+It also checks that swapping the model pointer (re-attaching to another
+SAP2000 instance) reaches wrappers that were already built.
+
+    python benchmarks/bench_startup.py
+"""
+import sys
+import time
+from functools import cached_property
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from Sap2000py.Saproject import Saproject
+from Sap2000py.SapWrapper import SapChild
+
+
+class StandInModel:
+    """answers every API call with its own name"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        return self
+
+    def __call__(self, *args):
+        return self.name
+
+
+class StandInObject:
+    def __init__(self, name):
+        self.SapModel = StandInModel(name)
+
+
+def new_project(name="first"):
+    Sap = Saproject(AttachToInstance=False)
+    Sap._Object = StandInObject(name)
+    Sap._Model = Sap._Object.SapModel
+    return Sap
+
+
+def build_all(wrapper):
+    """touch every sub wrapper, returns the number of wrappers"""
+    count = 1
+    for cls in type(wrapper).__mro__:
+        for name, attr in vars(cls).items():
+            if isinstance(attr, (SapChild, cached_property)):
+                count += build_all(getattr(wrapper, name))
+    return count
+
+
+def best_of(func, repeat=200):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    lazy = best_of(lambda: new_project().Results.Joint)
+    full = best_of(lambda: build_all(new_project()))
+    print(f"wrappers in the tree       {build_all(new_project())}")
+    print(f"lazy, one subsystem        {lazy * 1e6:8.1f} us")
+    print(f"full tree                  {full * 1e6:8.1f} us")
+
+    Sap = new_project("first")
+    build_all(Sap)
+    PointGet = Sap.Assign.PointObj.Get
+    assert PointGet.CommonTo("1") == "first"
+    Sap._Object = StandInObject("second")
+    Sap._Model = Sap._Object.SapModel
+    assert PointGet.CommonTo("1") == "second"
+    print("re-attach reaches cached wrappers: ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Import-time regression check of `import Sap2000py`
+
+Runs `python -X importtime -c "import Sap2000py"` in a fresh interpreter,
+fails (exit code 1) when the total exceeds the budget or when one of the
+heavy optional dependencies is imported. They belong to section meshing,
+DXF parsing, plotting and the COM connection, and must be imported by
+those features only.
+
+    python benchmarks/check_import_time.py [budget_ms]
+"""
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_MS = 500
+HEAVY = ("sectionproperties", "shapely", "ezdxf", "geopandas", "matplotlib", "comtypes")
+
+
+def import_times(module="Sap2000py"):
+    """{module: cumulative microseconds} of a fresh import"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match:
+            times[match.group(3)] = int(match.group(1))
+    return times
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    times = import_times()
+    total = times["Sap2000py"] / 1e3
+    heavy = sorted({name.split(".")[0] for name in times if name.split(".")[0] in HEAVY})
+    print(f"import Sap2000py  {total:8.1f} ms  (budget {budget:.0f} ms)")
+    for name, us in sorted(times.items(), key=lambda item: -item[1])[1:6]:
+        print(f"    {name:<30}{us / 1e3:8.1f} ms")
+    failed = False
+    if heavy:
+        print(f"FAIL: heavy optional dependencies imported: {heavy}")
+        failed = True
+    if total > budget:
+        print("FAIL: over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
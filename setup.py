@@ -34,4 +34,8 @@ setup(
         "rich",
         "sectionproperties>=3.3.0",
     ],
+    extras_require={
+        # sparse shell post-processing and the k-d tree of SapModelMirror, numpy fallbacks without it
+        "scipy": ["scipy"],
+    },
 )